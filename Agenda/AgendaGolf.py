@@ -18,14 +18,13 @@ Execució (des de la carpeta Agenda):
 
 # ── IMPORTACIONS ────────────────────────────────────────────────────────────────
 import streamlit as st
-from google import genai
-from google.genai import types
 import os
 import json
 import re
 from datetime import datetime, date
-import pdfplumber
-from streamlit_calendar import calendar as st_calendar
+# google-genai, pdfplumber i streamlit_calendar s'importen dins de la secció o
+# funció que els fa servir: són lents de carregar (~1,4 s entre tots tres) i
+# així el primer render de l'app no els ha d'esperar.
 
 # ── RUTES ───────────────────────────────────────────────────────────────────────
 BASE_DIR    = os.path.dirname(__file__)
@@ -189,6 +188,8 @@ def save_config(cfg: dict) -> None:
 
 def extract_pdf_text(uploaded_file) -> str:
     """Extreu el text complet d'un PDF pujat amb pdfplumber."""
+    import pdfplumber
+
     text_parts = []
     with pdfplumber.open(uploaded_file) as pdf:
         for page in pdf.pages:
@@ -209,6 +210,8 @@ def extract_events_with_gemini(client, pdf_text: str) -> list[dict]:
         location    : str  – Lloc o null
         description : str  – Descripció breu
     """
+    from google.genai import types
+
     prompt = f"""Analitza el text d'un document PDF que conté informació sobre competicions, esdeveniments o activitats de golf.
 
 Extreu TOTS els esdeveniments, competicions, tornejos, cursos, reunions o activitats que tinguin una data concreta.
@@ -357,7 +360,13 @@ if not API_KEY:
     )
     st.stop()
 
-client = genai.Client(api_key=API_KEY)
+
+
+@st.cache_resource
+def get_client(api_key: str):
+    """Crea el client de Gemini al primer ús i el reutilitza entre rerenderitzacions."""
+    from google import genai
+    return genai.Client(api_key=api_key)
 
 
 # ══════════════════════════════════════════════════════════════════════════════
@@ -409,6 +418,8 @@ if seccio == "📅 Calendari":
         .fc-list-event-title { font-weight: 600; }
         """
 
+        from streamlit_calendar import calendar as st_calendar
+
         result = st_calendar(
             events=cal_events,
             options=cal_options,
@@ -483,7 +494,7 @@ elif seccio == "📄 Importar PDF":
 
             with st.spinner("🤖 Gemini analitzant el document..."):
                 try:
-                    new_events = extract_events_with_gemini(client, pdf_text)
+                    new_events = extract_events_with_gemini(get_client(API_KEY), pdf_text)
                 except json.JSONDecodeError:
                     st.error("❌ Gemini no ha retornat un JSON vàlid. Torna-ho a intentar.")
                     st.stop()
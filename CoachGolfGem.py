@@ -2,10 +2,14 @@ import streamlit as st
 import google.generativeai as genai
 import os
 
-# ---------- CONEIXEMENT DELS VIDEOS DE YOUTUBE (auto-generat) ----------
-KNOWLEDGE = "=== Video 1 (https://youtu.be/Nb4KsqpWv24) ===\n¿Quieres aprender a chipear como un pro? Hago un stand pequeñito, cola centro derecha, pongo las manos un poquito adelantadas y el movimiento va a ser principalmente de hombros. Voy a mover ligeramente la cadera derecha, muy poquito, pero abriremos la cara del palo. Están un poquito alineado a la izquierda del objetivo y abriremos más cadera y los hombros después del impacto. En este vídeo te voy a enseñar los tres tipos de golpe que utilizo yo alrededor de Grim. Quédate hasta el final del vídeo y descúbrelos. Hola a todos, soy Daniel. Aquí estamos una semana más en el canal del T del uno. Hoy os voy a enseñar, como os he dicho, los tres tipos de golpe que utilizo yo alrededor de green. Golpe por bajo, golpe medio y un golpe más por alto, el flop que llamamos. Vamos a empezar por el golpe rodado. Para ello tengo esta distancia de unos 12 m. Voy a intentar botar la bola al principio de green y va a rodar hasta el hoyo. Para ello he cogido un san, pero podéis  cualquier palo de la bolsa, cualquier cualquier hierro o incluso el híbrido para hacer un rodadito que es muy sencillo con un movimiento super pequeñito. La vais a hacer rodar hacia el hoyo. Pero yo quiero el san porque sé que muchos de vosotros se os complica cuando tenéis un tramo de hierba bastante grande en la que tenéis que sobrevolar esa parte de del collarín o de la calle y luego botarla y rodar. Entonces, para esos golpes, el san viene muy bien. Lo primero que hago es me pongo delante de la bola y hago un stance pequeñito. Bola centro derecha. Pongo las manos un poquito adelantadas y el movimiento va a ser principalmente de hombros. Voy a mover ligeramente la cadera derecha, muy poquito, pero el principal movimiento y lo que va a hacer que chipeéis bien es hombros y abriros de caderas un poquito después del impacto. El tiempo que vais a utilizar es 2 1, es decir, eh va a ser el doble de lento la subida que la bajada. Va a ser tal que así el movimiento. Un, dos, un, dos. Va a ser más lento la subida que la bajada. Con ese timing golpearéis bien a la bola. Vamos a colocarnos y vamos a ejecutar el golpe. La quiero botar más o menos por aquí y que luego ruede. Vamos a golpearle a la bola. Me coloco, ¿sabéis? Bola centro derecha, stanch pequeñito, movimiento de hombros y timing 2 1. Ahí tenéis el golpe. Espero que os quede claro. Si tenéis alguna duda, ponérmelo en comentarios y os resolveré cualquier duda que tengáis. Vamos con el siguiente golpe, que será un golpe un poquito más a media altura y que el bote sea más blando. Para ello voy a utilizar el palo más abierto que tengo en la en la bolsa, que es un 58. Y vamos a cambiar un poquito el stans. En esta ocasión la bola la colocaremos al centro, abriremos la cara ligeramente y el stance lo abriremos un poquito a la izquierda, los pies un poquito alineados a la izquierda del objetivo. Después de eso, el movimiento es muy parecido al golpe rodado. Simplemente cambiamos esas dos esos dos fundamentos, la cara del palo más abierta y los pies un poquito encarados a la izquierda del objetivo. Después de eso, el movimiento es muy parecido, el tiempo también, 2 1, pero a diferencia de que después del impacto abriremos más la cadera y los hombros, lo voy a hacer. Voy a pegar un golpe hacia allí para que lo veáis. Vale, ten muy claro eso. El movimiento va a ser muy parecido al rodado, pero abriremos la cara del palo. Stans un poquito alineado a la izquierda del objetivo y abriremos más la cadera y los hombros después del impacto. El punto de bote, obviamente será más cerca del hoyo, no como el golpe rodado y que bote más cerca de bandera. Y ahí lo tenemos. Este tipo de golpe, el último golpe que vamos a explicar es el golpe por alto, el flop. Lo vamos a utilizar cuando estamos en el raf o cuando tenemos un green en alto y queremos hacer subir la bola mucho, darle mucha altura. Para este golpe vamos a cambiar totalmente el stance y cómo colocamos la cara del palo. Vamos a poner la cara mucho más abierta, prácticamente plana, dependiendo de la altura que le queramos dar. Eh, si queremos hacer un golpe que está entre el golpe a media altura y el flop, eh, no queremos arriesgar tanto abriendo mucho la cara. podemos abrir menos o más dependiendo de cuánta altura le queramos dar y dependiendo de la situación en la que estemos. Pero bueno, los las bases eh son las siguientes. Vamos a poner la cara para hacer un buen flop, poner la cara totalmente abierta. Eh, recordar de que tenéis que poner el grip después de colocar la cara abierta, no hacer el error que cometen muchos de colocar primero el grip y luego abrir la cara. Eso te pondrá el grip muy cerrado, muy fuerte y eso no lo queremos para un golpe de flop. Entonces, colocamos la cara del palo abierta, luego colocamos el grip bola al centro izquierda de nuestro stans. Pondremos un poquito de peso al pie izquierdo para evitar esas papas, esos golpes eh detrás que suelen suceder cuando queremos hacer un flop. Entonces, bola centro izquierda, un poquito de peso al pie izquierdo. Colocamos ahí, haremos un backwin un poquito más amplio. Haremos eh intentemos mantener el ángulo de 90º que formamos entre el brazo y la varilla. No es como el chip eh rodado o el chip a media altura que hemos hecho antes. Ahí queremos más amplitud en el backstream para darle más altura a la bola. De esta manera, sin tener que forzar las manos ni las muñecas, la bola subirá automáticamente para arriba. Ahora haréis más altura y de manera fácil podéis sobrepasar el obstáculo que tengáis delante o el green en alto. Tenemos la bola aquí en el raf. la ha colocado ahí un poquito hundidita, como la tendríamos si cae en el raf. Y ahí lo tenemos, el golpe por alto, el flop, la bola ha botado y ha rodado un metrito, como habíamos dicho. Si tenéis alguna duda, decídmelo en comentarios responderé cada una de las dudas, uno a uno. Recuerda suscribirte al canal y si quieres apoyar el TDEL un aprender Golf, tienes mis ebooks en la descripción. Nos vemos la próxima semana. Co?\n\n=== Video 2 (https://youtu.be/1pP_435kO1s) ===\nPues el ejercicio consiste en mover el pat en línea y así te aseguras que le das al centro de la bola. [Música] Ahí más o menos. Vale, perfecto. Los dos ejercicios que habitualmente practico. Repito, uno para moverlo en línea y con la cabeza cuadrada y otra para tocar el centro de la bola. Y a partir de aquí pues ya si quieres miramos un pad de competición afrontar. Ahora hemos visto, digamos, las pases, digamos, para mandar la bola al objetivo. Eh, exacto. Que entre o no entre. Ya depende de 1 si has leído bien la la caída, de la fuerza, pero al menos no podemos salir al campo a competir si no tiramos un pad de menos de 2 m, 2,5 donde quieres, porque si no entonces el resultado nos saldrá. Hola a todos, bienvenidos al canal del T del 1. Hoy nos encontramos en Golf Costa Dorada y viendo lo bien que gustó, lo la demanda que tuvo el vídeo de tips de golf en el que nos centramos en los hueches, yo y Maxim, eh vamos a hacer eh una nueva edición, un nuevo vídeo de tips de golf con David Solz. David, buenas, ¿qué tal? Bueno, ahora lo presentaremos bien. Eh, David es un campeón del mundo de Pichan Pat, eh, un gran pateador. Bueno, de hecho, los que conozcáis el deporte de Pichan Pat sabéis la importancia que tiene el PAT. Y, bueno, al final quien tiene un gran PAT es el que se lleva las victorias. Y bueno, pues en este nuevo vídeo de Tips de Golf nos centraremos en el pad y en, bueno, enseñaros algunos tips, eh, y alguna unos pequeños detalles para que mejoréis vuestro pad y metáis más pads en en vuestras competiciones. Bueno, aquí tenemos a David Solé, eh, como os he dicho, campeón del mundo de Pich, con un gran palmarés en sus 20 25 años como jugador de Pitan Pat. explícanos un poco pues eh cómo cómo es tu manera de patear general, o sea, una breve introducción de por qué eres conocido en ser el Patman o el gran pateador que eres. Sí, esto empezando por el final, esto de Patman vino en un Campeonato de Europa en el 20007 creo en Italia que después de varias rondas pateando muy muy bien, pues los holandeses se picaron y bueno, se picaron. me dieron este apodo de Patman porque con el swing siempre he sido bastante malillo, pero como el pitan pat, como bien has dicho, depende muchísimo más, incluso yo creo que en el golf la importancia de patear bien para sacar un buen resultado, al final si eres fuerte con el pat sacas buenos resultados y yo me intenté centrar en eso, en mejorar mi nivel de pat, mi nivel de patos años y dio sus frutos y tuve un nivel de pat muy alto y gracias a eso me gané ese apodo de Patman. Pues vamos al lío, a los aspectos técnicos. Eh, primero quiero que nos expliques cómo afrontas tú eh un pad cualquiera en competición. El pad, para mí, siempre cuando entrenamos pat es tirar la bola donde quieres. Para mí es una obsesión tirar en pats de menos de 2 m, 2,5, tirar el pat donde quieres. Hay temporadas que metes más, temporadas que metes menos, pero la clave es conseguir que con tu movimiento de pat tires la bola donde quieras. ¿Qué influye para tirar la bola donde quieras? Para mí hay dos aspectos fundamentales, la técnica y la emocional, la mental. Eh, te diría que las dos 50 importancia al principio y luego a medida que ya vas pateando técnicamente bien, pues la mental es es clave, o sea, es difícil de entrenar la parte mental, pero es de vital importancia estar mentalmente preparado a tirar un pat de metro, 1 metro y medio, 2 met, donde quieres, porque al final la presión hace que no movamos técnicamente el pad como hemos aprendido en el pat ingreo y siempre lo comentamos contigo, la parte mental es fundamental. Si viamos en este vídeo un poco la parte mental, que eso ya sería igual cuestión de psicólogos o de que te estés preparado a no a no perder o a no fallar y que mentalmente estés muy fuerte, la parte técnica es tirar el pat donde quieres. ¿Qué consiste eso? Hacer un movimiento eh lo más en línea posible. Sí que es verdad que va un poco dentro y un poco dentro y pegarle con el centro de la cara. O sea, al final tienes que conseguir un movimiento que vaya recto y pegar en el centro, no pegar ni en el talón ni en la punta. Para eso tenemos dos ejercicios que llevamos practicando tiempo, que es el rodillo, que lo llamo yo, que te ayuda a mover el pad en el en el plano adecuado. O sea, si veis, tiene un poco, si le haces tú maidani, tiene un poco de hacia dentro y un poco hacia adentro, pero te ayuda mucho a mover el pat en línea, por ejemplo, eh, para que veamos un pat en línea más o menos. No sé si lo he movido en línea más o menos. Sí. Bueno, cae un poquito a la derecha, puede ser. Este es izquierda, derecha, es un centro izquierda este pat, pero bueno, este ejercicio nos ayuda a mover el pat en línea. ¿Cómo hacerlo? Pues puedes tener grip normal, grip en pinza. Al final has de buscar un grip que te ayude a hacer ese movimiento en línea. Hay cosas que son fallos graves que todo el mundo dicear no te ayuda a llevarlo en línea, estar desconectado del cuerpo. Entonces buscas un buen grip y ahora, por ejemplo, llevo años pinceando, un buen grip estar sólido, o sea, compacto en el cuerpo, no van a estar con los codos fuera, porque no es que no valga, al final todo el mundo puede patear como quiera, pero no te va a ayudar a ser tan consistente en moverlo en línea. Entonces, si tú buscas una postura que con los codos estés bien compacto al cuerpo y con los hombros, con las manos muy neutras, lo puedas mover más o menos en la línea de que estás apuntando. Y el otro, de hecho, hay dos maneras, ¿no? Como de, o sea, digamos que si tú tu movimiento es muy malo, puedes hacer el movimiento con el pad pegado a a la barra, ¿no? El ejercicio puedes empezar o o recto así y entonces viendo vas viendo las presiones dónde las ejerces y más o menos presionas igual es que ahora estás moviendo bien y luego lo que haces es sacarlo un dedo o dos, intentas mantener la misma distancia tanto en el backswing como en el follow. Claro. Y este además este rodillo que lo recomiendo mucho, que me viene de Joel Girbao, que es un jugador profesional que le ha ido muy bien el pad me lo recomendó él ayuda a también mantenerla, o sea, porque puedes moverlo en línea, pero cerrando la cara o abriéndola. Claro, pues estas líneas de aquí te ayuda a moverlo en línea y cuadrado. O sea, aquí tienes que estar cuadrado y aquí tienes que estar cuadrado porque de nada sirve moverlo en línea. Si aquí cierras y lo llevas en línea con la cara del pado por la izquierda o al revés moverlo abierto y llegar en línea también, pero con la cara abierta. O sea, son lo que explicaba al principio, tienes que moverlo en línea y tienes que moverlo con la cara cuadrada. Eso te ayuda a pegar en el centro de la bola y que la bola salga donde quieres que salga y tires los patas apuntado. Pues el ejercicio consiste en mover el pat en línea y así miramos un pat de competición afrontar. Ahora hemos visto, digamos, las pases, digamos, para mandar la bola al objetivo. Exacto. Que entre o no entre. Ya depende de 1 si has leído bien la la caída, de la fuerza, pero al menos no podemos salir al campo a competir si no tiramos un pad de menos de 2 m, 2,5 donde quieres, porque si no entonces el resultado nos saldrá. Vale, pues vamos a un pat, no sé, mira, por ejemplo, desde aquí marco la bola, estaría marcada y me voy siempre detrás de la bola a una distancia razonable. Veo muchos jugadores que se ponen supercerca y aquí no tienes una buena perspectiva de la ca Exacto. Si te pones tan cerca, digamos que no puedes alinear bien la bola a donde quieres tirarla o y ves también la caída, o sea, desde aquí es más difícil ver la caída. Así que luego veré la parte final del pad, que eso sí que me gusta verlo, pero lo que intento ver a unos 2 3 met, consejo de Emilio, es ver un poco la caída y digo y entonces la les siempre me pillo más de la de atrás porque hay muchos jugadores que la miran desde el otro lado, pero para mí es más fiable la lectura desde atrás. Una vez lo he visto que veo que es más o menos recto o centro derecha, me aseguro sin chafarme la línea de los últimos dos palmos. Intento ver siempre los últimos dos palvos porque son los que tienen realmente importancia final, sobre todo es donde más cae, ¿no? Cuando pierde la fuerza a la bola, ¿correcto? O sea, en un pato, igual en ese patías en una primera lectura, pero en este pat me aseguraría viniendo aquí que la parte final de los últimos eso, los últimos tres palmos es conforme lo he leído yo o hay algo ahí. Claro. Entonces, una vez ya tengo esa lectura, eh, no soy de poner la línea porque la línea en la bola, que lo hacen todos los profesionales de golf, a veces me lo he planteado, tardo mucho tiempo en poner la línea donde estoy. Entonces, es tu detallito, ¿no? De es mi detalle que lo copié de otro jugador internacional de Peach que en lugar de para alinearte bien, porque muchos jugadores también cuando damos clases de Patti y vemos, nadie está alineado donde cree que realmente está apuntando. Cuesta mucho. Exacto. Al final es clave estar al menos ya de inicio, bien, con un buen stand, compacto, como he dicho, y que estés apuntando con el pad a donde quieres tirar el pad, porque si no de nada sirve todos los otros ejercicios si ya estás alineado mal. Entonces, o te pones la línea en la bola y pierdes tiempo alineándote con la línea o haces mi truco que es más casero, que es pongo, ponte aquí, Dani, si lo verás, pongo la línea de pat en el centro de la bola apuntando más o menos donde creo que va a ir a Aquí hemos dicho centro derecha, pues aquí yo ya sé que estoy bien, digamos que con esta línea de aquí, ¿no? alío a centro derecha creo que es la caída atrás. Pero claro, no tienes problemas porque tú otros jugadores hacen así, pone la línea, míralo, pone la línea, sí, y están ahí, pero tienes la línea es muy difícil de ver y estás todo el rato tocándola y hay mucha variación. A mí la línea me pone nervioso, entonces prefiero poner el logo de la bola, que es un poco indefinido porque no está en línea recta. Sí, pero ¿no has dicho antes que es difícil eh apuntar estando tan cerca de la bola? Claro, tú cuando te alineas la cara del palo la caída para ver la caída. Pero yo aquí ya sé que con la línea y poniéndome muy plano, ya veo que estoy apuntando a realmente donde la caída. Eso era para leer la ca. Entonces, lo que hago esta y esta línea una vez, o sea, cuando te estás agachando y apuntando con esta línea, eh, ¿miras hacia el hoyo o buscas un punto de referencia por aquí? miras hacia hoy miro hacia el hoyo. Se podría  un punto de referencia, pero miro hacia el hoyo, no lo toco y sé que no lo he tocado. Entonces, a veces compruebo contigo mismo decir, pues ahora sé que lo tengo recto o centro derecho. Entonces, yo ya sé que que haciendo este ejercicio ya estoy bien alineado. Ya vengo aquí y ya sé que estoy bien alineado. Y a partir de aquí es ejecutar lo que hemos practicado aquí antes. Lo típico, bola al ojo izquierdo en la vertical, eh, cabeza quieta, postura compacta y entonces ya ejecutar, intentar ejecutar lo mejor que puedes el Vale, lo has tirado un poco ahí. Ahora lo cortas y y lo y esto lo voy a meter. Sí, sí, lo voy a meter. No, no. Vale, ahí estaría. Perfecto. Pues esas serían, digamos, la las bases o en lo que te centras tú en un pad eh de competición, ¿no? Es el de alinear la cara hacia donde quieres ir. que hay dos sistemas, o con la línea de la bola, una línea así o yo recomiendo este, es el que todos los profesionales de golf hacen, pero a mí me ponen Sí, pero le le cuesta mucha gente alinearse con esta línea tan pequeñita. Sí, hay que hacer o si haces una gorda más larga con un retulador, ¿eh? Pero bueno, pues el método de David que le funciona super bien, recomiendo a todo el mundo. El mío es de handicap 36, pero es efectivo. Pero sí, al menos a ti te funciona, pero bueno, yo sé que estoy alineado, entonces yo no he movido el pad. Otra cosa, ni ponerlo hacia la punta, ni ponerlo hacia el talón, o sea, que que respire igual la altura en los en las dos bases del pad, porque ve mucha gente así. Al final en el pan no hay normas escritas, pero sí que todo te ayuda, si lo haces más o menos estándar a que seas más consistente. O sea, claro que luego hay gente que patea, sí, porque incluso hay grandes pateadores del PJ Tour, se la han visto con posturas como muy curvadas, con la cara abierta, pero que luego en el impacto la cuadran. Entonces, es que no hay sistema. Al final tú vas a encontrar tu sistema para tirar la bola donde quieras con la máxima consistencia y repetitivas veces posible. Entonces, lo normal es estar alineado, pero puede haber gente que patea así. He visto a jugadores que patean exagerando mal, alineados o lo que dices tú, abiertos o yo he estado cerrado muchas veces y pero luego la cuadras en el impacto. Luego cuadras. Al final hay que llegar, hay que tirar la bola donde quieras, que sistema el que a ti te vaya bien, pero no te vayas del pating game sin que la bola vaya donde quieras de forma regular y que luego en un momento de presión lo puedas repetir. Perfecto. Muchas gracias, David. Espero que os haya gustado este nuevo vídeo de la serie de tips de golf y nada, pues nos vemos en el siguiente vídeo. Muchas gracias. H luego. Adiós.\n\n=== Video 3 (https://youtu.be/pNcnpTgGMmY) ===\nHola muy buenas soy Fernando Galiano profesor de golf y hoy os voy a enseñar la diferencia del chip approach y el [Música] flop Bueno hoy vamos a ver la diferencia entre el chip approach y flop Entonces vamos a hacer diferentes situaciones porque la mayoría de los jugadores toman muy mal las decisiones cuando estamos cerca del Green y así regalamos muchos golpes al campo y hay que intentar de no regalar muchos golpes porque ya bastante complejo es este deporte entonces hoy os voy a enseñar en las diferentes situaciones qué golpe deberíamos de hacer vale en este caso vamos a analizar un poco eh esta situación la bola está muy cerca del Green pero la bandera está larga está al fondo del Green Entonces yo tengo mucho espacio para rodar la bola siempre en Golf hay que intentar de eh hacer el menos s posible porque contra menos swing menos margen de error vas a tener si es más amplio más grande el error será mayor entonces aquí estamos muy cerca de Green y la bandera al final vamos a aprovechar que tenemos mucho Green para rodar la bola entonces lo que vamos a hacer es vamos a un palo un poco más cerrado en vez del S vamos a un hierro nu un hierro 8 dependiendo de todo lo que tengamos que rodar analizamos bien miramos Dónde tiene que ser el punto de bote siempre intentamos de que sea desde el anillo a un metro más o menos si apuramos mucho aquí en el anillo puede botar justamente en el escalón y puede salir la bola un poco más fuerte entonces hay que intentar de botarla desde el principio a 1 metro más o menos cojo el palo un poquito que tenga menos grado por ejemplo sería el nu o el 8 me coloco apuntando y para que la bola salga un poco más baja y que ruede un poco más lo que vamos a hacer es colocar la bola al pie derecho manos adelantada y el peso a la izquierda y así la bola va a salir más baja y va a rodar un poco más vamos a golpear una a ver qué tal sale le voy a dar un pelín de caída apunto un poco a la izquierda bola al pie derecho manos adelantadas y el peso a la izquierda a ver qué tal swing muy corto vale swing cortito y la Bola acaba al lado del Hoyo porque hemos tomado una buena decisión hemos cogido un palo que está un poco más cerrado ahora vamos a ver una situación de approach bueno ahora en esta situación la bola no está tan cerca de Green entonces necesitamos volar necesitamos que la bola vuele un poco para que bote el principio de Green y que vaya rodando hacia la bandera no tenemos tanto margen de Green es decir aquí vamos a intentar de aprovechar el Green Pero qué es lo que pasa que el Green comienza demasiado lejos Comparado con antes el Green comienza más o menos a unos 7 o 8 m entonces necesitamos Ahora sí necesitamos el San para que la bola salga un poco alta que bote más o menos principio de Green y que la bola vaya rodando hacia la bandera la bandera ahora no va a estar no está al fondo no tenemos tanto margen de Green Entonces ahora vamos a necesitar el s y un medio swing más o menos para botarla a unos 10 m más o menos hacemos medio swing y que el palo siempre vaya con ritmo todo lo que subimos tenemos que acabar Vale entonces colocamos la cara del palo y vemos que el s tiene mucho más grado entonces la bola va a salir sola hacia arriba no podemos intentar de levantarla con el cuerpo es decir yo aquí no puedo levantarla con el cuerpo yo tengo que intentar de mantener el cuerpo giramos y la Bola se va a levantar sola debido a la cara del palo que tiene muchos grados voy a golpear una miramos la bandera y Med o incluso un poco menos bueno y en esta situación vemos que la bola está aquí perfecta justamente por delante tenemos un obstáculo y la bandera está al principio del Green Entonces tenemos muy poco margen de Green para rodar la bola entonces necesitamos una bola muy alta para intentar que caiga a plomo la bola y que no ruede mucho entonces para eso vamos a necesitar el palo más abierto de la bolsa que en este caso es el San en mi caso tengo el 58 gr entonces abro más la cara del palo para darle más grado al palo entonces en vez de 58 vamos a intentar de ponerle 62 64 gr o incluso más más si la queremos mucho más alta le damos más entonces pero más o menos abriendo un poco la cara del palo al abrir la cara del palo mi cara del palo va a apuntar a la derecha fijaros mi cara del palo se va a abrir y ahora la cara va a estar apuntando a la derecha Entonces al apuntar a la derecha mi cuerpo para compensar la cara del palo y que la cara del palo apunte al objetivo lo que vamos a hacer es apuntar con todo el cuerpo a la izquierda y así la cara del palo va a apuntar al objetivo qué es lo que vamos a hacer para Porque si abrimos la cara del palo la cara la bola va toda la fuerza no va a ser para ganar distancia sino va a ser para arriba Entonces qué es lo que tenemos que hacer tenemos que hacer mucho más swing le tenemos que dar velocidad abajo para que la bola haga más distancia va a salir alta pero pero al darle con más swing la bola va a ir ganando un poco más de distancia Pero va a salir mucho más alta entonces voy a abrir la cara del palo con todo el cuerpo voy a apuntar a la izquierda y ahora voy a hacer como de l a L y tengo que darle velocidad en la bajada vale de aquí de l a L Vale y la Bola va a salir muy alta y va a caer a plomo y no va no va a rodar apenas este golpe muy difícil de calcular la fuerza por eso necesitamos entrenar muchísimo haciendo globos Vale entonces abrimos la cara del palo y la Bola va a salir muy alta de l a L y velocidad y la Bola cae a plomo y no Rueda casi nada que no se os olvide arreglar el pique porque sobre todo cuando la bola cae a plomo baja con muchísima fuerza y si el Green está hablando vamos a dañar el Green entonces que no se os olvide arreglar el pique porque luego queremos patear y que que la bola ruede bien Así que muy importante respetar las normas del campo si te ha gustado este vídeo dale like y suscríbete para más contenido y nos vemos en el siguiente vídeo\n\n=== Video 4 (https://youtu.be/u4mvIC71Ny8) ===\nHola, muy buenas. Soy Fernando Galiano, profesor de golf y hoy le vamos a poner solución a los socket, a los sank, a los cañazos. ¿Cómo le vamos a poner solución? pues haciendo unos ejercicios y también os voy a dar unos consejos para cuando estemos agobiados en el campo de tanto pegar socket, os voy a dar un pequeño consejo para intentar de solucionarlo en el momento. [Música] Lo primero, ¿qué es pegar un socket shank, un cañazo? Es cuando contactamos con el cuello del palo, cuando yo voy a golpear y contacta el cuello del palo con la bola y la bola sale directamente a la derecha y no tiene ni una opción de  calle ni green. Entonces, ¿cómo vamos a solucion? Bueno, primero vamos a explicar por qué suceden esas cosas y hoy os voy a explicar cuatro causas que son las principales por las cuales yo pego shank. Yo le pego con el cuello del palo. Vamos a empezar por la primera. La primera es, fijaros, esta es mi posición neutral y si yo me coloco muy cerca, fijaros dónde está ahora mi cara del palo. Mi cara del palo está por esta parte de la bola y la bola, el cuello del palo está mirando a la bola. Si yo estoy muy cerca, no voy a tener espacio para mover las manos, con lo cual le voy a pegar con el cuello y la bola va a salir directa a la derecha. Entonces, la primera causa es porque podemos estar un poco cerca de la bola y no tenemos espacio para mover las manos. Segunda causa por la cual podemos pegar socket o shank. Fijaros, esta es mi posición. Ahora me voy a colocar bien enfente de la bola, me voy a dejar espacio, pero claro, yo voy a subir, subo en esta línea y en la bajada lo que voy a hacer es que mis manos y mis brazos como que vayan en otra línea. Si yo subo mis manos y mis brazo por esta línea, yo subo y bajo más o menos por la misma línea. Pero si yo subo por esta línea línea del palo y bajo con mis manos muy separadas de la línea de la subida, bajan por aquí, vamos a estar en el mismo problema de antes. Vamos a golpear con el cuello del palo. Fijaros bien. Vamos a poner un círculo aquí en las manos donde empiezan, donde continúan y momento de la bajada. mis manos en mi bajada, en mi downs mis manos están como muy separadas. Lo estoy haciendo muy exagerado para que lo veáis. Y mirad dónde contacto contacto con el cuello del palo. Entonces ahora mismo estoy muy bien colocado. Hago muy buena subida por la línea. Perfecto. Pero en la bajada cambio un poco la trayectoria de mis manos, ¿no? Bajo por la misma línea de la subida. Entonces, si tú cambias la posición de las manos, van a llegar muy separadas del cuerpo las manos, con lo cual eso va a hacer que el impacto sea con el cuello. Y ya tenemos ese socket o shank. La tercera causa es si yo me coloco normal, pero hecho demasiado peso en las puntas de los dedos de los pies, pues claro, me voy a echar como muy encima de la bola y va a pasar exactamente lo mismo. Voy a llegar y voy como como estoy muy encima de la bola, no tengo espacio aquí para pasar las manos porque me estoy cayendo encima de la bola y claro, al no tener espacio, pues mis manos se van lejos del cuerpo y vamos a contactar exactamente igual con el cuello del palo. Fijaros, a mí siempre me gusta colocar el peso un poquito en las puntas, pero más o menos sentirlo como en el nacimiento de los dedos de los pies. más o menos por aquí, un poquito adelantado. Si yo me he echo como muy hacia delante, hecho el peso muy adelante, va a pasar exactamente lo mismo de antes. Golpeo y me vengo como muy encima de la bola y voy a golpear con el cuello del palo. Entonces, siempre es importante de una vez que estoy el peso 50 repartido, hecho un poquito hacia delante, un pelín y ya lo tenemos. Yo me voy a echar muy encima y claro, fijaros dónde se coloca ya el palo, casi en el cuello. Entonces, yo voy a golpear, no tengo espacio y ya llego contactando con el cuello del palo. Y claro, si yo me echo muy encima de la bola, pues el palo va a llegar muy fácil al suelo y voy a sacar mucha chuleta. va a ser fácil de llegar por debajo de la bola, pero claro, no queremos pegar el socket, así que por eso hay que echar un poquito el peso hacia delante, no todo el peso hacia delante. Cuarta y última causa. Esta no es muy común, no lo suelo ver yo mucho en los principiantes, pero bueno, la la voy a decir porque también suele pasar menos, pero suele pasar. Y es por exceso de rotación. Cuando tú mueves mucho las manos, rotas demasiado las manos. Fijaros que la cara del palo abre mucho y cierra mucho. Entonces, claro, está muy poco tiempo la cara del palo cuadrada. Yo abro y voy cerrando cuadrada y ya cierra. Entonces está nada, muy pocos centímetros la cara del palo cuadrada. Entonces, si no controlamos eso muy bien, ¿qué es lo que va a pasar? Por exceso de rotación, yo puedo llegar con las manos aquí un poquito delantada. La cara del palo todavía está muy abierta y puedo contactar con el cuello del palo y la bola sale disparada a la derecha. También puede ser que la bola salga a la derecha porque claro, la cara del palo también llega abierta, pero si llegamos con la cara del palo muy abierta, lo primero que va a llegar va a ser el cuello y luego la cara del palo. Entonces, hay que intentar derrotar, pero tampoco en exceso. Entonces, vamos a hacer rotaciones, pero intentar que la cara del palo se mantenga más tiempo cuadrada. Desde aquí yo subo, cuadro más o menos en la línea del pie derecho, sigue cuadrada hasta la línea del pie izquierdo y ya cierro. Entonces ya va a estar todo este tramo con la cara del palo cuadrada hacia el objetivo. Vamos a intentar hacer eso para que la la bola no salga directa a la derecha. Aquí cuadrada, cuadrada y cierro. Mac y la bola sale mucho más recta. Ejercicio número uno para eh no pegar más socket ni shank. Eh, como veis, he colocado aquí dos bolas y más o menos a la distancia de casi una cara del palo. Yo tengo que ver que si estoy a esta bola, puedo golpear perfectamente y esta la puedo pegar un poco más y si yo le pego a esta bola, le puedo pegar perfectamente. Entonces, hemos dicho, sobre todo el error principal del socket es que golpeamos en el cuello porque la línea de las manos cambian y se van como muy lejos del comienzo. Ese es el error como principal, porque o me voy adelante o hecho el peso demasiado en las puntas o estoy muy cerca de la bola. Entonces, siempre nos vamos a dejar un poquito de distancia y lo que vamos a trabajar en este ejercicio es que las manos se vayan acercando al cuerpo. Si mis manos comienzan en esta línea, mis manos en el momento del golpeo tienen que venir mucho más cerca del cuerpo para evitar pegar con el cuello. Entonces, primer ejercicio es me voy a colocar a la bola más lejana de mi cuerpo. Me voy a colocar normal o incluso me echo un poquito para atrás porque ahora voy a colocarme a esta bola, pero tengo que golpear a la bola más cercana de mi cuerpo, con lo cual estamos trabajando que aquí comienzan mis manos y tengo que golpear con mis manos mucho más cerca del cuerpo y así vamos a corregir ese socket. Entonces, vamos a intentarlo. Me voy a colocar normal a esta bola y me voy a echar un poquito para atrás aquí. Perfecto. Y ahora suave, despacio porque tengo que cambiar la línea de mis manos. Perfecto. Un poquito con la cara del Pablo abierta, pero el impacto buenísimo. En este segundo ejercicio, una vez que ya hemos repetido varias veces este método, el primer ejercicio que es colocarme a esta bola y luego golpear a esta, pues ahora en este segundo ejercicio lo que vamos a hacer es me voy a colocar, voy a colocar la cara del palo para que la bola esté justamente en el centro, en el sweet spot, en el punto dulce de la cara del palo. Y ahora esta bola me la voy a acercar un poquito ahí, que pueda golpear esta bola sin ningún problema, sin contactar con la otra bola. Entonces, si yo voy a golpear y contacto con el cuello, le voy a dar a esta bola también. Entonces tengo que intentar de golpear y si contacto en el centro de la cara del palo no voy a contactar con esta bola, con la bola más lejos de mi cuerpo. Entonces tengo que estar muy concentrado para colocarme a esta bola y golpear a esta bola. Así que venga, vamos a intentarlo. Me coloco ahora todo normal. Yo me voy a colocar sin colocarme un poquito más lejos, sino perfecto. Me coloco y tengo espacio suficiente para no golpear a esta, sino solamente a la que estoy colocado desde aquí. Perfecto. La bola se queda en el mismo sitio y yo contacto eh a la bola en la que estaba colocado. Así que ahora nos vamos. Una vez que ya hemos hecho estos ejercicios varias veces, hemos golpeado varias bolas, nos vamos al campo porque os voy a dar un ejercicio, bueno, o un pequeño consejo. Os voy a dar algún consejo para cuando estemos un poquito bloqueados de siempre socket, socket, socket y ya estamos bloqueados mentalmente, os voy a dar un pequeño consejo para intentar de olvidarnos del socket. Ya estamos en el campo y ahora os voy a dar un consejo para cuando estamos pegando socket, socket sank sank bolas directas a la derecha. Entonces, eh antes de colocarnos a la bola, vamos a  alguna referencia, como por ejemplo una flor, eh una pequeña chuleta o una piña o una piedra, una rama, una hoja, algo. Por ejemplo, aquí tengo como una pequeña matita. Pues me voy a colocar a esa mata y vamos a hacer el mismo ejercicio que antes. Me coloco y el palo tiene que pasar por esta parte, por la parte entre la mata y mis pies, es decir, por aquí para que mis manos se vayan acercando. Desde aquí yo me coloco eh a esa flor, a esa matita y desde aquí el palo no le da al a esta matita, sino le da aquí por esta parte. El palablo pasa por esta parte, con lo cual ya estamos interiorizando ese ese nuevo movimiento de las manos comienzan aquí y quiero que las manos lleguen un poquito más cerca eh de mi cuerpo. Entonces, una vez que he hecho tres, cuatro veces ese swing, asegurándome que mi palo comienza aquí y el palo pasa por esta parte, me voy a colocar a la bola y le vamos a dar. Y la bola debería de salir perfecta o por lo menos deberíamos de mejorar en el impacto porque es cierto que cuando entras en el bucle de socket socket socket socket te puedes agobiar y te puedes bloquear un poquito mentalmente. Así que nada, espero que te sirvan estos ejercicios, espero que te ayuden muchísimo y si es así, coméntalo, déjalo en los comentarios y envíale este vídeo a ese amigo o compañero de partida que solamente pega socket en los partidos. Así que eh os dejo por aquí, nos vemos en el siguiente vídeo, así que dle like y suscribiros. Ciao. Ciao.\n\n=== Video 5 (https://youtu.be/ED63gIMfbf8) ===\nHola, muy buenas. Soy Fernando Galeano, profesor de golf y hoy vamos a hacer tres ejercicios para mejorar el impacto, para que el impacto sea centrado y no perdamos distancia. Después de hacer los tres ejercicios, vamos a chequear con algunos juguetitos que tengo en la bolsa, vamos a chequear si el impacto conseguimos que sea en el centro de la cara del palo o si no ha servido para nada los ejercicios. Así que bueno, vamos a comenzar con los ejercicios y luego chequeamos si es el impacto correcto en el centro de la cara del palo. Para este primer ejercicio vamos a necesitar dos dis. ¿Y dónde lo vamos a colocar? Pues me voy a colocar primero que la cara del palo, el centro de la cara del palo esté justamente alineado con el centro de la bola y ahí estaría perfecto la cara del palo. Entonces, una vez que colocamos bien la cara del palo, vamos a colocar el ti. Más o menos nos dejamos como medio medio dedo de margen en desde la punta hasta el ti tiene que haber como medio dedo de margen y otro ti. exactamente igual, paralelo a la varilla. Veis que lo pongo un poco inclinado y este ejercicio es para mejorar el impacto, que sea mucho más en el centro y que se vea perfectamente cuando golpeo en la punta. Vamos a ver que voy a contactar con este T y cuando golpeo más con el cuello del palo, vamos a ver que voy a contactar con el T que está más alejado, más alejado de mí. Entonces yo tengo que pasar con el palo entre medio de esos tis. Vamos a hacer primero unos de práctica. Me voy a colocar entre los dos tis. Perfecto. Y varios de práctica y que el palo pase por ahí. No puedo tocar los tis. No puedo tocar. Hacemos varios suines y ahora nos colocamos la bola y le vamos a dar y vamos a ver qué tal sale la bola y qué tal pasa el palo por ahí. Ya vemos que hemos sido capaz de pasar el palo por ahí, así que vamos ahora. Perfecto. Los t siguen en el mismo sitio y hemos podido pasar el palo por el medio. Así que ejercicio perfecto. Pasamos al segundo ejercicio y este en este ejercicio vamos a necesitar una toalla. Eh, no os asustéis, está un poco sucia, la verdad que lo tengo que la tengo que poner a lavar. Así que vamos a colocar la toalla a la distancia de una cara del palo. Yo me voy a colocar, coloco aquí la cara del palo y ahí tiene que estar la toalla. Entonces, este ejercicio es para mejorar el ángulo de ataque, para que ese ángulo de ataque sea totalmente descendente. Entonces, yo me coloco, tengo que bajar, no puedo contactar con la toalla y tengo que golpear bola y saco la chuleta por delante. Siempre en todos los impactos hay que intentar que la chuleta siempre esté por delante de la bola. No vale que el impacto sea primero en el suelo y luego la bola. Eso nos va a hacer perder muchísima distancia. Entonces, para eso coloco la toalla. La pongo ahí un poco pegada al suelo aquí. Y ahora vamos a hacer ese ángulo de ataque descendente. Vamos a hacer varios unes de práctica aquí. Perfecto. Siempre tengo que contactar como por delante de la varilla. Perfecto. Y ahora vamos a la bola y a ver si así el impacto es bola suelo. Va, perfecta. Eso sí, reparamos la chuleta. Pasamos al tercer y último ejercicio. Para este ejercicio vamos a necesitar un ti. Y claro, en el ejercicio anterior estábamos trabajando el ángulo de ataque, pues en este ejercicio es algo parecido. Entonces, como antes queríamos golpear para arriba porque si no le dábamos a la toalla, ahora tampoco quiero golpear para arriba con este ejercicio que vamos a colocar el ti en vez de una cara del palo por detrás, ahora va a ser una cara del palo por delante de la bola aquí. Y es porque antes no querías tocar la toalla, pero tampoco lo más seguro que más de una vez pegarás alguna bola filazos porque tampoco quieres golpear el al suelo. Entonces para no golpear solamente la bola, voy a colocar un ti. Voy a quitar ya la toalla y la voy a echar a lavar y vamos a golpear bola. Toco el suelo y levanto el palo del suelo hasta que toque el tí. Toco el tí y ya levanto el palo. Entonces, con esto vamos a conseguir que el palo llegue al suelo, porque yo necesito golpear bola y suelo hasta quitar el ti de ahí. Si yo, por ejemplo, pego un filazo, solamente toco la bola, fijaros que el TI no se mueve. Entonces, yo necesito llegar, profundizar abajo, pegar bola, suelo y ti. Y vamos a intentar demandar lo más lejo posible ese ti. Así que me voy a colocar una bola y vamos a pegarle. Ya se ha visto claramente en la cámara lenta que la bola ha salido perfectamente. El T está muy lejos, eh, así que siempre hay que tener esa intención de golpear hacia abajo y mantengo ese palo por debajo, no golpeo bola y ya me vengo hacia arriba con con los codos. No flexiona aquí el codo, sino yo golpeo y estiro aquí los brazos. La el punto más bajo del arco de Swing siempre tiene que estar por delante de la bola para golpear descendente y que la bola salga comprimida, que salga muy lejos, salga muy fuerte. Entonces, me coloco y para abajo. Así que ahora me voy a quitar todo esto y vamos a chequear a ver si el impacto es en el centro de la cara del palo. Pues bueno, vamos a chequear dónde es el impacto y para eso tengo estas lentejuelas o le puedo colocar una pegatina al palo para ver porque bueno, se queda marcado dónde impacto. Entonces, ya vamos a ver dónde golpeamos, si en el centro de la cara al palo, en la punta o un poco en el cuello o si es un poco filazo o le pego demasiado por arriba la bola. Pero claro, al estar la bola en el suelo, pues va a ser muy difícil golpear como muy por arriba. El palo tiene que pasar como muy por debajo. Así que bueno, a ver, a ver dónde impacto. Le voy a colocar esta pegatina al palo y a ver dónde es el impacto. Venga, primero le vamos a pegar con la pegatina y a ver dónde es el impacto. No ha tocado nada bien, ¿eh? Fijaros. Venga, segunda oportunidad. A ver si consigo contactar bien con la bola. Venga, vamos. Me voy a concentrar al máximo. Esa mejor, ¿eh? Esa mejor. Ya toca un poquito el círculo. Fijaros aquí. Pero yo creo que la pegatina debería estar un poquito más abajo porque tiene que coincidir con la cuarta estría. Mm, sí, es un poquito cerca del cuello, pero no está nada mal. Ya está mucho mejor, eh, ese impacto. Y ahora vamos a pasar a a las lentejuelas. Vamos a colocar la bola aquí en el punto del medio y claro, mi palo tiene que entrar justamente entre estas dos líneas. Desde ahí tiene que sacar la chuleta por aquí, desde aquí, más o menos entre las dos líneas amarillas y tiene que salir el palo por ahí. A ver si soy capaz de conseguir esta chuleta. Venga, deseadme suerte porque no estoy nada fino, ¿eh? Siempre colocamos la línea de la plantilla con la línea de mi objetivo. Es la misma línea, es la línea del objetivo. Y ahora nos concentramos en golpear un poquito de ascendente. Con esto vamos a ver si el impacto es en la punta, en el talón o incluso por detrás o si pegamos filazos. Venga, por detrás, por detrás. Madre mía. Fijaros donde debería de haber impactado, justamente aquí. Y he impactado muy por detrás. Venga, vamos a pegar otra porque vaya tela. Venga, segunda oportunidad. Vamos. Ahí un poquito mejor. He pegado justamente en el punto, así que no está nada mal. Fijaros. Punto donde estaba la bola. Y una vez que entro con el palo justamente debajo de la bola, saco la chuleta. Perfecto. Y fijaros, puede ser que el impacto sea un poco en la punta, un pelín, ¿eh? Porque por aquí va mi palo y la línea está como más cerca, no está como en el centro de la cara del palo, sino está un poco más en la punta. Así que hay que mejorar muchísimo. Tengo que entrenar mucho con estos tres ejercicios. La verdad que las Navidades no me han sentado nada bien. Así que nada, eh, que no se te olvide suscribiros y darle like. Nos vemos en el siguiente vídeo. T\n\n=== Video 6 (https://youtu.be/Joc50kdFE2c) ===\nHola, muy buenas. Soy Fernando Galiano, profesor de golf y hoy os voy a enseñar a cómo sacar la bola desde el raf. Vamos a hacer golpes largos y golpes cortos. Así que muy atentos porque os voy a decir qué palo tenemos que jugar en cada situación, cuando la bola está hundida, cuando la bola está perfecta, cuando estamos cerca de green, cuando estamos lejos de green, cuando tenemos alguno obstáculo por delante. Así que muy atentos porque os voy a dar algunos trucos esenciales para que podáis salir desde el raf sin ningún problema. [Música] [Música] Lo primero que tenemos que hacer es ver cómo está posicionada la bola y dependiendo de cómo está posicionada la bola, vamos a usar un palo u otro. Por ejemplo, eh tenemos la primera bola que está muy hundida, con lo cual, bueno, estamos primero en un golpe largo, más o menos tenemos como 200 m a greno, incluso un poco más. Eh, cuando la bola está hundida es totalmente imposible sacarla con una madera. La bola no va a salir. De todos modos, voy a pegarle ahora una bola con la madera y vais a ver que la bola no va a subir absolutamente nada. ¿Por qué? Porque cuando yo voy a golpear, yo tengo que pasar por toda esta hierba y cuando golpeo y voy golpeando la hierba, la cara del palo se me va a cerrar. Con lo cual, si yo cojo un palo que tiene muy pocos grados y además yo voy tocando la hierba, el palo se va a ir cerrando y va a tener cada vez menos grado, entonces la bola no va a subir. Con lo cual, cuando la bola está hundida, yo necesito eh un palo que esté más abierto, es decir, que tenga muchos grados. Entonces, me he traído el 54º. ¿Por qué? porque voy a ir mucho más directo a la bola. Se me va a cerrar un poco la cara del palo, es decir, voy a llegar con menos grados, pero claro, es un palo que tiene muchos grados, con lo cual voy a perder 5 o 6 gr, pero la bola va a salir. Me da igual no llegar al al objetivo, pero lo que sí quiero es salir de este obstáculo, porque al fin y al cabo el raf es bueno, como una pequeña penalización por no calle. Entonces, si yo cojo un hierro si, si vas muy fuerte de manos, el palo llega muy veloz ahí abajo de la bola, puede salir la bola, pero va a costar mucho trabajo ya dependiendo de la velocidad que tengas. Entonces, yo tengo aquí tres bolas y voy a pegar una bola con el San, una bola con el siete y una bola con la madera tres, estando la bola hundida. Y vamos a ver cómo van a salir las bolas. Madera tres va a salir muy baja y no va a hacer apenas metros. Hierro siete, si llegas muy rápido con las manos para que el palo pase por abajo veloz, puede salir la bola, pero obviamente no vas a hacer tus metros porque al tocar tanta hierba te va a frenar el palo. Y con el san, bueno, es solamente para sacar la calle, pero la bola vais a ver que va a ir mucho más alta. Eh, una cosa muy importante, cuando la bola está hundida, tenemos que ir como muy directo a por la bola, es decir, muy directo hacia abajo. ¿Para qué? Para que mi palo profundice y así la bola salga un poquito alta, que eso es un poco el objetivo, porque si yo llego muy justo solamente peinando el raf, la hierba, le vamos a dar con el filo. Entonces, la bola no va a hacer sus metros. Yo tengo que intentar de sacar chuleta, sacar petróleo fuerte abajo para que la bola suba. Venga, vamos a hacer esas demostraciones. Vamos a comenzar con eh la madera tres. La bola se va a hundir. Ahí está hundida. No sé si la veis en el en desde ahí, desde la cámara, pero la bola, la verdad que está muy hundida, así que hay que llegar por abajo. Venga, vamos a intentar pegar la madera tres a ver qué tal sale. Bueno, no ha ido tan mal, tan mal. También es cierto que hay veces que este raf está mucho más alto. Yo creo que está casi recién cortado, con lo cual el palo puede pasar mejor. Hay que ver muy bien eh cómo está eh el RAF, si está muy denso o no. Aquí eh está la bola hundida, pero bueno, no hay tanta densidad de hierba, no hay mucha hierba, entonces por eso la bola eh sale. Pero vamos, ya habéis visto que la bola eh sale muy baja. Venga, vamos a pegar otra. Me voy a hundir la la bola. Vale, ahí. Y ahora con el hierro 7. La bola debería de salir más eh más alta que la madera tres, pero claro, yo voy a intentar de llegar la con la máxima velocidad para que el palo pueda pasar bien. Se me va a cerrar un poco la cara del palo. Entonces, al tocar mucha hierba, yo voy a intentar de agarrar un poquito fuerte el palo, eh, porque claro, con las manos blandas se te va a quedar enganchado el palo. Entonces, hay que intentar de llegar con la máxima velocidad y agarrando nada un poquito fuerte el palo. Venga, llego con velocidad, hago una peña chuleta, el palo pasa por abajo y he hecho más metros que la madera tres con el hierro siete. Imagínate, ya puedes imaginarte, eh, que con la madera tres pierdo muchísima distancia estando en RAF, entonces mejor siempre un hierro. Venga, que me queda el S. El san yo se lo aconsejo, eh, a esas personas que tienen poca velocidad de swing o si tienen mucha velocidad pero el raf está muy muy denso y la hierba muy alta, San, yo eh también uso el S, eh, y voy y la saco a calle. Venga, hoo aquí un poquito la bola y la saco. La bola va a salir muy alta. Voy a intentar hacer un poco swing vertical y llegar como directo por debajo de la bola. La bola sale alta sin problema, ¿eh? Pero claro, aquí siempre hay que llegar con velocidad, eso es superimportante y un palo un poquito más abierto. ¿Y qué es lo que pasaría cuando la bola está eh perfecta? encima, que parece que está como un tí, encima de todas las hiervecitas. Cuando estamos en raf y no y la bola está eh perfecta, está por encima de toda la hierba, significais como si estuviese como en un tí. Entonces, claro, aquí podemos atacar con la madera. Aquí no hace falta de llegar con un palo tan eh abierto porque si os dais cuenta, le estar la bola un poquito más alta, no hace falta profundizar tanto por abajo, sino hay que intentar de llegar como un poquito más superficial y voy a tocar nada menos hierba que antes, con lo cual no te va a frenar tanto el palo. Entonces, desde aquí puedo pegar una madera sin ningún problema. [Música] Meo al bankker de la izquierda de Green. Eh, vamos, os voy a grabar dónde están todas las bolas para que veáis la gran diferencia entre algunos palos. Aquí tenemos el san. Vamos a cogerla. La verdad que me he quedado bastante lejos, pero bueno, hay que colocarla. Aquí tenemos la de la madera tres, la del hierro si está allí cuando la bola estaba hundida y cuando la bola estaba perfecta. La madera tres, mirad dónde la he puesto. Allí al lado de del bankker. Bueno, ahora vamos al bankker para que veáis. Bueno, ahora estamos cerca de green, ¿eh? Y ahora se nos complica mucho porque me he puesto la bola, fijaros. Me la pongo aquí debajo de toda esta hierbecita. Mira ahí donde quede. Claro, eh, esta hierba es mucho más alta, con lo cual fijaros cómo se frena mi palo, que me cuesta trabajo terminar el swing. Así que eh vamos a intentar aquí de abrir mucho la cara del palo y tengo que llegar con muchísima velocidad, exactamente igual que antes. Cuando la bola está muy hundida, hay que darle con mucha velocidad y profundizar abajo, porque claro, si tú llegas y quieres profundizar, tienes que tocar, mira, toda esa hierba, toda esta hierba, toda esta hierba y eso te va a frenar mucho el palo. Por eso siempre hay que llegar muy rápido. Las manos tienen que estar sueltas, sueltas para darle velocidad a ese palo. Así que lo que voy a hacer es abrir la cara del palo y hacer un poco el swing vertical. para llegar fuerte abajo. Venga, a ver si soy capaz de sacarla porque además tengo un bker aquí por delante, así que va a ser muy complicado. Lo aquí el objetivo es que pasemos el bankker y si se mantiene en green, perfecto. Pero no podemos caer en el bankker, así que abro. Puerta abajo, puerta abajo. Venga, objetivo cumplido. Fijaros que no ha salido nada alta porque eh me ha cerrado muchísimo eh la cara del palo y me ha frenado mucho la cara del palo también el raf y eso ha hecho que la bola salga muy floja y he pasado el banque de milagro. Y bueno, cuando la bola está perfectamente colocada es todo mucho más sencillo porque es como si jugásemos eh con la bola en un TI. Tenemos espacio eh para pasar con el palo por debajo perfectamente, así que es un golpe normal. Yo a veces no abro tanto la cara del palo porque cuando a veces hay mucha hierba, la bola se queda como muy alta y hay mucho espacio entre la tierra y la bola porque la hierba es tan alta que es como si estuviese en un T muy alto. Entonces, si la cara del palo llega muy abierta, ¿qué es lo que va a pasar? Que vamos a pasar con el palo por debajo y la bola no la vamos a tocar. Entonces, yo lo que hago es cara del palo neutrar todo dependiendo de cómo esté la bola, si está muy alta o eh más o menos como si estuviese un poquito altita. Entonces, hay que ver muy bien cómo está posicionada la bola y dependiendo de cómo esté posicionada la bola, voy a colocar la cara del palo eh de una manera u otra y también el tipo de golpe que yo quiera. Entonces, en este en esta circunstancia está como la bola un poquito altita, aquí el raf no está muy alto, está la bola perfecta, con lo cual yo voy a colocar la cara del palo neutra y que el palo pase por debajo, nada más. Yo solamente me voy a centrar en tocar la hierba y que el palo pase un poquito por abajo para que se levante la bola y pasar este banquer. No hace falta llegar aquí con tanta velocidad porque cuando yo impacto a la bola no voy a tocar tanta hierba antes, así que no me va a frenar tanto la hierba, el palo, así que eh va a ser más sencillo de golpear esta bola. Nada, mucho más suave, ritmo y la bola sube perfectamente. Ya la bola esa sale mucho más alta y más fácil. Eh, pues nada, yo voy a dejar por aquí el vídeo. Recordad, cuando estamos en raf hay que llegar con muchísima velocidad, hay que un palo cuando la bola está hundida, un palo un poquito más abierto. A mí siempre, personalmente, me gusta un swing más vertical para llegar más profundo y que el palo pueda llegar fácilmente por debajo y la cara se te va a cerrar. Así que muy importante de eh un palo un poco abierto. Eh, yo creo que no se me olvida nada. De todos modos, eh, si se me pasa algo o queréis ver algo detenidamente, comentadlo. Por ejemplo, eh, Fernando, te falta explicar cuando la bola está en raf en inclinación. Pues ponérmelo todo por comentarios. ¿Qué vídeo os gustaría ver o os gustaría que os explique para eh los siguientes vídeos? Eh, así que nada, que yo leo todos los comentarios, eh, me gusta siempre responderos, eh, así que nada, dle like, suscríbete y nos vemos en el siguiente vídeo. Y también otra cosa, cuando la bola está hundida en el rafil frenar la bola. Mi bola ha botado ahí al principio y ha rodado hasta el final del green. Es imposible frenar la bola. La bola va a salir disparada y muy baja. Así que recordad eso. Vamos a intentar debotarla 10, 15 m antes de la bandera. También depende de si tenemos algún obstáculo o no, pero hay que tener en cuenta esos pequeños detalles. La bola va a salir muy baja y va a rodar muchísimo.\n\n=== Video 7 (https://youtu.be/2PFCogJsaYE) ===\nHola muy buenas soy Fernando Galiano profesor de golf y Tengo una pregunta para ti sabes a qué distancia nos tenemos que colocar de la bola con un hierro 7 con un drive y con un s No te preocupes porque la solución la tengo yo y te la voy a dar en este vídeo Así que Quédate porque vamos a trabajar sobre el stance la posición del cuerpo en frente de la bola [Música] a mucha gente le surge esta duda de A qué distancia me tengo que poner de la bola porque hay veces que nos colocamos muy cerca o demasiado lejos cómo tienen que estar flexionado las rodillas cómo me tengo que colocar inclinado desde las caderas Bueno hoy vamos a salir de todas esas dudas y vamos a ver tres palos principales que pienso que es el Drive el hierro 7 y el San vamos a comenzar con el San para que veáis un poco eh cómo me tengo que colocar y vamos a ver la diferencia con los demás palos yo me voy a colocar fijaros que puesto eh este esta Cruz son las Varillas esta varilla tiene que estar apuntando a una línea paralela a la línea de mi objetivo y esta varilla tiene que estar en una línea totalmente perpendicular y apuntando a la bola Entonces yo me voy a colocar con el s y fijaros cómo me posiciono me voy a colocar con el hierro 7 y fijaros cómo me voy a posicionar Exactamente igual pero un poco más lejos Si yo me coloco aquí el s y el Ros 7 y el Drive el Drive voy a estar mucho más lejos entonces Cómo llegamos a esta conclusión muy sencillo el palo lo la inclinación de la varilla te va a dar todo lo lejos que tiene que estar fijaros la inclinación del Drive fijaros la inclinación del hierro 7 y fijaros la inclinación del San lo más importante que tenemos que ver Es que la base del palo me quedo con el hierro 7 ahora que la base del palo esté totalmente apoyada Y eso te va a dar esta inclinación y esta inclinación te va a decir todo lo lejos que tienes que estar de la bola entonces hoy te voy a dar un truco muy bueno para saber a qué distancia me tengo que colocar Entonces yo me voy a colocar aquí la bola justamente en esta línea me coloco la bola centro un poquito izquierda para el hierro si y fijaros una vez que ya estoy colocado siempre me tengo que dejar aquí como un pequeño espacio para que las manos puedan pasar libremente si yo estoy muy cerca no voy a tener espacio para pasar las manos porque mi mis manos Aquí tienen que pasar muy rápido si yo estoy demasiado lejos estoy creando muchísima tensión sobre todo en las lumbares y fijaros mis manos están como muy estiradas está muy lejos mía Entonces yo me tengo que colocar me inclino lo primero que tengo que hacer es me coloco totalmente recto flexiono un poco semif flexiono las rodillas que es flexiono Pero sin perder alturas si yo flexiono más de la cuenta ya estoy perdiendo altura con lo cual yo tengo que semif flexionar fijaros este pequeño desbloqueo de las rodillas y ahora me tengo que inclinar desde las caderas desde las caderas yo me tengo que inclinar es como echar mi culo para detrás Aquí más o menos las rodillas un truco muy bueno las rodillas no pueden sobrepasar la primera línea de los cordones si sobrepasa significa que estoy demasiado flexionado Entonces yo me tengo que colocar aquí primera línea de los cordones ahí y no sobrepasa fijaros me inclino desde las caderas y dejo caer mis brazos y donde caen mis brazos Ahí es donde tengo que mi palo aquí pero el truco muy bueno que aquí está la solución de todos los problemas es cuando tú coges el palo y consideres que está bien colocado vamos a soltar el palo y lo vamos a apoyar en la pierna izquierda y fijaros más o menos se va a apoyar a la mitad del cuádriceps izquierdo y si cogemos el San vamos a soltar el hierro s si cogemos el San yo me voy a colocar voy a estar más cerca porque el palo también es mucho más pequeño que el hierro s cuando yo considere que ya estoy bien colocado desbloqueo me inclino de las caderas y aquí ya Considero que estoy bien colocado pues entonces voy a soltar eh voy a soltar y cae en el mismo sitio a la mitad de mi cuádriceps izquierdo a otras personas dependiendo un poco de la altura de la persona y bueno eh También de eh del palo si están más apr right más vertical o si están más flat porque eh dependiendo de tu swing Pues bueno tendrás una inclinación en las Varillas totalmente diferentes que las mía porque las mías son un poquito vertical están un poco más así con lo cual eh Me va a apoyar un poco más en la mitad si tu varilla es un poquito más flat lo más seguro que eh la varilla en plan la punta de la varilla toque más cerca de la rodilla vamos a ver ahora con el Drive a ver dónde dónde Toca eh yo me voy a colocar y cuando yo considere que estoy bien voy a soltar el palo más o menos en la mitad del cuádriceps aquí se ha venido un poquito abajo porque yo con el Drive me suelo colocar un poquito lejos siempre me doy mucho espacio pero más o menos a la mitad del cuádriceps entonces tienes que intentar que todos los palos siempre toque aquí entre la mitad del cuádriceps y el final del cuadricep antes de llegar a la rodilla si yo estoy muy lejos y suelto fijaros que no toca y si yo estoy muy cerca me va a tocar aquí en la ingla izquierda al principio de de la pierna izquierda Entonces es muy importante siempre dejar con un poco de espacio para que puedan pasar las manos muy rápidas la posición de la bola eh siempre con el San sobre todo comenzamos con el s vamos a ponerla en el centro de los pies más o menos que esté totalmente perpendicular aquí en el centro de los pies y fijaros que cuando yo cojo el s es el palo más corto uno de los más cortos que tenemos en la bolsa con lo cual yo tengo que cerrar un poquito más los pies más que nada porque no voy a hacer tanta distancia Pero conforme yo voy ganando más distancia yo voy haciendo más distancia yo voy abriendo un poquito más los pies para ir creando más estabilidad en mi swing y cuando yo cojo el Drive que es con el palo que hago mucha más distancia abro mucho más los pies y cuando estoy en terrenos en inclinaciones eh también voy a abrir muchísimo más mis pies porque voy a crear muchas más eh Bueno quiero un swing más estable porque al estar en una una pendiente una inclinación Pues lo más seguro es que me caiga con lo cual yo voy a abrir mucho más los pies cuando yo abro mucho los pies esto lo podéis hacer en casa si os dais cuenta Yo abro mucho los pies y quiero girar estoy como muy limitado no no puedo girar tanto fijaros que este aquí está mi tope Pero si yo pongo los pies más juntos yo voy a poder girar muchísimo más entonces sin más para que sepáis que con los pies más abiertos crea más estabilidad Pero está más limitado en la rotación Así que eh vamos a pegar un hierro si y vamos a ver dónde está posicionada la bola hemos dicho que con el s cerramos un poquito más los pies los pies tienen que estar más juntos y la Bola más centro con el hierro 7 más o menos en los talones tienen que estar aquí más o menos a la a la axila la aila caen justamente aquí por dentro de los pies en la parte interior de los pies más o menos y la posición de la bola a mí siempre me gusta ponérmela un poquito centro izquierda Entonces yo me voy a colocar aquí y me coloco obviamente un poquito más lejos de la bola porque este palo es un poquito más largo que el s y cuando pasamos al Drive vamos a quitar estos palos cuando pasamos al Drive yo me voy a colocar muchísimo más lejos porque este palo es larguísimo y me voy a colocar más al talón izquierdo y fijaros como mis pies están mucho más abiertos y Mirad talón izquierdo y por último de las manos la posición de las manos siempre tiene que estar en la ingle izquierda aquí Ahí está posicionada las manos perfectamente y ya para acabar para que no se me olvide el peso el peso no puede estar ni a las puntas ni a los talones más o menos tiene que estar centro un poquito hacia delante nada más o menos tienes que sentir el peso en el inicio de los dedos del pie más o menos un poquito para delante un poquito en las puntas muy poco ahí fantástico y ahora dónde colocamos el peso derecha izquierda 50 50 a mí siempre me gusta con el Drive poner el peso nada un poquito a la derecha en el inicio cuando tú subas obviamente tenemos que poner más peso en la parte derecha y cuando voy bajando más o menos me gusta sentir un poquito el peso aquí pero tenemos que traspasar el el peso a la izquierda pero estamos hablando del stance de la posición inicial Así que 50 50 Siempre vamos a intentar que sea 5050 tanto con el s yro 7 y Drive para una bola de vuelo medio que salga un poquito alta Si queremos una bola baja obviamente tenemos que poner el peso más en la parte izquierda Pero como estamos hablando de un vuelo más o menos que la bola vaya altita que coja bueno eh de vuelo medio más o menos eh siempre peso 50 50 así que bueno Vamos a darle unas bolas a ver qué tal con con este truco de colocarme y que el palo quede más o menos a la mitad del cuádriceps un poquito para abajo y listo ahí y de posición yo creo que estoy perfecto porque el impacto ha sido bastante bueno así que nada yo te dejo por aquí voy a seguir entrenando si te ha gustado el vídeo dale like y suscríbete y nos vemos en el próximo vídeo\n\n=== Video 8 (https://youtu.be/KhThqqywr7Q) ===\nHola muy buenas soy Fernando Galiano profesor de golf y hoy vamos a ver la gran diferencia que hay entre un hierro largo y un hierro corto cómo nos tenemos que colocar Cómo tenemos que hacer el swing Cómo tenemos que golpear todo eso lo vamos a ver ahora en este [Música] vídeo lo primero que vamos a hacer es hablar un poit sobre los palos eh vamos a comenzar con el hierro 4 de los palos largos podemos el hierro TR hierro cu hierro 5 esos palos se consideran como hierros largos y hierros cortos se consideran a los sandw a los wed a los pitching wed eh hierro nu que en este caso tengo aquí el hierro 9 Así que vamos a ver la gran diferencia que hay entre un palo y otro y lo que podemos ver así a simple vista es que si yo lo coloco los dos al lado vemos que el hierro 4 es más largo que el hierro 9 y también como veis si yo coloco la base del palo totalmente apoyada veis que el hierro 9 Está como un poquito más vertical y el hierro 4 está un poco más flat un poquito más horizontal eso nos va a perjudicar bueno eso afecta a la a la hora de colocarte a la bola que por ejemplo con el hierro 9 al ser más corto y eh la varilla el L del palo está como un poquito vertical Pues yo tengo que estar un poquito más cerca Pero en cambio Si yo cojo el hierro 4 voy a estar como muy cerca de la bola con lo cual yo necesito separarme y por eso la varilla del palo está un poquito más flat un poquito más horizontal Y eso luego va a afectar un poco al plano del swing que ya iremos viendo más adelante dónde vamos a posicionar la bola con el hierro nu voy a posicionar la bola más al centro de los pies y con el hierro cu voy a posicionar la bola un poquito más al pie izquierdo fijaros El único cambio que he hecho hierro nu hierro cu es más o menos en la misma posición solamente lo único que hago es mover el pie derecho más hacia mi parte derecha para para abrir más los pies y así crear un poquito más de estabilidad porque estoy más lejos de la bola con lo cual Necesito un poquito más de estabilidad en mi swing como bien hemos dicho antes hierro 9 es un palo más corto y estoy más cerca con lo cual al estar un poquito más cerca y y al ser el palo un poquito más corto yo necesito una posición fijaros un poquito más eh Como más inclinación desde las caderas hacia abajo y mi swing cómo va a ser mi swing mi plano de swing va a ser un poquito más vertical Comparado con el hierro 4 eh Porque ahora vamos a el hierro 4 y vamos a ver la posición de la espalda voy a estar con el hierro 4 Esta es mi posición con el hierro 9 pues mi posición voy a estar mucho más lejos y voy a estar con mi espalda un poquito más erguida no voy a estar tan inclinado desde las caderas Entonces qué es lo que va pasar ahora en mi swing que cuando yo voy a subir no va a estar el palo aquí arriba no va a ser un swing tan vertical sino va a ser un swing un poquito más plano un poquito más flat horizontal aquí Cómo debería de ser el ángulo de ataque con el hierro corto y el hierro largo siempre que tengamos un hierro en las manos el ángulo de ataque tiene que ser descendente si tengo un hierro corto el ángulo de ataque va a ser más descendente Y si tengo un hierro largo el ángulo de ataque no va a ser tan descendente es descendente pero no tanto y ahora vamos a pegar unas bolas una con un hierro nueve y otra con el hierro cu y Vais a ver La Chuleta si hemos dicho que que con el hierro 9 va a ser más descendente y además mi swing va a ser un poquito más vertical por la posición de mi cuerpo con lo cual La Chuleta va a ser más profunda y voy a sacar mucho más chuleta el punto más bajo de mi arco de swing con el hierro corto va a estar un poquito más adelante y con el hierro largo no va a estar tan adelante porque si no voy a llegar con muy pocos grados si no va a estar nada muy poquito por delante por eso yo voy a sacar menos chuleta mi ángulo de ataque no va a ser Va a ser casi superficial pero con un ángulo de ataque un poquito descendente vamos a pegarle con el hierro corto y vamos a ver La Chuleta y mi punto más bajo tiene que estar ahí posición centro perfecto reparamos La Chuleta eh y ahora vamos a pegarle con el hierro largo que en este caso tengo el hierro cuatro y nos vamos a colocar la bola un poquito más al pie izquierdo y este pie lo separamos un poquito más para la derecha y vamos a ver que La Chuleta no va a ser tan profunda como el hierro corto apenas he sacado chuleta pero mi ángulo de ataque ha sido un poquito por delante es decir ángulo de ataque descendente el punto más bajo ha estado por delante y apenas saco chuleta Bueno ya hemos visto un poco Cómo deberíamos de hacer el swing y la pregunta es cómo va a salir la bola pues obviamente la cara del palo te lo dice todo el hierro 9 tiene más grados que el hierro 4 con lo cual la bola va a salir más alta pero va a hacer menos distancia comparada con el hierro cu con el hierro cu al tener menos grados la bola va a salir más baja y va a hacer mucha más distancia Entonces eh una cosa muy importante con el hierro 4 y por eso eh con los hierros largos no es fácil de darle porque al tener muy pocos grados la el palo ser un poquito más largo y yo voy a estar un poquito más lejos de la bola pues no es nada fácil Entonces le pegamos para abajo siempre con Los hierros pero con el hierro cuatro no hace falta con los hierros largos no hace falta pegarle tan hacia abajo porque si yo voy a pegarle muy hacia abajo le voy a quitar demasiados grados con lo cual la bola no va a subir entonces hay que llegar nada un poquito de descendente para que la bola salga comprimida y eh salga fuerte para esas personas que le cuesta muchísimo trabajo seguro que es porque tiene poca velocidad de swing o la mayoría le suele pasar eso que tiene poca velocidad de swing es un palo que necesit velocidad para darle espina a la bola porque la bola para que suba para arriba necesitamos que vaya así para atrás eso lo que va a hacer es que la bola suba entonces con más contra más velocidad la bola va a hacer más revoluciones para atrás es el Spin y y va a hacer Que suba la bola Entonces si tiene poca velocidad por muy bien que le pegues no vas a hacer mucha distancia y por eso a lo mejor con el hierro 4 pegas lo mismo que con el hierro 7 porque es un palo que necesitas velocidad de swing para que la bola suba y haga metros entonces bueno yo creo que hasta aquí el vídeo de hoy la comparación entre hierros cortos y hierros largos eh lo he intentado explicar lo mejor posible lo más fácil para que lo entiendas eh si tienes al alguna duda Comenta que yo te leo todos los comentarios Así que nada nos vemos en el siguiente vídeo dale like y suscríbete chao fore\n\n=== Video 9 (https://youtu.be/IWl3qndvGhM) ===\nel fin de gol lo podemos dividir en todos los pasos que nos dé la gana de hecho en el canal tenemos vídeos sobre cómo hacer el maxi cómo hacer el down swing postura finish de todo el yo de hoy vamos a simplificar el swing en cuatro pasos [Música] [Aplausos] [Música] o lago la filtración mundo que tal como estáis en el barro y tiene bienvenida a clases de golf almería el objetivo de hoy es simplificar simplificar el zinc en cuatro pasos y es que esto te puede venir bien tanto a un jugador que le pega a la bola ya razonablemente bien por no decir bien pero que tienen mucho ruido en su cabeza y muchas cosas que pensar y al final deja de lado las cosas básicas como al jugador que está empezando y necesita unas cuantas referencias con las que empezar el swing de golf o con las que ir evolucionando así creo que aunque es simplificar y significar nunca está de más y esto lo digo yo cuando en él cada vez nos complicamos la vida con cosas que dices la mía en el b nacional que he metido así que hoy vamos a simplificar el swing de golf en cuatro pasos vamos a dar por hecho que llegó para los adecuados longitud adecuada la postura adecuada gripa adecuado que está todo en su sitio entonces primer paso del fin de don es arrancar es el comienzo este primer paso va a ser de la colocación hasta que la varilla esté paralela al suelo sería el paso número uno quiero conseguir en este paso que mi varilla sea una continuación de mis pies cuando la varilla está paralela al suelo están en la misma línea que mis pies paso número 1 y si puedo conseguir que la carga del palo esté alineada con mi columna mejor que mejor para esto he tenido que haber girado mis hombros y lo quiero hacer sólo con las manos podré vale lo estoy haciendo pero evidentemente esto no es verdad estoy ahí muy estrecho sin espacio para hacer nada por lo tanto un poquito de giro nada más arrancar el swing para colocarla a la varilla en la misma línea que los pies y la cara del palo alineada con mi columna aproximadamente paso número 2 perdidas por el viento espero que no esté sonando demasiado paso número dos tope del back swing vamos a una referencia de varilla paralela al suelo cuando la varilla está para él al suelo tiene que estar apuntando a mi objetivo es decir está paralela también a la línea de mis pies 1 2 de hacerlo de frente que solo tengo una cámara 1 2 cuando llego aquí arriba con la varilla aproximadamente paralela al suelo y en la dirección del objetivo mis hombros han llegado a girar 90 grados mi hombro izquierdo está entre la bola y mi barbilla así que puedo intentar pensar que voy a meter el hombro izquierdo debajo de mi barbilla importante hombro debajo de la barbilla es decir barbilla debajo del hombro que es lo mismo verdad es que más de uno tiene como prisa por llegar ahí estoy viendo como sabe que tiene que mirar por encima del hombro está sirviendo el palo y está colocando la cabeza y barbilla y en su sitio es el hombro el que viene hacia mi barbilla paso número 1 paso número 2 referencias en el tope del número 2 la cara del palo está en 45 grados con respecto al suelo o puede que un poco mirando para arriba hacia es cuestión de gustos y cuestión de jugador pero todo lo que sea en torno a los 45 grados bien correcto con la varilla en la misma dirección que mis pies para eso hay que hacer mucho menos de lo que se piensa por lo general la mayoría de la gente cuando intenta colocar el palo ahí arriba se eleva a la olla y acaba poniendo el palo aquí atrás no hace falta si has hecho un buen comienzo del paso número uno de aquí aquí hay muy poco porque si os fijáis las manos están a la derecha de mi cuerpo vale esto es el tema de la propiocepción tener mucho cuidado con esto agente profesional es poco propioceptiva no vamos a decir y lo que está detrás de mí es la cabeza del palo que aparecerá por este lado pero mis manos están en este lado por lo tanto lo otro que iba de las manos aquí detrás nos puedo dejar aquí en la derecha con el paso número 3 trabajada este va a ser el paso más sencillo de todos 12 3 lanzó el palo lanzó las manos me da igual como lo sientas a la vez que el cuerpo está girando la bola es un obstáculo que me encuentro por el camino yo no voy a intentar pegarle a la bola de manera consciente la bola me la encuentro por el camino esto es fundamental hay algo súper básico pero fundamental si quiero generar realmente velocidad y a la vez darle dirección a la bola si la postura ha sido buena y en el paso 2 estoy correctamente colocado de aquí yo lanzo a la vez que giro y la bola me la encuentro por el camino no tengo que intentar pegar la labor de manera consciente como yo intenté ir a pegarle al formales que no le dé o no le dé bien estoy como como que gritando mucho y me da la sensación lugares como se escucha en el audio y es porque tengo frío se ha nublado cuando a grabar y hace un pelín de viento y estoy pasando un poco de frío por cierto han cortado el vídeo con estas cosas mías suscríbete al canal si aún no lo has hecho y dale a me gusta y extracción del vídeo y comenta si crees que esto te puede ayudar en tu swing está así buscar esta simplicidad si te quieres que te puede ayudar espero que sí paso número 4 el finish al fin es reflejo de que ha pasado durante la bajada de como me he movido durante la bajada si yo estoy aquí pues seguramente he frenado el golpe y si estoy aquí pues seguramente tirado poco al bajar el palo pero si yo estoy aquí seguramente ha sido razonable he bajado a la vez que he girado y estoy equilibrado decimos hay un vídeo sobre el tema del finish si yo le pego y me voy pa lante pues seguramente cuando estaba bajando y rotando eso no estaba muy fino referencias para el finish cuándo a cabo el peso está en el talón del pie izquierdo podemos ver muchos jugadores algo con la punta del pie izquierdo levantada o un poco hacia el exterior o bueno algunos completamente plantados ahí pero el peso en talón izquierdo manos a la izquierda de mi cabeza aproximadamente no queremos manos excesivamente bajas y manos excesivamente altas todo dando referencia talón nuevo el tema de la bajada que final es cuando le pegamos a la bola estar a una distancia adecuada es fundamental para poder encontrarme con la bola esto de pasar mucho en las clases si yo tengo un jugador otro es un jugador que tiende a bajar por fuera por lo general voy a estar lejos de la bola bajo por fuera buscando pegar ahora que están lejos de disposición mi palo se viene muy dentro y suelo perder que un poco hacia adelante ya no voy a poder hacer un movimiento fluido a través del impacto en cambio si tengo una buena distancia a la bola yo no pienso en darle a la bola yo pienso en lanzar girar y acabar en mi sitio equilibrado o no desde ahí un poquito como haciendo cosas que decir otras 12 3 y 4 y disfruto viendo a la bola volar no se estaba apuntando ni nada me estaba contando a la vez qué que explicaba no no contéis al menos uno con la voz que si no es como un poco cuesta llevar el ritmo ejercicios muy sencillo ponte de una zona que estoy muy despejada y su colocación efe el swing intenta ver si pasas el sitio disparas el palo por el mismo sitio que estaba colocado por ejemplo aquí estoy lejos estaba aquí he pasado por aquí pues quería hacer colocar la bola bueno por este lado no es como colocarla y mantengo la distancia y busco 1234 en la celo sin parar vale y el cuarto importante disfruto en el philips ha dejado cerca de la bandera en la que estuviera apuntando bueno el objetivo era simplificar el afinado tanto un montón de referencias ideas que pueden ser super provechosas pintando un poco de ruido sobre qué pasa entre cada posición si yo soy capaz de llevar a esas posiciones seguramente el camino entre la posición 1 la 2 la 3 y la 4 él también esté bastante bien a veces no hay que pensar tanto en el camino sino solo en esas posiciones para que el camino sea lo mejor posible sí es cierto que en algunos casos hay que fijarse mucho en el camino y hay que explicar al jugador como cómo hacer ese camino pero a veces simplificar y buscar esas posiciones ayuda mucho el objetivo como siempre es ayudarte perdona estoy pasando frío y estoy como acelerado como siempre muchas gracias por seguirme es pero sinceramente haberte ayudado a mostrar vídeo de la onu gustas estuviere segundo lo has hecho parte del mundo nos vemos\n\n=== Video 10 (https://youtu.be/XoUQnqQGayM) ===\nHola, muy buenas. Soy Fernando Galiano, profesor de golf y hoy estamos aquí muy cerca de Green. Estamos alrededor de Green. Vamos a hacer diferentes situaciones y os voy a explicar qué palo vamos a usar y cómo lo vamos a hacer para que os resulte fácil este golpe. [Música] [Música] Comenzamos con esta situación. La bola. Bueno, está todo eh plano. Eh, si eso está un poquito en subidita, pero no tenemos ningún obstáculo por delante nuestra, ni bueno, ni pasado de grenada, solamente los obstáculos están a la derecha y a la izquierda. Es decir, es un golpe sencillo. Entonces, bueno, tengo aquí dos palos, tengo el S y tengo el Peach. ¿Con qué palo debería de hacerlo? Bueno, no os preocupéis porque bueno, os voy a hacer la demostración con los dos, pero antes os voy a explicar una pequeña cosa y os voy a aconsejar cómo lo haría yo. Aquí si usamos el San, el SAN es un palo que tiene muchos grados, con lo cual es un palo que, bueno, la bola, cuando yo golpeo con el San, la bola va a salir más alta y va a rodar menos. Entonces, claro, si va a salir más alta y va a rodar poco, yo tengo que eh tengo que intentar que el bote sea lo más cercano al hoyo. Pero en cambio, si lo hago con el pitch, que es un palo un poco más cerrado, la bola va a salir un poco más baja y va a rodar más, con lo cual tengo que botarla antes, más o menos principio de green. Entonces, como yo la tengo que botar antes, mi swing será menor. Y si yo lo hago con el SAM, que la tengo que botar más lejos, más cerca del hoyo, mi swing va a ser muchísimo mayor, con lo cual el margen de error sube. Así que se puede hacer con los dos palos, pero con el que vas a crear más consistencia en los impactos va a ser con el pitch, que es un palo un poquito más cerrado. Dependiendo de todo lo que tengas que rodar y dependiendo de donde esté el punto de bote, vamos a  un palo u otro. Pero no os preocupéis porque de eso va este vídeo. Vamos a hacer eh diferentes golpes, un poquito más cerca o un poco más lejos y vamos a ver cuánto va a rodar la bola. Así que vamos a comenzar. Voy a pegar una con el san, pero antes vamos a poner el punto de bote. Siempre vamos a intentar que el punto de bote esté al principio de green. Más o menos entre 1 m y 2 m. Más o menos. Por aquí debería de botar la bola, que es más o menos entre 1 m y 2 m desde la entrada de green para que luego vaya rodando hacia el hoyo. En este caso, si lo hago con el sanoto ahí no va a llegar. Así que bueno, voy a intentar botarla ahí y vamos a ver que la bola no va a llegar al objetivo. Incluso me he pasado un poco. Voy a intentar pegar otra porque el bote ha sido por delante de la varilla y aún así no ha llegado a la bandera. Voy a pegar otra y voy a intentar botarla en la en la varilla, entre las varillas. que no es fácil. Esa también me vuelvoar y la bola no llega al objetivo. Y ahora voy a hacerlo con el pitch y claro, voy a hacer menos swing y vamos a intentar botarla ahí entre las varillas. A ver qué tal me sale para que veáis que con el pitch si echamos el peso un poquito en la pierna izquierda y las manos un poquito adelantadas y mantenemos el peso en la parte izquierda, las manos siempre la mantenemos también adelantadas y hacemos un movimiento solamente de brazos. La bola va a salir baja y va a rodar muchísimo. Así que el palo en esta situación que tenemos mucho espacio para rodar la bola, vamos a usar un palo que esté cerrado. En este caso es el pitch, porque el punto de bote más o menos está como a 9 8 m aproximadamente. Entonces, claro, la bola va a volar también mucho. Bueno, tiene que volar 8 m y luego tiene que rodar unos 10 12 m aproximadamente, pero si yo estoy más cerca del green, podemos usar también el pad para los principiantes. Pero bueno, ya estamos avanzando. Pero si yo me pongo más adelante el punto de bote, si yo me si yo me pongo, por ejemplo, aquí el punto de bote estará a 4 o 5 m y luego tengo que rodar exactamente lo mismo. Así que vamos a usar un palo un poquito más cerrado porque tendré que hacer menos y si lo hago con el pitch me quedaré corto y tendré que usar un un palo un poquito más cerrado, como por ejemplo es un nueve o un ocho para que la bola llegue a su destino. Para que lo veáis más claro, he hecho como una escalera eh donde yo considero que hay que pegar cada pal. Por ejemplo, más o menos de aquí al principio más o menos mi punto de bote hay como unos 22 25 met aproximadamente. Si yo me voy acercando ahí voy a otro palo. Tengo el pitch. ¿Qué pasa? que desde ahí a al hoyo más al punto de bote más o menos tenemos unos 15 m aproximadamente. Después, 5 m más adelante eh he puesto un hierro 8 y luego otros 4 m más adelante he puesto un hierro seis. Para que veáis la gran diferencia. Si las voto en el mismo sitio, debería, bueno, yo creo que debería de llegar al hoyo, más o menos debería de rodar unos 14 m, 15 m aproximadamente hasta llegar a Entonces vamos a hacer este pequeño ejercicio a ver si soy capaz de botarla en nuestra en nuestro punto de bote y que vaya rodando a al hoyo. Venga, nos vamos a concentrar este swing, un swing perfecto para botarla allí. Eh, nos concentramosamente en el punto de bote y bueno, y queremos que la bola salga un poquito baja. Entonces, con el ponemos un poquito en la pierna izquierda, manos un padas y durante todo el swing hay que mantener el peso en la parte izquierda. Venga, voy a intentar botar la cortita allí en el punto de bote y que vaya rodando al hoyo. Bueno, me ha faltado caída, pero no está nada mal. Más o menos a la altura de la bandera. Así que vamos adelante. Ahora tengo un pitch en las manos y misma sensación que antes, peso un poquito adelantado, manos adelantadas, porque yo lo que quiero es rodar la bola por el green. Entonces, me voy a colocar es un palo un poquito más cerrado. Si la intento botar allí me va a rodar más porque es un palo más cerrado. Venga, esa la he clavado, ¿eh? Y perfecta también altura de la bandera solamente. Bueno, me falta caída. Ahora estoy 5 m más cerca de mi punto de bote, con lo cual ahora tengo un hierro 8 en las manos. Venga, misma sensación. swing más cortito y me va a rodar mucho más porque es un palo más cerrado. La suerte a botar la varilla, pero bueno, no está nada mal. Altura de la bandera. Ahora tengo un hierro se en las manos. Voy a colocar varilla más o menos que esté a 1 m, que tenga 1 m de margen. Y ahora estoy muy cerquita, más o menos como 4 5 m del punto de bote y por eso cojo un palo muy cerrado porque tengo que rodar muchísimo la bola. Es cierto que desde aquí también se puede patear, incluso de un poquito más atrás también yo la suelo patear, pero bueno, cuando vamos a otros campos, eh, el raf empieza más o menos desde aquí. Entonces, cuando la bola está en raf, eh, no o la hierba está un poquito más alta, no se puede patear porque te va a frenar muchísimo la bola. Entonces, hay que aprender a hacer golpes de chip. Y bueno, hoy estamos haciendo la demostración que dependiendo de eh lo lejos que esté de mi punto de bote, va a rodar más o menos la bola y tengo que  eh uno otro palo. Entonces, ahora con el hierro seis vamos a intentar botarla aquí cortita y a ver si somos capaces. de acertar con el palo, eh, porque es muy importante de practicar esto para eh luego acertar eh bien eh que palo porque sobre todo vas a acertar más porque te va a ir dando la experiencia. Si nosotros desde aquí siempre vamos a  el san, pues bueno, una bola se va a quedar corta, una muy pasada. En cambio, si lo empiezas a hacer con palos más cerrados y empiezas a jugar mucho más con el green, con todo el espacio de green, pues te va eh a salir mejor y vas a acertar más con el palo. Siempre es la misma colocación, posición de la bola, centro, incluso un poquito al pie derecho, peso adelantado, manos adelantadas y nada, movimiento de brazos, no hace falta muñequear. Si yo empiezo a muñeiquear, le voy a dar muchos grados al palo y la bola se va a subir más de la cuenta, con lo cual va a rodar menos. Me ha tocado la varilla. No te puedo creer. Significa que lo estamos haciendo bien, ¿eh? Bota dentro y cuidado que puede entrar, ¿eh? Cuidado que puede entrar. has pasado por detrás del hoya. Bueno, estamos acertando con el palo. Eso es buena señal. Ahora estamos en otra situación que la bola está justamente por detrás de un obstáculo. Claro, por delante tenemos un obstáculo que hay que saltar para llegar a green. Entonces aquí no queda otra que  el palo más abierto de la bolsa para saltar el obstáculo y que la bola no ruede tanto. ¿Por qué? Porque no nos queremos no no la queremos jugar a botarla al principio de green porque está muy cerca del obstáculo. Aquí siempre en vez de dejarnos 1 metro de la entrada de green vamos a dejarnos un poco más. Siempre que la zona de el punto de bote esté un poco lejos del obstáculo para evitar riesgos. Entonces vamos a el palo más abierto y totalmente prohibido el pitch o cualquier otro palo que esté más cerrado. ¿Por qué? Por esta simple razón me voy a el pitch, la bola va a salir más baja. Eso es lo que puede pasar. O si paso, si paso eso, la bola, fijaros, al hacer más swing la bola va a salir muy baja y va a rodar muchísimo y me voy a pasar de green. Entonces con el san la bola va a salir un poquito más alta, que es lo que pasa que tenemos que hacer más swing, pero bueno, me da igual. Tenemos un obstáculo por delante, así que tenemos que evitar ese obstáculo. Me voy a colocar eh totalmente neutro la posición de la bola al centro. No hace falta poner tanto peso en la parte izquierda, sino un poquito más 50. Y ahora lo que vamos a hacer es jugar con la base del palo, mover eh brazos y también un poquito de muñecas para darle grados a ese palo. Y siempre que la base del palo deslice por la hierba, que el palo pase por abajo. Siempre super importante, si mi palo no llega abajo, le vamos a dar con el filo. La bola va a salir muy disparada, va a tocar el talud y se va a meter en obstáculos. Entonces, aquí lo más importante es peinar la hierba. Peino, peino. Fijaros, suave ritmo. Venga, me coloco, coloco la cara del palo normal, neutra, punto de bote, 2 o 3 m después de la entrada de green. Ay, ay, ay, ay, ay. Vale, eso, eso no se puede hacer, ¿eh? Eso no se puede hacer. Bueno, hemos saltado el obstáculo, pero no no se puede no nos la podemos jugar tanto. Venga, más wiin, más wiin. Es así. La bola va un poco más alta, cae un poquito más a plomo y rueda 1,5, dos como mucho y la bola se queda mucho más cerca de la bandera. Así que bueno, si te ha gustado este vídeo, dle like y suscríbete. Y nada, deja en los comentarios si te ha gustado estos pequeños trucos y consejos que te he dado. Así que nada, nos vemos en el siguiente vídeo.\n\n=== Video 11 (https://youtu.be/Ifd5MkFS4sU) ===\no el swing un poco más plano para poder pasar el palo vamos a ver un poco antes de pegar en el movimiento desde atrás para que vean cómo haces ese back son símbolo ahí como veis agua que un poquito de zoom cara abierta el stand es bastante abierto bienvenidos a un vídeo más del canal del tee del 1 hoy os traigo otro vídeo de técnica en esta ocasión haremos golpes the banker y bueno ha traído un invitado especial un gran campeón un jugador de promesa a catalana futura promesa del golf español y bueno eres álex de castro álex saluda y bueno con él trataremos los golpes the banker veremos un poco su técnica que es muy buena de hecho pondré por aquí debajo las estadísticas que tiene en juego corto digamos analizaremos los aspectos técnicos de su stands cómo colocar la cara como hace el swing en el bunker y pondremos luego varios golpes golpes cortos the banker golpes largos en su vida embajada para que veáis que cómo cambia su técnica en cada uno de esos golpes y bueno pues nos hallábamos aquí tenemos a alex alex bueno preséntate un poquito para nuestros espectadores del día del 1 bueno pues como ha dicho dani soy alex soy jugador de barcelona golf academy y nada muy contento de poder estar aquí explicaros un poco pues mi técnica en el banquete ayudaros a mejorar a la lex pues empezamos aquí tenemos un golpe de que diríamos 20 metros 220 metros mirad lo pongo aquí desde atrás para que lo veáis bien y bueno para el que no lo sepa alex es un jugador zurdo entonces lo veremos desde otra perspectiva pero al final no cambia nada y bueno lo que quiero que nos expliques es primero cómo haces este tipo de golpes con otro depende de la arena pero yo como soy jugador de aquí del truco barcelona la arena normalmente es esta de playa la que nos vamos a ver por todo el tour europeo del pga tour y me gusta me gusta ver la cara del palo no del todo mantener bueno pues unos grados unos grados más abiertos si abro mucho en el stands perdón los pies vale para buscar un punto de equilibrio y sobre todo pues mantener un poco el swing un poco más plano para poder pasar el palo bueno vamos a ver un poco antes de pegar en el movimiento desde atrás para que vean cómo haces es evasión símbolo ah y como veis algo que un poquito de zoom cara abierta el stand es bastante abierto apuntando a la derecha del objetivo y sobre todo un poquito más la derecha de la bola tiene salir un poco más por la izquierda y la cara está abierta terminada entre todo pasa del palo no sé le pegamos estas tres cosas y ven un poquito los golpes ahí lo tenéis a tener la cara tan abierta y el stands también abierto hacia la derecha del objetivo veis como al votar en green hace un ligero efecto hacia la izquierda sí también perfecto pues ahora vamos a ver un golpe un poquito más cerca nos ponemos con la y por la parte derecha más pegado al talud y me explicas un poco qué detalles técnicos cambias para dejar la bola cerca de bandera pues al tener un hay un poco más en su vida no me hace falta abrir tanto la cara del palo intentó dirigir un poco mi stands en función del like es como estoy en su vida pues no me voy a apoyar para la intentó redirigir un poco mi cuerpo en función del light sigo abriendo la cara no tanto depende también de la distancia en la que esté pero pero no no la habrá tanto y nada el swing sigue siendo bastante parecido un poco más vertical lo mejor pero pero bueno pues eso no mucho más están los pies básicamente lo mismo un poco más a la derecha y si digamos ahora te has abierto un poquito más para sacarla por encima del talud oa esta altura del talud no no lo necesita último 60 grados la cara está un poco más abierta no hace falta pero muchas cosas job pues ahí lo tenéis si tenéis dudas de alguno de los aspectos técnicos que estamos hablando en el vídeo lo podéis dejar en la caja de comentarios y bueno yo le haré la pregunta al xxi y ellos la responderá aquí directamente en los comentarios de youtube vale pues alex vamos a un golpe un poquito más largo por la parte del fondo the banker vale en bajada como me sitúo si no hacemos hacemos un golpe largo y luego cerca pero más pegado al talud en bajadas als aquí es el tipo de golpe aquí ya que serían 35 metros 30 30 y alguno supongo más larga es verdad pero pero mi técnica no va a cambiar mucho sí que es verdad que el swing a lo mejor lo voy a agrandar y la tarde del palo la voy a cerrar un poco más para poder ganar más distancia claro pero sin necesidad de apretar mucho la bola y luego pues nada el stand sigue siendo un poco más abierto es verdad que no voy a apuntar tanto a la derecha porque la cara está menos abierta pero aparte de eso no voy a cambiar mucho más es un detalle clave que tenéis que tener en cuenta que claro el ahora hemos añadido como unos 10 metros de más y él ha cerrado la cara para hacer esos metros de más que le falta para llegar al hoyo y ya ha cambiado la alineación ya no nos alinea tanto a la derecha del objetivo para que bueno al cerrar la cara vaya a más al sitio digamos no no tiene que no sale la bola con tanto efecto de derecha a izquierda no sería ese el detalle pues nada esto mira te voy a grabar una diferente que no los grabados y luego pegas otra y teclado de atrás vale que tenga una detrás cosas que vean un poco así el resultado del gol segundo planeta luego haremos una embajada vale salió bastante viva vamos a un pelín pero ahí tenéis la técnica y aquí la diferencia no sé sí exacto muy apreciable pero unos pocos metros de más pero bueno han tenido ahí yo creo que lo han visto claro los detallitos los cambios que haces para este tipo de golpe vale pues haremos el último golpe tenemos el último golpe por aquí es complicado pero es muy mira que se publican en embajadas y exacto que vean pues eso los ajustes técnicos que haces en este tipo de golpes para que luego los espectadores que vean el vídeo sepan qué cambios deben hacer en este golpe en aquel en el corto o allí en el más largo es verdad que sí que tengo los pies un poco más altos que la bola automáticamente más vertical bueno yo tiendo lo mismo que el golpe en su vida tiendo a dirigir un poco mi cuerpo en función del like pues nada un poquito más con el plano más hacia hacia el pie derecho en vuestro caso bueno los diestros sería más hacia el pie izquierdo y también me gusta poner un poco más la bola al pie derecho que hemos fracaso otra vez a la izquierda y nada en la cara y otra vez depende de la distancia en la que esté pero me gusta abrirla y nada y sobre todo pues eso seguir un poco un plano más vertical no forzar un un plano y plano horizontal es decir usan los golpes de aquí y los que has tenido el golpe corto pero sin talud y el golpe largo el stands no lo has abierto tanto no no y no te has puesto la bola tanto al pie derecho esos son los dos cambios que haces en este tipo de golpe y si no pero era un golpe muy complicado o sea el resultado es bueno muy bien pues yo creo que con estos detalles les quedaría muy claro cómo deben jugar en estos golpes the banker alrededor de green y nada si os ha gustado el vídeo decirlo en los comentarios dejar un like suscribiros y si os gusta pues estas intervenciones pues con álex con maxim y con otros jugadores que que podamos traer pues decirnos lo y pues haremos más vídeos de este tipo muchas gracias a todos por vernos gracias\n\n=== Video 12 (https://youtu.be/Oe8CcAhtwvc) ===\nhacía muy hacia la bola muy steeper y eso tampoco como el primer swing que ha dicho no claro claro y por eso tenía que cambiar tenía que hacer más movimiento de hombros eso me daba confianza más hacia arriba más usar bounce para para hacer error y mejor sabor bienvenidos al canal del pie el 1 hoy estamos aquí en club de golf barcelona con maxim dannielynn uno de los mejores jugadores de aquí de gol barcelona y bueno pues ya vamos a hacer como una pequeña sesión de webs que de hecho me llama cuando llegué aquí me llamó mucho la atención su manera de pegarle a los coches y de hecho bueno ahora veréis como le pegaba yo algunos detalles de los que hacen el con el wedge lo sé como añadido a mi forma de pegar a los wedge es entonces cuando te vais a ver pegar ahora un par de bolas y luego me veréis a mí con los cambios esto es que he hecho [Música] 7 y luego explicamos cada detalle esas empezaremos por el stands como hace estos stands porque si seguramente os habéis fijado que su contacto a la bola es muy limpio no hay nada de chuleta de hecho mira pega alguna desde el césped a parte de eso r chuleta explica un poquito primero de stands cómo lo haces vale de stands me gusta ponerme muy cerquita de la bola porque para mí es una posición más cerca estás más y la bola te la pones centrada izquierdo pie derecho lo pones muy cerquita a ver que lo veamos desde atrás hay cc si haces el arranque intento hacer solo con los hombros y podéis ver en el back swing no hay nada de acción de manos es todo movimiento de hombros y llega al movimiento del impacto casi como en el stands es decir al ser un movimiento tan de hombros no hay nada de luck ni nada de acción de manos a través del impacto ya bueno así es más fácil pegar siempre bien a la bola eso eso te hace el swing más halo o sea que más cerca del suelo así tienes menos error porque si con el swing muy agresivo muy hacia la bola y pegas un poquito antes la verdad que no te va a salir con un salón muy cerquita del suelo siempre si pegas un poquito papá no va a pasar nada desde atrás pero digan alguna aquí desde atrás sí la bola aún sale de eso porque el swing es muy solo sí es decir que es como que desliza el bounce super bien aunque fallas después del impacto el feeling que tienes es de pegar mucho bolas suelo pegarlo más hacia arriba sea como haces qué haces con los brazos los dejas muy pegados al cuerpo los estiras mucho vale si quiero hacer como una bola muy limpia al pintar sin adentrarme que hago japón intento hacer casi como hacia arriba intento notar que aquí ya llevo entonces pegar los dos tipos de bola al primero una más alta y más pegada hacia arriba y luego a otra más baja en una bola más baja intento también intentó irme un poquito más hacia la bola bueno pues ahora pegaré yo un par de bolas y directo con los cambios que añadido de la forma de pegar a los coches que explicas vengo a pegar un par con el swing anterior y otra y otras con los cambios que añadir mariola lo que me pasaba con poder wedge es que estaba pegando muy hola suelo y claro en algún momento en el que disparó las manos un poco antes de tiempo es como que tengo muchas chuletas la bola puesto hace los metros que deberían entonces la manera no sea como le estaba pegando antes era un poquito más separado de lo que he hecho con los cambios añadidos sentir un poco separado la cara del palo prácticamente plana y levantaban y levantaban el talón y la punta la bola centrada cara cerrada y lo estamos apuntando al objetivo y lo que hacía era un swing muy vertical y paraba aquí es decir entonces era así y eso es un movimiento que hacía hasta ahora ya que el agua como sí y eso es muy sticker y a veces te salen papas y exacto todo pues los cambios que ha añadido una vez viendo y conociendo pues la manera de cargar los widgets de máximo abrir un poquito de stands cara abierta la buena un poquito más centro izquierda siempre izquierda y un poquito más cerca del de la bola y el talón un pelín un pelín levantado eso lo que hace es que sea muy complicado un día el bound en la hierba es decir al ponerlo así desliza muy fácil porque hay como que menos superficie de bounce donde impactó entonces me ha acercado un poquito más te advierto el stands cara abierta y el movimiento muy de hombros muy de hombros y es que pasa el balance perfecto hay nada de chuletas solo desliza un poquito la hierba trama un par de la hierba no ponga extensión esto está un poquito verdad exacto pero la bola la bola aún ha salido bien i o sea muy bueno y los pactos esos serían los cambios que he añadido y los detalles que ha explicado maxim de cómo pegaba a los jueces de hecho él está estamos teniendo no hace un año así problemas con los jueces hace un año de verdad que no podría levantar la bola de calle pegaba sapo filazo y era justamente por eso porque hacía muy porque hacía muy hacia la bola muy steeper y eso tampoco como el primer swing que ha hecho claro claro y por eso tenía que cambiar tenía que hacer más movimiento de hombros eso me daba confianza más hacia arriba más sus árboles para para hacer error mejor pues ya estaría el vídeo espero que os guste es un vídeo cambiando un poco el contenido en la dinámica del canal que vamos los vídeos que vamos a subir ahora serán los partidos de más click que tenemos en costa dorada las entrevistas que ya habéis visto en el canal y pues yo creo que añadir alguno de estos así con algunos tips de cómo vamos nosotros a la bola buenos jugadores como maxim que son jugadores con digamos hoy o cualquiera de los que jugadores buenos que conozcamos creo que es interesante que lo veáis y que bueno igual los ayuda a algún tipo de lo que decimos o igual no pero yo voy a aportar algo a la comunidad de golf así que nada muchas gracias por ver el vídeo vemos [Música] ah [Música]\n\n=== Video 13 (https://youtu.be/IbW8IQjPvac) ===\nHola, muy buenas. Soy Fernando Galeano, profesor de golf y hoy estamos aquí en el campo de señorío de Zuasti. Hoy vamos a hacer el golpe de approach, pero cuidado, os voy a enseñar dos swinges y vamos a ver cuál es el swing correcto para el approach. [música] Vamos a comenzar y os voy a enseñar dos vídeos a cámara lenta, eh, haciendo los dos swines diferentes para el approach y me vais a decir cuál es el swing correcto. Así que déjalo en los comentarios si es el correcto el swing de la derecha o el swing de la izquierda. Ya habéis visto esos dos swines a cámara lenta y vemos que son un poco diferentes. Ahora voy a explicar un poco la técnica para eh el golpe y os voy a decir cuál es el correcto. Muy sencillo, los dos son correctos. Solamente que uno es para pegar la bola un poquito más alta, es más tipo globo y el otro es el golpe un poquito más estándar, que me coloco mucho más neutro, los pies paralelos a la a la línea del objetivo y la bola sale un poquito más baja en comparación con el otro swing. Pero bueno, no os preocupéis porque ahora os voy a explicar detalle a detalle eh cómo se hacen eso, esos tipos de golpes. Así que vamos a comenzar. Voy a explicar el primer golpe de approach, que es el golpe neutro. ¿Cómo es? ¿Cómo sería este golpe neutro? Pues nos vamos a colocar. Siempre lo vamos a hacer cuando vamos a utilizar el san cuando estamos cerca de green. Necesito una bola alta y bueno y que ruede poco, pero que ruede algo. Entonces vamos a el san el palo más abierto de la bolsa, la vamos a colocar la cara del palo apuntando hacia el objetivo y que la bola esté en el centro de los pies. Y cuidado, cuando estamos cerca de nuestro objetivo, cuando vamos a hacer un swing corto, pues vamos a colocar los pies un poquito más juntos. Y ahora muy importante en el approach de un buen ritmo, de hacer un buen ritmo. Y claro, aquí no vamos a muñequear mucho, lo que vamos a hacer es más giro del cuerpo y movimiento de brazos. Es cierto que con este golpe, este golpe es un poco más sencillo porque es un golpe, un swing más corto y vamos a trabajar siempre en línea, en línea paralela a mis pies. Entonces, al ser un golpe más corto, un swing más cortito, pues el margen de error va a disminuir, con lo cual es un poquito más sencillo. Entonces, una vez que ya tenemos el ritmo y la línea de swing correcta, sin muñequear mucho, no muñequeamos apenas nada, vamos a ver que la bola va a salir, va a salir siempre y cuando mi palo pase un poquito por debajo y ya verás como la bola va a subir un poco y va a llegar a nuestro destino, ¿no? Entonces, posición de los pies paralelo a mi línea del objetivo. Y ahora vamos a hacer ese balanceo suave, cogiendo el palo suave y lo único que quiero es una buena rotación de mi cuerpo. Venga. La bola sube y rueda un poco. Ese golpe es perfecto y es muy sencillo. Ahora os voy a explicar un poco por qué no vamos a hacer el otro el otro swing, que es elevando mucho la bola y que caiga la bola más a plomo y que no ruede mucho. Ese tipo de golpe, ¿cómo lo vamos a hacer? Pues muy sencillo. Luego os enseñaré dónde hacer este golpe que también este swing que también está bien, pero para esta circunstancia yo no la usaría porque, bueno, tengo desde el principio de green hasta la bandera más o menos tengo unos 7 8 m o menos. Es decir, que tengo margen para rodar un poco la bola. Entonces necesito una bola que vaya al cielo y que caiga plomo y que la bola no ruede apenas. Entonces, os voy a enseñar cómo sería el golpe de que sale más alto y eh y luego vamos a a una situación real. Entonces, os voy a enseñar cómo sería el golpe más alto. Entonces, lo primero que tenemos que hacer es nos vamos a colocar igual que antes, pero vamos a abrir la cara del palo, con lo cual la cara del palo ahora está apuntando a la derecha. Entonces yo si hago una línea de swing como la de antes, la bola, fijaros dónde sale, totalmente a la derecha. Entonces, para compensar un poco esa cara del palo, lo que yo voy a hacer es apuntar a la izquierda, con lo cual ya todo esto lo tengo que quitar. tiene que estar más así con todos los pies y todo mi cuerpo, tanto línea de los hombros, caderas, rodillas y pies, tienen que estar apuntando a la izquierda para compensar esta cara del palo. Y vamos a ver que si yo lo hago bien, mi línea de swing, claro, mi línea de swing tiene que ser paralela siempre a la de los pies. Entonces, si yo hago un buen swing y mi palo pasa por debajo, la bola, bueno, la cara del palo va a llegar con muchos grados, con lo cual la bola va a salir para arriba. ¿Por qué este golpe es un poco más difícil? Primero, porque la bola va a ir hacia arriba, va a hacer fuerza hacia arriba. Entonces, entonces no sabemos si va a llegar allí o no. Para hacer más fuerza, para que la bola llegue a mi destino, yo tengo que hacer más swing, con lo cual al hacer más swing, el margen de error sube. Entonces, me voy a colocar cara del palo muy abierta. Y ahora aquí sí vamos a usar mucho más mis muñecas, que está bien, pero es más complicado. Entonces voy a hacer varios swin en una línea paralela a la de mi objetivo. Creo que estoy apuntando demasiado a la izquierda, pero bueno, vamos a abrir más la cara del palo y vamos a ver como la bola va a subir al cielo. Me coloco aquí y me muevo bien hacia la izquierda, hacia donde está apuntando mi cuerpo. Cara del palo abierta y venga. Y aún así la bola sale a la derecha porque he abierto demasiado la cara del palo. Pero veis, la bola se queda en el sitio. Venga, vamos a pegar otra a ver si me sale bien. donde bota la bola se queda. Obviamente me falta entrenamiento. Eh, ahora estamos en la situación para pegar una bola más alta. Vamos a hacer el golpe de approach, pero yo diría casi globito. Entonces, el golpe de approach, pero con una bola muy alta. ¿Por qué? Porque tenemos un obstáculo aquí, la bandera casi al principio de green y además tenemos esa subidita que vamos que me obliga a botarla en la plataforma de arriba, que es en la plataforma de la bandera, porque ahí está justamente la la pendiente del green. Entonces, o la boto en la plataforma de la bandera o o claro, o se me va la bola para abajo. Entonces, necesito una bola muy alta para que caiga plomo y no ruede mucho. Y como no hay otro golpe aquí en todo el campo, nada más que este, me he venido en el golpe más difícil porque además estoy cuesta abajo, así que se me va a complicar más aún porque estando cuesta abajo, yo me tengo que colocar con la línea de los hombros, caderas y rodillas igual que el terreno. Entonces, eso me va a obligar a golpear también un poquito más descendente, más hacia abajo, igual que el terreno. Entonces, la bola va a salir baja, con lo cual yo tengo que abrir más todavía la cara del palo si quiero una bola alta. Entonces, se me añade un poco ya de por sí es complicado este golpe, como también para golpear también cuesta abajo. Entonces, se me se me ha complicado mucho, la verdad. Entonces voy a abrir mucho la cara del palo y voy a apuntar más a la izquierda. Pero cuidado, recordamos, yo necesito quebrar aquí un poquito las manos para darle un poquito de rapidez a ese palo para que hacer distancia, porque la bola va a hacer fuerza hacia arriba, no para hacer hacia delante, no para hacer distancia. Entonces, por eso necesito quebrar aquí un poquito las manos para darle rapidez al palo y recordar la línea de swing. Línea de swing hacia la izquierda. Hacia la izquierda, porque he hecho varios approach, varios globitos ahí y lo he visto. Claro, mi palo se venía un poquito para dentro, pero no lo suficiente, por eso la bola se me iba un poquito a la derecha. Entonces, bueno, viéndolo un poco en los vídeos, eh, entonces me coloco y voy a intentar de venirme hacia la izquierda. hacia la izquierda, que es más o menos para donde estoy apuntando. Y una cosa muy importante para este golpe, parece que la bola está al pie izquierdo. Si nos colocamos ahí enfrente, sí, bola al pie izquierdo, pero cuidado, yo en verdad quiero hacer un swing hacia la izquierda. Entonces, si yo no me coloco la cámara en perpendicular, sino me la coloco más perpendicular a donde estoy apuntando con los pies, la bola está al centro. Porque si yo me la coloco muy al pie izquierdo, va a ser más fácil de golpear un poquito por detrás. Te tienes que mover muy bien hacia delante. Entonces, si nos colocamos la cámara o nos vemos desde justamente la línea perpendicular a hacia donde está mi línea del objetivo, pues obviamente la bola está al pie izquierdo, pero claro, estamos apuntando a la izquierda. Entonces voy a apuntar a la izquierda y me voy a mover bien hacia la izquierda. Línea de su hacia la izquierda. Venga, por favor, hazlo a la primera. Cara del palo muy abierta. Me va a faltar fuerza. No está nada mal. Fijaros la bola va a las nubes, cae a plomo y no ha rodado casi nada. Me la voy a jugar y voy a pegar otra. Claro, este golpe si la bola está en un pequeño boquete no se puede hacer porque el palo no pasa por debajo. Siempre que la bola esté en condiciones, en una situación que tú veas que el palo puede pasar por debajo. Bien, entonces vamos a hacerlo otra vez. Me coloco y me muevo bien hacia la izquierda. Vamos, quebramos aquí un poquito las muñecas. Buah, esa es divina. Esa es divina. Nada, subscribe al like. Gracias.\n\n=== Video 14 (https://youtu.be/LEYR2BEDHFg) ===\n¿Os gustaría hacer un backspin como este? [música] Hola, soy Daniel García, soy jugador profesional de golf, miembro de la PGA de España y actualmente me estoy formando como técnico deportivo de la Real Federación Española de Golf. A continuación te voy a enseñar las claves para generar más efecto retroceso con tu swing. Lo primero que tenéis que saber son los conceptos que permiten que nuestra bola haga efecto retroceso cuando impactamos a la bola. El primero de ellos y creo que es el más fácil de conseguir o de cambiar en en un amater o cualquier jugador de golf es el de revisar nuestro material, tener una cara del palo limpia. Las estrías tienen que estar relativamente decentes, no llevar unas estrías o una cara de palo lisa de hace 20 o 30 años y el de usar una bola blanda. Eh, aquí tengo dos bolas. Esta es una Z Star, una Z Star de Rixon y una TP5X de Taylor Mate con estas bolas blandas y con una cara del palo con las estiras limpias y bien conservadas os permitirán un efecto retroceso mayor. El siguiente concepto que tenéis que tener en cuenta y para mí es uno de los más importantes es el de los grados de la cara del palo. Supongo que todos los amaters o jugadores habréis notado que con palos con mucha inclinación como el lckw, el sandwich o el gapwch producís mucho spin y uno de de esos puntos clave que tienen es que tienen muchos grados la cara del palo. Entonces eh algo que nos haría aumentar nuestro efecto retroceso es intentar llegar con los máximos grados posibles que nos permita esta cara del palo respecto a la vertical del suelo. Uno de los consejos o ejercicios que podéis practicar para conseguir esos máximos grados con el palo que tenéis en la mano es intentar que en el punto más bajo donde generáis velocidad tengáis el brazo totalmente estirado respecto a vuestra varilla. De esta manera, cuando generéis toda la velocidad de abajo, generaréis el máximo sprint posible al tener los máximos grados y la máxima velocidad en el punto bajo. El tercer concepto y no menos importante es el del ángulo de ataque. Tenemos que conseguir que el ángulo de ataque sea descendente en grados negativos y eso sumado a los grados de inclinación de la cara del palo producirá más spin. Un ejercicio muy bueno que podéis hacer para lograr un ángulo de ataque más descendente, para el que note que su ángulo de ataque pues es un pelín ascendente o no tiene los grados negativos suficientes para generar ese spin. hacer un arranque todo en bloque, un backswing cortito y en el momento antes de impactar intentar cimbrear la cara del palo empujando con los puños. Sería algo como así. Cuarto concepto. El cuarto concepto es la velocidad. Y creo que este puede ser el que cueste un poquito más en general a la mayoría de amaters. El conseguir una velocidad muy alta sumado a los pasos anteriores os va a generar mucho spin. Sí que es verdad que hay algunos eh algunos truquitos para generar más velocidad en un swing lento, como el de conseguir un plano más amplio, un backswing más alto. Eh, para mí ese sería el más fácil de cambiar y el intentar girar un poquito más tanto de hombros como de caderas, eso os ayudará a generar más velocidad. El quinto concepto y último es el de las condiciones del entorno. Empezaremos por la zona donde impactamos. Si [música] golpeamos la bola en una zona que está dura y muy segada, la fricción y el no tener hierba alrededor de la bola os generará mucho más spin. En cambio, en días en los que la zona está muy mojada, eh tenéis mucha hierba, eso os restará eh efecto retroceso a la bola. Luego en días de mucho viento, sobre todo cuando os coja el viento en contra, el efecto retroceso que eh hagáis eh con vuestro golpe os sumará más spin a la bola y os hará que vuelva muchos más metros hacia atrás cuando impacte el green. Vamos a hacer un repaso de estas cinco claves para generar más spin con vuestro swing. El primero es el del material, tener el material bien conservado y limpio. El segundo es el de los grados de la cara del palo. conseguir el máximo número de grados en el momento del impacto. El tercero es el del ángulo de ataque, intentar conseguir un ángulo de ataque descendente con grados negativos. El cuarto es el de la velocidad del swing. A más velocidad de swing, más efecto retroceso. Y el quinto es el de las condiciones del entorno. En una zona eh más dura, eh más segada ras, os generaréis más spin y en días de viento, sobre todo cuando os coja el viento en contra, generaréis más spin. Muchas gracias. Decidme si os han servido estos consejos, decídmelo en los comentarios, dejar un me gusta y suscribiros al canal. Nos vemos. M.\n\n=== NORMATIVA PITCH&PUTT ===\n3ª edició – Gener 2015 1\n \n \n \n \n \n \nREGLES DEL PITCH & PUTT  \n \nA CATALUNYA \n \n \n \n \nAprovades per les Assemblees de  \nl’ACPP i de la FCPP  \namb data de 17 de juny de2008 \n \n2ª Edició aprovada per les Assemblees de  \nl’ACPP i de la FCPP  \namb data de 23 de març de 2010 \n \n3ª Edició aprovada per les Assemblees de  \nl’ACPP i de la FCPP  \namb data de 18 de desembre de 2014 \n \nEn vigor des de l’1 de gener de 2015\n\n3ª edició – Gener 2015 2\nCONTINGUT \nIntroducció        \nCom utilitzar aquestes Regles     \nNormes de conducta       \nDefinicions        \n \n1ª Part GENERALITATS              \n\uf0b7 Regla 1 – General \n\uf0b7 Regla 2 – El Joc  \n \n2ª Part L’EQUIPAMENT / EL JUGADOR \n\uf0b7 Regla 3.1 – Els pals \n\uf0b7 Regla 3.2 – La bola \n\uf0b7 Regla 4 – Responsabilitats del jugador \n\uf0b7 Regla 5 – Practicar \n\uf0b7 Regla 6 – Lloc de sortida \n\uf0b7 Regla 7 – Jugant la bola \n\uf0b7 Regla 8 – Jugar des de lloc equivocat \n\uf0b7 Regla 9 – Netejar la bola \n\uf0b7 Regla 10 – Línia de joc. Línia de putt            \n \n3ª Part INCIDÈNCIES EN EL CAMP \n\uf0b7 Regla 11 – Condicions anormals del terreny \n\uf0b7 Regla 12 – Obstruccions \n\uf0b7 Regla 13 – Búnquer \n\uf0b7 Regla 14 – Obstacles d’aigua \n\uf0b7 Regla 15.1 – Green \n\uf0b7 Regla 15.2 – Green equivocat \n\uf0b7 Regla 15.3 – La bandera \n          \n4ª Part SITUACIONS DE LA BOLA DURANT EL JOC \n\uf0b7 Regla 16 - Bola Equivocada \n\uf0b7 Regla 17 - Bola Encastada \n\uf0b7 Regla 18 – Bola Moguda, Desviada o Aturada \n\uf0b7 Regla 19 – Bola Injugable \n\uf0b7 Regla 20 – Bola Perduda o Fora Límits \n\uf0b7 Regla 21 – Bola Provisional \n\uf0b7 Regla 22.1 – Buscant la bola \n\uf0b7 Regla 22.2 – Identificant la bola \n \n5ª Part  PRIOCEDIMENTS PER DROPAR, AIXECAR I MARCAR, \nCOL·LOCAR I REPOSAR \n\uf0b7 Regla 23.1 – Procediment per dropar \n\uf0b7 Regla 23.2 – Procediment per aixecar i marcar \n\uf0b7 Regla 23.3 – Procediment per col·locar i reposar \n          \n6ª Part  MODALITATS DE JOC\n\n3ª edició – Gener 2015 3\nFCPP / ACPP        Regles del Pitch & Putt a Catalunya \n \nLES REGLES DEL PITCH & PUTT A CATALUNYA  \n \nINTRODUCCIÓ \n \nLes competicions de Pitch and Putt que tenen lloc a Catalu nya es regeixen per les regles \nque figuren en aquest document i  segueixen les directrius i recomanacions establertes \nper la European Pitch and Putt Association (EPPA) i la International Federation of Pitch \nand Putt (FIPPA), entitats reguladores del Pitch and Putt a nivell europeu i nivell \nmundial respectivament. \n \nEls jugadors de Pitch and Putt, camps associats o adherits a l’ACPP i els clubs afiliats o \nadherits a la FCPP hauran de complir aquestes normes així com els reglaments i acords \nde les respectives Juntes Directives i Assemblees per a que tingui validesa qualsevol \ncompetició oficial d’aquest esport celebrada en el territori català. \n \nCAMPS, RECORREGUTS I NORMES BÀSIQUES \n \n1. Les competicions de Pitch and Putt només tindran validesa en aquells camps que \nd’acord amb l’article 6 A) dels Estatuts de la FCPP hagin estat homologats per \nl’Associació Catalana de Pitch and Putt.  \n2. Els recorreguts de Pitch and Putt catalans tenen una llargada  total de 1.000 \nmetres com a mínim i 1.600 com a màxim. La llargada  dels forats no pot ésser \ninferior a 40 metres ni superior a 120, sempre mesurats a centre de green.  \n3. El número de pals no pot ésser superior a set inclòs, obligatòriament, un putter. \n4. Els jugadors han de donar el seu cop de sortida des d ’una superf ície artificial, \nutilitzant o no un suport (tee), segons el seu criteri.  \n5. En les competicions locals anomenades EPPA o FIPP A, la llargària  màxima \nd’un for at serà de 90 metres ; la llargària  total màxima pels  divuit forats serà \nde1.200 metres; es jugarà amb un màxim de tres pals, del s quals un ha d’ésser el \nputter. En el cop de sortida cal col·locar la bola obligatòriament damunt d’un  \nsuport (tee) que ha de tenir una alçària mínima de 5 mm. \n \nREGLES DE JOC I LA SEVA APLICACIÓ. RECURSOS \n \n6. Les regles aplicables en les competicions que tinguin lloc a Catalunya –ja siguin \namb mides “catalanes” o les anomenades “EPPA” o “FIPPA” - seran les que \nconsten en aquest document.  \n7. Les regles aplicables en torneigs internacionals (tan t oficials com amistosos) \nseran les aprovades per l’ EPPA i la FIPPA per a aquestes competicions.  \n8. Els òrgans jurisdiccionals i els procediments i recursos en matèria de disciplina \nesportiva seran el s establerts en els Estatuts i Reglaments de Disciplina de l’ \nACPP i de la FCPP segons la competició de que es tracti. \n9. Cada competició oficial té el seu propi Reglament que no pot, en cap cas, \ncontradir el que s’estableix en el present Reglament General de  les \nCompeticions.\n\n3ª edició – Gener 2015 4\nFCPP / ACPP        Regles del Pitch & Putt a Catalunya \n \n10. En absència d’un Àrbitre, el Comitè de la Prova serà el responsable de resoldre \nles reclamacions dels jugadors en matèria de reglament. Si aquest Comitè no pot \narribar a una conclusió, podrà consultar amb el Comitè de Regles de la FCPP. \n11. El Pitch and  Putt a Catalunya és un esport en que homes i dones de totes les \nedats participen en les mateixes condicions. Malgrat això , es recomana el que hi \nhagi, a més de la classificació genera l, classificacions en les categories \nfemenina, sènior i juvenil per a fomentar l’esport entre aquests col·lectius. \n \nSISTEMA DE HANDICAP \n \n12. Segons la normativa internacional , el Pitch and Putt ha de tenir el seu sistema \npropi de handicap. L’ACPP i la FCPP com parteixen l’ús del mateix sistema de \nhandicap –propietat de la primera entitat -  que é s l’únic aplicable en les \ncompeticions oficials.\n\n3ª edició – Gener 2015 5\nFCPP / ACPP        Regles del Pitch & Putt a Catalunya \n \nCOM UTILITZAR AQUESTES REGLES \n \nÉs aconsellable que es familiaritzi amb aquestes Regles i les apliqui sempre que \nsorgeixi l’ocasió . En cas de dubte, jugui el camp tal com el  trobi i la bola tal com \nreposa. \n \nComprensió de les Paraules \nAquestes Regles s’han redactat d’una manera molt preci sa i deliberada. Vostè hauria de \ntenir en compte i comprendre les següents diferències en l’ús de les paraules: \n\uf0b7 pot  = opcional \n\uf0b7 hauria  = recomanació \n\uf0b7 haurà  = instrucció (penalització si no s’acompleix) \n\uf0b7 “la bola” = significa que no es pot canviar la bola per una altra \n\uf0b7 “una bola” = significa que es pot canviar la bola per una altra \n \nConèixer les Definicions \nUn bon coneixement de la terminologia definida és molt important per a la correcta \naplicació de les Regles. \n \nPenalització per infracció de les Regles o per incompliment del procediment \nLa penalització per infracció d’una regla tant en les competicions Stroke Play com en \nles competicions Matx Play és d’ UN COP  excepte que estigui estipulat d’una altra \nmanera. \n \nEl desconeixement de les Regles no eximeix de la penalització incorreguda.\n\n3ª edició – Gener 2015 6\nFCPP / ACPP        Regles del Pitch & Putt a Catalunya \n \nNORMES DE CONDUCTA \n \n\uf0b7 Ningú hauria de moure’s, parlar o situar -se a prop o directament  darrera de \nla bola o del forat quan un jugador està preparant o executant un cop. \n \n\uf0b7 Els jugadors haurien de jugar sense demora indeguda. \n \n\uf0b7 Quan el joc d’un forat ha estat completat, els jugadors haurien d’abandonar \nimmediatament el green i anotar el resultat en les targetes en el lloc de \nsortida del següent forat. \n \n\uf0b7 El jugador hauria d’assegurar -se de reparar amb cura qualsevol desperfecte \nocasionat al green per l’impacte d’una bola. \n \n\uf0b7 Els ju gadors haurien d ’evitar ocasionar cap desperfecte al green en \nmanipular la bandera , treure la bola del forat amb el cap del pal o  en \nrecolzar-se en el putter. \n \n\uf0b7 La bandera hauria de tornar -se a plantar en el forat de manera adequada \nabans de que els jugadors abandonin el green. \n \n\uf0b7 Abans d’abandonar un búnquer, el jugador hauria d’arranjar i allisar tots els \ndesperfectes ocasionats. \n \n\uf0b7 Es recomana l’us de vestimenta esportiva pròpia de la pràctica del Pitch and \nPutt intentant evitar: samarretes sense coll i sense mànigues en els homes, \nxandalls o samarretes esportives pròpies d’altres esports o amb simbologies \nalienes a l’esport, calçat esportiu no  adequat, obert o amb poca sujecció del \npeu. \n \n\uf0b7 La infracció reiterada de les Normes de Conducta, comportarà la \ndesqualificació del jugador per part del Comitè de la Prova.\n\n3ª edició – Gener 2015 7\nFCPP / ACPP        Regles del Pitch & Putt a Catalunya \n \nDEFINICIONS \n \nAIGUA ACCIDENTAL \n“Aigua Accidental” és una condició anormal del terreny per  acumulació temporal \nd’aigua, neu o gel natural en el camp,  que no està en un obstacle d’aigua i que sigui \nvisible abans o després de que el jugador es col·loqui.  La rosada i el gebre no son aigua \naccidental. \n \nÀRBITRE \nPersona designada pel Comitè per acompanyar als jugadors a fi de decidir qüestions de \nfet i aplicar les Regles. En tot e l referent a l’aplicació i interpretació de les Regles, la \ndecisió de l’àrbitre és final.  Haurà d’actuar davant qualsevol infracció d’una Regla que \nobservi o li sigui denunciada. \n \nBANDERA \nÉs un indicador dret i movible amb una tela incorporada, col·locat al centre del forat per \nindicar la seva posició. \n \nBÀNDOL \nUn, dos o més jugadors que són companys. \n \nBOLA EMBOCADA \nUna bola està “embocada” quan reposa dins de la circumferència del forat i tota ella es \ntroba per sota del nivell de la vora del forat. \n \nBOLA EN JOC \nUn bola està “en joc” tan aviat com el jugador ha executat un cop des del lloc de sortida, \nha estat dropada, col·locada o reposada quan les Regles ho permeten . Continua en joc \n(com a bola del jugador) fins a ser introduïda dins del forat, excepte quan està fora de \nlímits, “perduda o aixecada o ha estat substituïda d’acord amb aquestes regles.  Una bola \nque així substitueix la bola anterior es converteix en la bola en joc. \n \nBOLA EQUIVOCADA \nBola Equivocada és qualsevol bola que no sigui la bola en joc del jugador , una bola \nprovisional o en el joc per cops, una segona bola jugada pel jugador sota la Regla 2-c. \n \nBOLA MOGUDA \nEs considera que una bola s’ha mogut de la seva p osició original si s’ha desplaçat  tan \nsols una fracció de la seva circumferència. \n \nBOLA PERDUDA \nUna bola està “perduda” en el camp si: \na. No és trobada i identificada dins dels tres minuts, comptats des de que s’ha \ncomençat la seva recerca; o \nb. El jugador ha posat una al tra bola en joc sota les regles amb la penalització de \ncop i distància.\n\n3ª edició – Gener 2015 8\nFCPP / ACPP        Regles del Pitch & Putt a Catalunya \n \nBOLA PROVISIONAL \nUna bola provisional és una b ola jugada sota aquestes regles quan una bola pot estar \nperduda fora d’un obstacle d’aigua o pot estar fora de límits. \n \nBÚNQUER \nObstacle consistent en un àrea de terreny on la gesp a ha estat substituïda per sorra o \nsimilar. Una paret o vorera d’un búnquer que no estiguin cobertes de gespa, són part del \nbúnquer. \nEl marge d’un búnquer s’estén verticalment cap a baix però no cap a dalt. Una bola està \nen un búnquer quan hi reposa o qualsevol part d’ella el toca. \n \nCADDIE \nUn “caddie” és qui ajuda al jugador d’aco rd amb les Regles. Inclou portar -li els pals, \ndonar-li consell, etc.  \n \nCAMP \nEl “camp” és tota l’àrea dins de la qual està permès el joc. \n \nCAUSA ALIENA \nÉs aquella que no forma part del partit o en el joc per cops, no forma  part del bàndol del \ncompetidor. Ni el vent ni l’aigua són causa aliena. \n \nCOL·LOCAR-SE \nConsisteix en situar els peus en posició en preparar-se per a efectuar un cop. \n \nCOMITÈ \nÉs la comissió degudament anomenada  pel club o per l’associació organitzadora de la \ncompetició. El comitè no té poder  per excloure una Regla de Pitch and Putt.  El comitè \npot establir i publicar Regles Locals sempre i quan no vagin en contra  de les Regles de \nPitch and Putt. \n \nCOMPANY \nÉs un jugador associat amb un altre en el mateix bàndol. \n \nCOMPETIDOR \nÉs un jugador en una prova per cops. \n \nCONDICIONS ANORMALS DEL TERRENY \nÉs qualsevol aigua accidental, terreny en reparació o qualsevol desperfecte inusual en el \ncamp produït per causes naturals, animals, per vehicles o persones. \n \nCONSELL \nConsell és qualsevol parer o suggeriment  que pogués influir en un jugador per \ndeterminar el seu joc o el mètode per executar un cop . Informació relacionada amb les \nregles i qüestions de domini públic, no són consell.\n\n3ª edició – Gener 2015 9\nFCPP / ACPP        Regles del Pitch & Putt a Catalunya \n \nCOP \nUn cop és el movi ment del pal cap a la bola amb la intenció de copejar -la i moure -la. \nPerò si un jugador atura voluntàriament la baixada del pal abans de que el cap del pal \narribi a la bola, es considerarà que no ha executat un cop. \n \nCOP DE PENALITZACIÓ \nÉs el que, sota l’aplicació de les Regles, s’afegeix al resultat d’un jugador o bàndol. \n \nEQUIPAMENT \nÉs qualsevol cosa usada, portada o transportada pel jugador o tot al que transporta per a \nell, el seu company o qualsevol dels seus caddies. \n \nFORA DE LÍMITS \nEl “fora de l ímits” està definit per tanques, estaques, murs, línea blanca,  i jugar més \nenllà d’aquests límits està prohibit. La part interior d’aquests elements marca la línea de \nfora límits. El Comitè pot marcar com a fora de límits qualsevol part dins del camp. Una \nbola està fora de límits quan tota ella reposa fora de límits. Un jugador pot situar -se fora \nde límits per jugar una bola que està dins dels límits. \nEls objectes que defineixen el fora de límits no són obstruccions i es consideren fixes. \nLa línia de fora de límits s’estén verticalment cap a dalt i cap a baix. \n \nFORAT \nEl “forat” tindrà 108 mm de diàmetre i al menys 101,6 mm de fo ndària. Si s’utilitza un \nfolre aquest haurà d’estar enfonsat al menys 25,4 mm per sota la superfície del green. \n \nGREEN \nEl green és tot el  terreny del forat que s’està jugant preparat especialment pel putt er. \nUna bola està en el green quan qualsevol part d’ella mateixa toca el green.  \n \nGREEN EQUIVOCAT \nUn green equivocat és qualsevol green que no sigui el del forat que s’està jugant.  \n \nIMPEDIMENTS SOLTS \nImpediments solts són objectes naturals que no estiguin fixats o en creixement i que  no \nestiguin adherits a la bola i inclouen pedres que no estiguin sòlidament encastades, sorra \ni terra solta, fulles, llenya menuda, branques i similars, excrem ents, cucs, insectes i \ndetritus o piles formats per ells. \nLa rosada i el gebre no són impediments solts. \n \nLÍNIA DE JOC \nLa línia de joc és la direcció que el jugador desitja que segueixi la seva bola després \nd’un cop, més una distància raonable a ambdós cos tats de la direcció desitjada. La línia \nde joc s’estén verticalment cap amunt des del terra, però no es perllonga més enllà del \nforat. \n \nLÍNIA DE PUTT \nLa línia de putt és la línia que el jugador desitja que segueixi la seva bola després d’un \ncop en el green. La línia de putt no s’estén més enllà del forat.\n\n3ª edició – Gener 2015 10\nFCPP / ACPP        Regles del Pitch & Putt a Catalunya  \n \nLLOC DE SORTIDA \nEl lloc de sortida és l’indret des del qual s’inicia el joc en el forat que s’ha de jugar i és \nel mateix per a tots els jugadors. L’àrea definida com a lloc de sortida és la determinada \npel Comitè i la seva superfície serà artificial (estora), tret que el comitè ho estableixi \nd’una altra manera.  \n \nMARCADOR \nPersona designada pel Comitè per anotar el resultat d’un competidor en el joc per  cops. \nNo és un Àrbitre. \n \nOBSTACLES \nUn obstacle és qualsevol búnquer o obstacle d’aigua. Una bola està en un obstacle quan \nhi reposa o qualsevol part d’ella toca l’obstacle.  \n \nOBSTACLE D’AIGUA \nUn obstacle d’aigua és qualsevol mar, llac, bassa, riu, rasa, d renatge superficial o altres \nllits d’aigua oberts (continguin aigua o no).  Tot el terreny i  aigua dins del marge d’un \nobstacle d’aigua són part de l’obstacle. \nMentre el marge d’un obstacle d’aigua no estigui delimitat d’una altra manera, ho estarà \npel punt on comença la depressió  del terreny o un canvi important a les condicions del \nmateix. \nQuan el marge d’un obstacle d’aigua està delimitat per objectes artificials (travesses, \npedres, murs, tanques, etc.), aquests estan dins de l’obstacle i el seu marge est à definit \npels punts exteriors dels objectes a nivell del terra. Aquests objectes artificials són \nobstruccions inamovibles. \nQuan el marge d’un obstacle d’aigua està delimitat per una línia al terra, aquesta està \ndins de l’obstacle d’aigua. \nEl marge d’un obstacle d’aigua s’estén verticalment cap a dalt i cap a baix. \nLes estaques que identifiquen un obstacl e d’aigua haurien de ser vermelles i són \nobstruccions. \nEl Comitè o el seu representant autoritzat, pot declarar qualsevol part del recorregut \ncom a obstacle d’aigua. \n \nOBSTRUCCIONS \nUna obstrucció és qualsevol cosa artificial, tan t si està aixecada com si no, situada en el \ncamp excepte: \na. Els objectes que defineixen el fora de límits tal s com murs, tanques, estaques i \nfilats. \nb. Qualsevol construcció declarada pel comitè com a part integrant del camp. \nc. Qualsevol part d’un objecte artificial inamovible situat fora de límits. \nUna obstrucció és una obstrucció movible si es pot moure sense un esforç exagerat, \nsense demorar indegudament el joc i sense ocasionar desperfect es. D’una altra manera, \nés una obstrucció inamovible. \n \nPRACTICAR \nPracticar és colpejar una bola de manera deliberada de la forma que el jugador desitjaria \nfer-ho en el camp en el decurs del joc.\n\n3ª edició – Gener 2015 11\nFCPP / ACPP        Regles del Pitch & Putt a Catalunya  \n \nPREPARAR EL COP \nUn jugador ha preparat el cop quan s’ha col·loca t amb intenció de  efectuar-lo i ha \nrecolzat el pal darrera la bola. No obstant, en un obstacle, el jugador ha preparat el cop \nquan s’ha col·locat en posició, doncs no hi està permès recolzar el pal. \n \nPUNT MÉS PROPER D’ALLEUJAMENT \nEl punt més proper d’alleujament és el punt en el camp, més proper al lloc on reposa la \nbola, que no està més a prop del forat, i on no existeix la interferència de la qual està \npermès alleujar-se.  \n \nRECORREGUT \nRecorregut és tota l’àrea del camp, excepte: \na. El lloc de sortida i el green del forat que s’està jugant. \nb. Tots els obstacles del camp. \n \nSUPORT / TEE \nUn suport i/o un “tee” són dispositius artificials escollits per a elevar la bola sobre el \nterreny.  \n \nSWING DE PRÀCTICA \nUn swing de pràctica no és un cop de pràctica i e s pot efectuar en qualsevol lloc amb la \ncondició de que el jugador no infringeixi les Regles. \n \nTERRENY EN REPARACIÓ \nTerreny en Reparació és una condició anormal del terreny en  qualsevol part del camp \nmarcada com a tal pel comitè o així declarat pel seu representant autoritzat. Qualsevol \nherba, arbre o cosa en creixement dins del “terreny en reparació” és part del “terreny en \nreparació”. Inclou material apilat per a ser retirat i qualsevol forat fet per un enca rregat \ndel manteniment del camp, inc lòs si no està marcat com a tal, i les àrees \nmediambientalment sensibles. Les estaques i/o les línies que defineixen el “terreny en \nreparació” estan dins d’aquest terreny. Aquestes estaques són obstruccions. El marge \nd’un “terreny en reparació” s’estén verticalment cap a baix, però no cap a dalt. \nUna bola està en “terreny en reparació ” quan hi reposa o qualsevol part d’ella toca el \n“terreny en reparació”. \nUna Regla Local pot prohibir el joc des d’un “terreny en reparació”. \n \nVOLTA ESTIPULADA \nExcepte que el Comitè ho autoritzi d’una altra manera, una “volta estipulada” consisteix \nen jugar els forats del camp en el seu nombre i ordre correctes.\n\n3ª edició – Gener 2015 12\nFCPP / ACPP        Regles del Pitch & Putt a Catalunya \n \n1ª PART – GENERALITATS \n \nRegla 1. GENERAL \nQualsevol disputa o punt dubtós sobre les Regles o quan aquestes Regles no \nproporcionin aclariment per a una situació específica  ha de ser sotmès al Comitè de \nCompetició, la decisió del qual és final. \nSi el Comitè de Competició  no pot arribar a una decisió, sotmetrà la disputa o punt \ndubtós al Comitè de Regles i Camps de la FCPP, la decisió del qual és inapel·lable. \nEl Comitè ha d’establir les condicions sota les quals s’ha de jugar una competició i  pot \nestablir Regles Locals per a condicions anormals locals en el camp sempre que no vagin \ncontra les Regles del Pitch and Putt, per exemple, declarar una obstrucció inamovible \ncom a part integrant del camp (paret, pou,...), un búnquer impracticable com a terreny \nen reparació, una part de l camp significativa com obstacle d’aigua i declara r zones de \ndropatge quan per les condicions dels camp sigui necessari pel bon desenvolupament \ndel joc. \n     \nRegla 2. EL JOC \na. El joc del Pitch and Putt consisteix en jugar una bola amb un pal des de cada \nLloc de Sortida fins a l’interior del forat corresponent mitjançant un o successius \ncops d’acord amb aquestes Regles. Excepte si el Comitè ho permet d’una altra \nmanera, els forats hauran de jugar-se en ordre, començant en el forat número 1. \nb. La bola es jugarà t al com reposi excepte si les Regles ho disposen d’una altra \nmanera. \nc. Si un jugador té dubtes sobre la forma de procedir pot, sense penalització, acabar \nel forat amb dues boles. Abans de jugar, el jugador haurà d’anunciar el seu \npropòsit i haurà de dir quina  bola vol que compti d’acord amb les regles. El \ncomitè decidirà en acabar la volta estipulada.  Una segona bola jugada sota la \nregla 2.c, no és una bola provisional. \nd. Una competició està tancada quan el resultat ha estat publicat oficialment . En el \njoc per cops, no es pot anul·lar, modificar o imposar una penalització després de \nque s’hagi tancat la competició . Després de tancada una competició s’haurà \nd’aplicar una penalització de desqualificació si un competidor: \n\uf0b7 ha entregat un resultat en qualsevol forat més baix del realment obtingut. \n\uf0b7 ha entregat una targeta on hi figura un handicap superior al que l i \ncorrespon. \n\uf0b7 s’ha posat d’acord per no aplicar les Regles (Regla 4.f). \n\uf0b7 sabia abans de tancar -se la competició que havia infringit qualsevol \nRegla per la qual la penalització era la desqualificació. \ne. Només una penalització de desqualificació pot deixar d’aplicar -se, modificar-se \no imposar-se en casos individuals excepcionals si el Comitè ho considera oportú.\n\n3ª edició – Gener 2015 13\nFCPP / ACPP        Regles del Pitch & Putt a Catalunya \n \n2ª PART – L’EQUIPAMENT / EL JUGADOR \n \nRegla 3. ELS PALS I LA BOLA \n \n3.1. ELS PALS \na. No es poden aplicar materials estranys a la cara d’un pal (sota penalització de \ndesqualificació). \nb. Un jugador podrà seleccionar per la volta, un màxim de set pals (que s ’ajustin a \nles especificacions  reconegudes). És obligatori, sota penalització de \ndesqualificació, que un d’ells sigui un putter. \nc. Si un jugador ha començat la volta amb menys de set pals en podrà afegir \nsempre que no excedeixi de set i que no sigui de qualsevol altra persona que està \njugant en el camp. \nd. Es pot substituir un pal només si aquest ha quedat inservible en el decurs normal \ndel joc (actes raonables excloent els violents). La substitució no pot fer -se \nprenent prestat un pal  seleccionat per el joc p er qualsevol altra persona que \nestigui jugant en el camp i haurà de fer-se sense demora indeguda. \ne. Els companys de bàndol poden compartir els pals, sempre que el nombre total de \npals no sigui superior a set. \n \nPENALITZACIÓ PER INFRACCIÓ DE LA REGLA 3.1.c, 3.1.d, 3.1.e \n(qualsevol sigui el número de pals portats en excés): afegir un cop en cada \nforat on ha existit la infracció amb un màxim de tres cops per volta.  \n \nf. El jugador haurà de declarar fora de joc qualsevol pal o pals portats o utilitzats \ninfringint la Regla 3.1.b en el moment de descobrir -ho. Aquests pals no es \npodran utilitzar durant la resta de la volta estipulada. \n \nPENALITZACIÓ per infracció de la Regla 3.1.f: desqualificació \n \n3.2. LA BOLA \na. El diàmetre de la bola no tindrà menys de 42,67 mm (1,68 polz ades) i haurà \nd’ajustar-se a les especificacions reconegudes. \nb. En competició, la bola que jugui el jugador haurà de ser clarament identificable. \nc. No es poden aplicar materials estranys a les boles o manipular -les de qualsevol \naltra manera. \n \nPENALITZACIÓ: desqualificació \n \nd. Si una bola es trenca com a resultat d’un cop, el cop s’anul·la i el jugador jugarà \nuna altra bola sense penalització tant a prop com sigui possible del lloc on va \njugar la bola original.\n\n3ª edició – Gener 2015 14\nFCPP / ACPP        Regles del Pitch & Putt a Catalunya \n \nRegla 4. RESPONSABILITATS DEL JUGADOR \na. El jugador haurà de sortir a l’hora establerta pel comitè.  \nb. El jugador haurà de romandre tota la volta estipulada en el grup designat pel \ncomitè. \nc. El jugador no pot interrompre el joc. Si un jugador interromp el joc sense permís \ndel Comitè, ha de informar el Comitè tan aviat com sigui possible. Si el Comitè \nconsidera raonables els motius pels que ha interromput el joc, no hi ha penalitat, \nen cas contrari està desqualificat. \nQuan el joc és suspès pel comitè, el jugadors poden acabar el joc del forat que \ns’està jugant o interrompre el joc immediatament . Els jugadors no reprendran el \njoc fins que el Comitè l´ordeni. \nEl joc ha de ser reprès de d`on va ser interromput, excepte que es reprengui el \njoc en un dia diferent,  que la decisió correspondrà a la Comissió esportiva de la \nFCPP. Si es reprèn el mateix dia, el jugador procedirà  com segueix: \nSi el jugador havia aixecat la bola, ha de col•locar una bola en el punt en que va \nser aixecada la bola original \nSi el jugador no havia aixecat la bola, pot aixecar, netejar i reposar la bola en el \npunt en que va ser aixecada. La bola ha de ser marcada abans d`aixecar-la. \nSi la bola o el marcador de la bola s`ha mogut mentre el joc estava suspès, ha de \ncol•locar-se una bola o un ma rcador de bola en el punt on van ser moguts. Si el \npunt on la bola ha de ser col•locada, no es pot determinar, haurà de ser estimat i \ncol•locar la bola en aquest punt. \nd. El jugador pot ser assistit per un caddie però no pot tenir més d’un caddie alhora. \nEl comitè, en les condicions d’una competició, pot prohibir l’ús de caddies. \ne. El jugador és responsable de que el resultat anotat en la seva targeta en cada \nforat és el correcte. Després d’acabar la volta, el jugador haurà d’assegurar -se de \nque ell i els marcadors que hagin intervingut han signat la targeta i retornar -la al \ncomitè tan aviat com sigui possible. \nf. Acord per Excloure Regles: els jugadors no es posaran d’acord per excloure \nl’acompliment de qualsevol Regle o suprimir qualsevol penalització \nincorreguda. \ng. En el joc per cops si un jugador deixa d’embocar la bola en qualsevol forat, està \ndesqualificat. Si un jugador torna un resultat en qualsevol forat més baix que el \nrealment obtingut, el jugador està desqualificat. Un resultat més alt del realment \nobtingut es mantindrà. \nh. Si un competidor refusa acomplir una Regla afectant els drets d’un altre \ncompetidor, estarà desqualificat. \n \nPENALITZACIÓ: desqualificació \n \ni. Abans de començar el joc d’un forat (o quan es canvia la bola), cada jugador \nhauria d’identificar clarament la seva bola al seu marcador / contrari. \nj. Cap jugador influirà en la posició o el moviment d’una bola excepte quan les \nRegles ho permeten. Moure l’equipament de qualsevol jugador o la bandera \natesa, no suposa infracció d’aquesta Regla.\n\n3ª edició – Gener 2015 15\nFCPP / ACPP        Regles del Pitch & Putt a Catalunya \n \nk. Un jugador no donarà ni demanarà consell, excepte al/del seu company de \nbàndol/caddie. El comitè, en les condicions d’una competició per equips, pot \npermetre que cada equip designi una persona que pot donar conse ll als membres \nd’aquest equip. \nl. El jugador serà el responsable de jugar la seva bola.  Excepte en un obstacle,  el \njugador podrà marcar i aixecar la bola per tal de poder identificar -la. El jugador \nhaurà d’informar el seu propòsit al seu marcador / adversari. \nm. Els jugadors d’un mateix grup haurien de lliurar conjuntament les seves targetes \nde resultats als organitzadors de la competició. \nn. Les penalitzacions incorregudes entre el joc de dos forats, s’aplicaran en el \nsegüent forat. \n \nPENALITZACIÓ: un cop \n \no. El jugador haurà de jugar sense demora indeguda. \n \nPENALITZACIÓ PER INFRACCIÓ DE LA REGLA 4.o:  \n1ª infracció: avís sense penalització.  \n2ª infracció: 1 cop de penalització. \n3ª infracció: desqualificació. \n \nRegla 5. PRACTICAR. \na. En qualsevol dia d’una competició abans d’una volta, un jugador pot practicar el \ncamp de la competició fins a una hora abans de l’horari de sortida establert pel \ncomitè. El comitè, en les condicions d’una competició, pot prohibir practicar al \ncamp en qualsevol dia d’una competició. \n \nPENALITZACIÓ: desqualificació \n \nb. En el decurs de qualsevol competició  un jugador no realitzar à cap cop de \npràctica excepte que es pot practicar el putt en el green de l’últim forat jugat  \nsense demorar el joc. El comitè, en les condicions d’una competició, pot prohibir \npracticar el putt en el green de l’últim forat jugat. \n \nPENALITZACIÓ: un cop \n \nc. No es considerarà “pràctica” el fet de que un jugador acabi de jugar un forat tot i \nque el seu resultat no compti. Aquesta Regla és d’aplicació en totes les \nmodalitats de joc.\n\n3ª edició – Gener 2015 16\nFCPP / ACPP        Regles del Pitch & Putt a Catalunya \n \nRegla 6. LLOC DE SORTIDA \na. L’àrea definida com a lloc de sortida (estora) no es pot desplaçar de la ubicació \ninicial determinada pel comitè. \nb. Tant en el joc per cops com en el joc per forats, el pr imer jugador que jugarà des \ndel primer lloc de sortida estarà determinat per l’ordre de sortides o en el seu \ndefecte o en cas d’un desempat, és decidirà per sorteig. El bàndol amb el resultat \nmés baix brut en el forat acabat de jugar, sortirà primer en el següent lloc de \nsortida. \nc. La bola haurà de jugar-se des de dins del lloc de sortida acomodant-la o no sobre \nun suport (tee)  reglamentari. A les competicions anomenades EPPA o FIPPA \nserà obligatori jugar des d’un suport (tee). \nSi en començar un forat, un competido r juga des de fora del lloc de sortida, \nhaurà de repetir el cop des del lloc correcte amb un cop de penalització. Si no \nrectifica l’error i surt des del següent lloc de sortida estarà desqualificat. \nEl cop donat des de fora del lloc de sortida i els donats  abans de corregir l’error, \nno comptaran pel seu resultat. \nd. Si la bola cau del suport (tee) o el jugador la fa caure en preparar el cop, es \npodrà tornar a acomodar damunt del suport (tee) sense penalització. Si en \naquestes circumstàncies la bola ha estat copejada, haurà de comptar-se el cop i la \nbola es jugarà tal com reposi. \ne. Un jugador que jugui des d’un lloc de sortida equivocat, haurà d’anular el cop/s \njugat/s i haurà de jugar des del lloc de sortida correcte. El jugador incorrerà en la \npenalització d’un cop.  Si  l’error no es rectifica abans de jugar un cop des del \nsegüent forat, estarà desqualificat. \nSi el forat que està jugant és l’últim forat de la volta, haurà d’anunciar -ho  i \nrectificar abans d’abandonar el green. \nf. Un jugador haurà d’acabar el forat amb la bola jugada des del lloc de sortida \nexcepte que una regla l’autoritzi a substituir -la per una altra bola (una bola \ninservible pel joc, perduda o irrecuperable). \ng. Un jugador pot col·locar -se fora del lloc de sortida per a jugar una bola que hi \nestà dins. \nh. Un jugador pot eliminar irregularitats de la superfície del lloc de sortida o treure \nrosada, gebre o aigua \n \nPENALITZACIÓ PER INFRACCIÓ DE LA REGLA 6.a, 6.f : un cop \n \nRegla 7. JUGANT LA BOLA \na. La bola haurà de copejar -se amb el cap del pal i no s’haurà d’ empènyer, \narrossegar o encullerar. \nb. Si el pal d’un jugador copeja més d’una vegada la bola en executar un cop, el \njugador comptarà el cop i se’n afegirà un altre de penalització  per un total de \ndos cops. \nc. En el joc per cops, quan les boles estan en joc, s’hauria de jugar en primer lloc la \nbola més allunyada del forat. \nd. En el joc per forats, si un jugador juga fora de torn, el contrari pot requerir al \njugador que cancel·li el cop i jugui en l’ordre correcte. \ne. Es poden treure impediments solts exce pte quan una bo la està en moviment o \nquan tant els impediments solts com la bola toquen o reposen en un obstacle.\n\n3ª edició – Gener 2015 17\nFCPP / ACPP       Regles del Pitch & Putt a Catalunya \n \nf. Per equitat, un jugador té  dret a jugar la seva bola en les mateixes condicions \nque tenia en el moment en que va quedar en repòs. \n \nPENALITZACIÓ PER INFRACCIÓ DE LA REGLA 7.a, 7.e : un cop \n \nRegla 8. JUGAR DES D’UN LLOC EQUIVOCAT \na. Si un jugador executa un cop amb la seva bola en joc des d’un lloc en el camp \non les Regles no permeten jugar un cop, dropar una bola o col·locar-la o quan \nles Regles requereixen que una bola dropada torni a dropar -se o una bola \nmoguda sigui reposada, el jugador estarà jugant des d’un lloc equivocat. \nEl jugador haurà d'acabar el forat amb la bola jugada des del lloc equivocat \nsense corregir l’error i afegirà un cop de penalització segons la regla aplicable. \nb. Si el comitè considera que el jugador ha aconseguit un avantatge considerable, \nestarà desqualificat. \n \nRegla 9. NETEJAR LA BOLA \nUna bola que ha estat aixecada segons les Regles, podrà s er netejada sense penalització \nexcepte si la bola ha estat marcada i aixecada per què interfereix o ajuda (fora de green) \nal joc. \n \nPENALITZACIÓ: un  cop  \n \nRegla 10. LÍNIA DE JOC. LÍNIA DE PUTT \na. Un jugador no millorarà o permetrà que es millori la línia  de joc o la posició de \nla bola i no mourà, doblegarà o trencarà qualsevol cosa fixa o en creixement \nexcepte si:  \n\uf0b7 aquesta acció succeeix en col·locar-se netament. \n\uf0b7 en executar un cop o el moviment cap enrera del seu pal per a un cop \ni executar-ne el cop. \nb. Si la posició de la bola, a qualsevol lloc del camp, interfereix amb la col·locació, \nswing o línia de joc d’un altre jugador, o ajuda en el seu joc, la bola haurà de \nmarcar-se i aixecar -se, si és requerit  per qualsevol jugador , i posteriorment \nreposar-se. La bola no es pot netejar tret que estigui en el green . En stroke play \nsi el Comitè determina que els competidors han acordat no aixecar una bola que \npot ajudar qualsevol competidor, estan desqualificats. \nc. En un altre lloc que no sigui el green, qualsevol pot  indicar la línia de joc, però \nel jugador no pot permetre que algú (el seu caddie, el seu company, el caddie del \nseu company) es situï en o a prop o d’una prolongació d’aquesta línia mentre \nefectua el cop. \nd. Quan la bola d’un jugador està a green, ell, el se u company o el seu caddie pot, \nabans però no durant el cop, senyalar la línia de putt però sense tocar la \nsuperfície del green. \ne. Un jugador en executar un cop, no haurà d’acceptar ajuda física ni protecció \ncontra els elements ni permetre que el seu caddie, company o el caddie del seu \ncompany es situïn a o a prop de la prolongació de la línia de joc o línia de putt \ndarrera de la bola. \nPENALITZACIÓ PER INFRACCIÓ DE LA REGLA 10: un cop\n\n3ª edició – Gener 2015 18\nFCPP / ACPP        Regles del Pitch & Putt a Catalunya \n \n3ª PART – INCIDÈNCIES EN EL CAMP \n \nRegla 11. CONDICIONS ANORMALS DEL TERRENY \n \nSi la bola d’un jugador reposa o toca una condició anormal del terreny o quan aquesta \ncondició interfereix amb la seva col·locació, el seu swing, o la línia de putt quan la bola \nestà a green, el juga dor pot alleujar-se sense penalització o jugar-la com reposa sinó hi \nha una regla local que ho prohibeixi. \n \nProcediment d’alleujament opcional: \n\uf0b7 En el recorregut: dropar la bola dins la distancia d’un pal del punt més \nproper d’alleujament però no més aprop del forat i que no sigui en un \nobstacle o en un green.  \n\uf0b7 En el bunker: dropar la bola dins del bunker dins la distancia d’un pal del \npunt més proper d’alleujament però no més aprop del forat. \n\uf0b7 En el green: col·locar la bola en el punt més proper d’alleujamen t però no \nmés aprop del forat. El punt més proper pot ser fora de green. \n \nPENALITZACIÓ PER INFRACCIÓ DE LA REGLA 11: un  cop  \n \nRegla 12. OBSTRUCCIONS \na. Qualsevol obstrucció movible  es pot treure sense penalització.  Si la bola es \nmou, haurà de reposar -se. Si no es reposa, s’incorrerà en un cop de \npenalització, en aplicació de la Regla 18.a Si la bola reposa dins o sobre \nl’obstrucció movible, es pot aixecar la bola  i treure l’obstrucció . La bola es  \ndroparà en el recorregut o en un obstacle, i en el green es col·locarà tant a prop \ncom sigui possible del punt on es trobava la bola. \nb. Excepte quan la bola està en un obstacle d’aigua, un jugador pot alleujar -se \nsense penalització quan la bola s’atura al damunt d’una obstrucció inamovible \no si aquesta interfereix amb la col·locació, el swing del jugador o la línia de putt \nquan la bola està a green. \n \nProcediment d’alleujament opcional: \n\uf0b7 En el recorregut: dropar la bola dins la distancia d’un pal del punt més \nproper d’alleujament però no més aprop del forat i que no sigui  en un \nobstacle o en un green.  \n\uf0b7 En el bunker: dropar  la bola dins del bunker dins la distancia d’un pal del \npunt més proper d’alleujament però no més aprop del forat. \n\uf0b7 En el green: col·locar  la bola en el punt més proper d’alleujament però no \nmés aprop del forat. El punt més proper pot ser fora de green. \n \nPENALITZACIÓ PER INFRACCIÓ DE LA REGLA 12: un cop\n\n3ª edició – Gener 2015 19\nFCPP / ACPP        Regles del Pitch & Putt a Catalunya \n \nRegla 13. BÚNQUER \na. Abans d’executar un cop a la bola dins d’un búnquer, el jugador no haurà de \n\uf0b7 Tocar la superfície o la sorra amb el pal excepte si ho fa per evitar o com a \nconseqüència d’una caiguda, en treure una obstrucció, al mesurar, al \nmarcar la posició, recuperar o aixecar, col·locar o reposar una bola sota un \nRegla o en recolzar els seus pals. \n\uf0b7 Tocar o moure un impediment solt dins del búnquer. \nb. Un cop amb el qual la bola no surti del búnquer no representa en sí una infracció \nde la Regla  13.a però, allisar irregularitats abans de jugar -ne un segon o \nqualsevol dels cops posteriors des de la sorra, és una infracció de la Regla. \n \nPENALITZACIÓ PER INFRACCIÓ DE LA REGLA 13: un  cop  \n \nRegla 14. OBSTACLES D’AIGUA \na. Es pot jugar una bola dins d’un obstacle d’aigua sense penalització, però el \njugador no podrà: \n\uf0b7 Tocar la superfície o l’aigua de l’obstacle am b el pal excepte si ho fa per \nevitar o com a conseqüència d’una caiguda, en treure una obstrucció, al \nmesurar, al marcar la posició, recuperar o aixecar, col·locar o reposar una \nbola sota un Regla o en recolzar els seus pals. \n\uf0b7 Tocar o treure impediments solts de dins de l’obstacle. \n \nb. Si una bola està o està perduda dins d’un obstacle d’aigua (tant si la bola està \ndins de l’aigua o no), el jugador pot amb un cop de penalització: \n \n Procediment per continuar el joc \n\uf0b7 Jugar una bola tan a prop com sigui possible del  punt on va ser jugada per \núltima vegada la bola original o  del punt on es va jugar l’últim cop des de \nfora de l’obstacle d’aigua. \n\uf0b7 Dropar una bola darrera de l’obstacle d’aigua, mantenint una línia recta \nentre el forat, el punt per on la bola original creu à per última vegada el \nmarge de l’obstacle d’aigua i el punt on es droparà la bola \n\uf0b7 Dropar una bola fora del obstacle d’aigua dins de la distància d ’un pal i no \nmés a prop del forat que el punt per on la bola original creuà per última \nvegada el marge de l’obstacle d’aigua. \n \nPENALITZACIÓ PER INFRACCIÓ DE LA REGLA 14: un  cop  \n \nRegla 15.1 EL GREEN \na. Una bola en el green pot ser aixecada. La posició de la bola ha de ser marcada \nabans d’aixecar-la i la bola reposada per a continuar el joc. \nb. A green: \n\uf0b7 Es poden treure  impediments solts aixecant-los o escombrant-los cap a un \ncostat, sempre que no es faci pressió cap avall. \n\uf0b7 Es poden reparar les marques que han deixat els impactes de les boles o \ncondicions anormals del terreny.\n\n3ª edició – Gener 2015 20\nFCPP / ACPP        Regles del Pitch & Putt a Catalunya \n \nc. Si el marcador de bola interfereix en el joc d’un jugador  hauria de desplaçar -se \nuna o més llargades del cap d’un pal cap a un costat o l’altra de la seva posició \noriginal. El marcador de bola que ha estat així desplaçat cap a un costat o l’a ltre, \nhaurà de tornar -se a col·locar en la seva posició original abans de reposar la \nbola. \nd. Si la bola d’un  jugador jugada des de green copeja una altra bola que també està \na green, el jugador incorrerà en  un cop de penalització i jugarà la seva bola des \non reposi. La bola moguda haurà de reposar-se en la seva posició original. \ne. Si la bola d’un jugador jugada des de fora de green copeja una bola que reposa a \ngreen, no hi ha penalització i el jugador jugarà la seva bola des d’on reposi. La \nbola moguda haurà de reposar-se en la seva posició original. \nf. Quan qualsevol part d’una bola penja sobre la vora del forat, el jugador pot \nesperar 10 segons per determinar si aquesta està en repòs. Si mentrestant la bola \nno ha caigut dins del forat, es considera que està en r epòs i per tant serà jugada. \nSi passats 10 segons la bola cau dins del forat, la bola es considerarà embocada i \nel jugador afegirà 1 cop al resultat del forat. \ng. Si qualsevol tapa de forat anterior interfereix amb la línia de putt, la tapa es \npodrà reparar  o la bola es podrà aixecar i col·locar cap a un costat o l’altre no \nmés a prop del forat, sense penalització, en el punt més proper on la tapa no \ninterfereixi la línia de putt. \nh. En el green, només es pot utilitzar el putter excepte que, quan aquest ha queda t \nmalmès en el decurs normal del joc, el jugador podrà: \n\uf0b7 Acabar la volta estipulada utilitzant qualsevol pal de la seva bossa; o \n\uf0b7 Substituir el putter per un altre putter que no hagi estat seleccionat pel joc \nper qualsevol altra persona que estigui jugant en  el camp. Ho haurà de fer \nsense  demorar el joc. \n \nPENALITZACIÓ: un cop \n \nRegla 15.2 GREEN EQUIVOCAT \nUna bola que reposi en un green que no sigui el del forat que s’està jugant, haurà de ser \nmarcada, aixecada i dropada fora de green, sense penalització, dins de la distància d’un \npal del punt més proper d’alleujament però no més a prop del forat. \n \nPENALITZACIÓ: un  cop  \n \nRegla 15.3 LA BANDERA \na. La bola d’un jugador, jugada des de green, no haurà de copejar la bandera tant si \naquesta està plantada en el forat o treta i reposant dins o fora de green. \nb. Si una bola reposa contra la bandera que està en el forat i la bola no està \nembocada, el jugador o un altre persona autoritzada per ell, pot moure la bandera \ni si cau dins es considera embocada amb l’últim cop. D’una a ltra manera, si la \nbola ha estat moguda, s’haurà de col·locar a la vora del forat, sense penalització. \n \nPENALITZACIÓ: un cop\n\n3ª edició – Gener 2015 21\nFCPP / ACPP        Regles del Pitch & Putt a Catalunya \n \n4ª PART – SITUACIONS DE LA BOLA DURANT EL JOC \n \nRegla 16. BOLA EQUIVOCADA \na. Si un jugador juga un cop/s amb una bola equivocada  que no està en un \nobstacle, incorrerà amb la penalització d’un cop  i haurà de jugar amb la seva \npròpia bola. Si l’error no es rectifica abans de jugar un cop des del següent lloc \nde sortida, el jugador estarà desqualificat.  \nb. No hi ha penalització si un jugador juga una bola equivocada en un obstacle. \nEls cops jugats amb una bola equivocada no es comptaran sigui on sigui des on \nes juguin.  \n \nRegla 17. BOLA ENCASTADA,  \nUna bola encastada en el seu propi impac te en el terreny del recorregut pot ser \naixecada, netejada i dropada sense penalització dins de la distància d’un pal des \nd’on reposava però no més aprop del forat. \n \nEl jugador pot reparar sense penalització els piques en el terreny del recorregut  \ni en la seva línea de joc per impacte recent de qualsevol bola sempre que siguin \nben visibles i que no hagin estat prèviament reparats. Qualsevol altre dany en el \nrecorregut, produït o no per una bola, no pot ser reparat si està en la línea de joc \nd’un jugador. \n \nPENALITZACIÓ: un  cop  \n \nRegla 18. BOLA MOGUDA, DESVIADA O ATURADA \na. Quan la bola en joc i en repòs d’un jugador és moguda per ell mateix, el seu \ncompany, el seu equipament o els seus caddies, el jugador incorrerà en un cop \nde penalització i haurà de reposar l a bola. Si no la reposa, seran d’aplicació les \nRegles 8 a/b. \nb. Si una bola en joc i en repòs es mou mentre que el jugador ha preparat el cop, es \nconsidera que el jugador ha mogut la bola i incorre en un cop de penalització i \nhaurà de reposar la bola. Si és p ràcticament segur que una ràfega de vent és la \nque mou la bola no hi ha penalització i la bola haurà de jugar -se des de la seva \nnova posició. Si el jugador es retira de la bola abans d’executar un cop es \nconsidera que ha deixat de preparar el cop i no hi h a penalització si després la \nbola es mou. \nEs considera que una bola s’ha mogut de la seva posició original si s’ha \ndesplaçat tan sols una fracció de la seva circumferència. \nc. Si una bola en repòs és moguda per una causa aliena o per un altre jugador, el \nseu equipament o els seus caddies, haurà de reposar -se sense penalització. Si la \nbola no és recuperable, es podrà substituir per una altra bola. \nd. Si la bola es mou després de que el jugador, el seu company o els seus caddies \ntoquin qualsevol impediment solt, es  reposarà amb un cop de penalització \nexcepte en el green que es reposarà sense penalització.\n\n3ª edició – Gener 2015 22\nFCPP / ACPP        Regles del Pitch & Putt a Catalunya \n \ne. Si una bola o un marcador de bola és accidentalment mogut durant el procés \nd’aixecar la bola sota una R egla o en marcar la seva posició, s’haurà de reposar \nla bola o el marcador. No hi ha penalització sempre que el moviment de la bola \no el marcador sigui directament atribuïble a l’acte específic de marcar la seva \nposició o d’aixecar la bola. D’una altra manera, el jugador incorre en un cop de \npenalització sota aquesta Regla o sota la Regla 18.a. \nf. Si una bola en moviment és aturada o desviada per qualsevol causa aliena o per \nqualsevol jugador o el seu equipament, haurà de jugar-se tal com reposi. \ng. Si una bola e n moviment és aturada o desviada pel jugador o el seu company o \nel seu equipament, s’incorrerà en un cop de penalització  i haurà de jugar -se la \nbola com reposi.  \n  \nPENALITZACIÓ: un cop \n \nh. Si una bola en moviment és aturada o desviada  intencionadament pel jugador, \ncaddie o company per a obtenir -ne un avantatge considerable o per perjudicar a \nun altre jugador, s’incorrerà en la penalització de desqualificació. \n  \nRegla 19. BOLA INJUGABLE \nEl jugador pot considerar  la seva bola injugable  a qua lsevol lloc del camp excepte \nquan la bola està en un obstacle d’aigua . El jugador és l’únic jutge per determinar si la \nbola est à injugable . Si el jugador declara que la seva bola est à injugable sota la \npenalització d’un cop podrà: \n \ni. Jugar una bola tan a prop co m sigui possible del punt on la bola original \nva ser jugada per última vegada. \n \nProcediment per continuar el joc: \n\uf0b7 Des del lloc de sortida la bola pot ser acomodada. \n\uf0b7 Des del recorregut o des d’un obstacle es droparà una bola. \n\uf0b7 Des del green es col·locarà una bola. \n \nii. Dropar una bola darrera del punt on reposa la bola, mantenint una línia \nrecta entre el forat, el punt on reposa la bola i el punt on es droparà la \nbola, sense límit de distància, o \niii. Dropar una bola dins de la distància d’un pal des del punt on reposa la \nbola, però no més a prop del forat. \n \nSi la bola injugable est à en un búnquer i el jugador opta per procedir sota la clausula ii) \no iii) haurà de dropar la bola dins del búnquer. \n \nPENALITZACIÓ: Un cop\n\n3ª edició – Gener 2015 23\nFCPP / ACPP        Regles del Pitch & Putt a Catalunya \n \nRegla 20. BOLA PERDUDA O FORA LÍMITS \na. Si el jugador considera que la seva bola ha anat a parar fora límits o està perduda \nfora d’un obstacle d’aigua, s’afegirà un cop de pen alització i haur à de jugar una  \nbola tan aprop com sigui possible del punt on va ser jugada la bola original per \núltima vegada. \n \nProcediment per continuar el joc: \n\uf0b7 Des del lloc de sortida la bola pot ser acomodada. \n\uf0b7 Des del recorregut o des d’un obstacle es droparà una bola. \n\uf0b7 Des del green es col·locarà una bola. \n \nb. Si un jugador executa un cop a una bola des del punt on va ser jugada la bola \noriginal per última vegada es considera que ha procedit sota la penalitat de cop i \ndistància. \nc. Si la bola original ha estat moguda per una causa aliena, est à perduda a una \nobstrucció o en una condició anormal del terreny , o està en un obstacle d ’aigua, \nel jugador pot procedir segons la Regla aplicable. \n \nPENALITZACIÓ: Cop i distància \n \nRegla 21. BOLA PROVISIONAL \na. Una Bola Provisional  hauria de jugar -se si el jugador considera que la bola  \noriginal pot estar perduda fora d’un obstacle d’aigua o pot estar fora de límits. El \njugador haurà d’informar de la seva intenció de jugar una bola provisional al seu \nmarcador. Si no es fa així es considera que ha juga t una bola sota la penalització \nde cop i distància. \n \nb. Si la bola original està perduda fora d’un obstacle d’aigua, està fora de límits,  \nla bola provisional es converteix en la bola en joc i el jugador afegirà un cop de \npenalització al resultat obtingut. \n \nc. Si la bola original no està ni perduda fora d’un obstacle d’aigua  ni està fora de \nlímits, la bola provisional serà abandonada, sense penalització, i els cops jugats \namb aquesta bola no compt aran. L’incompliment d’abandonar una bola \nprovisional constitueix estar jugant amb una bola equivocada. \n \nRegla 22. BUSCANT LA BOLA / IDENTIFICANT LA BOLA \n \n22.1. BUSCANT LA BOLA \na. En el recorregut: el jugador pot tocar o doblegar herbes altes, matolls o simil ars \ndurant la recerca de la seva bola però només en la mesura necessària per a \ntrobar-la i identificar-la sempre i quan no es millorin: el lloc on reposa la bola, \nl’àrea de col·locació o swing o la línia de joc. El jugador no té  necessàriament el \ndret de veure la seva bola en executar un cop.\n\n3ª edició – Gener 2015 24\nFCPP / ACPP        Regles del Pitch & Putt a Catalunya \n \nb. En un obstacle: el jugador pot treure tants impediments solts o sorra com sigui \nnecessari per veure una part de la bo la. No hi ha penalització si la bola es mou i \ncaldrà reposar-la tal com estava.  \nSi la bola reposa d ins de l’aigua en un obstacle d’aigua, es podrà buscar amb un \npal o similar i si en fer -ho es mou, haurà de reposar -se llevat de que el ju gador \nvulgui aplicar la Regla 13 . No hi ha penalització sempre que el moviment de la \nbola sigui atribuïble a la recerc a de la bola. D’una altra manera, el jugador \ninfringirà la Regla 18.a.      \nc. En una obstrucció o en una condició anormal del terreny no hi ha penalització si \nla bola es mou i caldrà reposar -la tal com estava. Un cop reposada es podrà \ntambé procedir segons les Regles 11 i 12, si són d’aplicació. \n \nPENALITZACIÓ: Un cop. \n \n22.2. IDENTIFICANT LA BOLA \nEl jugador és responsable de jugar la bola correcta i hauria de posar un senyal \nd’identificació en la seva bola. \nPer identificar una bola en repòs, el jugador haurà d ’anunciar la seva intenció al \nseu contrari/marcador i/o company -competidor, marcar la posició de la bola i  \naixecar-la i una vega da identificada  haurà de reposar -se. Si la bola és la del \njugador i aquest no acompleix amb tot o una par t del procediment, incor rerà en \nun cop de penalització\n\n3ª edició – Gener 2015 25\nFCPP / ACPP        Regles del Pitch & Putt a Catalunya \n \n5ª PART – PROCEDIMENT PER DROPAR, AIXECAR I MARCAR, COLOCAR \nI REPOSAR \n \nRegla 23.1  PROCEDIMENT PER DROPAR \na. Una bola que ha de ser dropada sota les Regles haurà de ser d ropada pel propi \njugador. El jugador haurà de quedar -se ert, mantenir la bola a l’altura de \nl’espatlla amb el braç estès i deixar -la caure no més a prop del forat. La bola \ndropada haurà de tocar primer una part del camp on la Regla aplicable exigeix \nque la bola sigui dropada. \nSi en dropar la bola aquesta toca qualsevol persona o l’equip de qualsevol \njugador abans o després de tocar una part del camp i abans de que quedi en \nrepòs, s’haurà de tornar a dropar tantes vegades com calgui, sense penalització.  \n \nb. Una bola dropada haurà de tornar-se a dropar, sense penalització, si: \n\uf0b7 Queda en repòs a més de dos pals de distància de on va tocar per primera \nvegada una part del camp. \n\uf0b7 Roda i queda en repòs dins d’un obstacle. \n\uf0b7 Roda i queda en repòs fora d’un obstacle. \n\uf0b7 Roda i queda en repòs en un green. \n\uf0b7 Queda en repòs fora de límits. \n\uf0b7 Queda en repòs més a prop del forat. \n\uf0b7 Queda en repòs en una posició on existeix la interferència inicial. \nSi la bola en tornar -se a dropar queda en repòs en qualsevol de les posicions \nesmentades més amunt, haurà de ser col·locada tan a prop com sigui possible del \npunt on va tocar el camp en tornar-se a dropar. \n \nPENALITZACIÓ: un cop \n \nRegla 23.2  PROCEDIMENT PER AIXECAR I MARCAR \na. Una bola que ha d’aixecar -se segons les regles pot ser aixecada pel ju gador o \nqualsevol persona autoritzada pel jugador.  En qualsevol d’aquests casos el \njugador és responsable de qualsevol infracció de les regles. \nb. La posició de la bola ha de ser marcada abans de ser aixecada segons una regla \nque requereix reposar-la o col·locar-la, utilitzant un marcador de bola, moneda o \nsimilar. \n \nPENALITZACIÓ: un cop \n \nRegla 23.3  PROCEDIMENT PER COL·LOCAR I REPOSAR \na. Una bola que ha de col·locar -se segons les regles pot ser col·locada pel jugador \no qualsevol persona autoritzada pel jugador  una sola vegada . En qualsevol \nd’aquests casos el jugador és responsable de qualsevol infracció de les regles. \nb. Una bola que ha de reposar -se segons les regles pot ser reposada pel jugador o \nqualsevol persona autoritzada pel jugador. En qualsevol d’aquests ca sos el \njugador és responsable de qualsevol infracció de les regles. \n \nPENALITZACIÓ: un cop.\n\n3ª edició – Gener 2015 26\nFCPP / ACPP        Regles del Pitch & Putt a Catalunya \n \n6ª PART – MODALITATS DE JOC \n \nMATX PLAY  \n\uf0b7 Un partit consisteix en que un bàndol juga contra un altre una volta e stipulada, a \nno ser que el comitè ho estableixi d’una altra manera. \n\uf0b7 En matx play el joc es juga per forats. Un forat és guanyat pel bàndol que \nemboca la seva bola amb el menor nombre de cops. En un partit amb handicap, \nguanya el forat el resultat net més baix. \n\uf0b7 Un forat està empatat si cada bàndol emboca amb un mateix nombre de cops. \n\uf0b7 Un partit està guanyat quan un bàndol avantatja a l’altra en un nombre de forats \nmajor que el nombre de forats que queden per jugar. \n\uf0b7 Un jugador pot concedir al seu contrari el s eu pròxim cop en qualsevol moment \nsempre que la bola del contrari estigui aturada. Es considera que el contrari ha \nembocat amb el seu següent cop i la bola pot ser aixecada per qualsevol bàndol. \n\uf0b7 Un jugador pot concedir un forat en qualsevol moment abans de l començament \no de la conclusió d’aquest forat. \n\uf0b7 Un jugador pot concedir un partit en qualsevol moment abans del començament \no de la conclusió d’aquest partit. \n \nMODALITATS MATXPLAY \n\uf0b7 Matx Play Individual: un partit on un jugador juga contra un altre. \n\uf0b7 Quatre Boles Matx Play : un partit on dos jugadors juguen la seva millor bola \ncontra   la millor bola de dos altres jugadors. \nReglamentació: un bàndol pot estar representat per un company per tot o per una \npart d’un partit. Un company absent es pot incorporar al partit entre el joc de dos \nforats però no durant el joc d’un forat. \nLes boles del mateix bàndol es poden jugar en l’ordre que aquest vulgui. \nSi un jugador en un forat juga una bola equivocada estarà desqualificat per  \naquell forat però el seu company no incor re en penalització encara que la bola \njugada hagi estat la seva. \n\uf0b7 Foursome Matx Play : un partit on dos jugadors juguen contra dos altres \njugadors, i cada bàndol juga amb una bola. Els companys de bàndol hauran de \njugar alternativament des del lloc de sortid a / estora i continuar el joc de cada \nforat alternant els cops. \nReglamentació: si un jugador juga quan ho hauria d’haver fer el seu company, el \nseu bàndol incorrerà en 1 cop de penalització. \n \nSTROKE PLAY  \n\uf0b7 Una competició Stroke Play consisteix en jugar una volta estipulada, a no ser \nque el comitè ho estableixi d’una altra manera. \n\uf0b7 El competidor o bàndol que jugui la volta estipulada en el menor nombre de \ncops serà el guanyador. En una competició handicap el competidor o bàndol \namb el resultat net més baix en la volta o voltes estipulades és el guanyador.\n\n3ª edició – Gener 2015 27\nFCPP / ACPP        Regles del Pitch & Putt a Catalunya \n \nMODALITATS STROKEPLAY \n\uf0b7 Stroke Play Individual : una competició Stroke play on cada jugador juga \ncontra els altres competidors. \n\uf0b7 Quatre Boles Stroke Play  (fourball): una competició Stroke play on dos \njugadors juguen com companys de bàndol i cadascun  juga la seva pròpia bola, \npuntuant la millor bola dels dos. \nReglamentació: un bàndol pot estar representat per qualsevol dels companys per \ntota o per una part de la volta estipulada. Un competidor absent pot unir-se al seu \ncompany entre el joc de dos forats però no durant el joc d’un forat. \nEl marcador haurà d’anotar en cada forat només el resultat brut del company del \nqual comptarà el resultat. La targeta nomé s haurà de formar -la un dels \ncompanys. \nUn bàndol pot jugar en l’ordre que consideri oportú les boles que pertanyen al \nseu bàndol. \nSi un competidor juga un cop amb una bola equivocada, incorrerà en la \npenalització d’un cop i haurà de corregir l’error segons  les Regles. El seu \ncompany no incorrerà en cap penalització encara que la bola equivocada sigui la \nseva. \nSi un competidor infringeix una Regla i aquesta infracci ó ajuda al joc del seu \ncompany, aquest també serà penlitzat. \n\uf0b7 Foursome Stroke Play : una competi ció Stroke Play on dos jugadors, jugant \ncom companys de bàndol, juguen només una bola. Els companys de bàndol \nhauran de jugar alternativament des del lloc de sortida / estora i continuar el joc \nde cada forat alternant els cops. \nReglamentació: si els companys juguen en ordre incorrecte, es cancel·larà el cop \ni s’incorrerà en 1 cop de penalització. El bàndol haurà de corregir l’error jugant \nuna bola en l’ordre correcte. Si el bàndol executa un  cop des del següent lloc de \nsortida sense corregir l’error o abandona l’últim green de la seva volta sense fer-\nho, estarà desqualificat. \n\uf0b7 Greensome: Una competició Stroke Play on dos jugadors, jugant com \ncompanys de bàndol, juguen cadascun el primer cop de cada forat, escullen la \nmillor bola de les dues i acaben el forat jugant alternativament. \n \nFORMES DE CÀLCUL STABLEFORD  \nuna competició Stableford és una modalitat de joc per cops. El recompte en aquestes \ncompeticions es fa per punts obtinguts en relació amb un resultat fixat per cada forat i el \nhandicap del jugador. \n \nForats jugats en (sense tenir en compte el handicap) ....................................Punts \nMés d’un cop sobre el resultat fixat per cada forat o sense resultat anotat   0  \nUn cop més del resultat fixat pel forat                 1  \nResultat fixat pel forat    2  \nUn cop menys del resultat fixat pel forat       3  \nDos cops menys del resultat fixat pel forat                 4  \nQui més punts obté és el guanyador. El marcador anotarà només el número de cop s \nbruts realitzats en el forat on el competidor punt uï. El marcador és responsable d’anotar \nnomés el resultat brut  en cada forat on el resultat net del competidor obté un o més \npunts.\n\n3ª edició – Gener 2015 28\nFCPP / ACPP        Regles del Pitch & Putt a Catalunya \n \nAPÈNDIX I \n \nREGLES DE L’ESTATUT DEL JUGADOR AFICIONAT (*) \n \nEl Pitch and Putt és essencialment un esport aficionat. \n \nUn jugador no pot: \n \n\uf0b7 Competir per un premi en metàl·lic. \n\uf0b7 Acceptar un premi o premis amb un preu de venda superior als 600 €. \n\uf0b7 Canviar qualsevol premi per diners en efectiu. \n\uf0b7 Utilitzar un premi en forma de bo per pagar tot o una part de \nl’abonament d’un Club. \n\uf0b7 Acceptar ser membre honorífic  o membre amb una tarifa reduïda com a \nincentiu per ser membre de l’equip del Club. \n \nUn jugador pot: \n \n\uf0b7 Participar voluntàriament en una “pool” organitzada pels mateixos \nparticipants en la competició d’un Club. \n\uf0b7 Impartir instrucció d’una manera voluntària. \n\uf0b7 Acceptar premis simbòlics gravats de forma personalitzada i que en \naquest cas excedeixin la quantitat de 600 €. \n\uf0b7 Acceptar manutenció i beguda gratis en una competició sempre que això \nsigui ofert a tots els competidors. \n\uf0b7 Cobrar les despeses per participa r en esdeveniments a nivell de C lub, \npromocionals o internacionals. \n \nLa infracció d’aquestes regles co mportarà l’exclusió automàtica de la llicència per \ncompetir. La pròpia associació del jugador és la que autoritzarà, al cap d’un any dels \nfets que van ocasionar la pèrdua de la condició d’aficionat, la seva readmissió per a \ncompetir. \n \n(*) L’apendix I relatiu a les Regles de l ’Estatut del Jugador Aficionat seran d’aplicació \núnicament per a competicions de l’Associació Catalana de Pitch and Putt"
-
-SYSTEM_INSTRUCTION = 'Ets un entrenador de golf especialitzat en Pitch&Putt. Respons preguntes sobre tecnica de golf (cops, swing, postura, grip) i sobre la normativa oficial de Pitch&Putt. Tens dues fonts de coneixement principals: 1) Les transcripcions dels videos de YouTube sobre tecnica de golf. 2) El document oficial de normativa de Pitch&Putt. Quan responguis sobre tecnica, fes referencia als videos. Quan responguis sobre normes i regles, fes referencia al document de normativa. Si la pregunta no esta coberta per cap de les fonts, pots usar el teu coneixement general de golf pero indica-ho clarament.'
+from coach_knowledge_pack import SYSTEM_SECTION, KnowledgePack
+
+# ---------- CONEIXEMENT DELS VIDEOS DE YOUTUBE ----------
+# coach_knowledge.bin (generat per build_gem.py): seccions comprimides que es
+# llegeixen amb mmap (vegeu coach_knowledge_pack.py)
+_pack = KnowledgePack(os.path.join(os.path.dirname(os.path.abspath(__file__)), "coach_knowledge.bin"))
+SYSTEM_INSTRUCTION = _pack.section(SYSTEM_SECTION)
+KNOWLEDGE = _pack.knowledge()
 
 # -----------------------------------------------------------------------
 
@@ -18,47 +18,39 @@ Execució:
 # ── IMPORTACIONS ───────────────────────────────────────────────────────────────
 
 import streamlit as st               # Framework web per crear la interfície d'usuari
-from google import genai             # NOU SDK de Google Gemini (substitueix google.generativeai)
-from google.genai import types       # Tipus de configuració del nou SDK
 import os                            # Operacions amb el sistema de fitxers
+import logging                       # Registre de mètriques (tokens, temps de resposta...)
 import time                          # Pausar l'execució mentre el servidor processa el vídeo
-import tempfile                      # Crear fitxers temporals per al vídeo pujat
-import requests as _req              # Crida HTTP servidor→API per al comptador de visites
 import streamlit.components.v1 as _components  # Per injectar HTML/JS (Google Analytics)
 import uuid as _uuid                  # Per generar client_id únic per sessió (GA4)
-try:
-    from langdetect import detect as _detect_lang
-    _LANGDETECT_OK = True
-except ImportError:
-    _LANGDETECT_OK = False
+from coach_langid import detect_language, language_name  # Detecció d'idioma determinista i memoritzada
+from coach_resources import get_client, get_knowledge  # Recursos compartits per procés
+from coach_telemetry import get_dispatcher  # Telemetria GA4 i comptador de visites en segon pla
+# Les dependències pesades (google.genai, NumPy, requests, langdetect...) no
+# s'importen aquí: cada secció les carrega la primera vegada que les necessita,
+# així el primer render (menú i portada) no les ha d'esperar.
+
+
+# Els mòduls coach_* registren les mètriques de cada petició amb logging
+# (temps fins al primer token, tokens servits des del cache...)
+logging.basicConfig(level=logging.INFO, format="%(asctime)s %(name)s: %(message)s")
 
 
 # ── CÀRREGA DEL CONEIXEMENT (KNOWLEDGE) ───────────────────────────────────────
-# coach_config.json conté les transcripcions dels vídeos de YouTube,
-# la normativa de Pitch&Putt i la instrucció de sistema (SYSTEM_INSTRUCTION).
+# coach_knowledge.bin conté les transcripcions dels vídeos de YouTube,
+# la normativa de Pitch&Putt i la instrucció de sistema (SYSTEM_INSTRUCTION),
+# en seccions comprimides (vegeu coach_knowledge_pack.py).
 #
 # Per actualitzar el coneixement o modificar SYSTEM_INSTRUCTION,
-# edita directament coach_config.json o torna a executar build_gem.py.
+# edita build_gem.py (o les fonts) i torna'l a executar.
 
-def _load_config():
-    """
-    Llegeix KNOWLEDGE i SYSTEM_INSTRUCTION des de coach_config.json.
+# La capa de recursos (coach_resources.py) l'obre una sola vegada per procés i
+# el torna a obrir només si el fitxer canvia. D'entrada només se'n llegeix la
+# instrucció de sistema i la versió (hash del contingut); les transcripcions es
+# descomprimeixen la primera vegada que calen (instrucció de sistema completa).
+RES = get_knowledge()
 
-    Returns:
-        tuple: (knowledge: str, system_instruction: str)
-               Retorna strings buits si el fitxer no existeix o hi ha error.
-    """
-    import json
-    config_path = os.path.join(os.path.dirname(__file__), "coach_config.json")
-    try:
-        with open(config_path, "r", encoding="utf-8") as f:
-            cfg = json.load(f)
-        return cfg.get("knowledge", ""), cfg.get("system_instruction", "")
-    except Exception:
-        return "", ""
-
-# S'executa una sola vegada en arrencar l'app
-KNOWLEDGE, SYSTEM_INSTRUCTION = _load_config()
+RETRIEVAL_TOP_K = 8   # Passatges rellevants enviats amb cada pregunta
 
 
 # ── CONFIGURACIÓ DE LA PÀGINA ─────────────────────────────────────────────────
@@ -83,18 +75,16 @@ _GA4_ENDPOINT   = (
 )
 
 
+# Dispatcher en segon pla (un per procés): els events van a una cua i un fil
+# de treball els envia agrupats, sense bloquejar mai el render de la pàgina.
+_TELEMETRY = get_dispatcher(_GA4_ENDPOINT)
+
+
 def _ga4_send(event_name: str, params: dict = None) -> None:
-    """Envia un event a GA4 via Measurement Protocol (servidor Python)."""
+    """Encua un event per a GA4 (Measurement Protocol); l'enviament és asíncron."""
     if "ga4_client_id" not in st.session_state:
         st.session_state.ga4_client_id = str(_uuid.uuid4())
-    payload = {
-        "client_id": st.session_state.ga4_client_id,
-        "events": [{"name": event_name, "params": params or {}}],
-    }
-    try:
-        _req.post(_GA4_ENDPOINT, json=payload, timeout=3)
-    except Exception:
-        pass  # El tracking no hauria d'aturar mai l'app
+    _TELEMETRY.send_event(st.session_state.ga4_client_id, event_name, params)
 
 # Envia el page_view una sola vegada per sessió
 if "ga4_page_viewed" not in st.session_state:
@@ -138,7 +128,7 @@ if not API_KEY:
 
 
 # ── COMPTADOR DE VISITES (servidor Python → API) ─────────────────────────────
-# La crida HTTP es fa des del SERVIDOR Python (no del navegador),
+# La crida HTTP es fa des del SERVIDOR Python (no del navegador), en segon pla,
 # de manera que no hi ha problemes de CORS ni de CSP del navegador.
 # session_state evita comptar més d'una vegada per sessió de Streamlit:
 # - Clic a un botó / canvi de sacció  → NO compta (session_state persisteix)
@@ -154,15 +144,18 @@ if "visit_counted" not in st.session_state:
 
 if not st.session_state.visit_counted:
     st.session_state.visit_counted = True
-    try:
-        r = _req.get(
-            "https://api.counterapi.dev/v1/coachgolfpro/visites/up",
-            timeout=4,
-        )
-        if r.ok:
-            st.session_state.visit_count = r.json().get("count")
-    except Exception:
-        pass  # Si l'API no respon, el comptador no es mostra però l'app continua
+    # La crida es fa en segon pla: el resultat es recull quan ja ha arribat
+    st.session_state.visit_future = _TELEMETRY.fetch_json(
+        "https://api.counterapi.dev/v1/coachgolfpro/visites/up",
+        timeout=4,
+    )
+
+_visit_future = st.session_state.get("visit_future")
+if _visit_future is not None and _visit_future.done():
+    # Si l'API no ha respost, el comptador no es mostra però l'app continua
+    _visit_data = _visit_future.result()
+    st.session_state.visit_count = _visit_data.get("count") if _visit_data else None
+    st.session_state.visit_future = None
 
 
 
@@ -195,10 +188,11 @@ if not API_KEY:
     st.error("❌ No s'ha trobat la API Key. Contacta l'administrador de l'aplicació.")
     st.stop()
 
-# Creem el client del nou SDK amb la clau carregada.
-# A diferència de l'SDK antic (genai.configure), el nou SDK usa un objecte Client
-# que s'instancia amb la clau i es reutilitza per a totes les crides.
-client = genai.Client(api_key=API_KEY)
+# El client del nou SDK es crea amb get_client(API_KEY) just abans de la primera
+# crida a Gemini. A diferència de l'SDK antic (genai.configure), el nou SDK usa
+# un objecte Client que s'instancia amb la clau i es reutilitza per a totes les
+# crides; get_client() el crea una sola vegada per procés (amb el seu pool de
+# connexions HTTP) i el comparteix entre rerenderitzacions.
 
 
 # ══════════════════════════════════════════════════════════════════════════════
@@ -208,9 +202,12 @@ client = genai.Client(api_key=API_KEY)
 # dels 14 vídeos de golf de YouTube.
 #
 # Flux:
-#   1. SYSTEM_INSTRUCTION + KNOWLEDGE → instrucció de sistema completa
+#   1. SYSTEM_INSTRUCTION + KNOWLEDGE → instrucció de sistema completa,
+#      registrada com a cached content (una vegada per versió del coneixement)
 #   2. L'usuari escriu una pregunta
-#   3. client.models.generate_content() envia la pregunta + instrucció al model
+#   3. Si l'índex BM25 (coach_index.json) hi troba passatges rellevants,
+#      client.models.generate_content() envia la pregunta + aquests passatges;
+#      si no, envia la pregunta + referència al cache del coneixement complet
 #   4. La resposta es mostra i es guarda a session_state per a la conversa
 
 if seccio == "💬 Consulta al entrenador":
@@ -219,24 +216,6 @@ if seccio == "💬 Consulta al entrenador":
     st.caption("Fes preguntes sobre tècnica, swing, postura, grip... Basat en els vídeos del canal.")
     st.caption("També pots consultar sobre les regles del Pitch&Putt.")
 
-    # Instrucció de sistema: rol de l'entrenador + transcripcions dels vídeos
-    full_system = (
-        SYSTEM_INSTRUCTION
-        + "\n\n---\nCONTINGUT DELS VIDEOS:\n"
-        + KNOWLEDGE
-        + "\n\n---\n"
-        + "LANGUAGE RULE (MANDATORY): Always respond in the EXACT same language "
-        + "as the user's question. If the question is in English, respond in English. "
-        + "If in Spanish/Castilian, respond in Spanish. If in Catalan, respond in Catalan. "
-        + "Never switch language. This rule overrides everything else."
-    )
-
-    # Configuració del model: instrucció de sistema passada com a GenerateContentConfig
-    # (nou SDK: la configuració va separada del nom del model)
-    chat_config = types.GenerateContentConfig(
-        system_instruction=full_system,
-    )
-
     # Historial de la conversa guardat a session_state.
     # Streamlit relança l'script en cada interacció; session_state persiteix entre rerenderitzacions.
     # Format: [{"role": "user"/"assistant", "content": "..."}, ...]
@@ -251,6 +230,35 @@ if seccio == "💬 Consulta al entrenador":
     # camp de text fix a la part inferior; := assigna i comprova en una línia
     if prompt := st.chat_input("Pregunta al teu entrenador de golf..."):
 
+        # Dependències del chat: s'importen a la primera pregunta (després, Python
+        # les té en memòria) i els índexs/caches es carreguen una vegada per procés
+        from coach_context_cache import get_knowledge_cache
+        from coach_resources import CITATION_RULE, get_answer_caches
+        from coach_retrieval import format_passages, hybrid_search, load_index
+        from coach_streaming import render_stream
+        from coach_tfidf import load_tfidf
+
+        client = get_client(API_KEY)
+
+        # Context caching: la instrucció de sistema es registra UNA vegada per versió
+        # del coneixement al servidor i les crides només hi fan referència.
+        # Si el caching no està disponible, s'envia en línia com abans.
+        # RES.full_system (tot el coneixement descomprimit) només es construeix
+        # si cal el mode complet: les preguntes resoltes per recuperació o pel
+        # cache de respostes no el toquen.
+        knowledge_cache = get_knowledge_cache(
+            client, "gemini-2.5-flash", lambda: RES.full_system, RES.version)
+
+        # Índex BM25 de passatges generat per build_gem.py (None si no existeix):
+        # permet enviar només els passatges rellevants en lloc de tot el KNOWLEDGE.
+        coach_index = load_index(os.path.join(os.path.dirname(__file__), "coach_index.json"))
+        # Matriu TF-IDF (coach_tfidf/*.npy, memory-mapped) com a complement de BM25
+        coach_tfidf = load_tfidf(os.path.join(os.path.dirname(__file__), "coach_tfidf"))
+
+        # Cache de respostes en disc (coach_answers.sqlite): les preguntes repetides
+        # (o les seves paràfrasis, en el mateix idioma) es responen sense cridar l'API
+        answer_cache, semantic_cache = get_answer_caches()
+
         st.session_state.gem_messages.append({"role": "user", "content": prompt})
         with st.chat_message("user"):
             st.markdown(prompt)
@@ -276,42 +284,77 @@ if seccio == "💬 Consulta al entrenador":
                 </style>""",
                 unsafe_allow_html=True,
             )
+            started = time.perf_counter()   # Inici de la petició (per mesurar el TTFT)
             try:
-                # Nova crida al model:  client.models.generate_content()
-                # - model: nom del model Gemini
-                # - contents: el missatge de l'usuari
-                # - config: inclou la instrucció de sistema amb el coneixement dels vídeos
                 # ── DETECCIÓ D'IDIOMA ─────────────────────────────────────────────
                 # Detectem l'idioma del prompt per indicar-lo explícitament
                 # al model, evitant que infereixi malament l'idioma.
-                _LANG_NAMES = {
-                    "ca": "Catalan", "es": "Spanish", "en": "English",
-                    "fr": "French",  "de": "German",  "it": "Italian",
-                    "pt": "Portuguese", "nl": "Dutch",
-                }
-                _detected = "the same language as the question"
-                if _LANGDETECT_OK and len(prompt) >= 10:
-                    try:
-                        _code = _detect_lang(prompt)
-                        _detected = _LANG_NAMES.get(_code, _code)
-                    except Exception:
-                        pass
-
-                response = client.models.generate_content(
-                    model="gemini-2.5-flash",
-                    contents=(
-                        f"[SYSTEM RULE - HIGHEST PRIORITY: You MUST reply in "
-                        f"{_detected}. Do NOT change the language under any "
-                        f"circumstances. The user's question is: \"{prompt}\"]\n\n{prompt}"
-                    ),
-                    config=chat_config,
+                # Determinista i memoritzada; les preguntes curtes (p. ex. "i el grip?")
+                # hereten l'últim idioma detectat en aquesta sessió.
+                _code = detect_language(prompt, fallback=st.session_state.get("chat_lang"))
+                if _code:
+                    st.session_state.chat_lang = _code
+                    _detected = language_name(_code)
+                else:
+                    _detected = "the same language as the question"
+
+                question = (
+                    f"[SYSTEM RULE - HIGHEST PRIORITY: You MUST reply in "
+                    f"{_detected}. Do NOT change the language under any "
+                    f"circumstances.]\n\n{prompt}"
                 )
-                answer = response.text
-                thinking_placeholder.empty()   # Elimina el "Pensant..."
-                st.markdown(answer)
+
+                # ── CACHE DE RESPOSTES ────────────────────────────────────────────
+                # Mateixa pregunta (o una de molt similar) + idioma + versió del
+                # coneixement → resposta guardada
+                answer = answer_cache.get(prompt, _detected, RES.version)
+                if answer is None:
+                    # Pregunta similar (paràfrasi) ja resposta en el mateix idioma
+                    answer = semantic_cache.get(prompt, _detected, RES.version)
+
+                # ── RECUPERACIÓ DE PASSATGES ──────────────────────────────────────
+                # Si hi ha índex i la pregunta hi troba coincidències, només
+                # s'envien els k passatges més rellevants (BM25 + TF-IDF).
+                # Si no, es fa servir tot el coneixement (via el cache de context).
+                hits = (
+                    hybrid_search(coach_index, prompt, k=RETRIEVAL_TOP_K, tfidf=coach_tfidf)
+                    if coach_index and answer is None else []
+                )
+                if answer is not None:
+                    stream = None
+                    thinking_placeholder.markdown(answer)
+                elif hits:
+                    # Enllaços al minut exacte només si els passatges en porten
+                    # (transcripcions amb segments; vegeu coach_retrieval.py)
+                    cite = CITATION_RULE + "\n\n" if any("start" in h for h in hits) else ""
+                    stream = client.models.generate_content_stream(
+                        model="gemini-2.5-flash",
+                        contents=(
+                            "CONTINGUT RELLEVANT DELS VIDEOS I LA NORMATIVA:\n"
+                            + format_passages(hits)
+                            + "\n\n---\n"
+                            + cite
+                            + question
+                        ),
+                        config=RES.retrieval_config,
+                    )
+                else:
+                    stream = knowledge_cache.generate_content_stream(contents=question)
+                if stream is not None:
+                    # ── STREAMING ─────────────────────────────────────────────────
+                    # Els fragments substitueixen el "Pensant..." a mesura que arriben;
+                    # es registra el temps fins al primer token i el total
+                    answer = render_stream(stream, thinking_placeholder, "chat", started).text
+                    # Una resposta buida (bloquejada pels filtres, tallada) no es guarda:
+                    # si no, les preguntes iguals o similars mostrarien una bombolla buida
+                    if answer.strip():
+                        answer_cache.put(prompt, _detected, RES.version, answer)
+                        semantic_cache.put(prompt, _detected, RES.version, answer)
                 st.session_state.gem_messages.append({"role": "assistant", "content": answer})
                 # Tracking GA4: registra cada consulta al entrenador
-                _ga4_send("coach_query", {"language": _detected, "section": "chat"})
+                _ga4_send("coach_query", {
+                    "language": _detected, "section": "chat", "cached": stream is None,
+                })
 
             except Exception as e:
                 err = str(e)
@@ -334,36 +377,98 @@ if seccio == "💬 Consulta al entrenador":
 # ══════════════════════════════════════════════════════════════════════════════
 # L'usuari puja un vídeo del swing; Gemini l'analitza visualment.
 #
-# Flux (4 passos):
-#   1. Guardar el vídeo en un fitxer temporal al disc local
-#   2. Pujar-lo a la Files API de Google (emmagatzematge temporal al núvol)
-#   3. Esperar que Google acabi de processar el vídeo (estat "PROCESSING")
-#   4. Generar l'anàlisi combinant el prompt de text + el vídeo processat
-#   + Neteja: eliminar fitxers temporals (local i remot)
+# Flux (3 passos):
+#   0. (Opcional) Retallar localment la finestra del swing i reduir resolució/fps
+#      (vegeu coach_video.py): menys bytes, menys espera i menys tokens
+#   1. Pujar-lo a la Files API de Google directament des de la memòria, a trossos
+#      (sense fitxer temporal ni còpia sencera del vídeo; vegeu coach_upload.py)
+#   2. Esperar que Google acabi de processar el vídeo (estat "PROCESSING"),
+#      amb consultes cada cop més espaiades i un termini màxim
+#   3. Generar l'anàlisi combinant el prompt de text + el vídeo processat
+#   Tot el procés s'executa en segon pla (coach_swing.py + coach_jobs.py): la
+#   pàgina no queda bloquejada i l'identificador del treball es guarda a la URL.
+#   + Els passos 0-2 comencen tan bon punt es tria el fitxer (pujada per
+#     endavant), mentre l'usuari encara edita el prompt
+#   + El fitxer remot es conserva fins que caduca (coach_video_registry.py): repetir
+#     l'anàlisi del mateix clip no el torna a pujar, i amb el mateix prompt es
+#     mostra l'anàlisi guardada
+#
+# Abans / després: els dos clips s'alineen localment a l'impacte, només se'n
+# pugen els trams alineats (el clip antic, si ja és al registre, no es torna a
+# pujar) i es comparen en una sola crida amb una taula d'evolució per aspecte.
+#
+# Mode ràpid (fotogrames clau): en lloc dels passos 0-2, s'extreuen localment
+# cinc fotogrames (address, takeaway, top, impact, finish) i s'envien com a
+# imatges en línia en una sola crida: sense pujada ni espera de "PROCESSING".
 
 elif seccio == "🎥 Anàlisi de vídeo":
 
     st.title("🎥 Anàlisi de Swing per Vídeo")
     st.caption("Puja un vídeo del teu swing i l'IA analitzarà el teu moviment.")
 
-    # Configuració del model per a anàlisi visual (expert en biomecànica de golf)
-    video_config = types.GenerateContentConfig(
-        system_instruction=(
-            "Ets un expert en biomecànica de golf. Analitza el vídeo fotograma a fotograma. "
-            "Fixa't en el grip, l'alineació, el backswing i el follow-through. "
-            "Dóna consells concrets per corregir errors visuals."
-        ),
+    # Modes: un sol swing; una sessió sencera (tots els clips alhora, amb un
+    # informe per clip i un resum dels errors recurrents); o abans / després
+    # (dos clips alineats a l'impacte i comparats en una sola crida)
+    video_mode = st.radio(
+        "Què vols analitzar?",
+        ["🎬 Un swing", "📚 Sessió sencera (diversos clips)", "🆚 Abans / després"],
+        horizontal=True,
     )
+    batch_mode = video_mode.startswith("📚")
+    compare_mode = video_mode.startswith("🆚")
 
     # Widget de pujada de fitxers. Accepta MP4, MOV i AVI.
-    uploaded_file = st.file_uploader(
-        "📁 Puja el teu swing (MP4, MOV, AVI)",
-        type=["mp4", "mov", "avi"],
-    )
-
-    if uploaded_file:
+    if compare_mode:
+        col_before, col_after = st.columns(2)
+        before_file = col_before.file_uploader(
+            "📁 Swing anterior", type=["mp4", "mov", "avi"], key="swing_before_upload",
+        )
+        after_file = col_after.file_uploader(
+            "📁 Swing actual", type=["mp4", "mov", "avi"], key="swing_after_upload",
+        )
+        uploaded_files = [before_file, after_file] if before_file and after_file else []
+    elif batch_mode:
+        uploaded_files = st.file_uploader(
+            "📁 Puja els clips de la sessió (MP4, MOV, AVI)",
+            type=["mp4", "mov", "avi"],
+            accept_multiple_files=True,
+            key="swing_batch_upload",
+        ) or []
+    else:
+        uploaded_file = st.file_uploader(
+            "📁 Puja el teu swing (MP4, MOV, AVI)",
+            type=["mp4", "mov", "avi"],
+            key="swing_upload",
+        )
+        uploaded_files = [uploaded_file] if uploaded_file else []
+
+    def _prefetch_caption(job, vkey: str) -> None:
+        """Línia d'estat d'una pujada per endavant acabada (sense refrescar-la)."""
+        from coach_jobs import DONE
+        if job is None or job["status"] != DONE or (job["result"] or {}).get("key") != vkey:
+            return      # Fallida (l'anàlisi ho tornarà a intentar) o una altra variant
+        st.caption("✅ Vídeo ja pujat i processat: l'anàlisi començarà de seguida.")
+
+    @st.fragment(run_every=1.0)
+    def _poll_prefetch(job_id: str) -> None:
+        """Estat de la pujada per endavant en curs (només aquesta línia es refresca)."""
+        from coach_jobs import DONE, FAILED
+        from coach_resources import get_job_queue
+        job = get_job_queue().get(job_id)
+        if job is None or job["status"] in (DONE, FAILED):
+            st.rerun()                      # L'estat final es mostra fora del fragment
+        st.caption(f"⬆️ Preparant el vídeo en segon pla mentre escrius: {job['stage'].lower()}...")
+
+    if uploaded_files:
         # Previsualització del vídeo directament a la pàgina
-        st.video(uploaded_file)
+        if compare_mode:
+            col_before.video(before_file)
+            col_after.video(after_file)
+        elif batch_mode:
+            st.caption(f"{len(uploaded_files)} clips · "
+                       f"{sum(f.size for f in uploaded_files) / 1e6:.0f} MB en total")
+        else:
+            st.video(uploaded_files[0])
 
         # Prompt editable: l'usuari pot personalitzar la pregunta al model
         prompt_video = st.text_area(
@@ -372,57 +477,173 @@ elif seccio == "🎥 Anàlisi de vídeo":
             height=80,
         )
 
-        if st.button("🔍 Analitzar Swing"):
-            with st.spinner("L'IA està estudiant el teu moviment... (pot trigar uns segons)"):
-                try:
-                    # PAS 1: Guardar el vídeo en un fitxer temporal al disc local.
-                    # delete=False: el fitxer no s'elimina automàticament en tancar-lo
-                    # (el necessitem per pujar-lo a l'API de Google)
-                    with tempfile.NamedTemporaryFile(delete=False, suffix=".mp4") as tmp:
-                        tmp.write(uploaded_file.read())
-                        video_path = tmp.name
-
-                    # PAS 2: Pujar el vídeo a la Files API de Google Gemini.
-                    # client.files.upload() retorna una referència al fitxer al núvol
-                    video_file = client.files.upload(file=video_path)
-
-                    # PAS 3: Esperar que Google acabi de processar el vídeo.
-                    # El servidor analitza el vídeo de forma asíncrona;
-                    # comprovem l'estat cada 2 segons fins que deixi de ser "PROCESSING"
-                    while video_file.state.name == "PROCESSING":
-                        time.sleep(2)
-                        video_file = client.files.get(name=video_file.name)
-
-                    # PAS 4: Generar l'anàlisi multimodal (text + vídeo).
-                    # Passem una llista amb el prompt i la referència al vídeo processat;
-                    # Gemini analitza ambdós conjuntament
-                    response = client.models.generate_content(
-                        model="gemini-2.5-flash",
-                        contents=[prompt_video, video_file],
-                        config=video_config,
-                    )
+        # Mode d'anàlisi: el vídeo complet (Files API) o només cinc fotogrames clau
+        # extrets localment i enviats com a imatges (diagnòstic ràpid, sense pujada)
+        # (en la comparació, els dos clips sempre es retallen als trams alineats)
+        keyframe_mode = by_aspect = False
+        if not compare_mode:
+            analysis_mode = st.radio(
+                "Mode d'anàlisi:",
+                ["🎬 Vídeo complet", "🖼️ Fotogrames clau (ràpid)"],
+                horizontal=True,
+            )
+            keyframe_mode = analysis_mode.startswith("🖼️")
+
+        # Preprocessament local: retalla el clip a la finestra del swing (detectada
+        # pel moviment) i el torna a codificar més petit abans de pujar-lo
+        trim_swing = compare_mode
+        if not keyframe_mode and not compare_mode:
+            trim_swing = st.checkbox("✂️ Retallar el swing i reduir el vídeo abans de pujar-lo", value=True)
+        if trim_swing:
+            col_res, col_fps = st.columns(2)
+            max_height = col_res.selectbox("Resolució màxima", [480, 720, 1080], index=1,
+                                           format_func=lambda h: f"{h}p")
+            target_fps = col_fps.selectbox("Fotogrames per segon", [15, 30, 60], index=1)
+
+        # Informe per aspectes: una crida curta per aspecte, totes alhora sobre el
+        # mateix vídeo, en lloc d'una sola resposta llarga
+        if not compare_mode:
+            by_aspect = st.checkbox(
+                "🧩 Analitzar cada aspecte per separat i en paral·lel "
+                "(grip, alineació, backswing, follow-through)",
+            )
 
-                    st.markdown("### 📊 Informe de l'Entrenador")
-                    st.markdown(response.text)
-
-                    # NETEJA: Eliminar el vídeo del servidor de Google.
-                    # (s'elimina sol als 48h, però és millor fer-ho immediatament)
-                    try:
-                        client.files.delete(name=video_file.name)
-                    except Exception:
-                        pass
-
-                    # NETEJA: Eliminar el fitxer temporal del disc local
-                    try:
-                        os.remove(video_path)
-                    except Exception:
-                        pass
-
-                except Exception as e:
-                    err = str(e)
-                    if "429" in err or "quota" in err.lower():
-                        st.error("⚠️ Quota esgotada. Espera uns minuts i torna-ho a intentar.")
-                    else:
-                        st.error(f"❌ Error en l'anàlisi: {err}")
+        from coach_resources import get_job_queue, get_video_registry
+        from coach_swing import SwingRequest
+        from coach_video_registry import video_digest, video_key
+
+        # El hash de cada clip (clau del registre de vídeos) es calcula una
+        # vegada per fitxer pujat i sessió
+        digests = st.session_state.setdefault("video_digests", {})
+        for f in uploaded_files:
+            if f.file_id not in digests:
+                digests[f.file_id] = video_digest(f)
+
+        requests = [
+            SwingRequest(
+                data=f.getvalue(),
+                name=f.name,
+                mime_type=f.type,
+                digest=digests[f.file_id],
+                prompt=prompt_video,
+                keyframe_mode=keyframe_mode,
+                trim=trim_swing,
+                max_height=max_height if trim_swing else 720,
+                fps=target_fps if trim_swing else 30,
+                aspects=by_aspect,
+            )
+            for f in uploaded_files
+        ]
+        client = get_client(API_KEY)
+
+        # Pujada per endavant: amb un sol swing i el vídeo complet, el retall, la
+        # pujada i el processament comencen ara, mentre l'usuari revisa el vídeo i
+        # edita el prompt. "Analitzar" aprofita el fitxer ja ACTIVE del registre
+        # (o s'espera a la pujada en curs, sense repetir-la). És un treball de
+        # fons: no ocupa els fils de les anàlisis. Un sol cop per clip, amb la
+        # configuració inicial; si després es canvia la resolució o els fps,
+        # l'anàlisi puja ella mateixa aquella variant.
+        if not batch_mode and not compare_mode and not keyframe_mode:
+            from coach_swing import prefetch_video
+            prefetches = st.session_state.setdefault("video_prefetches", {})
+            if requests[0].digest not in prefetches:
+                prefetches[requests[0].digest] = get_job_queue().submit(
+                    "swing-prefetch", prefetch_video, client, get_video_registry(), requests[0],
+                    background=True,
+                )
+            # Només mentre la pujada és a la cua o en curs es consulta cada segon
+            from coach_jobs import DONE, FAILED
+            prefetch = get_job_queue().get(prefetches[requests[0].digest])
+            if prefetch is None or prefetch["status"] in (DONE, FAILED):
+                _prefetch_caption(prefetch, video_key(requests[0].digest, requests[0].variant))
+            else:
+                _poll_prefetch(prefetch["id"])
+
+        button = "🔍 Comparar" if compare_mode else "🔍 Analitzar sessió" if batch_mode else "🔍 Analitzar Swing"
+        if st.button(button):
+            from coach_swing import analyze_batch, analyze_comparison, analyze_swing
+
+            # L'anàlisi s'executa en segon pla (coach_jobs.py): la pàgina només
+            # guarda l'identificador del treball (també a la URL, per recuperar-lo
+            # si es refresca el navegador) i en consulta l'estat
+            if compare_mode:
+                job_id = get_job_queue().submit(
+                    "swing-compare", analyze_comparison, client, get_video_registry(), *requests,
+                )
+            elif batch_mode:
+                job_id = get_job_queue().submit(
+                    "swing-batch", analyze_batch, client, get_video_registry(), requests,
+                )
+            else:
+                job_id = get_job_queue().submit(
+                    "swing", analyze_swing, client, get_video_registry(), requests[0],
+                )
+            st.session_state.video_job = job_id
+            st.query_params["job"] = job_id
+
+    elif compare_mode:
+        st.info("👆 Puja el swing anterior i l'actual per comparar-los.")
     else:
         st.info("👆 Puja un vídeo per començar l'anàlisi.")
+
+    # ── ESTAT DE L'ANÀLISI EN SEGON PLA ──────────────────────────────────────
+    # Mentre el treball s'executa, un fragment es refresca cada segon (només
+    # aquesta part de la pàgina) amb l'etapa, el progrés i el text parcial.
+    # Quan acaba, es torna a executar la pàgina sencera per mostrar l'informe.
+
+    def _show_swing_report(result: dict, title: bool = True) -> None:
+        import base64
+        if title:
+            st.markdown("### 📊 Informe de l'Entrenador")
+        for note in result.get("notes", []):
+            st.caption(note)
+        frames = result.get("frames", [])
+        if frames:
+            for col, k in zip(st.columns(len(frames)), frames):
+                col.image(base64.b64decode(k["jpeg"]), caption=f"{k['phase']} · {k['time']:.2f} s")
+        st.markdown(result.get("text", ""))
+        if result.get("tokens"):
+            label = "fotogrames" if frames else "vídeo"
+            st.caption(f"Tokens d'entrada (prompt + {label}): {result['tokens']:,}")
+
+    @st.fragment(run_every=1.0)
+    def _poll_swing_job(job_id: str) -> None:
+        from coach_jobs import DONE, FAILED, QUEUED
+        from coach_resources import get_job_queue
+        job = get_job_queue().get(job_id)
+        if job is None or job["status"] in (DONE, FAILED):
+            st.rerun()
+        if job["status"] == QUEUED:
+            st.info(f"⏳ Anàlisi a la cua (posició {job['position']}). Pots continuar navegant.")
+            return
+        st.progress(job["progress"], text=f"⏳ {job['stage']}...")
+        if job["text"]:
+            st.markdown("### 📊 Informe de l'Entrenador")
+            st.markdown(job["text"] + " ▌")
+
+    job_id = st.session_state.get("video_job") or st.query_params.get("job")
+    if job_id:
+        from coach_jobs import DONE, FAILED
+        from coach_resources import get_job_queue
+        job = get_job_queue().get(job_id)
+        if job is None:
+            st.query_params.pop("job", None)
+            st.session_state.video_job = None
+        elif job["status"] == DONE and job["kind"] == "swing-batch":
+            result = job["result"]
+            st.markdown("### 📊 Resum de la sessió")
+            st.caption(f"{len(result['clips'])} clips en {result['seconds']:.0f} s "
+                       f"(un per un haurien estat {result['clip_seconds']:.0f} s)")
+            st.markdown(result["summary"] or "—")
+            for clip in result["clips"]:
+                with st.expander(f"{'❌' if clip['error'] else '🎬'} {clip['name']}"):
+                    if clip["error"]:
+                        st.error(clip["error"])
+                    else:
+                        _show_swing_report(clip, title=False)
+        elif job["status"] == DONE:
+            _show_swing_report(job["result"] or {})
+        elif job["status"] == FAILED:
+            st.error(job["error"] or "❌ Error en l'anàlisi.")
+        else:
+            _poll_swing_job(job_id)
@@ -0,0 +1,119 @@
+"""
+bench_context_cache.py
+======================
+Comprova el context caching del KNOWLEDGE contra un client fals local
+(sense xarxa ni API Key) i mostra la reducció de tokens d'entrada per crida.
+
+Execució (des de l'arrel del projecte):
+  python bench/bench_context_cache.py
+"""
+
+import os
+import sys
+import time
+from types import SimpleNamespace
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from coach_context_cache import KnowledgeCache  # noqa: E402
+from coach_resources import get_knowledge  # noqa: E402
+
+
+def _tokens(text) -> int:
+    """Aproximació grollera: ~4 caràcters per token."""
+    return len(text or "") // 4
+
+
+class FakeCaches:
+    def __init__(self, fail=False):
+        self.store = {}
+        self.fail = fail
+        self.updates = 0
+
+    def list(self):
+        return list(self.store.values())
+
+    def create(self, model, config):
+        if self.fail:
+            raise RuntimeError("400 caching not supported")
+        name = f"cachedContents/{len(self.store) + 1}"
+        self.store[name] = SimpleNamespace(
+            name=name, model=f"models/{model}", display_name=config.display_name,
+            text=config.system_instruction,
+        )
+        return self.store[name]
+
+    def update(self, name, config):
+        self.updates += 1
+
+
+class FakeModels:
+    def __init__(self, caches):
+        self.caches = caches
+
+    def generate_content(self, model, contents, config):
+        cached = self.caches.store.get(config.cached_content) if config.cached_content else None
+        if config.cached_content and cached is None:
+            raise RuntimeError("404 cached content not found")
+        system = cached.text if cached else config.system_instruction
+        usage = SimpleNamespace(
+            prompt_token_count=_tokens(system) + _tokens(contents),
+            cached_content_token_count=_tokens(system) if cached else None,
+        )
+        return SimpleNamespace(text="ok", usage_metadata=usage)
+
+
+class FakeClient:
+    def __init__(self, fail=False):
+        self.caches = FakeCaches(fail)
+        self.models = FakeModels(self.caches)
+
+
+def ask(label, cache, questions):
+    print(f"\n{label}")
+    for q in questions:
+        cache.generate_content(contents=q)
+        u = cache.last_usage
+        print(f"  prompt={u['prompt_tokens']:>6}  cache={u['cached_tokens']:>6}  "
+              f"facturats={u['billed_tokens']:>6}  reducció={u['reduction']:.1%}")
+
+
+if __name__ == "__main__":
+    res = get_knowledge()
+    system_text, version = res.full_system, res.version
+    questions = ["Com evito l'slice?", "Quina és la regla del fora de límits?", "Com agafo el pal?"]
+
+    client = FakeClient()
+    cache = KnowledgeCache(client, "gemini-2.5-flash", system_text, version)
+    ask("Amb cache:", cache, questions)
+    assert len(client.caches.store) == 1, "el cache s'ha de crear una sola vegada per versió"
+
+    # Un segon procés amb la mateixa versió reutilitza el cache existent
+    other = KnowledgeCache(client, "gemini-2.5-flash", system_text, version)
+    ask("Reutilitzant el cache d'un altre procés:", other, questions[:1])
+    assert len(client.caches.store) == 1
+    other.close()
+
+    # Cache esborrat al servidor → la crida es reintenta en línia
+    client.caches.store.clear()
+    ask("Cache caducat (fallback en línia):", cache, questions[:1])
+    assert cache.last_usage["cached_tokens"] == 0
+    # ... i la pregunta següent el torna a crear de seguida (sense esperar RETRY_AFTER_SECONDS)
+    ask("Després de caducar:", cache, questions[1:2])
+    assert cache.last_usage["cached_tokens"] > 0
+    cache.close()
+
+    # Sense ús en tot un TTL, el TTL ja no es renova
+    idle_client = FakeClient()
+    idle = KnowledgeCache(idle_client, "gemini-2.5-flash", system_text, version, ttl=0.2)
+    idle.generate_content(contents=questions[0])
+    time.sleep(1.0)
+    updates = idle_client.caches.updates
+    time.sleep(0.5)
+    assert idle.name is None and idle_client.caches.updates == updates <= 2
+    print(f"\nCache sense ús: {updates} renovacions i s'atura")
+
+    offline = KnowledgeCache(FakeClient(fail=True), "gemini-2.5-flash", system_text, version)
+    ask("Caching no disponible (mode en línia):", offline, questions[:1])
+    assert offline.last_usage["cached_tokens"] == 0
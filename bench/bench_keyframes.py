@@ -0,0 +1,94 @@
+"""
+bench_keyframes.py
+==================
+Compara l'anàlisi amb el vídeo complet i l'anàlisi amb fotogrames clau
+(coach_video.extract_keyframes) sobre els mateixos clips.
+
+Sense --live només es mesura la part local (temps de preparació, bytes a
+enviar i tokens estimats). Amb --live i GEMINI_API_KEY es fan les crides
+reals i es mesuren la latència total (pujada + processament + resposta en
+el mode vídeo) i els tokens d'entrada que retorna l'API.
+
+Execució (des de l'arrel del projecte):
+  python bench/bench_keyframes.py [clip.mp4 ...] [--live]
+  (sense clips, es fa servir un clip sintètic de bench_preprocess.py)
+"""
+
+import argparse
+import io
+import os
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from bench_preprocess import synthetic_clip  # noqa: E402
+
+from coach_video import extract_keyframes, keyframe_contents  # noqa: E402
+
+MODEL = "gemini-2.5-flash"
+PROMPT = "Analitza aquest swing de golf. Quins són els 3 errors principals i com puc corregir-los?"
+
+
+def full_video(client, clip: io.BytesIO) -> dict:
+    from coach_resources import get_video_config
+    from coach_upload import upload_video, wait_until_active
+
+    started = time.perf_counter()
+    video_file = wait_until_active(client, upload_video(client, clip, "video/mp4"))
+    response = client.models.generate_content(
+        model=MODEL, contents=[PROMPT, video_file], config=get_video_config(),
+    )
+    seconds = time.perf_counter() - started
+    client.files.delete(name=video_file.name)
+    return {"seconds": seconds, "tokens": response.usage_metadata.prompt_token_count}
+
+
+def keyframes(client, clip: io.BytesIO) -> dict:
+    from coach_resources import get_video_config
+
+    started = time.perf_counter()
+    frames = extract_keyframes(clip)
+    response = client.models.generate_content(
+        model=MODEL, contents=keyframe_contents(PROMPT, frames), config=get_video_config(),
+    )
+    return {"seconds": time.perf_counter() - started,
+            "tokens": response.usage_metadata.prompt_token_count}
+
+
+if __name__ == "__main__":
+    ap = argparse.ArgumentParser()
+    ap.add_argument("clips", nargs="*")
+    ap.add_argument("--live", action="store_true", help="crides reals a Gemini (GEMINI_API_KEY)")
+    args = ap.parse_args()
+
+    clips = {}
+    for path in args.clips:
+        with open(path, "rb") as f:
+            clips[os.path.basename(path)] = f.read()
+    if not clips:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "synthetic.mp4")
+            synthetic_clip(path, 1920, 1080, 60, 10.0, (4.0, 5.5))
+            with open(path, "rb") as f:
+                clips["sintètic 1080p60 10s"] = f.read()
+
+    client = None
+    if args.live:
+        from coach_resources import get_client
+        client = get_client(os.environ["GEMINI_API_KEY"])
+
+    for name, data in clips.items():
+        frames = extract_keyframes(io.BytesIO(data))
+        print(f"{name}:")
+        print(f"  local   vídeo: {len(data) / 1e6:7.1f} MB  ~{frames.original.tokens:6,} tokens")
+        print(f"  local   fotog: {frames.bytes / 1e6:7.2f} MB  ~{frames.tokens:6,} tokens  "
+              f"(extracció {frames.seconds:.2f}s; "
+              + ", ".join(f"{k.phase} {k.time:.2f}s" for k in frames.frames) + ")")
+        if client:
+            v, k = full_video(client, io.BytesIO(data)), keyframes(client, io.BytesIO(data))
+            print(f"  API     vídeo: {v['seconds']:6.1f} s  {v['tokens']:6,} tokens d'entrada")
+            print(f"  API     fotog: {k['seconds']:6.1f} s  {k['tokens']:6,} tokens d'entrada")
@@ -0,0 +1,92 @@
+"""
+bench_knowledge.py
+==================
+Compara el temps de càrrega i el pic de memòria (tracemalloc) del coneixement:
+
+  - abans (JSON):   json.load de coach_config.json (indent=2), com CoachGolfPro.py
+  - abans (mòdul):  importar el CoachGolfGem.py generat amb el literal KNOWLEDGE
+                    (Python compila els ~186 KB de codi font)
+  - després (recuperació): obrir coach_knowledge.bin i llegir-ne només la
+                    instrucció de sistema (el que necessita el mode recuperació)
+  - després (complet): a més, descomprimir totes les seccions
+
+Els artefactes antics es reconstrueixen en un directori temporal a partir de
+coach_knowledge.bin (mateix contingut). Cada mesura s'executa en un procés nou.
+
+Execució (des de l'arrel del projecte, després de build_gem.py):
+  python bench/bench_knowledge.py
+"""
+
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from coach_knowledge_pack import SYSTEM_SECTION, KnowledgePack  # noqa: E402
+from coach_resources import KNOWLEDGE_FILE  # noqa: E402
+
+MODES = {
+    "json": "abans (JSON)",
+    "module": "abans (mòdul .py)",
+    "pack-system": "després (recuperació)",
+    "pack-full": "després (complet)",
+}
+
+
+def _child(mode: str, tmp: str) -> dict:
+    sys.dont_write_bytecode = True      # El mòdul es compila des del codi font, com la primera vegada
+    tracemalloc.start()
+    started = time.perf_counter()
+    if mode == "json":
+        with open(os.path.join(tmp, "coach_config.json"), encoding="utf-8") as f:
+            cfg = json.load(f)
+        size = len(cfg["knowledge"])
+    elif mode == "module":
+        sys.path.insert(0, tmp)
+        import gem_knowledge
+        size = len(gem_knowledge.KNOWLEDGE)
+    else:
+        pack = KnowledgePack(KNOWLEDGE_FILE)
+        size = len(pack.section(SYSTEM_SECTION))
+        if mode == "pack-full":
+            size = len(pack.knowledge())
+    seconds = time.perf_counter() - started
+    peak = tracemalloc.get_traced_memory()[1]
+    return {"ms": seconds * 1000, "peak_kb": peak / 1024, "chars": size}
+
+
+if __name__ == "__main__":
+    if len(sys.argv) == 4 and sys.argv[1] == "--child":
+        print(json.dumps(_child(sys.argv[2], sys.argv[3])))
+        sys.exit(0)
+
+    pack = KnowledgePack(KNOWLEDGE_FILE)
+    system_instruction, knowledge = pack.section(SYSTEM_SECTION), pack.knowledge()
+    with tempfile.TemporaryDirectory() as tmp:
+        with open(os.path.join(tmp, "coach_config.json"), "w", encoding="utf-8") as f:
+            json.dump({"system_instruction": system_instruction, "knowledge": knowledge},
+                      f, ensure_ascii=False, indent=2)
+        with open(os.path.join(tmp, "gem_knowledge.py"), "w", encoding="utf-8") as f:
+            f.write(f"KNOWLEDGE = {knowledge!r}\n\nSYSTEM_INSTRUCTION = {system_instruction!r}\n")
+
+        print("Mida dels artefactes:")
+        print(f"  coach_config.json    {os.path.getsize(os.path.join(tmp, 'coach_config.json')):>9,} bytes")
+        print(f"  literal a .py        {os.path.getsize(os.path.join(tmp, 'gem_knowledge.py')):>9,} bytes")
+        print(f"  coach_knowledge.bin  {os.path.getsize(KNOWLEDGE_FILE):>9,} bytes "
+              f"({len(pack.names)} seccions, {pack.raw_size():,} bytes sense comprimir)")
+        print("\nCàrrega (mediana de 5 processos nous):")
+        for mode, label in MODES.items():
+            runs = []
+            for _ in range(5):
+                out = subprocess.run([sys.executable, os.path.abspath(__file__), "--child", mode, tmp],
+                                     capture_output=True, text=True, check=True)
+                runs.append(json.loads(out.stdout.strip().splitlines()[-1]))
+            r = sorted(runs, key=lambda r: r["ms"])[len(runs) // 2]
+            print(f"  {label:24s} {r['ms']:7.2f} ms   pic de memòria {r['peak_kb']:6.0f} KB   "
+                  f"({r['chars']:,} caràcters)")
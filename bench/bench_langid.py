@@ -0,0 +1,78 @@
+"""
+bench_langid.py
+===============
+Microbenchmark de la detecció d'idioma: el camí anterior del chat
+(`langdetect.detect`) contra coach_langid.detect_language.
+
+Mesura, per a cada camí:
+  - la primera crida en un procés nou (càrrega de perfils)
+  - el temps per crida amb preguntes noves i amb preguntes repetides
+  - el determinisme (respostes diferents per a la mateixa pregunta)
+  - l'encert sobre un petit conjunt etiquetat
+
+Execució (des de l'arrel del projecte):
+  python bench/bench_langid.py
+"""
+
+import os
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+LABELED = [
+    ("Com puc evitar l'slice amb el driver?", "ca"),
+    ("Quina és la regla del fora de límits en el pitch and putt?", "ca"),
+    ("Què he de fer si la bola queda dins del búnquer?", "ca"),
+    ("¿Cómo evito el slice con el driver?", "es"),
+    ("¿Cuál es la regla de bola perdida en pitch and putt?", "es"),
+    ("¿Qué hago si la bola queda en el búnker?", "es"),
+    ("How can I stop slicing my driver?", "en"),
+    ("What is the out of bounds rule in pitch and putt?", "en"),
+    ("Comment corriger mon slice au driver ?", "fr"),
+    ("Wie kann ich meinen Slice mit dem Driver vermeiden?", "de"),
+    ("Come posso evitare lo slice con il driver?", "it"),
+    ("Como posso evitar o slice com o driver?", "pt"),
+    ("Hoe kan ik mijn slice met de driver voorkomen?", "nl"),
+]
+
+OLD = "from langdetect import detect\nf = lambda t: detect(t)\n"
+NEW = "from coach_langid import detect_language\nf = lambda t: detect_language(t)\n"
+
+
+def cold_start_ms(setup: str) -> float:
+    """Temps de la primera detecció en un procés Python nou (import inclòs)."""
+    code = (
+        f"import sys, time; sys.path.insert(0, {ROOT!r}); t0 = time.perf_counter()\n"
+        f"{setup}f('Com puc evitar l\\'slice amb el driver?')\n"
+        "print((time.perf_counter() - t0) * 1000)"
+    )
+    return float(subprocess.check_output([sys.executable, "-c", code], text=True))
+
+
+def measure(label: str, setup: str):
+    scope = {}
+    exec(setup, scope)
+    f = scope["f"]
+    cold = cold_start_ms(setup)
+
+    t0 = time.perf_counter()
+    results = [f(t) for t, _ in LABELED]
+    first_ms = (time.perf_counter() - t0) / len(LABELED) * 1000
+
+    t0 = time.perf_counter()
+    runs = [[f(t) for t, _ in LABELED] for _ in range(20)]
+    repeat_ms = (time.perf_counter() - t0) / (20 * len(LABELED)) * 1000
+
+    unstable = sum(len({r[i] for r in runs}) > 1 for i in range(len(LABELED)))
+    correct = sum(r == lang for r, (_, lang) in zip(results, LABELED))
+    print(f"{label:<22} {cold:>9.1f} {first_ms:>9.3f} {repeat_ms:>9.3f} "
+          f"{unstable:>9d} {correct:>5d}/{len(LABELED)}")
+
+
+if __name__ == "__main__":
+    print(f"{'camí':<22} {'fred(ms)':>9} {'nova(ms)':>9} {'rep.(ms)':>9} {'inestables':>9} {'encerts':>7}")
+    measure("langdetect.detect", OLD)
+    measure("coach_langid", NEW)
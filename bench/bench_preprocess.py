@@ -0,0 +1,106 @@
+"""
+bench_preprocess.py
+===================
+Prova el preprocessament de coach_video.py amb un clip sintètic: escena
+quieta (amb soroll de sensor), un "swing" (pal que gira) al mig i més escena
+quieta al final.
+
+Mostra la finestra detectada respecte a la real, la mida i durada abans i
+després, l'estimació de tokens de vídeo, el temps de l'energia de moviment
+amb tots els fotogrames i mostrejada (MOTION_FPS), i el temps de CPU del
+preprocessament al costat del temps de pujada que estalvia (--mbps).
+
+Execució (des de l'arrel del projecte):
+  python bench/bench_preprocess.py [--width 1920 --height 1080 --fps 60 --seconds 10 --mbps 10]
+"""
+
+import argparse
+import io
+import math
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import cv2  # noqa: E402
+
+from coach_video import MOTION_FPS, motion_energy, prepare_video, swing_window  # noqa: E402
+
+
+def club_angle(t: float, swing: tuple) -> float:
+    """
+    Angle del pal (graus) amb el ritme d'un swing real: backswing lent (55%
+    del temps), pausa al top, downswing ràpid fins a l'impacte (la màxima
+    velocitat) i follow-through més lent fins al finish.
+    """
+    start, end = swing
+    d = end - start
+    top, downswing, impact = start + 0.55 * d, start + 0.6 * d, start + 0.75 * d
+    if t < start:
+        return 0.0
+    if t < top:                                   # Backswing: 0 → -160°
+        return -160 * (t - start) / (top - start)
+    if t < downswing:                             # Pausa al top
+        return -160.0
+    if t < impact:                                # Downswing accelerat: -160° → 0
+        return -160 + 160 * ((t - downswing) / (impact - downswing)) ** 2
+    if t < end:                                   # Follow-through: 0 → 150°
+        return 150 * (t - impact) / (end - impact)
+    return 150.0                                  # Finish aguantat
+
+
+def synthetic_clip(path: str, width: int, height: int, fps: int, seconds: float,
+                   swing: tuple) -> None:
+    """Escriu un clip amb un pal que fa un swing entre swing[0] i swing[1] segons."""
+    rng = np.random.default_rng(0)
+    background = rng.integers(60, 120, (height, width, 3), dtype=np.uint8)
+    cx, cy, r = width // 2, height // 2, height // 3
+    writer = cv2.VideoWriter(path, cv2.VideoWriter_fourcc(*"mp4v"), fps, (width, height))
+    for i in range(round(seconds * fps)):
+        t = i / fps
+        frame = background.copy()
+        frame += rng.integers(0, 3, frame.shape, dtype=np.uint8)          # Soroll de sensor
+        angle = math.radians(90 + club_angle(t, swing))
+        tip = (int(cx + r * math.cos(angle)), int(cy + r * math.sin(angle)))
+        cv2.line(frame, (cx, cy), tip, (240, 240, 240), max(4, width // 200))
+        writer.write(frame)
+    writer.release()
+
+
+if __name__ == "__main__":
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--width", type=int, default=1920)
+    ap.add_argument("--height", type=int, default=1080)
+    ap.add_argument("--fps", type=int, default=60)
+    ap.add_argument("--seconds", type=float, default=10.0)
+    ap.add_argument("--mbps", type=float, default=10.0, help="velocitat de pujada (Mbit/s)")
+    args = ap.parse_args()
+
+    swing = (args.seconds * 0.4, args.seconds * 0.4 + 1.5)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "clip.mp4")
+        synthetic_clip(path, args.width, args.height, args.fps, args.seconds, swing)
+        with open(path, "rb") as f:
+            clip = io.BytesIO(f.read())
+
+        print("Energia de moviment:")
+        for label, sample_fps in (("tots els fotogrames", 0), (f"mostrejada a {MOTION_FPS} fps", MOTION_FPS)):
+            started = time.perf_counter()
+            energy = motion_energy(path, sample_fps=sample_fps)
+            window = swing_window(energy, args.fps)
+            print(f"  {label:<24} {time.perf_counter() - started:.2f} s  "
+                  f"finestra {window[0] / args.fps:.2f}–{(window[1] + 1) / args.fps:.2f} s")
+
+    result = prepare_video(clip)
+    print(f"Swing real:      {swing[0]:.2f}–{swing[1]:.2f} s")
+    print(f"Swing detectat:  {result.window[0]:.2f}–{result.window[1]:.2f} s (amb marge)")
+    print(f"Abans:   {result.original.describe()}  ~{result.original.tokens:,} tokens")
+    print(f"Després: {result.prepared.describe()}  ~{result.prepared.tokens:,} tokens")
+    saved = (result.original.bytes - result.prepared.bytes) * 8 / (args.mbps * 1e6)
+    print(f"Preprocessament: {result.seconds:.2f} s de CPU · pujada estalviada: ~{saved:.1f} s "
+          f"a {args.mbps:g} Mbit/s (guany net ~{saved - result.seconds:.1f} s)")
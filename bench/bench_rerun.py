@@ -0,0 +1,63 @@
+"""
+bench_rerun.py
+==============
+Mesura el temps de CPU per rerenderització del treball de càrrega de
+CoachGolfPro.py: abans (tot es refeia a cada rerun) i després (capa de
+recursos compartida de coach_resources.py).
+
+Execució (des de l'arrel del projecte):
+  python bench/bench_rerun.py [--reruns 50]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from google import genai  # noqa: E402
+from google.genai import types  # noqa: E402
+
+from coach_knowledge_pack import SYSTEM_SECTION, KnowledgePack  # noqa: E402
+from coach_resources import KNOWLEDGE_FILE, LANGUAGE_RULE, get_client, get_knowledge  # noqa: E402
+
+FAKE_KEY = "bench-key"
+
+
+def rerun_before():
+    """Treball que feia cada rerenderització abans de la capa de recursos."""
+    pack = KnowledgePack(KNOWLEDGE_FILE)
+    knowledge, system_instruction = pack.knowledge(), pack.section(SYSTEM_SECTION)
+    pack.close()
+    client = genai.Client(api_key=FAKE_KEY)
+    full_system = (
+        system_instruction + "\n\n---\nCONTINGUT DELS VIDEOS:\n" + knowledge + "\n\n---\n" + LANGUAGE_RULE
+    )
+    types.GenerateContentConfig(system_instruction=system_instruction + "\n\n---\n" + LANGUAGE_RULE)
+    return client, full_system
+
+
+def rerun_after():
+    """Treball de cada rerenderització amb la capa de recursos."""
+    return get_client(FAKE_KEY), get_knowledge().full_system
+
+
+def cpu_ms(fn, n: int) -> float:
+    t0 = time.process_time()
+    for _ in range(n):
+        fn()
+    return (time.process_time() - t0) / n * 1000
+
+
+if __name__ == "__main__":
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--reruns", type=int, default=50)
+    args = ap.parse_args()
+
+    rerun_after()   # primera càrrega (es paga una sola vegada per procés)
+    before = cpu_ms(rerun_before, args.reruns)
+    after = cpu_ms(rerun_after, args.reruns)
+    print(f"CPU per rerun abans:  {before:8.3f} ms")
+    print(f"CPU per rerun després:{after:8.3f} ms  ({before / max(after, 1e-6):.0f}x menys)")
@@ -0,0 +1,76 @@
+"""
+bench_segments.py
+=================
+Mida del context que s'envia al model en mode recuperació (k passatges):
+
+  - abans:   passatges de PASSAGE_WORDS paraules, enllaç al vídeo sencer
+  - després: finestres de ~WINDOW_SECONDS segons, enllaç al minut (?t=)
+
+Fa servir les transcripcions de transcripts.jsonl; les que encara no tenen
+segments amb temps (descarregades abans de guardar-los) es parteixen en
+segments sintètics de SEGMENT_WORDS paraules a WORDS_PER_SECOND, com els
+subtítols automàtics de YouTube.
+
+Execució (des de l'arrel del projecte):
+  python bench/bench_segments.py [--k 8]
+"""
+
+import argparse
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from coach_retrieval import BM25Index, format_passages, video_passages  # noqa: E402
+from coach_transcripts import open_store, read_video_list  # noqa: E402
+
+SEGMENT_WORDS = 8
+WORDS_PER_SECOND = 2.5
+
+QUERIES = [
+    "cómo hago un chip alrededor del green",
+    "how do I fix my grip?",
+    "posició de les mans a l'impacte",
+    "el backswing es demasiado largo",
+    "com controlar la distància dels approach curts",
+]
+
+
+def _segments(entry: dict) -> list:
+    if entry.get("segments"):
+        return entry["segments"]
+    words = entry["text"].split()
+    step = SEGMENT_WORDS / WORDS_PER_SECOND
+    return [[i * step, step, " ".join(words[w:w + SEGMENT_WORDS])]
+            for i, w in enumerate(range(0, len(words), SEGMENT_WORDS))]
+
+
+if __name__ == "__main__":
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--k", type=int, default=8, help="passatges per pregunta")
+    args = ap.parse_args()
+
+    videos = read_video_list()
+    before, after = [], []
+    with open_store() as store:
+        for vid_id, entry in store.records(videos):
+            if entry.get("status") == "ok":
+                before += video_passages(vid_id, videos[vid_id], entry["text"])
+                after += video_passages(vid_id, videos[vid_id], entry["text"], _segments(entry))
+    indexes = {"abans": BM25Index.build(before), "després": BM25Index.build(after)}
+    print(f"Passatges: {len(before)} de {len(before[0]['text'].split())} paraules -> "
+          f"{len(after)} finestres de ~{sum(len(p['text'].split()) for p in after) // len(after)} paraules\n")
+
+    print(f"{'consulta':<48} {'abans':>8} {'després':>8}")
+    totals = dict.fromkeys(indexes, 0)
+    for q in QUERIES:
+        sizes = {name: len(format_passages(index.search(q, k=args.k))) for name, index in indexes.items()}
+        for name, size in sizes.items():
+            totals[name] += size
+        print(f"{q[:46]:<48} {sizes['abans']:>8,} {sizes['després']:>8,}")
+    print(f"{'mitjana (caràcters de context)':<48} {totals['abans'] // len(QUERIES):>8,} "
+          f"{totals['després'] // len(QUERIES):>8,}")
+
+    hit = indexes["després"].search(QUERIES[0], k=1)[0]
+    print(f"\nExemple de capçalera:\n  {format_passages([hit]).splitlines()[0]}")
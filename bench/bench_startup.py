@@ -0,0 +1,116 @@
+"""
+bench_startup.py
+================
+Mesura el temps d'arrencada (primer render) de CoachGolfPro.py i
+Agenda/AgendaGolf.py i quines dependències pesades s'hi carreguen.
+
+Cada mesura s'executa en un procés Python nou (sense mòduls en memòria):
+
+  - Importació: temps d'`import <mòdul>` de cada dependència pesada.
+  - Primer render: temps d'executar l'app amb streamlit.testing (AppTest)
+    fins a mostrar la pàgina inicial, amb una API Key falsa i la telemetria
+    desactivada (no es fa cap petició a GA4 ni al comptador de visites).
+    Amb --eager, les dependències pesades s'importen abans de l'app, com
+    feien les importacions al començament del fitxer (mesura "abans").
+
+Execució (des de l'arrel del projecte):
+  python bench/bench_startup.py [--runs 3]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+APPS = {
+    "CoachGolfPro": os.path.join(ROOT, "CoachGolfPro.py"),
+    "AgendaGolf": os.path.join(ROOT, "Agenda", "AgendaGolf.py"),
+}
+
+# Dependències que abans s'importaven al començament de cada app
+HEAVY = {
+    "CoachGolfPro": ["google.genai", "google.genai.types", "numpy", "requests", "langdetect"],
+    "AgendaGolf": ["google.genai", "google.genai.types", "pdfplumber", "streamlit_calendar"],
+}
+
+
+def _child_import(module: str) -> dict:
+    t0 = time.perf_counter()
+    __import__(module)
+    return {"seconds": time.perf_counter() - t0}
+
+
+def _child_render(app: str, eager: bool) -> dict:
+    from concurrent.futures import Future
+
+    sys.path.insert(0, ROOT)
+    import coach_telemetry
+
+    def _no_fetch(self, url, timeout=4):
+        future = Future()
+        future.set_result(None)
+        return future
+
+    coach_telemetry.TelemetryDispatcher.send_event = lambda self, *a, **kw: None
+    coach_telemetry.TelemetryDispatcher.fetch_json = _no_fetch
+
+    from streamlit.testing.v1 import AppTest
+
+    t0 = time.perf_counter()
+    if eager:
+        for module in HEAVY[app]:
+            __import__(module)
+    at = AppTest.from_file(APPS[app], default_timeout=60)
+    at.secrets["GEMINI_API_KEY"] = "bench-key"
+    at.run()
+    seconds = time.perf_counter() - t0
+    return {
+        "seconds": seconds,
+        "errors": [e.value for e in at.exception],
+        "loaded": [m for m in HEAVY[app] if m in sys.modules],
+    }
+
+
+def _spawn(*args) -> dict:
+    out = subprocess.run(
+        [sys.executable, os.path.abspath(__file__), "--child", *args],
+        cwd=ROOT, capture_output=True, text=True, check=True,
+    )
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def _median(results: list) -> float:
+    return statistics.median(r["seconds"] for r in results) * 1000
+
+
+if __name__ == "__main__":
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--runs", type=int, default=3)
+    ap.add_argument("--child", nargs="+", help=argparse.SUPPRESS)
+    args = ap.parse_args()
+
+    if args.child:
+        kind, target, *rest = args.child
+        result = _child_import(target) if kind == "import" else _child_render(target, "eager" in rest)
+        print(json.dumps(result))
+        sys.exit(0)
+
+    print("Importació en un procés nou (mediana):")
+    for module in sorted({m for mods in HEAVY.values() for m in mods} | {"streamlit"}):
+        ms = _median([_spawn("import", module) for _ in range(args.runs)])
+        print(f"  {module:22s} {ms:8.1f} ms")
+
+    print("\nPrimer render (mediana):")
+    for app in APPS:
+        before = [_spawn("render", app, "eager") for _ in range(args.runs)]
+        after = [_spawn("render", app) for _ in range(args.runs)]
+        for result in before + after:
+            if result["errors"]:
+                print(f"  {app}: excepció a l'app: {result['errors']}")
+        print(f"  {app:13s} abans: {_median(before):8.1f} ms   després: {_median(after):8.1f} ms")
+        print(f"  {'':13s} dependències pesades carregades: {', '.join(after[-1]['loaded']) or '(cap)'}")
@@ -0,0 +1,85 @@
+"""
+bench_telemetry.py
+==================
+Prova el dispatcher de telemetria contra un servidor HTTP local que fa
+d'endpoint GA4 i de comptador de visites (lent a propòsit).
+
+Comprova que:
+  - send_event() no bloqueja encara que el servidor trigui segons a respondre
+  - els events s'agrupen en lots de com a màxim 25 per client_id
+  - els errors 5xx es reintenten i el comptador es llegeix en segon pla
+
+Execució (des de l'arrel del projecte):
+  python bench/bench_telemetry.py
+"""
+
+import json
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import coach_telemetry  # noqa: E402
+from coach_telemetry import GA4_MAX_EVENTS, TelemetryDispatcher  # noqa: E402
+
+DELAY = 1.0          # Latència simulada del servidor (segons)
+received = []        # Lots rebuts pel servidor fals
+fail_next = [1]      # Nombre de respostes 503 a retornar abans de respondre bé
+
+
+class StandIn(BaseHTTPRequestHandler):
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        time.sleep(DELAY)
+        if fail_next[0] > 0:
+            fail_next[0] -= 1
+            self.send_response(503)
+        else:
+            received.append(body)
+            self.send_response(204)
+        self.end_headers()
+
+    def do_GET(self):
+        time.sleep(DELAY)
+        payload = json.dumps({"count": 1234}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, *args):
+        pass
+
+
+if __name__ == "__main__":
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StandIn)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = f"http://127.0.0.1:{server.server_port}"
+    coach_telemetry.RETRY_BACKOFF = 0.05
+
+    dispatcher = TelemetryDispatcher(f"{base}/mp/collect", timeout=5)
+
+    t0 = time.perf_counter()
+    visits = dispatcher.fetch_json(f"{base}/visites/up")
+    for i in range(60):
+        dispatcher.send_event("client-a", "coach_query", {"i": i})
+    for i in range(5):
+        dispatcher.send_event("client-b", "page_view", {"i": i})
+    enqueue_ms = (time.perf_counter() - t0) * 1000
+    print(f"65 events + GET del comptador encuats en {enqueue_ms:.2f} ms "
+          f"(servidor amb {DELAY:.1f} s de latència)")
+
+    assert dispatcher.flush(timeout=30), "la cua no s'ha buidat"
+    sizes = sorted(len(b["events"]) for b in received)
+    print(f"Lots rebuts: {sizes}  (màxim {GA4_MAX_EVENTS} per lot)")
+    print(f"Comptador de visites: {visits.result(timeout=10)}")
+    print(f"Estadístiques: {dispatcher.stats}")
+
+    assert sum(sizes) == 65 and max(sizes) <= GA4_MAX_EVENTS
+    assert enqueue_ms < 100
+    server.shutdown()
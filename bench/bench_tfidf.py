@@ -0,0 +1,61 @@
+"""
+bench_tfidf.py
+==============
+Mesura el temps de puntuació TF-IDF (un matvec NumPy) i de la cerca BM25
+amb milers de passatges (els passatges reals de coach_index.json replicats).
+
+Execució (des de l'arrel del projecte, després de build_gem.py):
+  python bench/bench_tfidf.py [--copies 20]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from coach_retrieval import BM25Index, hybrid_search  # noqa: E402
+from coach_tfidf import TfidfIndex  # noqa: E402
+
+QUERIES = [
+    "quina és la regla del fora de límits?",
+    "cómo hago un chip alrededor del green",
+    "how do I fix my grip?",
+    "bola injugable dins del búnquer",
+]
+
+
+def timeit(fn, repeat=50) -> float:
+    """Temps mitjà (ms) d'una crida."""
+    t0 = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - t0) / repeat * 1000
+
+
+if __name__ == "__main__":
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--copies", type=int, default=20, help="vegades que es repliquen els passatges")
+    args = ap.parse_args()
+
+    base = BM25Index.load(os.path.join(ROOT, "coach_index.json")).passages
+    passages = base * args.copies
+    bm25 = BM25Index.build(passages)
+    with tempfile.TemporaryDirectory() as tmp:
+        TfidfIndex.build(passages).save(tmp)
+        t0 = time.perf_counter()
+        tfidf = TfidfIndex.load(tmp)
+        load_ms = (time.perf_counter() - t0) * 1000
+
+        print(f"{len(passages):,} passatges, {len(tfidf.vocab):,} termes, "
+              f"{len(tfidf.data):,} valors no nuls (càrrega mmap: {load_ms:.2f} ms)\n")
+        print(f"{'consulta':<42} {'tfidf':>9} {'bm25':>9} {'híbrid':>9}")
+        for q in QUERIES:
+            print(f"{q[:40]:<42} "
+                  f"{timeit(lambda: tfidf.ranked(q)):>7.2f}ms "
+                  f"{timeit(lambda: bm25.ranked(q)):>7.2f}ms "
+                  f"{timeit(lambda: hybrid_search(bm25, q, tfidf=tfidf)):>7.2f}ms")
+        del tfidf  # allibera el memory-map abans d'esborrar el directori temporal
@@ -0,0 +1,92 @@
+"""
+bench_transcript_store.py
+=========================
+Cost d'afegir una transcripció i de recórrer-les totes a escala de llista
+de reproducció (N transcripcions sintètiques amb segments, ~60 KB cadascuna):
+
+  - abans:   transcripts.json (un sol objecte): json.load + afegir + json.dump
+             sencer; build_gem.py el carregava tot
+  - després: transcripts.jsonl + índex: obrir, afegir una línia i desar
+             l'índex; records() les llegeix d'una en una
+
+Temps i pic de memòria (tracemalloc).
+
+Execució (des de l'arrel del projecte):
+  python bench/bench_transcript_store.py [--videos 500]
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from coach_transcripts import TranscriptStore, migrate  # noqa: E402
+
+
+def _entry(i: int) -> dict:
+    segments = [[s * 3.0, 3.0, f"Frase {s} del vídeo {i}: mantén el cap quiet i gira les espatlles."]
+                for s in range(400)]
+    return {"status": "ok", "lang": "es", "text": " ".join(seg[2] for seg in segments), "segments": segments}
+
+
+def measure(label: str, fn) -> None:
+    tracemalloc.start()
+    started = time.perf_counter()
+    fn()
+    seconds = time.perf_counter() - started
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    print(f"  {label:40s} {seconds * 1000:9.1f} ms   pic {peak / 2**20:7.1f} MB")
+
+
+def add_json(path: str, vid_id: str) -> None:
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+    data[vid_id] = _entry(-1)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+
+
+def add_store(path: str, vid_id: str) -> None:
+    with TranscriptStore(path) as store:
+        store.put(vid_id, _entry(-1))
+
+
+def read_json(path: str) -> None:
+    with open(path, encoding="utf-8") as f:
+        for entry in json.load(f).values():
+            len(entry["text"])
+
+
+def read_store(path: str) -> None:
+    with TranscriptStore(path) as store:
+        for _, entry in store.records():
+            len(entry["text"])
+
+
+if __name__ == "__main__":
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--videos", type=int, default=500)
+    args = ap.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        legacy, path = os.path.join(tmp, "transcripts.json"), os.path.join(tmp, "transcripts.jsonl")
+        with open(legacy, "w", encoding="utf-8") as f:
+            json.dump({f"v{i:010d}": _entry(i) for i in range(args.videos)}, f, ensure_ascii=False, indent=2)
+        migrate(legacy, path)
+        TranscriptStore(path).close()           # Índex inicial
+        print(f"{args.videos} transcripcions: transcripts.json {os.path.getsize(legacy) / 2**20:.1f} MB, "
+              f"transcripts.jsonl {os.path.getsize(path) / 2**20:.1f} MB\n")
+
+        print("Afegir una transcripció:")
+        measure("abans (carregar + reescriure el JSON)", lambda: add_json(legacy, "nou00000001"))
+        measure("després (una línia al final)", lambda: add_store(path, "nou00000001"))
+        print("\nRecórrer-les totes (build_gem.py):")
+        measure("abans (json.load)", lambda: read_json(legacy))
+        measure("després (records(), d'una en una)", lambda: read_store(path))
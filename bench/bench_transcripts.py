@@ -0,0 +1,47 @@
+"""
+bench_transcripts.py
+====================
+Temps de get_transcripts.py amb el proveïdor fals (sense xarxa):
+
+  - abans:   un vídeo darrere l'altre (--workers 1), com el bucle original
+  - després: pool de fils (WORKERS)
+  - represa: la mateixa llista amb la meitat ja descarregada
+  - amb errors transitoris (30 % dels intents): reintents amb jitter
+
+Execució (des de l'arrel del projecte):
+  python bench/bench_transcripts.py
+"""
+
+import contextlib
+import io
+import os
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from get_transcripts import WORKERS, FakeProvider, harvest  # noqa: E402
+
+VIDEOS = 40
+LATENCY = 0.25          # Segons per transcripció (ordre de magnitud d'una petició a YouTube)
+
+
+def _run(label: str, ids: list, provider, path: str, **kwargs) -> None:
+    with contextlib.redirect_stdout(io.StringIO()):
+        stats = harvest(ids, provider, path, **kwargs)
+    print(f"  {label:34s} {stats['seconds']:6.2f} s   {stats['ok']:3d} noves, "
+          f"{stats['skipped']:3d} saltades, {stats['error']} errors, {provider.calls} peticions")
+
+
+if __name__ == "__main__":
+    ids = [f"fake{i:07d}" for i in range(VIDEOS)]
+    print(f"{VIDEOS} vídeos, {LATENCY * 1000:.0f} ms per transcripció:")
+    with tempfile.TemporaryDirectory() as tmp:
+        _run("abans (seqüencial)", ids, FakeProvider(LATENCY), os.path.join(tmp, "a.jsonl"), workers=1)
+        _run(f"després ({WORKERS} fils)", ids, FakeProvider(LATENCY), os.path.join(tmp, "b.jsonl"))
+        path = os.path.join(tmp, "c.jsonl")
+        _run("primera meitat", ids[:VIDEOS // 2], FakeProvider(LATENCY), path)
+        _run("represa (llista sencera)", ids, FakeProvider(LATENCY), path)
+        _run("30 % d'errors transitoris", ids, FakeProvider(LATENCY, fail_rate=0.3),
+             os.path.join(tmp, "d.jsonl"), base=0.1, cap=1.0)
@@ -0,0 +1,112 @@
+"""
+bench_upload.py
+===============
+Compara la memòria màxima (RSS) de pujar un vídeo a la Files API:
+
+  - abans:   uploaded_file.read() → NamedTemporaryFile → files.upload(path)
+  - després: coach_upload.upload_video() (memoryview, a trossos, sense disc)
+
+El SDK real de google-genai puja contra un servidor HTTP local que imita el
+protocol de pujada resumable de la Files API (no es fa cap crida a Google).
+Cada pujada s'executa en un procés nou perquè el pic d'RSS sigui el seu; el
+vídeo ja és en memòria abans de mesurar, com l'UploadedFile de Streamlit.
+
+Execució (des de l'arrel del projecte):
+  python bench/bench_upload.py [--mb 200]
+"""
+
+import argparse
+import io
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+
+class FilesApiStandIn(BaseHTTPRequestHandler):
+    """Pujada resumable: POST de creació + POSTs de trossos fins a 'finalize'."""
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        while length:                       # Descarta el cos sense guardar-lo
+            length -= len(self.rfile.read(min(length, 1 << 20)))
+        command = self.headers.get("X-Goog-Upload-Command", "")
+        if self.path.startswith("/upload/") and command != "upload" and "finalize" not in command:
+            body, headers = b"{}", {"x-goog-upload-url": f"http://{self.headers['Host']}/session"}
+        elif "finalize" in command:
+            body = json.dumps({"file": {"name": "files/bench", "state": "ACTIVE"}}).encode()
+            headers = {"x-goog-upload-status": "final"}
+        else:
+            body, headers = b"", {"x-goog-upload-status": "active"}
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for k, v in headers.items():
+            self.send_header(k, v)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def _peak_rss_mb() -> float:
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024   # Linux: KB
+
+
+def _child(mode: str, port: int, mb: int) -> dict:
+    from google import genai
+
+    from coach_upload import upload_video
+
+    client = genai.Client(api_key="bench-key", http_options={"base_url": f"http://127.0.0.1:{port}"})
+    upload_video(client, io.BytesIO(b"warm-up"), "video/mp4")   # Imports i connexió fora de la mesura
+    uploaded_file = io.BytesIO(os.urandom(mb * 1024 * 1024))   # Com l'UploadedFile de Streamlit
+    uploaded_file.name, uploaded_file.type = "swing.mp4", "video/mp4"
+    baseline = _peak_rss_mb()
+
+    started = time.perf_counter()
+    if mode == "before":
+        with tempfile.NamedTemporaryFile(delete=False, suffix=".mp4") as tmp:
+            tmp.write(uploaded_file.read())
+            video_path = tmp.name
+        client.files.upload(file=video_path)
+        os.remove(video_path)
+    else:
+        upload_video(client, uploaded_file)
+    return {"seconds": time.perf_counter() - started, "baseline": baseline, "peak": _peak_rss_mb()}
+
+
+if __name__ == "__main__":
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--mb", type=int, default=200)
+    ap.add_argument("--child", nargs=2, help=argparse.SUPPRESS)
+    args = ap.parse_args()
+
+    if args.child:
+        print(json.dumps(_child(args.child[0], int(args.child[1]), args.mb)))
+        sys.exit(0)
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FilesApiStandIn)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    port = server.server_address[1]
+
+    print(f"Vídeo de {args.mb} MB (RSS amb el vídeo ja en memòria com a base):")
+    for mode in ("before", "after"):
+        out = subprocess.run(
+            [sys.executable, os.path.abspath(__file__), "--mb", str(args.mb), "--child", mode, str(port)],
+            capture_output=True, text=True, check=True,
+        )
+        r = json.loads(out.stdout.strip().splitlines()[-1])
+        label = "abans" if mode == "before" else "després"
+        print(f"  {label:8s} pic RSS {r['peak']:7.1f} MB  (+{r['peak'] - r['baseline']:6.1f} MB "
+              f"per la pujada)  {r['seconds']:.2f}s")
+    server.shutdown()
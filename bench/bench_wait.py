@@ -0,0 +1,86 @@
+"""
+bench_wait.py
+=============
+Compara l'espera del processament de la Files API: consulta fixa cada 2 s
+(abans) i wait_until_active() de coach_upload.py (després), amb un client
+fals on cada fitxer triga un temps conegut a passar a ACTIVE.
+
+Mesura el temps perdut (espera - temps real de processament) i el nombre de
+consultes, i comprova que cap durada acaba més tard que abans (p. ex. 6 s,
+que la consulta fixa encerta de ple), el termini i l'estat FAILED.
+
+Execució (des de l'arrel del projecte):
+  python bench/bench_wait.py
+"""
+
+import os
+import sys
+import time
+from types import SimpleNamespace
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from coach_upload import (ProcessingFailed, ProcessingTimeout, wait_stats,  # noqa: E402
+                          wait_until_active)
+
+
+class FakeFiles:
+    """files.get / files.delete d'un servidor on el fitxer queda llest (o falla) als `ready` s."""
+
+    def __init__(self, ready: float, final: str = "ACTIVE"):
+        self.ready, self.final = ready, final
+        self.created = time.monotonic()
+        self.gets = 0
+        self.deleted = []
+
+    def upload(self):
+        return self.get(name="files/bench")
+
+    def get(self, name):
+        self.gets += 1
+        done = time.monotonic() - self.created >= self.ready
+        state = self.final if done else "PROCESSING"
+        return SimpleNamespace(name=name, state=SimpleNamespace(name=state), error=None)
+
+    def delete(self, name):
+        self.deleted.append(name)
+
+
+def fixed_poll(client, file):
+    """El bucle d'abans: consulta cada 2 s, sense termini."""
+    while file.state.name == "PROCESSING":
+        time.sleep(2)
+        file = client.files.get(name=file.name)
+    return file
+
+
+if __name__ == "__main__":
+    print(f"{'processament':>12s} {'abans: espera':>14s} {'consultes':>9s} "
+          f"{'després: espera':>16s} {'consultes':>9s}")
+    slower = []
+    for ready in (0.3, 1.0, 2.5, 4.1, 6.0, 9.0):
+        row = []
+        for waiter in (fixed_poll, wait_until_active):
+            client = SimpleNamespace(files=FakeFiles(ready))
+            t0 = time.monotonic()
+            waiter(client, client.files.upload())
+            row.append((time.monotonic() - t0, client.files.gets - 1))
+        print(f"{ready:11.1f}s {row[0][0]:13.2f}s {row[0][1]:9d} {row[1][0]:15.2f}s {row[1][1]:9d}")
+        if row[1][0] > row[0][0] + 0.05:
+            slower.append(ready)
+    assert not slower, f"més lent que la consulta fixa amb {slower} s de processament"
+
+    client = SimpleNamespace(files=FakeFiles(ready=60))
+    try:
+        wait_until_active(client, client.files.upload(), deadline=1.0)
+    except ProcessingTimeout as e:
+        print(f"\nTermini: {e} (esborrat: {client.files.deleted})")
+
+    client = SimpleNamespace(files=FakeFiles(ready=0.5, final="FAILED"))
+    try:
+        wait_until_active(client, client.files.upload())
+    except ProcessingFailed as e:
+        print(f"FAILED:  {e} (esborrat: {client.files.deleted})")
+
+    print(f"\nwait_stats(): {wait_stats()}")
@@ -0,0 +1,158 @@
+"""
+semantic_cache_hit_rate.py
+==========================
+Eina fora de línia per triar SIMILARITY_THRESHOLD (coach_semantic_cache.py):
+
+  - amb un registre de preguntes passades, informa de la taxa d'encerts del
+    cache exacte i del cache semàntic per a diversos llindars;
+  - amb --pairs, sobre parells etiquetats ({"a", "b", "same"}; vegeu
+    semantic_pairs.jsonl) informa, per a cada llindar, de quantes paràfrasis
+    es reconeixen i de quants parells diferents s'accepten (respostes
+    equivocades), i recomana el llindar amb més paràfrasis i cap error.
+    Només compten els parells amb els mateixos termes clau (key_terms): la
+    resta no són mai un encert, sigui quin sigui el llindar. Els parells
+    amb "must_miss" (p. ex. una pregunta i la seva negació) els ha de
+    rebutjar key_terms sol (si no, el codi de sortida és 1); els de
+    "known_limit" (qui fa què: "la meva bola toca la del company") són
+    límits coneguts, que es mostren però no compten.
+
+El registre pot ser:
+  - un fitxer de text amb una pregunta per línia, o
+  - un fitxer JSONL amb objectes {"prompt": "...", "lang": "..."}.
+Si no hi ha "lang", es detecta amb coach_langid (com fa el chat).
+
+Execució (des de l'arrel del projecte):
+  python bench/semantic_cache_hit_rate.py preguntes.txt [--thresholds 0.8 0.85 0.9]
+  python bench/semantic_cache_hit_rate.py --pairs bench/semantic_pairs.jsonl
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from coach_answer_cache import AnswerCache  # noqa: E402
+from coach_langid import detect_language  # noqa: E402
+from coach_semantic_cache import SemanticCache, embed, key_terms  # noqa: E402
+
+
+def read_log(path: str) -> list[tuple[str, str]]:
+    """Llegeix el registre i retorna [(pregunta, idioma), ...]."""
+    entries = []
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            if line.startswith("{"):
+                rec = json.loads(line)
+                prompt, lang = rec["prompt"], rec.get("lang")
+            else:
+                prompt, lang = line, None
+            if lang is None:
+                lang = detect_language(prompt, fallback="unknown")
+            entries.append((prompt, lang))
+    return entries
+
+
+def score_pairs(pairs: list[dict], threshold: float) -> dict:
+    """
+    Guarda la pregunta "a" de cada parell i hi busca la "b" (SemanticCache.lookup).
+
+    Returns:
+        dict: {"hits", "positives", "false_hits", "negatives"}
+    """
+    hits = false_hits = 0
+    with tempfile.TemporaryDirectory() as tmp:
+        for i, pair in enumerate(pairs):
+            lang = pair.get("lang") or detect_language(pair["a"], fallback="unknown")
+            cache = SemanticCache(os.path.join(tmp, f"{i}.sqlite"), threshold=threshold)
+            cache.put(pair["a"], lang, "pairs", "resposta")
+            if cache.get(pair["b"], lang, "pairs") is not None:
+                if pair["same"]:
+                    hits += 1
+                else:
+                    false_hits += 1
+    positives = sum(1 for p in pairs if p["same"])
+    return {"hits": hits, "positives": positives, "false_hits": false_hits,
+            "negatives": len(pairs) - positives}
+
+
+def replay(entries, threshold: float) -> dict:
+    """Simula el chat: cada errada es "respon" i s'afegeix als dos nivells del cache."""
+    with tempfile.TemporaryDirectory() as tmp:
+        db = os.path.join(tmp, "cache.sqlite")
+        exact = AnswerCache(db)
+        semantic = SemanticCache(db, threshold=threshold)
+        exact_hits = semantic_hits = 0
+        for i, (prompt, lang) in enumerate(entries):
+            if exact.get(prompt, lang, "log") is not None:
+                exact_hits += 1
+            elif semantic.get(prompt, lang, "log") is not None:
+                semantic_hits += 1
+            else:
+                exact.put(prompt, lang, "log", f"resposta {i}")
+                semantic.put(prompt, lang, "log", f"resposta {i}")
+    n = len(entries) or 1
+    return {
+        "exact": exact_hits / n,
+        "semantic": semantic_hits / n,
+        "total": (exact_hits + semantic_hits) / n,
+    }
+
+
+if __name__ == "__main__":
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("log", nargs="?", help="fitxer .txt o .jsonl amb les preguntes passades")
+    ap.add_argument("--pairs", help="fitxer .jsonl amb parells etiquetats {a, b, same}")
+    ap.add_argument("--thresholds", type=float, nargs="+",
+                    default=[0.3, 0.35, 0.4, 0.45, 0.5, 0.55, 0.6, 0.7, 0.8, 0.85, 0.9])
+    args = ap.parse_args()
+    if not args.log and not args.pairs:
+        ap.error("cal un registre de preguntes o --pairs")
+
+    if args.pairs:
+        with open(args.pairs, encoding="utf-8") as f:
+            pairs = [json.loads(line) for line in f if line.strip()]
+        leaks = [p for p in pairs if p.get("must_miss") and key_terms(p["a"]) == key_terms(p["b"])]
+        for p in pairs:
+            if p.get("known_limit"):
+                print(f"Límit conegut ({float(embed(p['a']) @ embed(p['b'])):.2f}): {p['a']} / {p['b']}")
+        pairs = [p for p in pairs if not p.get("known_limit")]
+        decided = [p for p in pairs if key_terms(p["a"]) == key_terms(p["b"])]
+        print(f"{len(pairs)} parells ({sum(p['same'] for p in pairs)} paràfrasis, "
+              f"{sum(bool(p.get('must_miss')) for p in pairs)} que key_terms ha de rebutjar); "
+              f"el llindar en decideix {len(decided)} ({sum(p['same'] for p in decided)} paràfrasis)\n")
+        pairs = decided
+        print(f"{'llindar':>8} {'paràfrasis':>12} {'errors':>8}")
+        best = None
+        for t in args.thresholds:
+            r = score_pairs(pairs, t)
+            print(f"{t:>8.2f} {r['hits']:>5}/{r['positives']:<6} {r['false_hits']:>4}/{r['negatives']}")
+            # Més paràfrasis sense cap error; a igualtat, el llindar més alt
+            if r["false_hits"] == 0 and (best is None or r["hits"] >= best[1]):
+                best = (t, r["hits"])
+        sims = {same: [float(embed(p["a"]) @ embed(p["b"])) for p in pairs if p["same"] == same]
+                for same in (True, False)}
+        print(f"\nSimilitud dels parells que decideix el llindar: paràfrasis des de "
+              f"{min(sims[True], default=1):.2f}; "
+              + (f"parells diferents fins a {max(sims[False]):.2f}" if sims[False] else
+                 "cap parell diferent té els mateixos termes clau"))
+        if best:
+            print(f"Llindar recomanat: {best[0]:.2f} ({best[1]} paràfrasis, cap error)")
+        else:
+            print("\nCap llindar evita tots els errors")
+        for p in leaks:
+            print(f"❌ key_terms no els distingeix: {p['a']} / {p['b']}")
+        sys.exit(1 if leaks else 0)
+
+    entries = read_log(args.log)
+    print(f"{len(entries)} preguntes al registre\n")
+    print(f"{'llindar':>8} {'exacte':>8} {'semàntic':>9} {'total':>8}")
+    for t in args.thresholds:
+        r = replay(entries, t)
+        print(f"{t:>8.2f} {r['exact']:>8.1%} {r['semantic']:>9.1%} {r['total']:>8.1%}")
@@ -1,49 +1,51 @@
+"""
+build_gem.py
+============
+Genera els artefactes de coneixement de l'entrenador a partir de les
+transcripcions (transcripts.jsonl, vegeu coach_transcripts.py) dels vídeos
+de videos.txt i de la normativa (rules.txt):
+coach_knowledge.bin (el coneixement, en seccions comprimides; vegeu
+coach_knowledge_pack.py), coach_index.json (BM25) i coach_tfidf/.
+
+La generació és incremental:
+  - build_manifest.json guarda el hash del contingut de cada font (cada
+    vídeo, rules.txt, la instrucció de sistema i el codi que genera els
+    artefactes) i de cada artefacte generat. La llista de vídeos és una
+    dada (videos.txt), no codi: afegir-ne un només processa aquell vídeo.
+  - Només es tornen a processar (text del coneixement i passatges) les fonts
+    que han canviat; la resta surt de .build_gem_cache.json.
+  - Si cap font ni cap artefacte ha canviat, no s'escriu res. Si no, cada
+    artefacte s'escriu a un fitxer temporal i substitueix l'anterior amb
+    os.replace (mai queda a mitges), i només si el contingut és diferent.
+
+Execució:
+  python build_gem.py            # refà només el que ha canviat
+  python build_gem.py --check    # codi de sortida 1 si cal refer algun artefacte
+  python build_gem.py --force    # ho refà tot
+"""
+
+import argparse
+import hashlib
 import json
 import os
+import sys
+import tempfile
+import time
 
-# Carregar transcripcions dels vídeos de YouTube
-d = json.load(open('transcripts.json', encoding='utf-8'))
-
-# Carregar normativa de Pitch&Putt (des de rules.txt, generat per extract_rules.py)
-rules_text = ""
-rules_file = os.path.join(os.path.dirname(__file__), 'rules.txt')
-if os.path.exists(rules_file):
-    with open(rules_file, 'r', encoding='utf-8') as f:
-        rules_text = f.read().strip()
-    print(f'Normativa carregada: {len(rules_text):,} caràcters')
-else:
-    print('⚠️  rules.txt no trobat. Executa primer: python extract_rules.py')
-
-videos = {
-    'Nb4KsqpWv24': 'Video 1',
-    '1pP_435kO1s': 'Video 2',
-    'pNcnpTgGMmY': 'Video 3',
-    'u4mvIC71Ny8': 'Video 4',
-    'ED63gIMfbf8': 'Video 5',
-    'Joc50kdFE2c': 'Video 6',
-    '2PFCogJsaYE': 'Video 7',
-    'KhThqqywr7Q': 'Video 8',
-    'IWl3qndvGhM': 'Video 9',
-    'XoUQnqQGayM': 'Video 10',
-    'Ifd5MkFS4sU': 'Video 11',
-    'Oe8CcAhtwvc': 'Video 12',
-    'IbW8IQjPvac': 'Video 13',
-    'LEYR2BEDHFg': 'Video 14',
-}
-
-parts = []
-for vid_id, label in videos.items():
-    if d[vid_id]['status'] == 'ok':
-        url = f'https://youtu.be/{vid_id}'
-        # Clean text to avoid issues with string delimiters
-        text = d[vid_id]['text'].replace('"""', "'''")
-        parts.append(f'=== {label} ({url}) ===\n{text}')
-
-# Afegim la normativa de Pitch&Putt com a secció separada del coneixement
-if rules_text:
-    parts.append(f'=== NORMATIVA PITCH&PUTT ===\n{rules_text}')
-
-knowledge = '\n\n'.join(parts)
+from coach_transcripts import open_store, read_video_list
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+RULES_FILE = os.path.join(ROOT, 'rules.txt')
+MANIFEST_FILE = os.path.join(ROOT, 'build_manifest.json')
+CACHE_FILE = os.path.join(ROOT, '.build_gem_cache.json')     # Treball per font (local)
+
+KNOWLEDGE_FILE = os.path.join(ROOT, 'coach_knowledge.bin')
+INDEX_FILE = os.path.join(ROOT, 'coach_index.json')
+TFIDF_DIR = os.path.join(ROOT, 'coach_tfidf')
+TFIDF_FILES = ('data.npy', 'indices.npy', 'rows.npy', 'idf.npy', 'vocab.json')
+
+# Codi que decideix el contingut dels artefactes: si canvia, es refà tot
+CODE_FILES = ('build_gem.py', 'coach_knowledge_pack.py', 'coach_retrieval.py', 'coach_tfidf.py')
 
 SYSTEM_INSTRUCTION = (
     "Ets un entrenador de golf especialitzat en Pitch&Putt. Respons preguntes sobre tecnica de golf "
@@ -57,172 +59,268 @@ SYSTEM_INSTRUCTION = (
     "de golf pero indica-ho clarament."
 )
 
-app_code = '''import streamlit as st
-import google.generativeai as genai
-import os
 
-# ---------- CONEIXEMENT DELS VIDEOS DE YOUTUBE (auto-generat) ----------
-KNOWLEDGE = """ + repr(knowledge) + """
-
-SYSTEM_INSTRUCTION = """ + repr(SYSTEM_INSTRUCTION) + """
-
-# -----------------------------------------------------------------------
-
-st.set_page_config(page_title="Golf Coach Gem", page_icon="⛳")
-
-st.markdown("""
-    <style>
-    .main { background-color: #f0fdf4; }
-    .stButton>button { background-color: #166534; color: white; }
-    </style>
-    """, unsafe_allow_html=True)
-
-st.title("⛳ Entrenador de Golf (Gem)")
-st.subheader("Basat en els teus videos de YouTube")
-
-# Llegir API Key des del fitxer si existeix
-default_key = ""
-key_file = os.path.join(os.path.dirname(__file__), "API_KEY.txt")
-if os.path.exists(key_file):
-    with open(key_file, "r") as f:
-        default_key = f.read().strip()
-
-API_KEY = st.sidebar.text_input("API Key de Gemini", value=default_key, type="password")
-
-if API_KEY:
-    genai.configure(api_key=API_KEY)
-
-    full_system = SYSTEM_INSTRUCTION + "\\n\\n---\\nCONTINGUT DELS VIDEOS:\\n" + KNOWLEDGE
-
-    model = genai.GenerativeModel(
-        model_name="gemini-2.5-flash",
-        system_instruction=full_system
-    )
-
-    if "gem_messages" not in st.session_state:
-        st.session_state.gem_messages = []
-
-    for message in st.session_state.gem_messages:
-        with st.chat_message(message["role"]):
-            st.markdown(message["content"])
-
-    if prompt := st.chat_input("Pregunta al teu entrenador de golf..."):
-        st.session_state.gem_messages.append({"role": "user", "content": prompt})
-        with st.chat_message("user"):
-            st.markdown(prompt)
-
-        with st.chat_message("assistant"):
-            try:
-                response = model.generate_content(prompt)
-                answer = response.text
-                st.markdown(answer)
-                st.session_state.gem_messages.append({"role": "assistant", "content": answer})
-            except Exception as e:
-                err = str(e)
-                if "429" in err or "quota" in err.lower():
-                    st.error("⚠️ Quota esgotada. Espera uns minuts i torna-ho a intentar.")
-                else:
-                    st.error(f"❌ Error: {err}")
-
-    if st.session_state.gem_messages:
-        if st.button("🗑️ Netejar conversa"):
-            st.session_state.gem_messages = []
-            st.rerun()
-
-else:
-    st.warning("Introdueix la teva API Key a la barra lateral per comenar.")
-'''
-
-# Use format to safely embed the knowledge and system instruction
-final_code = f'''import streamlit as st
-import google.generativeai as genai
-import os
+# ── FONTS ─────────────────────────────────────────────────────────────────────
+
+def _sha256(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def _file_sha256(path: str) -> str:
+    """SHA-256 d'un fitxer, o "" si no existeix."""
+    try:
+        with open(path, 'rb') as f:
+            return _sha256(f.read())
+    except OSError:
+        return ''
+
+
+def _video_text(entry: dict) -> tuple:
+    """Text i segments amb temps ([[inici, durada, text], ...]) d'una transcripció."""
+    if entry.get('status') != 'ok':
+        return '', []
+    return entry.get('text', ''), entry.get('segments', [])
+
+
+def _video_hash(label: str, entry: dict) -> str:
+    text, segments = _video_text(entry)
+    return _sha256(f'{label}\0{text}\0{json.dumps(segments)}'.encode('utf-8'))
+
+
+def load_sources(store, videos: dict = None) -> dict:
+    """
+    Llegeix les fonts del coneixement i en calcula el hash.
+
+    Les transcripcions es llegeixen d'una en una (store.records) i no es
+    guarden: process_source() només torna a llegir les dels vídeos canviats.
 
-# ---------- CONEIXEMENT DELS VIDEOS DE YOUTUBE (auto-generat) ----------
-KNOWLEDGE = {repr(knowledge)}
-
-SYSTEM_INSTRUCTION = {repr(SYSTEM_INSTRUCTION)}
-
-# -----------------------------------------------------------------------
-
-st.set_page_config(page_title="Golf Coach Gem", page_icon="\u26f3")
-
-st.markdown("""
-    <style>
-    .main {{ background-color: #f0fdf4; }}
-    .stButton>button {{ background-color: #166534; color: white; }}
-    </style>
-    """, unsafe_allow_html=True)
-
-st.title("\u26f3 Entrenador de Golf (Gem)")
-st.subheader("Basat en els teus videos de YouTube")
-
-default_key = ""
-key_file = os.path.join(os.path.dirname(__file__), "API_KEY.txt")
-if os.path.exists(key_file):
-    with open(key_file, "r") as f:
-        default_key = f.read().strip()
-
-API_KEY = st.sidebar.text_input("API Key de Gemini", value=default_key, type="password")
-
-if API_KEY:
-    genai.configure(api_key=API_KEY)
-
-    full_system = SYSTEM_INSTRUCTION + "\\n\\n---\\nCONTINGUT DELS VIDEOS:\\n" + KNOWLEDGE
-
-    model = genai.GenerativeModel(
-        model_name="gemini-2.5-flash",
-        system_instruction=full_system
-    )
-
-    if "gem_messages" not in st.session_state:
-        st.session_state.gem_messages = []
-
-    for message in st.session_state.gem_messages:
-        with st.chat_message(message["role"]):
-            st.markdown(message["content"])
-
-    if prompt := st.chat_input("Pregunta al teu entrenador de golf..."):
-        st.session_state.gem_messages.append({{"role": "user", "content": prompt}})
-        with st.chat_message("user"):
-            st.markdown(prompt)
-
-        with st.chat_message("assistant"):
-            try:
-                response = model.generate_content(prompt)
-                answer = response.text
-                st.markdown(answer)
-                st.session_state.gem_messages.append({{"role": "assistant", "content": answer}})
-            except Exception as e:
-                err = str(e)
-                if "429" in err or "quota" in err.lower():
-                    st.error("\u26a0\ufe0f Quota esgotada. Espera uns minuts i torna-ho a intentar.")
-                else:
-                    st.error(f"\u274c Error: {{err}}")
-
-    if st.session_state.gem_messages:
-        if st.button("\U0001f5d1\ufe0f Netejar conversa"):
-            st.session_state.gem_messages = []
-            st.rerun()
-
-else:
-    st.warning("Introdueix la teva API Key a la barra lateral per comenar.")
-'''
-
-with open('CoachGolfGem.py', 'w', encoding='utf-8') as f:
-    f.write(final_code)
-
-print(f'CoachGolfGem.py generat correctament! ({len(final_code):,} bytes)')
-
-# ── GENERACIÓ DE coach_config.json ────────────────────────────────────────────
-# Fitxer de configuració independent llegit per CoachGolfPro.py.
-# Permet modificar SYSTEM_INSTRUCTION sense tocar CoachGolfGem.py.
-config = {
-    "system_instruction": SYSTEM_INSTRUCTION,
-    "knowledge": knowledge,
-}
-config_path = os.path.join(os.path.dirname(__file__), 'coach_config.json')
-with open(config_path, 'w', encoding='utf-8') as f:
-    json.dump(config, f, ensure_ascii=False, indent=2)
-
-print(f'coach_config.json generat correctament! ({os.path.getsize(config_path):,} bytes)')
+    Args:
+        store: TranscriptStore amb les transcripcions dels vídeos
+        videos: {id: etiqueta} dels vídeos del coneixement (per defecte, videos.txt)
+
+    Returns:
+        dict: {clau: {"hash", ...dades}}: una entrada per vídeo ("video:<id>"),
+              "rules", "system" i "code", en l'ordre del coneixement.
+    """
+    # Transcripcions dels vídeos de YouTube
+    videos = read_video_list() if videos is None else videos
+    hashes = {vid_id: _video_hash(videos[vid_id], entry) for vid_id, entry in store.records(videos)}
+
+    sources = {}
+    for vid_id, label in videos.items():
+        sources[f'video:{vid_id}'] = {
+            'hash': hashes.get(vid_id) or _video_hash(label, {}),
+            'id': vid_id, 'label': label,
+        }
+
+    # Normativa de Pitch&Putt (des de rules.txt, generat per extract_rules.py)
+    rules_text = ''
+    if os.path.exists(RULES_FILE):
+        with open(RULES_FILE, 'r', encoding='utf-8') as f:
+            rules_text = f.read().strip()
+    sources['rules'] = {'hash': _sha256(rules_text.encode('utf-8')), 'text': rules_text}
+
+    sources['system'] = {'hash': _sha256(SYSTEM_INSTRUCTION.encode('utf-8'))}
+    sources['code'] = {'hash': _sha256(''.join(
+        _file_sha256(os.path.join(ROOT, name)) for name in CODE_FILES).encode('ascii'))}
+    return sources
+
+
+def process_source(key: str, source: dict, store) -> dict:
+    """
+    Treball d'una sola font: la seva part del coneixement i els seus passatges.
+
+    Returns:
+        dict: {"hash", "part" (text o None), "passages"}
+    """
+    from coach_retrieval import rules_passages, video_passages
+
+    part, passages = None, []
+    text, segments = _video_text(store.get(source['id']) or {}) if key.startswith('video:') else ('', [])
+    if text:
+        url = f"https://youtu.be/{source['id']}"
+        part = f"=== {source['label']} ({url}) ===\n{text}"
+        passages = video_passages(source['id'], source['label'], text, segments)
+    elif key == 'rules' and source['text']:
+        # La normativa de Pitch&Putt és una secció separada del coneixement
+        part = f"=== NORMATIVA PITCH&PUTT ===\n{source['text']}"
+        passages = rules_passages(source['text'])
+    return {'hash': source['hash'], 'part': part, 'passages': passages}
+
+
+# ── ARTEFACTES ────────────────────────────────────────────────────────────────
+
+def _outputs() -> list:
+    """Fitxers generats (rutes absolutes)."""
+    return [KNOWLEDGE_FILE, INDEX_FILE] + [os.path.join(TFIDF_DIR, n) for n in TFIDF_FILES]
+
+
+def _load_json(path: str) -> dict:
+    try:
+        with open(path, encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _write_json_atomic(path: str, data: dict, **kwargs) -> None:
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), prefix='.tmp-')
+    with os.fdopen(fd, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, **kwargs)
+    os.replace(tmp, path)
+
+
+def _publish(tmp: str, path: str) -> bool:
+    """
+    Substitueix `path` per `tmp` de manera atòmica, només si el contingut canvia.
+
+    Returns:
+        bool: True si s'ha escrit.
+    """
+    if _file_sha256(tmp) == _file_sha256(path):
+        os.remove(tmp)
+        return False
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    os.replace(tmp, path)
+    return True
+
+
+def stale(sources: dict, manifest: dict) -> list:
+    """
+    Què ha canviat respecte del manifest.
+
+    Returns:
+        list: claus de les fonts noves, canviades o eliminades i rutes
+              relatives dels artefactes que falten o s'han modificat.
+    """
+    recorded = manifest.get('sources', {})
+    changed = [k for k in sources if recorded.get(k) != sources[k]['hash']]
+    changed += [k for k in recorded if k not in sources]
+    outputs = manifest.get('outputs', {})
+    for path in _outputs():
+        rel = os.path.relpath(path, ROOT)
+        if outputs.get(rel) != _file_sha256(path):
+            changed.append(rel)
+    return changed
+
+
+def build(sources: dict, store, force: bool = False) -> list:
+    """
+    Refà els artefactes a partir de les fonts, reaprofitant el treball per
+    font de .build_gem_cache.json.
+
+    Returns:
+        list: rutes relatives dels artefactes reescrits.
+    """
+    from coach_knowledge_pack import SYSTEM_SECTION, write_pack
+    from coach_retrieval import BM25Index
+    from coach_tfidf import TfidfIndex
+
+    cache = {} if force else _load_json(CACHE_FILE)
+    same_code = cache.get('code') == sources['code']['hash']
+    processed, reused = {}, 0
+    for key, source in sources.items():
+        if key in ('system', 'code'):
+            continue
+        cached = cache.get(key)
+        if same_code and cached and cached['hash'] == source['hash']:
+            processed[key] = cached
+            reused += 1
+        else:
+            processed[key] = process_source(key, source, store)
+    print(f'Fonts: {len(processed) - reused} processades, {reused} sense canvis')
+
+    knowledge = '\n\n'.join(p['part'] for p in processed.values() if p['part'])
+    passages = [passage for p in processed.values() for passage in p['passages']]
+    written = []
+
+    # Tot es genera en un directori temporal al costat dels artefactes (mateix
+    # sistema de fitxers, perquè os.replace sigui atòmic)
+    with tempfile.TemporaryDirectory(dir=ROOT, prefix='.build-') as tmp:
+        def publish(name: str, path: str) -> None:
+            if _publish(os.path.join(tmp, name), path):
+                written.append(os.path.relpath(path, ROOT))
+
+        # Coneixement (una sola còpia) llegit per CoachGolfPro.py i CoachGolfGem.py:
+        # la instrucció de sistema i una secció comprimida per font
+        write_pack(os.path.join(tmp, 'knowledge.bin'), {
+            SYSTEM_SECTION: SYSTEM_INSTRUCTION,
+            **{key: p['part'] for key, p in processed.items() if p['part']},
+        })
+        publish('knowledge.bin', KNOWLEDGE_FILE)
+
+        # Índex BM25 de passatges (transcripcions + normativa) per a la recuperació:
+        # CoachGolfPro.py només envia al model els passatges rellevants per a cada pregunta.
+        BM25Index.build(passages).save(os.path.join(tmp, 'index.json'))
+        publish('index.json', INDEX_FILE)
+
+        # Matriu TF-IDF (fitxers .npy) sobre els mateixos passatges, per complementar BM25
+        tfidf = TfidfIndex.build(passages)
+        tfidf.save(os.path.join(tmp, 'tfidf'))
+        for name in TFIDF_FILES:
+            publish(os.path.join('tfidf', name), os.path.join(TFIDF_DIR, name))
+
+    for rel in written:
+        print(f'{rel} generat correctament! ({os.path.getsize(os.path.join(ROOT, rel)):,} bytes)')
+    print(f'{len(passages)} passatges, {tfidf.n_rows} passatges x {len(tfidf.vocab)} termes '
+          f'TF-IDF, {len(knowledge):,} caràcters de coneixement')
+
+    _write_json_atomic(CACHE_FILE, {'code': sources['code']['hash'], **processed},
+                       separators=(',', ':'))
+    return written
+
+
+def invalidate_answers() -> None:
+    """
+    Les respostes guardades al cache del chat corresponen al coneixement anterior:
+    s'esborren totes les que no siguin de la versió nova de coach_knowledge.bin.
+    """
+    from coach_answer_cache import AnswerCache
+    from coach_knowledge_pack import KnowledgePack
+    from coach_semantic_cache import SemanticCache
+
+    new_version = KnowledgePack(KNOWLEDGE_FILE).version
+    removed = AnswerCache().invalidate(keep_version=new_version)
+    removed += SemanticCache().invalidate(keep_version=new_version)
+    print(f'Cache de respostes invalidat ({removed} respostes antigues esborrades)')
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description="Genera els artefactes de coneixement de l'entrenador.")
+    ap.add_argument('--check', action='store_true',
+                    help='només comprova si els artefactes estan al dia (codi 1 si no)')
+    ap.add_argument('--force', action='store_true', help='ho refà tot, encara que no hi hagi canvis')
+    args = ap.parse_args()
+
+    with open_store() as store:
+        started = time.perf_counter()
+        sources = load_sources(store)
+        if not sources['rules']['text']:
+            print('⚠️  rules.txt no trobat. Executa primer: python extract_rules.py')
+        changed = stale(sources, _load_json(MANIFEST_FILE))
+
+        if args.check:
+            if changed:
+                print(f"Cal tornar a executar build_gem.py: {', '.join(changed)}")
+            else:
+                print(f'Artefactes al dia ({len(sources)} fonts, {time.perf_counter() - started:.3f} s)')
+            return 1 if changed else 0
+
+        if not changed and not args.force:
+            print(f'Res a fer: cap font ni artefacte ha canviat ({time.perf_counter() - started:.3f} s)')
+            return 0
+
+        print(f"Canvis: {', '.join(changed) if changed else '(--force)'}")
+        written = build(sources, store, force=args.force)
+        if os.path.relpath(KNOWLEDGE_FILE, ROOT) in written:
+            invalidate_answers()
+        _write_json_atomic(MANIFEST_FILE, {
+            'sources': {key: source['hash'] for key, source in sources.items()},
+            'outputs': {os.path.relpath(path, ROOT): _file_sha256(path) for path in _outputs()},
+        }, indent=1)
+        print(f'Fet en {time.perf_counter() - started:.2f} s ({len(written)} artefactes reescrits)')
+        return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,157 @@
+"""
+coach_answer_cache.py
+=====================
+Cache persistent (SQLite) de respostes del chat de l'entrenador.
+
+Les preguntes repetides ("com evito l'slice?", "quina és la regla del fora de
+límits?") es responen des del disc sense tornar a cridar Gemini.
+
+  - Clau: pregunta normalitzada + idioma detectat + versió del coneixement
+    (hash del contingut de coach_knowledge.bin). Si el coneixement canvia, les respostes
+    antigues deixen de coincidir i build_gem.py les esborra.
+  - Límit de mida LRU (max_entries) i caducitat per TTL.
+  - Comptadors persistents d'encerts (hits) i errades (misses).
+"""
+
+import hashlib
+import os
+import re
+import sqlite3
+import time
+import unicodedata
+from contextlib import contextmanager
+
+ANSWER_CACHE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "coach_answers.sqlite")
+MAX_ENTRIES = 2000                  # Respostes màximes guardades (LRU)
+TTL_SECONDS = 30 * 24 * 3600        # Una resposta caduca als 30 dies
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS answers (
+    key         TEXT PRIMARY KEY,
+    version     TEXT NOT NULL,
+    lang        TEXT NOT NULL,
+    prompt      TEXT NOT NULL,
+    answer      TEXT NOT NULL,
+    created     REAL NOT NULL,
+    last_access REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS answers_last_access ON answers (last_access);
+CREATE TABLE IF NOT EXISTS stats (
+    name  TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+"""
+
+
+def normalize_prompt(prompt: str) -> str:
+    """
+    Normalitza una pregunta per comparar-la amb les anteriors.
+
+    Minúscules, Unicode NFKC, espais col·lapsats i sense signes de
+    puntuació inicials/finals (¿?¡!.).
+    """
+    text = unicodedata.normalize("NFKC", prompt).lower()
+    text = re.sub(r"\s+", " ", text).strip()
+    return text.strip("¿?¡!.,;: ")
+
+
+def cache_key(prompt: str, lang: str, version: str) -> str:
+    raw = "\0".join((normalize_prompt(prompt), lang, version))
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+class AnswerCache:
+    """
+    Cache de respostes guardat en un fitxer SQLite.
+
+    Cada operació obre la seva pròpia connexió, de manera que es pot usar
+    des de diversos fils de Streamlit (i diversos processos) alhora.
+    """
+
+    def __init__(self, path: str = ANSWER_CACHE_FILE,
+                 max_entries: int = MAX_ENTRIES, ttl: float = TTL_SECONDS):
+        self.path = path
+        self.max_entries = max_entries
+        self.ttl = ttl
+        with self._connect() as db:
+            db.executescript(_SCHEMA)
+
+    @contextmanager
+    def _connect(self):
+        """Connexió amb commit automàtic en sortir del bloc, i tancada després."""
+        db = sqlite3.connect(self.path, timeout=5)
+        try:
+            with db:
+                yield db
+        finally:
+            db.close()
+
+    def _count(self, db, name: str) -> None:
+        db.execute(
+            "INSERT INTO stats (name, value) VALUES (?, 1) "
+            "ON CONFLICT(name) DO UPDATE SET value = value + 1",
+            (name,),
+        )
+
+    def get(self, prompt: str, lang: str, version: str):
+        """
+        Busca la resposta d'una pregunta.
+
+        Returns:
+            str | None: la resposta guardada, o None si no hi és o ha caducat.
+        """
+        key = cache_key(prompt, lang, version)
+        now = time.time()
+        with self._connect() as db:
+            row = db.execute("SELECT answer, created FROM answers WHERE key = ?", (key,)).fetchone()
+            if row and now - row[1] <= self.ttl:
+                db.execute("UPDATE answers SET last_access = ? WHERE key = ?", (now, key))
+                self._count(db, "hits")
+                return row[0]
+            if row:
+                db.execute("DELETE FROM answers WHERE key = ?", (key,))
+            self._count(db, "misses")
+        return None
+
+    def put(self, prompt: str, lang: str, version: str, answer: str) -> None:
+        """Guarda una resposta i aplica els límits de mida (LRU) i TTL."""
+        now = time.time()
+        with self._connect() as db:
+            db.execute(
+                "INSERT OR REPLACE INTO answers VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (cache_key(prompt, lang, version), version, lang,
+                 normalize_prompt(prompt), answer, now, now),
+            )
+            db.execute("DELETE FROM answers WHERE created < ?", (now - self.ttl,))
+            db.execute(
+                "DELETE FROM answers WHERE key IN ("
+                "  SELECT key FROM answers ORDER BY last_access DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,),
+            )
+
+    def invalidate(self, keep_version: str = None) -> int:
+        """
+        Esborra les respostes d'altres versions del coneixement (o totes).
+
+        Returns:
+            int: nombre de respostes esborrades.
+        """
+        with self._connect() as db:
+            if keep_version is None:
+                cur = db.execute("DELETE FROM answers")
+            else:
+                cur = db.execute("DELETE FROM answers WHERE version != ?", (keep_version,))
+            return cur.rowcount
+
+    def stats(self) -> dict:
+        """Retorna {"entries", "hits", "misses", "hit_rate"}."""
+        with self._connect() as db:
+            counters = dict(db.execute("SELECT name, value FROM stats").fetchall())
+            entries = db.execute("SELECT COUNT(*) FROM answers").fetchone()[0]
+        hits, misses = counters.get("hits", 0), counters.get("misses", 0)
+        return {
+            "entries": entries,
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": hits / (hits + misses) if hits + misses else 0.0,
+        }
@@ -0,0 +1,321 @@
+"""
+coach_context_cache.py
+======================
+Context caching del coneixement de l'entrenador (KNOWLEDGE) al servidor de Gemini.
+
+En lloc d'enviar els ~180 KB de SYSTEM_INSTRUCTION + KNOWLEDGE a cada pregunta,
+es registra una sola vegada com a "cached content" (per versió del coneixement,
+identificada pel hash del contingut de coach_knowledge.bin) i les crides del chat només hi fan
+referència amb `cached_content=<nom>`.
+
+  - Un fil en segon pla renova el TTL del cache abans que caduqui, mentre
+    s'utilitzi: si en tot un TTL no hi ha hagut cap crida amb cache (ara és
+    el mode de reserva del chat), es deixa caducar.
+  - Si el cache no es pot crear, es torna automàticament al comportament
+    anterior (instrucció de sistema enviada en línia) i no es reintenta fins
+    al cap de RETRY_AFTER_SECONDS. Si ha caducat, es torna a crear a la
+    crida següent.
+  - Cada crida registra quants tokens d'entrada s'han servit des del cache.
+
+El client és injectable: qualsevol objecte amb `caches.create/update/list`
+i `models.generate_content` serveix (vegeu bench/bench_context_cache.py).
+google.genai.types s'importa al primer ús (és una importació lenta).
+"""
+
+import hashlib
+import logging
+import threading
+import time
+
+log = logging.getLogger(__name__)
+
+# ── CONFIGURACIÓ ──────────────────────────────────────────────────────────────
+CACHE_TTL_SECONDS = 3600        # Durada de cada registre del cache al servidor
+RETRY_AFTER_SECONDS = 300       # Espera abans de reintentar si no s'ha pogut crear el cache
+DISPLAY_NAME_PREFIX = "coach-knowledge-"
+
+
+def knowledge_version(config_path: str) -> str:
+    """
+    Calcula la versió d'un fitxer de coneixement a partir del seu contingut.
+
+    Returns:
+        str: els 16 primers caràcters hexadecimals del SHA-256 del fitxer,
+             o "" si el fitxer no es pot llegir.
+    """
+    h = hashlib.sha256()
+    try:
+        with open(config_path, "rb") as f:
+            for block in iter(lambda: f.read(1 << 16), b""):
+                h.update(block)
+    except OSError:
+        return ""
+    return h.hexdigest()[:16]
+
+
+def usage_report(response) -> dict:
+    """
+    Extreu el recompte de tokens d'entrada d'una resposta de generate_content.
+
+    Returns:
+        dict: {"prompt_tokens", "cached_tokens", "billed_tokens", "reduction"}
+              on `reduction` és la fracció (0-1) de tokens servits des del cache.
+    """
+    usage = getattr(response, "usage_metadata", None)
+    prompt_tokens = getattr(usage, "prompt_token_count", None) or 0
+    cached_tokens = getattr(usage, "cached_content_token_count", None) or 0
+    return {
+        "prompt_tokens": prompt_tokens,
+        "cached_tokens": cached_tokens,
+        "billed_tokens": prompt_tokens - cached_tokens,
+        "reduction": (cached_tokens / prompt_tokens) if prompt_tokens else 0.0,
+    }
+
+
+class KnowledgeCache:
+    """
+    Gestiona el cached content d'una versió concreta del coneixement.
+
+    Args:
+        client: client de google-genai (o un fals amb la mateixa interfície)
+        model: nom del model Gemini (el cache és específic de cada model)
+        system_text: instrucció de sistema completa (rol + KNOWLEDGE), o una
+                     funció sense arguments que la retorna: així només es
+                     construeix (i es descomprimeix el coneixement) quan cal
+                     crear el cache o enviar-la en línia, no a cada pregunta
+        version: versió del coneixement (vegeu knowledge_version)
+        ttl: segons de vida de cada registre; es renova a la meitat del TTL
+    """
+
+    def __init__(self, client, model: str, system_text, version: str,
+                 ttl: int = CACHE_TTL_SECONDS):
+        self.client = client
+        self.model = model
+        self._system_text = system_text
+        self.version = version
+        self.ttl = ttl
+        self.display_name = DISPLAY_NAME_PREFIX + version
+        self.name = None                 # Nom del cached content al servidor
+        self.last_usage = None           # Últim usage_report() (per mostrar/registrar)
+        self._failed_at = 0.0
+        self._last_used = time.monotonic()
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._refresher = None
+
+    @property
+    def system_text(self) -> str:
+        """Instrucció de sistema completa (es resol al primer ús)."""
+        if callable(self._system_text):
+            self._system_text = self._system_text()
+        return self._system_text
+
+    # ── Registre del cache ───────────────────────────────────────────────────
+
+    def _find_existing(self):
+        """Reutilitza un cache ja registrat per aquesta versió (p. ex. per un altre procés)."""
+        for cached in self.client.caches.list():
+            if (cached.display_name == self.display_name
+                    and (cached.model or "").endswith(self.model)):
+                return cached.name
+        return None
+
+    def ensure(self):
+        """
+        Retorna el nom del cached content, creant-lo si cal.
+
+        Returns:
+            str | None: nom del cache, o None si el caching no està disponible
+                        (en aquest cas s'ha d'usar la instrucció en línia).
+        """
+        if self.name:
+            return self.name
+        with self._lock:
+            if self.name:
+                return self.name
+            if time.monotonic() - self._failed_at < RETRY_AFTER_SECONDS:
+                return None
+            from google.genai import types
+            try:
+                self.name = self._find_existing()
+                if self.name:
+                    # Pot ser a punt de caducar (p. ex. ja no el renova ningú)
+                    self.client.caches.update(
+                        name=self.name, config=types.UpdateCachedContentConfig(ttl=f"{self.ttl}s"),
+                    )
+                else:
+                    cached = self.client.caches.create(
+                        model=self.model,
+                        config=types.CreateCachedContentConfig(
+                            display_name=self.display_name,
+                            system_instruction=self.system_text,
+                            ttl=f"{self.ttl}s",
+                        ),
+                    )
+                    self.name = cached.name
+                    log.info("Cache de coneixement creat: %s (%s)", self.name, self.version)
+            except Exception as e:
+                self._failed_at = time.monotonic()
+                log.warning("Context caching no disponible, s'usa el mode en línia: %s", e)
+                return None
+            self._start_refresher()
+            return self.name
+
+    def invalidate(self):
+        """
+        Oblida el cache actual (p. ex. si el servidor diu que ha caducat): la
+        crida següent el torna a crear de seguida.
+        """
+        with self._lock:
+            self.name = None
+
+    def close(self):
+        """Atura la renovació del TTL en segon pla."""
+        self._stop.set()
+
+    # ── Renovació del TTL en segon pla ───────────────────────────────────────
+
+    def _start_refresher(self):
+        if self._refresher and self._refresher.is_alive():
+            return
+        self._refresher = threading.Thread(
+            target=self._refresh_loop, name=f"cache-ttl-{self.version}", daemon=True,
+        )
+        self._refresher.start()
+
+    def _refresh_loop(self):
+        from google.genai import types
+        while not self._stop.wait(self.ttl / 2):
+            name = self.name
+            if not name:
+                return
+            if time.monotonic() - self._last_used > self.ttl:
+                # Ningú l'ha fet servir en tot un TTL: es deixa caducar
+                log.info("Cache %s sense ús; no es renova més", name)
+                self.invalidate()
+                return
+            try:
+                self.client.caches.update(
+                    name=name,
+                    config=types.UpdateCachedContentConfig(ttl=f"{self.ttl}s"),
+                )
+            except Exception as e:
+                log.warning("No s'ha pogut renovar el TTL de %s: %s", name, e)
+                self.invalidate()
+                return
+
+    # ── Crides al model ──────────────────────────────────────────────────────
+
+    def config(self, **kwargs):
+        """
+        Construeix el GenerateContentConfig per a una crida del chat.
+
+        Si hi ha cache, hi fa referència; si no, inclou la instrucció en línia.
+        """
+        from google.genai import types
+        self._last_used = time.monotonic()
+        name = self.ensure()
+        if name:
+            return types.GenerateContentConfig(cached_content=name, **kwargs)
+        return self.inline_config(**kwargs)
+
+    def inline_config(self, **kwargs):
+        """GenerateContentConfig amb la instrucció de sistema en línia (sense cache)."""
+        from google.genai import types
+        return types.GenerateContentConfig(system_instruction=self.system_text, **kwargs)
+
+    def generate_content(self, contents, **kwargs):
+        """
+        Equivalent a client.models.generate_content() amb el coneixement en cache.
+
+        Si la crida amb cache falla (cache caducat o esborrat), es reintenta
+        una vegada amb la instrucció de sistema en línia.
+        """
+        config = self.config(**kwargs)
+        try:
+            response = self.client.models.generate_content(
+                model=self.model, contents=contents, config=config,
+            )
+        except Exception as e:
+            if not config.cached_content:
+                raise
+            log.warning("Crida amb cache fallida (%s); es reintenta en línia", e)
+            self.invalidate()
+            response = self.client.models.generate_content(
+                model=self.model,
+                contents=contents,
+                config=self.inline_config(**kwargs),
+            )
+        self._record_usage(response)
+        return response
+
+    def generate_content_stream(self, contents, **kwargs):
+        """
+        Equivalent a client.models.generate_content_stream() amb el coneixement en cache.
+
+        El primer fragment es demana abans de retornar: si la crida amb cache
+        falla, es reintenta en línia sense que l'usuari hagi vist res.
+        """
+        config = self.config(**kwargs)
+        try:
+            stream = iter(self.client.models.generate_content_stream(
+                model=self.model, contents=contents, config=config,
+            ))
+            first = next(stream, None)
+        except Exception as e:
+            if not config.cached_content:
+                raise
+            log.warning("Crida amb cache fallida (%s); es reintenta en línia", e)
+            self.invalidate()
+            stream = iter(self.client.models.generate_content_stream(
+                model=self.model,
+                contents=contents,
+                config=self.inline_config(**kwargs),
+            ))
+            first = next(stream, None)
+
+        def chunks():
+            last = first
+            if first is not None:
+                yield first
+            for chunk in stream:
+                last = chunk
+                yield chunk
+            if last is not None:
+                self._record_usage(last)   # El recompte de tokens arriba a l'últim fragment
+
+        return chunks()
+
+    def _record_usage(self, response):
+        self.last_usage = usage_report(response)
+        log.info(
+            "Tokens d'entrada: %(prompt_tokens)d (cache: %(cached_tokens)d, "
+            "facturats: %(billed_tokens)d, reducció: %(reduction).0f%%)",
+            {**self.last_usage, "reduction": self.last_usage["reduction"] * 100},
+        )
+
+
+# ── REGISTRE PER PROCÉS ───────────────────────────────────────────────────────
+# Streamlit torna a executar l'script a cada interacció, però els mòduls
+# importats es mantenen: així el cache es registra una vegada per procés i versió.
+
+_caches: dict = {}
+_caches_lock = threading.Lock()
+
+
+def get_knowledge_cache(client, model: str, system_text, version: str) -> KnowledgeCache:
+    """
+    Retorna el KnowledgeCache compartit per a (model, versió), creant-lo si cal.
+
+    `system_text` pot ser el text o una funció que el retorna (vegeu KnowledgeCache).
+    """
+    key = (model, version)
+    with _caches_lock:
+        cache = _caches.get(key)
+        if cache is None:
+            # Una versió nova del coneixement substitueix les anteriors
+            for old_key in [k for k in _caches if k[0] == model]:
+                _caches.pop(old_key).close()
+            cache = _caches[key] = KnowledgeCache(client, model, system_text, version)
+        cache.client = client
+        return cache
@@ -0,0 +1,218 @@
+"""
+coach_jobs.py
+=============
+Cua de treballs en segon pla per a les anàlisis de vídeo.
+
+Abans, tot el procés (pujada → espera → generació) s'executava dins de
+l'script de Streamlit sota un `st.spinner`: la sessió quedava bloquejada
+i, si el navegador es refrescava, la feina es perdia. Ara:
+
+  - Cada anàlisi és un treball amb un identificador, executat per un pool
+    de fils del procés amb un límit de concurrència (MAX_WORKERS, o la
+    variable d'entorn COACH_VIDEO_WORKERS). Els que no hi caben esperen a
+    la cua.
+  - L'estat (queued → running → done / failed), l'etapa, el progrés i el
+    text parcial es poden consultar en qualsevol moment (get()).
+  - El resultat final es desa en un fitxer SQLite: l'identificador, guardat
+    a la URL, permet recuperar-lo després de refrescar la pàgina.
+  - Els treballs que estaven en curs quan el procés es va aturar es marquen
+    com a fallits en tornar a arrencar.
+  - Els treballs de fons (submit(..., background=True), p. ex. les pujades
+    per endavant) tenen el seu propi pool, més petit (BACKGROUND_WORKERS):
+    no ocupen els fils de les anàlisis ni les fan esperar a la cua.
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+
+log = logging.getLogger(__name__)
+
+JOBS_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "coach_jobs.sqlite")
+MAX_WORKERS = int(os.environ.get("COACH_VIDEO_WORKERS", "2"))   # Anàlisis simultànies
+BACKGROUND_WORKERS = int(os.environ.get("COACH_BACKGROUND_WORKERS", "1"))   # Treballs de fons simultanis
+TTL_SECONDS = 7 * 24 * 3600         # Els treballs acabats es guarden 7 dies
+
+# Estats d'un treball
+QUEUED, RUNNING, DONE, FAILED = "queued", "running", "done", "failed"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id       TEXT PRIMARY KEY,
+    kind     TEXT NOT NULL,
+    status   TEXT NOT NULL,
+    stage    TEXT NOT NULL,
+    result   TEXT,
+    error    TEXT,
+    created  REAL NOT NULL,
+    updated  REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS jobs_updated ON jobs (updated);
+"""
+
+
+class Job:
+    """
+    Estat viu d'un treball en curs, que la funció del treball va actualitzant.
+
+    També té un mètode `markdown(text)`, de manera que es pot passar com a
+    placeholder a coach_streaming.render_stream() per anar-hi acumulant el
+    text a mesura que arriba.
+    """
+
+    def __init__(self, job_id: str, kind: str, background: bool = False):
+        self.id = job_id
+        self.kind = kind
+        self.background = background
+        self.status = QUEUED
+        self.stage = "A la cua"
+        self.progress = 0.0           # 0-1 dins de l'etapa actual
+        self.text = ""                # Text parcial de la resposta
+        self.result = None            # Resultat final (quan status és DONE)
+        self.error = None             # Missatge d'error (quan status és FAILED)
+        self.created = time.time()
+
+    def update(self, stage: str = None, progress: float = None) -> None:
+        if stage is not None:
+            self.stage = stage
+        if progress is not None:
+            self.progress = progress
+
+    def markdown(self, text: str) -> None:
+        self.text = text
+
+    def snapshot(self) -> dict:
+        return {"id": self.id, "kind": self.kind, "status": self.status, "stage": self.stage,
+                "progress": self.progress, "text": self.text, "result": self.result, "error": self.error}
+
+
+class JobQueue:
+    """
+    Pool de fils que executa treballs i en desa el resultat.
+
+    Args:
+        path: fitxer SQLite on es desen els treballs
+        max_workers: treballs executats alhora (la resta esperen)
+        background_workers: treballs de fons executats alhora, en un pool a part
+    """
+
+    def __init__(self, path: str = JOBS_FILE, max_workers: int = MAX_WORKERS,
+                 background_workers: int = BACKGROUND_WORKERS):
+        self.path = path
+        self.max_workers = max_workers
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="coach-job")
+        self._background = ThreadPoolExecutor(max_workers=background_workers,
+                                              thread_name_prefix="coach-background")
+        self._live: dict = {}
+        self._lock = threading.Lock()
+        with self._connect() as db:
+            db.executescript(_SCHEMA)
+            # Treballs que el procés anterior no va poder acabar
+            db.execute("UPDATE jobs SET status = ?, error = ?, updated = ? WHERE status IN (?, ?)",
+                       (FAILED, "S'ha interromput (el servidor s'ha reiniciat).", time.time(),
+                        QUEUED, RUNNING))
+            db.execute("DELETE FROM jobs WHERE updated < ?", (time.time() - TTL_SECONDS,))
+
+    @contextmanager
+    def _connect(self):
+        """Connexió amb commit automàtic en sortir del bloc, i tancada després."""
+        db = sqlite3.connect(self.path, timeout=5)
+        try:
+            with db:
+                yield db
+        finally:
+            db.close()
+
+    def _save(self, job: Job, result=None, error: str = None) -> None:
+        with self._connect() as db:
+            db.execute(
+                "INSERT OR REPLACE INTO jobs VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (job.id, job.kind, job.status, job.stage,
+                 None if result is None else json.dumps(result, ensure_ascii=False),
+                 error, job.created, time.time()),
+            )
+
+    def submit(self, kind: str, fn, *args, background: bool = False, **kwargs) -> str:
+        """
+        Posa un treball a la cua.
+
+        `fn(job, *args, **kwargs)` s'executa en un fil del pool; ha de retornar
+        un resultat serialitzable en JSON. Si llança una excepció, el treball
+        queda com a fallit amb el missatge de l'excepció.
+
+        Args:
+            background: treball de fons, que s'executa al pool petit i mai
+                        endarrereix les anàlisis
+
+        Returns:
+            str: identificador del treball.
+        """
+        job = Job(uuid.uuid4().hex[:12], kind, background)
+        with self._lock:
+            self._live[job.id] = job
+        self._save(job)
+        (self._background if background else self._pool).submit(self._run, job, fn, args, kwargs)
+        log.info("Treball %s (%s) a la cua", job.id, kind)
+        return job.id
+
+    def _run(self, job: Job, fn, args, kwargs) -> None:
+        job.status, job.stage = RUNNING, "Començant"
+        self._save(job)
+        started = time.perf_counter()
+        # El resultat (o l'error) es desa al Job abans que l'estat canviï: get()
+        # mai veu DONE sense resultat, encara que el Job continuï a _live
+        try:
+            result = fn(job, *args, **kwargs)
+            job.result = json.loads(json.dumps(result, ensure_ascii=False))   # Com el llegirà get() de la base
+            job.status, job.stage = DONE, "Acabat"
+            self._save(job, result=result)
+        except Exception as e:
+            log.warning("Treball %s fallit: %s", job.id, e)
+            job.error = str(e)
+            job.status = FAILED
+            self._save(job, error=str(e))
+        finally:
+            with self._lock:
+                self._live.pop(job.id, None)
+        log.info("Treball %s (%s): %s en %.1fs", job.id, job.kind, job.status,
+                 time.perf_counter() - started)
+
+    def get(self, job_id: str):
+        """
+        Estat d'un treball.
+
+        Returns:
+            dict | None: {"id", "kind", "status", "stage", "progress", "text",
+                          "result", "error", "position"} o None si no existeix.
+                          `position` és el lloc a la cua (0 si ja s'executa).
+        """
+        with self._lock:
+            job = self._live.get(job_id)
+            if job is not None:
+                info = job.snapshot()
+                info["position"] = sum(1 for j in self._live.values()
+                                       if j.status == QUEUED and j.background == job.background
+                                       and j.created <= job.created)
+                return info
+        with self._connect() as db:
+            row = db.execute("SELECT kind, status, stage, result, error FROM jobs WHERE id = ?",
+                             (job_id,)).fetchone()
+        if row is None:
+            return None
+        kind, status, stage, result, error = row
+        return {"id": job_id, "kind": kind, "status": status, "stage": stage,
+                "progress": 1.0 if status == DONE else 0.0, "text": "",
+                "result": json.loads(result) if result else None, "error": error, "position": 0}
+
+    def stats(self) -> dict:
+        """Retorna {"running", "queued", "max_workers"} de les anàlisis del procés actual."""
+        with self._lock:
+            statuses = [j.status for j in self._live.values() if not j.background]
+        return {"running": statuses.count(RUNNING), "queued": statuses.count(QUEUED),
+                "max_workers": self.max_workers}
@@ -0,0 +1,127 @@
+"""
+coach_knowledge_pack.py
+=======================
+Fitxer binari compacte amb el coneixement de l'entrenador (coach_knowledge.bin).
+
+Abans, build_gem.py incrustava tot el corpus a CoachGolfGem.py com un literal
+de 186 KB (que Python havia de compilar en importar-lo) i el tornava a
+escriure, sencer i indentat, a coach_config.json. Ara n'hi ha una sola còpia:
+
+  - Cada secció (la instrucció de sistema, cada vídeo, la normativa) es
+    comprimeix per separat amb zlib.
+  - Una taula d'offsets al principi del fitxer diu on és cada secció.
+  - El fitxer s'obre amb mmap i només es descomprimeixen les seccions que es
+    demanen (el mode recuperació només necessita la instrucció de sistema).
+
+Format (enters little-endian):
+
+  capçalera  MAGIC (4) · format (u16) · nombre de seccions (u16) ·
+             SHA-256 del contingut (32)
+  taula      per secció: offset (u64) · mida comprimida (u32) ·
+             mida original (u32) · mida del nom (u16) · nom (UTF-8)
+  dades      les seccions comprimides, una darrere l'altra
+"""
+
+import hashlib
+import mmap
+import struct
+import zlib
+
+MAGIC = b"CGKP"
+FORMAT_VERSION = 1
+SYSTEM_SECTION = "system"       # Instrucció de sistema; la resta és el coneixement
+COMPRESSION_LEVEL = 9
+
+_HEADER = struct.Struct("<4sHH32s")
+_ENTRY = struct.Struct("<QIIH")
+
+
+def _digest(sections: dict) -> bytes:
+    h = hashlib.sha256()
+    for name, text in sections.items():
+        h.update(name.encode("utf-8") + b"\0" + text.encode("utf-8") + b"\0")
+    return h.digest()
+
+
+def write_pack(path: str, sections: dict) -> None:
+    """
+    Escriu un fitxer de coneixement.
+
+    Args:
+        path: fitxer de sortida
+        sections: {nom: text}, en l'ordre en què s'han d'ajuntar (vegeu
+                  KnowledgePack.knowledge)
+    """
+    names = [name.encode("utf-8") for name in sections]
+    blobs = [zlib.compress(text.encode("utf-8"), COMPRESSION_LEVEL) for text in sections.values()]
+    offset = _HEADER.size + sum(_ENTRY.size + len(n) for n in names)
+    table = []
+    for name, blob, text in zip(names, blobs, sections.values()):
+        table.append(_ENTRY.pack(offset, len(blob), len(text.encode("utf-8")), len(name)) + name)
+        offset += len(blob)
+    with open(path, "wb") as f:
+        f.write(_HEADER.pack(MAGIC, FORMAT_VERSION, len(names), _digest(sections)))
+        f.writelines(table)
+        f.writelines(blobs)
+
+
+class KnowledgePack:
+    """
+    Fitxer de coneixement obert amb mmap.
+
+    Llegir la capçalera i la taula no descomprimeix res; cada secció es
+    descomprimeix quan es demana (i qui la fa servir la guarda si cal).
+
+    Raises:
+        ValueError: si el fitxer no és un coach_knowledge.bin d'aquest format.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, "rb") as f:
+            try:
+                self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                raise ValueError(f"{path} és buit") from None
+        try:
+            magic, version, count, digest = _HEADER.unpack_from(self._mm, 0)
+            if magic != MAGIC or version != FORMAT_VERSION:
+                raise ValueError(f"{path}: format de coneixement no suportat ({magic!r} v{version})")
+            self.version = digest.hex()[:16]
+            self._table = {}
+            pos = _HEADER.size
+            for _ in range(count):
+                offset, size, raw_size, name_len = _ENTRY.unpack_from(self._mm, pos)
+                pos += _ENTRY.size
+                name = bytes(self._mm[pos:pos + name_len]).decode("utf-8")
+                pos += name_len
+                self._table[name] = (offset, size, raw_size)
+        except (struct.error, UnicodeDecodeError) as e:
+            self._mm.close()
+            raise ValueError(f"{path} està malmès: {e}") from None
+
+    @property
+    def names(self) -> list:
+        """Noms de les seccions, en l'ordre del fitxer."""
+        return list(self._table)
+
+    def raw_size(self, name: str = None) -> int:
+        """Mida descomprimida d'una secció (o de totes) en bytes, sense descomprimir-la."""
+        if name is not None:
+            return self._table[name][2]
+        return sum(raw for _, _, raw in self._table.values())
+
+    def section(self, name: str) -> str:
+        """Text d'una secció ("" si no existeix)."""
+        if name not in self._table:
+            return ""
+        offset, size, _ = self._table[name]
+        with memoryview(self._mm)[offset:offset + size] as blob:
+            return zlib.decompress(blob).decode("utf-8")
+
+    def knowledge(self) -> str:
+        """Totes les seccions de coneixement (vídeos i normativa), en ordre."""
+        return "\n\n".join(self.section(name) for name in self._table if name != SYSTEM_SECTION)
+
+    def close(self) -> None:
+        self._mm.close()
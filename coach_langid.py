@@ -0,0 +1,83 @@
+"""
+coach_langid.py
+===============
+Detecció de l'idioma de les preguntes del chat.
+
+Substitueix la crida directa a `langdetect.detect`, que carrega els perfils
+dels 55 idiomes la primera vegada (lent) i no és determinista (dues crides
+amb el mateix text poden donar idiomes diferents). Aquí:
+
+  - Només es carreguen els perfils dels idiomes de l'app
+    (ca/es/en/fr/de/it/pt/nl), una sola vegada per procés.
+  - La llavor aleatòria és fixa: el mateix text dona sempre el mateix idioma.
+  - Els resultats es memoritzen (preguntes repetides → cap càlcul).
+  - Les preguntes massa curtes fan servir l'últim idioma detectat a la sessió.
+"""
+
+import os
+import threading
+from functools import lru_cache
+
+# Idiomes suportats i el nom que es passa al model a la instrucció d'idioma
+LANG_NAMES = {
+    "ca": "Catalan", "es": "Spanish", "en": "English",
+    "fr": "French",  "de": "German",  "it": "Italian",
+    "pt": "Portuguese", "nl": "Dutch",
+}
+MIN_CHARS = 10          # Per sota d'aquesta llargada la detecció no és fiable
+SEED = 0                # Llavor fixa: resultats deterministes
+
+_factory = None
+_factory_lock = threading.Lock()
+
+
+def _get_factory():
+    """Carrega (una sola vegada) els perfils de langdetect dels idiomes suportats."""
+    global _factory
+    if _factory is None:
+        with _factory_lock:
+            if _factory is None:
+                from langdetect.detector_factory import PROFILES_DIRECTORY, DetectorFactory
+                profiles = []
+                for code in LANG_NAMES:
+                    with open(os.path.join(PROFILES_DIRECTORY, code), "r", encoding="utf-8") as f:
+                        profiles.append(f.read())
+                factory = DetectorFactory()
+                factory.load_json_profile(profiles)
+                factory.set_seed(SEED)
+                _factory = factory
+    return _factory
+
+
+@lru_cache(maxsize=2048)
+def _detect(text: str) -> str:
+    detector = _get_factory().create()
+    detector.append(text)
+    return detector.detect()
+
+
+def detect_language(prompt: str, fallback: str = None):
+    """
+    Detecta l'idioma d'una pregunta.
+
+    Args:
+        prompt: text de l'usuari
+        fallback: codi d'idioma a retornar si el text és massa curt o la
+                  detecció falla (normalment, l'últim idioma de la sessió)
+
+    Returns:
+        str | None: codi ISO 639-1 ("ca", "es", "en"...) o `fallback`.
+    """
+    text = " ".join(prompt.split())
+    if len(text) < MIN_CHARS:
+        return fallback
+    try:
+        return _detect(text)
+    except Exception:
+        # langdetect no instal·lat o text sense caràcters útils
+        return fallback
+
+
+def language_name(code: str) -> str:
+    """Nom de l'idioma per a la instrucció del model ("ca" → "Catalan")."""
+    return LANG_NAMES.get(code, code)
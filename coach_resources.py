@@ -0,0 +1,223 @@
+"""
+coach_resources.py
+==================
+Recursos compartits per procés entre les rerenderitzacions de Streamlit.
+
+Streamlit torna a executar CoachGolfPro.py de dalt a baix a cada interacció.
+Sense aquesta capa, cada rerenderització tornava a llegir i parsejar el
+coneixement (~184 KB), a crear un genai.Client nou i a concatenar els
+~180 KB de la instrucció de sistema. Aquí:
+
+  - coach_knowledge.bin (coach_knowledge_pack.py) s'obre una vegada per
+    procés i només es torna a obrir si en canvia la data de modificació o la
+    mida.
+  - Les seccions comprimides del coneixement només es descomprimeixen (una
+    vegada) quan es necessiten: el mode recuperació només fa servir la
+    instrucció de sistema.
+  - Es reutilitza un sol genai.Client per API Key (i el seu pool de
+    connexions HTTP).
+
+google.genai, NumPy i la resta de dependències pesades s'importen només
+quan es fan servir per primera vegada, no en carregar aquest mòdul.
+"""
+
+import logging
+import os
+import threading
+from dataclasses import dataclass
+from functools import cached_property, lru_cache
+
+from coach_knowledge_pack import SYSTEM_SECTION, KnowledgePack
+
+log = logging.getLogger(__name__)
+
+KNOWLEDGE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "coach_knowledge.bin")
+
+LANGUAGE_RULE = (
+    "LANGUAGE RULE (MANDATORY): Always respond in the EXACT same language "
+    "as the user's question. If the question is in English, respond in English. "
+    "If in Spanish/Castilian, respond in Spanish. If in Catalan, respond in Catalan. "
+    "Never switch language. This rule overrides everything else."
+)
+
+
+# Mode recuperació: només s'afegeix a la pregunta quan algun passatge recuperat
+# porta el minut exacte ("start"); sense, el model s'inventaria els temps
+CITATION_RULE = (
+    "Quan facis servir un passatge d'un video, cita'l amb el seu enllac "
+    "(https://youtu.be/<id>?t=<segons>) perque l'usuari pugui anar directament a aquell moment."
+)
+
+
+# Configuració del model per a l'anàlisi visual del swing (expert en biomecànica)
+VIDEO_SYSTEM_INSTRUCTION = (
+    "Ets un expert en biomecànica de golf. Analitza el vídeo fotograma a fotograma. "
+    "Fixa't en el grip, l'alineació, el backswing i el follow-through. "
+    "Dóna consells concrets per corregir errors visuals."
+)
+
+
+@lru_cache(maxsize=None)
+def get_video_config():
+    """GenerateContentConfig de l'anàlisi de vídeo (creat una sola vegada)."""
+    from google.genai import types
+    return types.GenerateContentConfig(system_instruction=VIDEO_SYSTEM_INSTRUCTION)
+
+
+# Anàlisi per aspectes (coach_swing.SWING_ASPECTS): cada crida només mira una
+# part del swing, amb una resposta curta i sense pensament previ
+ASPECT_SYSTEM_INSTRUCTION = (
+    "Ets un expert en biomecànica de golf. Analitza el vídeo fotograma a fotograma "
+    "centrant-te només en l'aspecte que se't demana. Sigues breu i dóna consells "
+    "concrets per corregir errors visuals."
+)
+ASPECT_MAX_TOKENS = 700         # Sortida màxima de cada aspecte
+
+
+@lru_cache(maxsize=None)
+def get_aspect_config():
+    """GenerateContentConfig de cada crida de l'anàlisi per aspectes."""
+    from google.genai import types
+    return types.GenerateContentConfig(
+        system_instruction=ASPECT_SYSTEM_INSTRUCTION,
+        max_output_tokens=ASPECT_MAX_TOKENS,
+        thinking_config=types.ThinkingConfig(thinking_budget=0),
+    )
+
+
+@dataclass(frozen=True)
+class Knowledge:
+    """Coneixement de l'entrenador i tot el que se'n deriva, calculat al primer ús."""
+    system_instruction: str
+    version: str                 # Hash del contingut (KnowledgePack.version)
+    retrieval_system: str        # Rol + regla d'idioma (mode recuperació)
+    pack: KnowledgePack = None   # None si el fitxer no existeix o no es pot llegir
+
+    @cached_property
+    def knowledge(self) -> str:
+        """Transcripcions i normativa (es descomprimeixen aquí, una sola vegada)."""
+        if self.pack is None:
+            return ""
+        try:
+            return self.pack.knowledge()
+        except ValueError:
+            # get_knowledge() ja ha tancat aquest paquet perquè el fitxer ha
+            # canviat: una rerenderització en curs fa servir el vigent
+            return get_knowledge(self.pack.path).knowledge
+
+    @cached_property
+    def full_system(self) -> str:
+        """Rol + KNOWLEDGE + regla d'idioma (mode complet / cache)."""
+        return (
+            self.system_instruction
+            + "\n\n---\nCONTINGUT DELS VIDEOS:\n"
+            + self.knowledge
+            + "\n\n---\n"
+            + LANGUAGE_RULE
+        )
+
+    @cached_property
+    def retrieval_config(self):
+        """GenerateContentConfig del mode recuperació (creat al primer ús)."""
+        from google.genai import types
+        return types.GenerateContentConfig(system_instruction=self.retrieval_system)
+
+
+def _build_knowledge(path: str) -> Knowledge:
+    """Obre coach_knowledge.bin i en llegeix només la instrucció de sistema."""
+    try:
+        pack = KnowledgePack(path)
+    except (OSError, ValueError) as e:
+        log.warning("No s'ha pogut carregar el coneixement (%s): %s", path, e)
+        pack = None
+    system_instruction = pack.section(SYSTEM_SECTION) if pack else ""
+    return Knowledge(
+        system_instruction=system_instruction,
+        version=pack.version if pack else "",
+        retrieval_system=system_instruction + "\n\n---\n" + LANGUAGE_RULE,
+        pack=pack,
+    )
+
+
+_lock = threading.Lock()
+_knowledge: dict = {}
+_clients: dict = {}
+
+
+def get_knowledge(path: str = KNOWLEDGE_FILE) -> Knowledge:
+    """
+    Retorna el coneixement carregat, obrint el fitxer només si ha canviat.
+
+    En canviar el fitxer, tanca el paquet anterior (el seu mmap i el
+    descriptor de fitxer que manté obert).
+
+    Returns:
+        Knowledge: amb strings buits si el fitxer no existeix o hi ha error.
+    """
+    try:
+        st = os.stat(path)
+        stamp = (st.st_mtime_ns, st.st_size)
+    except OSError:
+        stamp = None
+    with _lock:
+        cached = _knowledge.get(path)
+        if cached is None or cached[0] != stamp:
+            if cached is not None and cached[1].pack is not None:
+                cached[1].pack.close()
+            cached = _knowledge[path] = (stamp, _build_knowledge(path))
+        return cached[1]
+
+
+def get_client(api_key: str):
+    """Retorna el genai.Client compartit per a aquesta API Key (creat una sola vegada)."""
+    with _lock:
+        client = _clients.get(api_key)
+        if client is None:
+            from google import genai
+            client = _clients[api_key] = genai.Client(api_key=api_key)
+        return client
+
+
+_answer_caches = None
+
+
+def get_answer_caches():
+    """
+    Retorna els dos nivells del cache de respostes, creats una sola vegada.
+
+    Returns:
+        tuple: (AnswerCache, SemanticCache) sobre coach_answers.sqlite.
+    """
+    global _answer_caches
+    from coach_answer_cache import AnswerCache
+    from coach_semantic_cache import SemanticCache
+    with _lock:
+        if _answer_caches is None:
+            _answer_caches = (AnswerCache(), SemanticCache())
+        return _answer_caches
+
+
+_video_registry = None
+
+
+def get_video_registry():
+    """Retorna el registre de vídeos pujats i anàlisis (coach_videos.sqlite), creat una sola vegada."""
+    global _video_registry
+    from coach_video_registry import VideoRegistry
+    with _lock:
+        if _video_registry is None:
+            _video_registry = VideoRegistry()
+        return _video_registry
+
+
+_job_queue = None
+
+
+def get_job_queue():
+    """Retorna la cua de treballs en segon pla (coach_jobs.sqlite), creada una sola vegada."""
+    global _job_queue
+    from coach_jobs import JobQueue
+    with _lock:
+        if _job_queue is None:
+            _job_queue = JobQueue()
+        return _job_queue
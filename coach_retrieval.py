@@ -0,0 +1,306 @@
+"""
+coach_retrieval.py
+==================
+Motor de recuperació (BM25) sobre les transcripcions dels vídeos i la normativa.
+
+En lloc d'enviar tot el coneixement amb cada pregunta, build_gem.py trosseja
+cada transcripció en finestres d'uns 30 segons (amb l'enllaç al minut exacte
+del vídeo, https://youtu.be/<id>?t=<s>) i cada secció de rules.txt en passatges,
+construeix un índex invertit BM25 i el guarda a coach_index.json (al costat de
+coach_knowledge.bin). CoachGolfPro.py carrega l'índex una vegada per procés i
+només envia al model els k passatges més rellevants per a cada pregunta.
+
+Ús des de build_gem.py:
+    passages = video_passages(...) + rules_passages(...)
+    BM25Index.build(passages).save(INDEX_FILE)
+
+Ús des de l'app:
+    index = load_index(INDEX_FILE)
+    hits = index.search(pregunta, k=8)
+"""
+
+import json
+import math
+import os
+import re
+import threading
+import unicodedata
+from collections import Counter
+
+INDEX_FORMAT = 1
+
+# Mida dels passatges (en paraules) i solapament entre passatges consecutius
+PASSAGE_WORDS = 150
+PASSAGE_OVERLAP = 30
+
+# Durada aproximada de les finestres de les transcripcions amb temps (segons)
+WINDOW_SECONDS = 30
+
+# Paràmetres estàndard de BM25
+BM25_K1 = 1.5
+BM25_B = 0.75
+
+# Paraules buides (ca/es/en) que no aporten res a la cerca
+_STOPWORDS = frozenset("""
+a al als amb aquest aquesta aquests aquestes com de del dels des el els en
+es i la les li lo ma me mes molt no o per perque pero que qui se si son sobre
+també te un una uns unes va vaig ve ja hi ho jo tu ell ella nosaltres
+y e el la los las un una unos unas de del al en con por para que se lo le les
+es son muy mas pero como cuando donde esto esta este estos estas eso esa ese
+yo tu mi su sus nos os ya hay vamos voy va porque entonces bueno pues aqui
+the a an and or of to in on for with is are be it this that as at by from how
+what do does i you my your we our can not
+""".split())
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+
+def tokenize(text: str) -> list[str]:
+    """
+    Normalitza i separa un text en termes de cerca.
+
+    Passa a minúscules, elimina accents (així "límits" = "limits") i
+    descarta paraules buides i termes d'un sol caràcter.
+    """
+    text = unicodedata.normalize("NFKD", text.lower())
+    text = "".join(c for c in text if not unicodedata.combining(c))
+    return [t for t in _TOKEN_RE.findall(text) if len(t) > 1 and t not in _STOPWORDS]
+
+
+# ── TROSSEJAT EN PASSATGES ────────────────────────────────────────────────────
+
+def _windows(text: str, size: int = PASSAGE_WORDS, overlap: int = PASSAGE_OVERLAP):
+    """Divideix un text en finestres de `size` paraules amb `overlap` de solapament."""
+    words = text.split()
+    step = max(1, size - overlap)
+    for start in range(0, max(1, len(words) - overlap), step):
+        chunk = words[start:start + size]
+        if chunk:
+            yield " ".join(chunk)
+
+
+def time_windows(segments: list, seconds: float = WINDOW_SECONDS):
+    """
+    Ajunta els segments consecutius d'una transcripció en finestres de
+    `seconds` segons com a mínim (l'última pot ser més curta).
+
+    Args:
+        segments: [[inici, durada, text], ...] en segons (transcripts.json)
+
+    Yields:
+        tuple: (inici, final, text) de cada finestra
+    """
+    start = end = None
+    texts = []
+    for seg_start, duration, text in segments:
+        if start is None:
+            start = seg_start
+        end = seg_start + duration
+        texts.append(text.strip())
+        if end - start >= seconds:
+            yield start, end, " ".join(t for t in texts if t)
+            start, texts = None, []
+    if texts:
+        yield start, end, " ".join(t for t in texts if t)
+
+
+def clock(seconds: float) -> str:
+    """Segons en format m:ss (o h:mm:ss)."""
+    m, s = divmod(int(seconds), 60)
+    h, m = divmod(m, 60)
+    return f"{h}:{m:02d}:{s:02d}" if h else f"{m}:{s:02d}"
+
+
+def video_passages(vid_id: str, label: str, text: str, segments: list = None) -> list[dict]:
+    """
+    Trosseja la transcripció d'un vídeo en passatges.
+
+    Amb els segments (i els seus temps), cada passatge és una finestra de
+    ~WINDOW_SECONDS segons amb l'enllaç al seu inici ("start", en segons);
+    sense, finestres de PASSAGE_WORDS paraules i l'enllaç al vídeo.
+    """
+    if segments:
+        return [
+            {"source": "video", "label": label, "url": f"https://youtu.be/{vid_id}?t={int(start)}",
+             "text": chunk, "start": int(start)}
+            for start, _, chunk in time_windows(segments) if chunk
+        ]
+    url = f"https://youtu.be/{vid_id}"
+    return [
+        {"source": "video", "label": label, "url": url, "text": chunk}
+        for chunk in _windows(text)
+    ]
+
+
+# Capçaleres de secció de rules.txt: "Regla 20. BOLA PERDUDA..." a inici de línia
+# (les entrades de l'índex del document van sagnades i no coincideixen)
+_RULE_HEADER_RE = re.compile(r"^Regla \d+(?:\.\d+)?\.?\s+\S.*$", re.MULTILINE)
+
+
+def rules_passages(rules_text: str) -> list[dict]:
+    """Trosseja la normativa per seccions (una per regla) i després per mida."""
+    sections = []
+    matches = list(_RULE_HEADER_RE.finditer(rules_text))
+    intro_end = matches[0].start() if matches else len(rules_text)
+    sections.append(("Normativa: introducció i definicions", rules_text[:intro_end]))
+    for m, nxt in zip(matches, matches[1:] + [None]):
+        end = nxt.start() if nxt else len(rules_text)
+        sections.append((f"Normativa: {m.group(0).strip()}", rules_text[m.start():end]))
+
+    return [
+        {"source": "rules", "label": label, "url": None, "text": chunk}
+        for label, body in sections
+        for chunk in _windows(body)
+    ]
+
+
+def format_passages(hits: list[dict]) -> str:
+    """Dona format als passatges recuperats per incloure'ls al prompt."""
+    blocks = []
+    for p in hits:
+        label = f"{p['label']}, {clock(p['start'])}" if "start" in p else p["label"]
+        header = f"{label} ({p['url']})" if p.get("url") else label
+        blocks.append(f"=== {header} ===\n{p['text']}")
+    return "\n\n".join(blocks)
+
+
+# ── ÍNDEX BM25 ────────────────────────────────────────────────────────────────
+
+class BM25Index:
+    """
+    Índex invertit BM25 sobre una llista de passatges.
+
+    Attributes:
+        passages: llista de dicts {"source", "label", "url", "text"} (i "start",
+                  en segons, per a les finestres de vídeo amb temps)
+        postings: {terme: [[id_passatge, freqüència], ...]}
+        doc_len:  nombre de termes de cada passatge
+    """
+
+    def __init__(self, passages: list[dict], postings: dict, doc_len: list[int]):
+        self.passages = passages
+        self.postings = postings
+        self.doc_len = doc_len
+        n = len(doc_len)
+        self.avgdl = (sum(doc_len) / n) if n else 0.0
+        # IDF de BM25 (variant sempre positiva)
+        self.idf = {
+            term: math.log(1 + (n - len(plist) + 0.5) / (len(plist) + 0.5))
+            for term, plist in postings.items()
+        }
+
+    @classmethod
+    def build(cls, passages: list[dict]) -> "BM25Index":
+        """Construeix l'índex a partir dels passatges."""
+        postings: dict = {}
+        doc_len = []
+        for i, p in enumerate(passages):
+            terms = tokenize(p["text"] + " " + p["label"])
+            doc_len.append(len(terms))
+            for term, tf in Counter(terms).items():
+                postings.setdefault(term, []).append([i, tf])
+        return cls(passages, postings, doc_len)
+
+    def save(self, path: str) -> None:
+        """Guarda l'índex en JSON compacte."""
+        data = {
+            "format": INDEX_FORMAT,
+            "passages": self.passages,
+            "doc_len": self.doc_len,
+            "postings": self.postings,
+        }
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, separators=(",", ":"))
+
+    @classmethod
+    def load(cls, path: str) -> "BM25Index":
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("format") != INDEX_FORMAT:
+            raise ValueError(f"Format d'índex no suportat: {data.get('format')}")
+        return cls(data["passages"], data["postings"], data["doc_len"])
+
+    def scores(self, query: str) -> dict[int, float]:
+        """Puntuació BM25 de cada passatge que conté algun terme de la consulta."""
+        scores: dict[int, float] = {}
+        for term in set(tokenize(query)):
+            plist = self.postings.get(term)
+            if not plist:
+                continue
+            idf = self.idf[term]
+            for i, tf in plist:
+                norm = BM25_K1 * (1 - BM25_B + BM25_B * self.doc_len[i] / self.avgdl)
+                scores[i] = scores.get(i, 0.0) + idf * tf * (BM25_K1 + 1) / (tf + norm)
+        return scores
+
+    def ranked(self, query: str, k: int = 8) -> list[tuple[int, float]]:
+        """Retorna [(id_passatge, puntuació), ...] dels k passatges millor puntuats."""
+        return sorted(self.scores(query).items(), key=lambda kv: kv[1], reverse=True)[:k]
+
+    def search(self, query: str, k: int = 8, min_score: float = 0.0) -> list[dict]:
+        """
+        Retorna els k passatges més rellevants per a la consulta.
+
+        Returns:
+            list[dict]: passatges (amb la clau "score") ordenats per rellevància;
+                        llista buida si cap passatge supera `min_score`.
+        """
+        return [
+            {**self.passages[i], "score": round(s, 3)}
+            for i, s in self.ranked(query, k)
+            if s > min_score
+        ]
+
+
+def hybrid_search(index: BM25Index, query: str, k: int = 8, tfidf=None,
+                  rrf_k: int = 60) -> list[dict]:
+    """
+    Combina el rànquing BM25 amb el de similitud TF-IDF (Reciprocal Rank Fusion).
+
+    Args:
+        index: índex BM25 (coach_index.json)
+        tfidf: índex TF-IDF opcional amb el mètode ranked(query, k) i les
+               mateixes files que `index` (vegeu coach_tfidf.py)
+        rrf_k: constant de la fusió; valors alts donen més pes a les posicions baixes
+
+    Returns:
+        list[dict]: passatges (amb la clau "score" de la fusió) ordenats per rellevància.
+    """
+    if tfidf is None or tfidf.n_rows != len(index.passages):
+        return index.search(query, k=k)
+    fused: dict[int, float] = {}
+    for ranking in (index.ranked(query, 2 * k), tfidf.ranked(query, 2 * k)):
+        for pos, (i, _) in enumerate(ranking):
+            fused[i] = fused.get(i, 0.0) + 1.0 / (rrf_k + pos + 1)
+    ranked = sorted(fused.items(), key=lambda kv: kv[1], reverse=True)[:k]
+    return [{**index.passages[i], "score": round(s, 4)} for i, s in ranked]
+
+
+# ── CÀRREGA UNA VEGADA PER PROCÉS ─────────────────────────────────────────────
+
+_loaded: dict = {}
+_loaded_lock = threading.Lock()
+
+
+def load_index(path: str):
+    """
+    Carrega l'índex des del disc, una sola vegada per procés i data de modificació.
+
+    Returns:
+        BM25Index | None: None si el fitxer no existeix o no es pot llegir
+                          (l'app torna a enviar tot el coneixement).
+    """
+    try:
+        mtime = os.path.getmtime(path)
+    except OSError:
+        return None
+    with _loaded_lock:
+        cached = _loaded.get(path)
+        if cached and cached[0] == mtime:
+            return cached[1]
+        try:
+            index = BM25Index.load(path)
+        except Exception:
+            index = None
+        _loaded[path] = (mtime, index)
+        return index
@@ -0,0 +1,304 @@
+"""
+coach_semantic_cache.py
+=======================
+Segon nivell del cache de respostes: preguntes gairebé idèntiques.
+
+El cache exacte (coach_answer_cache.py) no reconeix les paràfrasis
+("com evito l'slice?" / "com puc evitar fer slice?"). Aquí cada pregunta es
+representa amb un vector local de n-grames de caràcters (hashing, sense cap
+servei extern) i es retorna la resposta guardada si:
+
+  - l'idioma detectat coincideix,
+  - la similitud del cosinus supera el llindar, i
+  - les dues preguntes tenen els mateixos termes clau (key_terms): el tipus
+    de pregunta (com / què / quan / quant / puc...), si és negativa (no /
+    not / mai / nunca...), els números exactes i l'arrel de cada paraula de
+    contingut. La similitud sola confon "regla 20" amb "regla 21" (0.90),
+    "moure la bola" amb "netejar la bola" o "no puc moure la bola" amb
+    "puc moure la bola" (0.96).
+
+SIMILARITY_THRESHOLD surt de bench/semantic_cache_hit_rate.py --pairs sobre
+parells etiquetats (bench/semantic_pairs.jsonl), comptant només els parells
+amb els mateixos termes clau (els que decideix el llindar): cap parell
+diferent hi arriba, i 0.45 és el llindar més alt que no perd cap paràfrasi
+amb una altra redacció (la menys similar és a 0.48).
+Límit conegut: no distingeix qui fa què ("la meva bola toca la del company"
+/ "la bola del company toca la meva", 0.98).
+
+Els vectors de cada (versió, idioma) es guarden també en una matriu en
+memòria; cada consulta només llegeix de la base les files noves.
+
+Les dades es guarden a la mateixa base SQLite que el cache exacte
+(taula `semantic`), amb la mateixa versió del coneixement, TTL i límit LRU.
+"""
+
+import re
+import threading
+import time
+import unicodedata
+import zlib
+
+import numpy as np
+
+from coach_answer_cache import ANSWER_CACHE_FILE, MAX_ENTRIES, TTL_SECONDS, AnswerCache, normalize_prompt
+from coach_retrieval import tokenize
+
+VECTOR_DIM = 2048                  # Nombre de "cubs" del hashing
+NGRAM_SIZES = (3, 4)               # Mides dels n-grames de caràcters
+SIMILARITY_THRESHOLD = 0.45        # Similitud mínima per reutilitzar una resposta (vegeu el docstring)
+KEY_STEM_CHARS = 5                 # Arrel de les paraules de contingut ("hierro"/"hierba" → "hierr"/"hierb")
+
+# Tipus de pregunta (ca/es/en): "com agafo...?" i "quin pal agafo...?" no són la mateixa
+_INTERROGATIVES = {
+    "com": "how", "como": "how", "how": "how",
+    "que": "what", "quin": "what", "quina": "what", "quins": "what", "quines": "what",
+    "cual": "what", "cuales": "what", "what": "what", "which": "what",
+    "quan": "when", "cuando": "when", "when": "when",
+    "quant": "much", "quanta": "much", "quants": "much", "quantes": "much", "cuanto": "much",
+    "cuanta": "much", "cuantos": "much", "cuantas": "much", "many": "much", "much": "much", "long": "much",
+    "puc": "can", "podem": "can", "puedo": "can", "podemos": "can", "can": "can",
+    "perque": "why", "porque": "why", "why": "why",
+    "donde": "where", "where": "where",
+}
+
+# Terminacions que es treuen abans de tallar l'arrel ("evito"/"evitar" → "evit")
+_SUFFIXES = sorted("iendo ando ing ar er ir ed es as os s o a e".split(), key=len, reverse=True)
+
+# "how high / how far..." pregunta una quantitat, no una manera
+_DEGREE = frozenset("far high long many much big fast often".split())
+
+# Pals que comparteixen arrel amb una altra paraula ("putt"/"putter", "drive"/"driver")
+_WHOLE_WORDS = frozenset("driver drivers putter putters chipper chippers".split())
+
+# Direcció ("del green al bunker" ≠ "del bunker al green"): si n'hi ha almenys dos
+# (origen i destí), la paraula que segueix cada marcador es guarda en ordre
+_ROUTE_MARKERS = frozenset("from onto into desde hasta hacia del al cap fins".split())
+
+# Negacions: "no puc moure la bola?" té la resposta contrària a "puc moure la bola?"
+_NEGATORS = frozenset("no not ni never nunca jamas mai tampoc tampoco".split())
+_CONTRACTIONS = re.compile(r"\b(can|won|don|doesn|didn|isn|aren|wasn|weren|shouldn|couldn|wouldn)['’]?t\b")
+
+# Verbs auxiliars i paraules de farciment que no canvien què es pregunta
+_FILLERS = frozenset("""
+puc pots pot podem poden puedo puedes puede podemos pueden can could should would may might
+permet permite allowed allow am fer faig fa fas hacer hago hace haces do does doing did make
+he ha has han debo debes debe deben deber tenir tener have had must meu meva mi mis my
+diu dice say says es esta ser is are be was were will vull quiero want need cal hay queda quedar
+""".split())
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS semantic (
+    id          INTEGER PRIMARY KEY,
+    version     TEXT NOT NULL,
+    lang        TEXT NOT NULL,
+    prompt      TEXT NOT NULL,
+    vector      BLOB NOT NULL,
+    answer      TEXT NOT NULL,
+    created     REAL NOT NULL,
+    last_access REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS semantic_version_lang ON semantic (version, lang);
+"""
+
+
+def embed(text: str, dim: int = VECTOR_DIM) -> np.ndarray:
+    """
+    Vector de n-grames de caràcters (hashing amb signe), normalitzat L2.
+
+    El text es normalitza (minúscules, sense accents ni puntuació) i es
+    delimita amb espais, així els n-grames capturen inicis i finals de paraula.
+    crc32 fa que el vector sigui el mateix en tots els processos.
+    """
+    text = unicodedata.normalize("NFKD", normalize_prompt(text))
+    text = "".join(c if c.isalnum() else " " for c in text if not unicodedata.combining(c))
+    text = " " + " ".join(text.split()) + " "
+    vec = np.zeros(dim, dtype=np.float32)
+    for n in NGRAM_SIZES:
+        for i in range(len(text) - n + 1):
+            h = zlib.crc32(text[i:i + n].encode("utf-8"))
+            vec[h % dim] += 1.0 if (h >> 31) & 1 else -1.0
+    norm = np.linalg.norm(vec)
+    return vec / norm if norm else vec
+
+
+def _stem(word: str) -> str:
+    """Arrel d'una paraula: sense la terminació més llarga de _SUFFIXES i tallada a KEY_STEM_CHARS."""
+    for suffix in _SUFFIXES:
+        if word.endswith(suffix) and len(word) - len(suffix) >= 3:
+            word = word[:-len(suffix)]
+            break
+    return word[:KEY_STEM_CHARS]
+
+
+def key_terms(text: str) -> tuple:
+    """
+    Termes que dues preguntes han de compartir exactament per reutilitzar la resposta.
+
+    Returns:
+        tuple: (tipus de pregunta o None, si és negativa, números en ordre,
+               recorregut (arrels després de from/del/al..., en ordre),
+               frozenset d'arrels (_stem) de les paraules de contingut)
+    """
+    text = unicodedata.normalize("NFKD", normalize_prompt(text))
+    text = "".join(c for c in text if not unicodedata.combining(c))
+    text = _CONTRACTIONS.sub(lambda m: {"can": "can", "won": "will"}.get(m[1], m[1][:-1]) + " not", text)
+    words = re.findall(r"[a-z0-9]+", text)
+    kind = next((_INTERROGATIVES[w] for w in words if w in _INTERROGATIVES), None)
+    if "how" in words and words[words.index("how") + 1:][:1] and words[words.index("how") + 1] in _DEGREE:
+        kind = "much"
+    negated = any(w in _NEGATORS for w in words)        # tokenize() descarta "no"
+    numbers = tuple(w for w in words if w.isdigit())    # "de 100 a 90" ≠ "de 90 a 100"
+    content = [t for t in tokenize(text)
+               if not t.isdigit() and t not in _INTERROGATIVES and t not in _FILLERS
+               and t not in _NEGATORS and t not in _ROUTE_MARKERS]
+    stem = {t: t if t in _WHOLE_WORDS else _stem(t) for t in content}
+    route = []
+    for i, w in enumerate(words):
+        if w in _ROUTE_MARKERS:
+            following = next((x for x in words[i + 1:] if x in stem), None)
+            if following:
+                route.append(stem[following])
+    route = tuple(route) if len(route) >= 2 else ()     # "regla del fora de límits" no és un recorregut
+    return kind, negated, numbers, route, frozenset(stem.values())
+
+
+class _Rows:
+    """Files d'un (versió, idioma) en memòria: ids, data, termes clau i matriu de vectors."""
+
+    def __init__(self):
+        self.ids, self.created, self.terms, self.prompts = [], [], [], []
+        self.matrix = np.zeros((0, VECTOR_DIM), dtype=np.float32)
+        self.last_id = 0
+
+    def extend(self, rows: list) -> None:
+        """Afegeix files (id, vector, prompt, created) llegides de la base."""
+        self.ids += [r[0] for r in rows]
+        self.prompts += [r[2] for r in rows]
+        self.created += [r[3] for r in rows]
+        self.terms += [key_terms(r[2]) for r in rows]
+        vectors = np.frombuffer(b"".join(r[1] for r in rows), dtype=np.float32)
+        self.matrix = np.vstack([self.matrix, vectors.reshape(len(rows), -1)])
+        self.last_id = max(self.last_id, rows[-1][0])
+
+    def keep(self, mask) -> None:
+        """Es queda només les files de `mask` (p. ex. les no caducades)."""
+        idx = np.flatnonzero(mask)
+        self.ids, self.created, self.terms, self.prompts = (
+            [col[i] for i in idx] for col in (self.ids, self.created, self.terms, self.prompts))
+        self.matrix = self.matrix[idx]
+
+
+class SemanticCache(AnswerCache):
+    """
+    Cache de respostes per similitud de la pregunta.
+
+    Args:
+        threshold: similitud del cosinus mínima (0-1) per considerar un encert
+    """
+
+    def __init__(self, path: str = ANSWER_CACHE_FILE, max_entries: int = MAX_ENTRIES,
+                 ttl: float = TTL_SECONDS, threshold: float = SIMILARITY_THRESHOLD):
+        super().__init__(path, max_entries, ttl)
+        self.threshold = threshold
+        self._rows: dict = {}           # (versió, idioma) → _Rows
+        self._rows_lock = threading.Lock()
+        with self._connect() as db:
+            db.executescript(_SCHEMA)
+
+    def _load(self, db, version: str, lang: str, now: float) -> _Rows:
+        """Matriu en memòria de (versió, idioma), amb les files afegides des de l'última consulta."""
+        rows = self._rows.setdefault((version, lang), _Rows())
+        new = db.execute(
+            "SELECT id, vector, prompt, created FROM semantic "
+            "WHERE version = ? AND lang = ? AND id > ? ORDER BY id",
+            (version, lang, rows.last_id),
+        ).fetchall()
+        if new:
+            rows.extend(new)
+        if rows.created and rows.created[0] < now - self.ttl:
+            rows.keep(np.asarray(rows.created) >= now - self.ttl)
+        if len(rows.ids) > self.max_entries:
+            # El límit LRU n'ha esborrat de la base: es deixen només les que hi queden
+            alive = {r[0] for r in db.execute("SELECT id FROM semantic WHERE version = ? AND lang = ?",
+                                                (version, lang))}
+            rows.keep(np.isin(rows.ids, list(alive)))
+        return rows
+
+    def lookup(self, prompt: str, lang: str, version: str):
+        """
+        Busca la pregunta guardada més similar (mateix idioma i versió) que
+        tingui els mateixos termes clau.
+
+        Returns:
+            tuple | None: (resposta, similitud, pregunta_guardada), o None si cap
+                          pregunta supera el llindar amb els mateixos termes clau.
+        """
+        now = time.time()
+        with self._connect() as db, self._rows_lock:
+            rows = self._load(db, version, lang, now)
+            if rows.ids:
+                sims = rows.matrix @ embed(prompt)
+                terms = key_terms(prompt)
+                gone = []
+                for best in np.argsort(-sims):
+                    if sims[best] < self.threshold:
+                        break
+                    if rows.terms[best] != terms:
+                        continue
+                    found = db.execute("SELECT answer FROM semantic WHERE id = ?",
+                                       (rows.ids[best],)).fetchone()
+                    if found is None:
+                        gone.append(best)           # Esborrada (LRU, invalidate) des d'un altre lloc
+                        continue
+                    db.execute("UPDATE semantic SET last_access = ? WHERE id = ?", (now, rows.ids[best]))
+                    self._count(db, "semantic_hits")
+                    return found[0], float(sims[best]), rows.prompts[best]
+                if gone:
+                    rows.keep(~np.isin(np.arange(len(rows.ids)), gone))
+            self._count(db, "semantic_misses")
+        return None
+
+    def get(self, prompt: str, lang: str, version: str):
+        """Com AnswerCache.get(): la resposta de la pregunta similar, o None."""
+        found = self.lookup(prompt, lang, version)
+        return found[0] if found else None
+
+    def put(self, prompt: str, lang: str, version: str, answer: str) -> None:
+        """Guarda la pregunta (amb el seu vector) i la resposta."""
+        now = time.time()
+        with self._connect() as db:
+            db.execute(
+                "INSERT INTO semantic (version, lang, prompt, vector, answer, created, last_access) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (version, lang, normalize_prompt(prompt), embed(prompt).tobytes(), answer, now, now),
+            )
+            db.execute("DELETE FROM semantic WHERE created < ?", (now - self.ttl,))
+            db.execute(
+                "DELETE FROM semantic WHERE id IN ("
+                "  SELECT id FROM semantic ORDER BY last_access DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,),
+            )
+
+    def invalidate(self, keep_version: str = None) -> int:
+        """Esborra les preguntes d'altres versions del coneixement (o totes)."""
+        with self._connect() as db:
+            if keep_version is None:
+                cur = db.execute("DELETE FROM semantic")
+            else:
+                cur = db.execute("DELETE FROM semantic WHERE version != ?", (keep_version,))
+        with self._rows_lock:
+            self._rows = {k: v for k, v in self._rows.items() if k[0] == keep_version}
+        return cur.rowcount
+
+    def stats(self) -> dict:
+        """Retorna {"entries", "hits", "misses", "hit_rate"} del nivell semàntic."""
+        with self._connect() as db:
+            counters = dict(db.execute("SELECT name, value FROM stats").fetchall())
+            entries = db.execute("SELECT COUNT(*) FROM semantic").fetchone()[0]
+        hits, misses = counters.get("semantic_hits", 0), counters.get("semantic_misses", 0)
+        return {
+            "entries": entries,
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": hits / (hits + misses) if hits + misses else 0.0,
+        }
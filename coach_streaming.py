@@ -0,0 +1,62 @@
+"""
+coach_streaming.py
+==================
+Mostra les respostes de Gemini a mesura que arriben (streaming).
+
+En lloc d'esperar la resposta sencera amb un "Pensant..." a la pantalla,
+els fragments de `client.models.generate_content_stream()` s'escriuen
+directament al placeholder de Streamlit. Per a cada petició es mesura i es
+registra el temps fins al primer token (TTFT) i el temps total.
+"""
+
+import logging
+import time
+from dataclasses import dataclass
+
+log = logging.getLogger(__name__)
+
+CURSOR = " ▌"   # Indicador d'escriptura mentre arriben fragments
+
+
+@dataclass
+class StreamResult:
+    """Resultat d'una resposta en streaming."""
+    text: str
+    ttft: float          # Segons fins al primer fragment amb text
+    total: float         # Segons fins a l'últim fragment
+    chunks: int
+    last_chunk: object   # Últim fragment (conté usage_metadata)
+
+
+def render_stream(stream, placeholder, label: str = "", started: float = None) -> StreamResult:
+    """
+    Escriu els fragments d'un stream de Gemini en un placeholder de Streamlit.
+
+    Args:
+        stream: iterable de GenerateContentResponse (generate_content_stream)
+        placeholder: st.empty() (o qualsevol objecte amb .markdown())
+        label: nom de la petició per al registre ("chat", "video"...)
+        started: time.perf_counter() de l'inici de la petició; per defecte, ara
+
+    Returns:
+        StreamResult: text complet i temps mesurats.
+    """
+    started = time.perf_counter() if started is None else started
+    parts, ttft, n, last = [], None, 0, None
+    for chunk in stream:
+        n += 1
+        last = chunk
+        text = chunk.text or ""
+        if not text:
+            continue
+        if ttft is None:
+            ttft = time.perf_counter() - started
+        parts.append(text)
+        placeholder.markdown("".join(parts) + CURSOR)
+    answer = "".join(parts)
+    placeholder.markdown(answer)
+    total = time.perf_counter() - started
+    ttft = total if ttft is None else ttft
+    log.info("Streaming %s: primer token %.2fs, total %.2fs (%d fragments, %d caràcters)",
+             label, ttft, total, n, len(answer))
+    return StreamResult(answer, ttft, total, n, last)
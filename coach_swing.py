@@ -0,0 +1,600 @@
+"""
+coach_swing.py
+==============
+Procés complet d'una anàlisi de swing per vídeo, independent de Streamlit.
+
+S'executa com a treball en segon pla (coach_jobs.py): rep la petició
+(SwingRequest), va informant de l'etapa i del progrés al Job i retorna un
+resultat serialitzable en JSON que la pàgina mostra quan acaba.
+
+Etapes:
+  - Registre (coach_video_registry.py): anàlisi ja feta o vídeo ja pujat.
+  - Mode ràpid: cinc fotogrames clau en línia (coach_video.py).
+  - Mode vídeo: retall del swing (opcional), pujada sense còpies
+    (coach_upload.py), espera del processament i generació en streaming.
+  - Per aspectes (opcional): en lloc d'una sola resposta llarga, una crida
+    curta i concurrent per a cada aspecte del swing (SWING_ASPECTS) sobre el
+    mateix fitxer pujat; els resultats es guarden per separat al registre i
+    s'ajunten en l'informe final.
+
+analyze_batch() fa el mateix per a tots els clips d'una sessió alhora (amb
+paral·lelisme limitat) i hi afegeix un resum dels errors recurrents.
+analyze_comparison() compara dos swings (abans / després) alineats a
+l'impacte localment, reutilitzant els fitxers ja pujats del registre.
+prefetch_video() comença la pujada d'un clip tan bon punt l'usuari el tria.
+"""
+
+import base64
+import io
+import logging
+import os
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+
+log = logging.getLogger(__name__)
+
+VIDEO_MODEL = "gemini-2.5-flash"
+# Crides simultànies a Gemini que pot fer una sessió (límit de l'API per
+# minut i per projecte); la sessió és un sol treball de la cua (coach_jobs)
+BATCH_MAX_CALLS = int(os.environ.get("COACH_BATCH_MAX_CALLS", "8"))
+
+# Anàlisi per aspectes: (clau, títol de la secció de l'informe, prompt)
+SWING_ASPECTS = (
+    ("grip", "✊ Grip",
+     "Analitza NOMÉS el grip: posició de les mans, pressió i orientació de la cara del pal."),
+    ("alignment", "📐 Alineació i postura",
+     "Analitza NOMÉS l'alineació i la postura a l'address: peus, malucs, espatlles, "
+     "posició de la bola i angle de la columna."),
+    ("backswing", "↩️ Backswing",
+     "Analitza NOMÉS el backswing: takeaway, gir d'espatlles i malucs, pla del pal i "
+     "posició al top."),
+    ("follow_through", "🎯 Impacte i follow-through",
+     "Analitza NOMÉS l'impacte i el follow-through: transferència de pes, alliberament "
+     "del pal, extensió i equilibri al finish."),
+)
+ASPECT_PROMPT = "{aspect}\n\nPetició del jugador (per context): {prompt}"
+
+BATCH_SUMMARY_PROMPT = (
+    "Aquests són els informes de {n} swings del mateix jugador en una sessió "
+    "d'entrenament. Fes un resum breu: quins errors es repeteixen (i en quants "
+    "clips), quins apareixen només de manera puntual i quines 2-3 prioritats de "
+    "treball recomanes per a la propera sessió. Respon en el mateix idioma que "
+    "els informes."
+)
+
+COMPARE_PROMPT = (
+    "El primer vídeo és el swing ANTERIOR i el segon el swing ACTUAL del mateix "
+    "jugador.{alignment} Compara'ls amb una taula de columnes Aspecte | Abans | Ara | "
+    "Evolució (✅ millor, ➖ igual, ❌ pitjor) per al grip, l'alineació, el backswing, "
+    "l'impacte i el follow-through. Després, llista els errors corregits, els que "
+    "continuen i els nous.\n\nPetició del jugador: {prompt}"
+)
+COMPARE_ALIGNED = " Tots dos estan retallats al voltant de l'impacte, que cau al segon {impacts}."
+COMPARE_IMPACTS = (" L'impacte cau al segon {before:.1f} del swing anterior i al segon {after:.1f} "
+                   "de l'actual: compara'ls fase per fase a partir d'aquests moments.")
+
+
+@dataclass
+class SwingRequest:
+    """Tot el que cal per analitzar un vídeo fora de l'script de Streamlit."""
+    data: bytes               # Contingut del clip (compartit, no copiat)
+    name: str
+    mime_type: str
+    digest: str               # SHA-256 del clip (coach_video_registry.video_digest)
+    prompt: str
+    keyframe_mode: bool = False
+    trim: bool = True
+    max_height: int = 720
+    fps: int = 30
+    aspects: bool = False     # Una crida concurrent per aspecte (SWING_ASPECTS)
+    model: str = VIDEO_MODEL
+
+    @property
+    def variant(self) -> str:
+        """Què s'envia al model (forma part de la clau del registre)."""
+        if self.keyframe_mode:
+            return "keyframes"
+        if self.trim:
+            return f"swing-{self.max_height}p{self.fps}"
+        return "original"
+
+    def aspect_prompts(self) -> dict:
+        """Prompt de cada aspecte ({clau: prompt}), amb la petició del jugador."""
+        return {key: ASPECT_PROMPT.format(aspect=aspect, prompt=self.prompt)
+                for key, _, aspect in SWING_ASPECTS}
+
+    def clip(self) -> io.BytesIO:
+        """BytesIO sobre el contingut del clip (sense còpia), amb nom i tipus."""
+        clip = io.BytesIO(self.data)
+        clip.name, clip.type = self.name, self.mime_type
+        return clip
+
+
+def friendly_error(e: Exception) -> str:
+    """Missatge per a l'usuari a partir d'una excepció del procés."""
+    from coach_upload import ProcessingFailed, ProcessingTimeout
+
+    if isinstance(e, ProcessingTimeout):
+        return "⏱️ Google ha trigat massa a processar el vídeo. Prova amb un clip més curt."
+    if isinstance(e, ProcessingFailed):
+        return f"❌ {e}"
+    err = str(e)
+    if "429" in err or "quota" in err.lower():
+        return "⚠️ Quota esgotada. Espera uns minuts i torna-ho a intentar."
+    return f"❌ Error en l'anàlisi: {err}"
+
+
+def analyze_swing(job, client, registry, request: SwingRequest) -> dict:
+    """
+    Analitza un swing i retorna l'informe.
+
+    Args:
+        job: coach_jobs.Job (etapa, progrés i text parcial)
+        client: genai.Client
+        registry: coach_video_registry.VideoRegistry
+        request: SwingRequest
+
+    Returns:
+        dict: {"text", "notes" (avisos i resums a mostrar), "frames"
+              (fotogrames clau en base64), "cached", "tokens"}
+
+    Raises:
+        RuntimeError: amb el missatge per a l'usuari (friendly_error).
+    """
+    try:
+        return _analyze(job, client, registry, request)
+    except Exception as e:
+        raise RuntimeError(friendly_error(e)) from e
+
+
+def _analyze(job, client, registry, request: SwingRequest) -> dict:
+    from coach_context_cache import usage_report
+    from coach_resources import get_video_config
+    from coach_streaming import render_stream
+    from coach_video_registry import video_key
+
+    result = {"text": "", "notes": [], "frames": [], "cached": False, "tokens": 0}
+    vkey = video_key(request.digest, request.variant)
+
+    # Mateix clip, mateix prompt i mateix model: resposta del registre (en
+    # mode per aspectes, cal tenir-los tots)
+    if request.aspects:
+        reports = {key: registry.get_analysis(vkey, prompt, request.model)
+                   for key, prompt in request.aspect_prompts().items()}
+        cached_report = merge_aspects(reports) if all(reports.values()) else None
+    else:
+        cached_report = registry.get_analysis(vkey, request.prompt, request.model)
+    if cached_report:
+        result.update(text=cached_report, cached=True)
+        result["notes"].append("♻️ Anàlisi ja feta d'aquest mateix vídeo (sense cap crida a Gemini).")
+        return result
+
+    keyframes = None
+
+    # MODE RÀPID: address, takeaway, top, impact i finish, escollits amb
+    # l'energia de moviment i enviats en línia en una sola crida
+    if request.keyframe_mode:
+        from coach_video import extract_keyframes, keyframe_contents
+        job.update("Extraient els fotogrames clau")
+        keyframes = extract_keyframes(request.clip())
+        if keyframes is None:
+            result["notes"].append("⚠️ No s'han pogut extreure els fotogrames clau; s'analitza el vídeo complet.")
+            vkey = video_key(request.digest, "original")
+
+    if keyframes:
+        def make_contents(prompt):
+            return keyframe_contents(prompt, keyframes)
+        result["notes"].append(keyframes.summary())
+        result["frames"] = [
+            {"phase": k.phase, "time": k.time, "jpeg": base64.b64encode(k.jpeg).decode("ascii")}
+            for k in keyframes.frames
+        ]
+    else:
+        # PAS 0-2: retall, pujada i processament (o el fitxer ja pujat, o el
+        # d'una pujada per endavant encara en curs; vegeu prefetch_video)
+        video_file, vkey, notes = remote_video(
+            job, client, registry, request, vkey, trim=request.trim and not request.keyframe_mode,
+        )
+        result["notes"].extend(notes)
+
+        def make_contents(prompt):
+            return [prompt, video_file]
+
+    # PAS 3 (per aspectes): una crida curta i concurrent per aspecte sobre el
+    # mateix vídeo, i els resultats ajuntats en un sol informe
+    if request.aspects:
+        job.update("Analitzant cada aspecte del swing", 1.0)
+        result.update(_analyze_aspects(job, client, registry, request, vkey, make_contents))
+        return result
+
+    # PAS 3: Generar l'anàlisi multimodal en streaming; el text parcial es va
+    # guardant al Job perquè la pàgina el mostri mentre arriba
+    job.update("Generant l'informe", 1.0)
+    started = time.perf_counter()
+    stream = client.models.generate_content_stream(
+        model=request.model,
+        contents=make_contents(request.prompt),
+        config=get_video_config(),
+    )
+    streamed = render_stream(stream, job, "keyframes" if keyframes else "video", started)
+    usage = usage_report(streamed.last_chunk)
+    result.update(text=streamed.text, tokens=usage["prompt_tokens"])
+    if streamed.text:
+        registry.put_analysis(vkey, request.prompt, request.model, streamed.text)
+    return result
+
+
+# ── FITXER REMOT (PUJADA ÚNICA I PER ENDAVANT) ───────────────────────────────
+
+_inflight: dict = {}            # Clau del vídeo → Future de la pujada en curs
+_inflight_lock = threading.Lock()
+
+
+def remote_video(job, client, registry, request: SwingRequest, vkey: str, trim: bool = True) -> tuple:
+    """
+    Fitxer remot ACTIVE d'un clip: del registre, o retallat, pujat i esperat.
+
+    Si ja hi ha una pujada en curs del mateix vídeo (p. ex. la que comença
+    prefetch_video() quan l'usuari tria el fitxer), se n'espera el resultat
+    en lloc de pujar-lo dues vegades.
+
+    Returns:
+        tuple: (fitxer remot, clau del registre amb què s'ha guardat, avisos)
+    """
+    with _inflight_lock:
+        future = _inflight.get(vkey)
+        owner = future is None
+        if owner:
+            future = _inflight[vkey] = Future()
+    if not owner:
+        job.update("Esperant la pujada que ja està en curs")
+        try:
+            return future.result()
+        except Exception as e:
+            log.info("La pujada en curs de %s ha fallat (%s); es torna a intentar", vkey, e)
+            return remote_video(job, client, registry, request, vkey, trim)
+    try:
+        found = _upload(job, client, registry, request, vkey, trim)
+        future.set_result(found)
+        return found
+    except BaseException as e:
+        future.set_exception(e)
+        raise
+    finally:
+        with _inflight_lock:
+            _inflight.pop(vkey, None)
+
+
+def _upload(job, client, registry, request: SwingRequest, vkey: str, trim: bool) -> tuple:
+    from coach_upload import expected_progress, upload_video, wait_until_active
+    from coach_video_registry import video_key
+
+    notes, prepared = [], None
+
+    # Vídeo ja pujat abans (i encara viu al servidor): no cal pujar-lo
+    video_file = registry.get_file(client, vkey)
+
+    # PAS 0: Retallar i reduir el vídeo localment (si OpenCV no hi és o el
+    # vídeo no es pot descodificar, es puja l'original)
+    if video_file is None and trim:
+        from coach_video import prepare_video
+        job.update("Retallant el swing")
+        prepared = prepare_video(request.clip(), request.max_height, request.fps)
+        if prepared is None:
+            vkey = video_key(request.digest, "original")
+            video_file = registry.get_file(client, vkey)
+        else:
+            notes.append(prepared.summary())
+
+    if video_file is None:
+        # PAS 1: Pujar el vídeo a la Files API, a trossos i sense còpies
+        job.update("Pujant el vídeo", 0.0)
+        if prepared:
+            video_file = upload_video(client, io.BytesIO(prepared.data), prepared.mime_type)
+        else:
+            video_file = upload_video(client, request.clip())
+
+        # PAS 2: Esperar que Google acabi de processar el vídeo (consultes
+        # cada cop més espaiades, termini de 5 minuts)
+        job.update("Google està processant el vídeo", 0.0)
+        video_file = wait_until_active(
+            client, video_file,
+            on_progress=lambda elapsed, state: job.update(progress=expected_progress(elapsed)),
+        )
+
+        # El fitxer es queda al servidor fins que caduqui (~48 h) per
+        # reutilitzar-lo; el registre esborra els menys usats si n'hi ha massa
+        registry.put_file(client, vkey, video_file)
+    return video_file, vkey, notes
+
+
+def prefetch_video(job, client, registry, request: SwingRequest) -> dict:
+    """
+    Treball que puja i processa un clip per endavant, tan bon punt l'usuari
+    el tria, mentre encara edita el prompt. Quan demana l'anàlisi, el fitxer
+    ja és ACTIVE al registre (o la pujada en curs s'aprofita).
+
+    Returns:
+        dict: {"file" (nom del fitxer remot), "key", "notes"}
+
+    Raises:
+        RuntimeError: amb el missatge per a l'usuari (friendly_error).
+    """
+    from coach_video_registry import video_key
+
+    try:
+        video_file, vkey, notes = remote_video(
+            job, client, registry, request, video_key(request.digest, request.variant), request.trim,
+        )
+    except Exception as e:
+        raise RuntimeError(friendly_error(e)) from e
+    return {"file": video_file.name, "key": vkey, "notes": notes}
+
+
+# ── ANÀLISI PER ASPECTES ─────────────────────────────────────────────────────
+
+def merge_aspects(reports: dict) -> str:
+    """Ajunta els informes de cada aspecte ({clau: text o None}) en un de sol."""
+    return "\n\n".join(
+        f"#### {title}\n{reports.get(key) or '⏳'}" for key, title, _ in SWING_ASPECTS
+    )
+
+
+def _analyze_aspects(job, client, registry, request: SwingRequest, vkey: str, make_contents) -> dict:
+    """
+    Una crida curta per aspecte, totes alhora i sobre el mateix vídeo.
+
+    Els aspectes ja guardats al registre no es tornen a demanar. L'informe
+    parcial (amb els aspectes ja acabats) es va mostrant al Job.
+
+    Returns:
+        dict: {"text", "tokens"}
+    """
+    from coach_context_cache import usage_report
+    from coach_resources import get_aspect_config
+
+    prompts = request.aspect_prompts()
+    reports = {key: registry.get_analysis(vkey, prompt, request.model) for key, prompt in prompts.items()}
+    missing = [key for key, text in reports.items() if not text]
+    tokens = 0
+
+    def generate(key: str):
+        started = time.perf_counter()
+        response = client.models.generate_content(
+            model=request.model,
+            contents=make_contents(prompts[key]),
+            config=get_aspect_config(),
+        )
+        log.info("Aspecte %s: %.2fs", key, time.perf_counter() - started)
+        return key, response
+
+    started = time.perf_counter()
+    job.markdown(merge_aspects(reports))
+    with ThreadPoolExecutor(max_workers=len(SWING_ASPECTS), thread_name_prefix=f"aspects-{job.id}") as pool:
+        for future in as_completed([pool.submit(generate, key) for key in missing]):
+            key, response = future.result()
+            reports[key] = response.text or ""
+            tokens += usage_report(response)["prompt_tokens"]
+            if reports[key]:
+                registry.put_analysis(vkey, prompts[key], request.model, reports[key])
+            job.markdown(merge_aspects(reports))
+    log.info("Anàlisi per aspectes: %d crides en %.2fs (%d del registre)",
+             len(missing), time.perf_counter() - started, len(prompts) - len(missing))
+    return {"text": merge_aspects(reports), "tokens": tokens}
+
+
+# ── SESSIONS (DIVERSOS CLIPS) ─────────────────────────────────────────────────
+
+def batch_parallelism(requests: list, max_calls: int = BATCH_MAX_CALLS) -> int:
+    """
+    Clips d'una sessió que es processen alhora: tots, sempre que les crides
+    simultànies a Gemini no passin de `max_calls` (en el mode per aspectes,
+    cada clip en fa una per aspecte alhora).
+    """
+    calls_per_clip = len(SWING_ASPECTS) if any(r.aspects for r in requests) else 1
+    return max(1, min(len(requests), max_calls // calls_per_clip))
+
+
+def analyze_batch(job, client, registry, requests: list, parallelism: int = None) -> dict:
+    """
+    Analitza tots els clips d'una sessió en paral·lel i en resumeix els errors.
+
+    Cada clip passa pel mateix procés que analyze_swing() (registre, retall,
+    pujada, espera i generació); se'n processen `parallelism` alhora (per
+    defecte, batch_parallelism()), de manera que el temps total s'acosta al
+    del clip més lent. Tota la sessió és un sol treball de la cua: ocupa un
+    dels fils de coach_jobs i els seus clips no competeixen amb les altres
+    anàlisis per aquests fils.
+
+    Returns:
+        dict: {"clips": [{"name", "seconds", "error", **resultat}], "summary",
+              "seconds" (temps total), "clip_seconds" (suma dels clips)}
+    """
+    from coach_jobs import Job
+    from coach_resources import get_video_config
+    from coach_streaming import render_stream
+
+    started = time.perf_counter()
+    parallelism = parallelism or batch_parallelism(requests)
+    clip_jobs = [Job(f"{job.id}-{i}", "swing") for i in range(len(requests))]
+    clips = [None] * len(requests)
+
+    def show_status() -> None:
+        done = sum(c is not None for c in clips)
+        job.update(f"Analitzant la sessió ({done}/{len(requests)} clips)", done / len(requests))
+        job.markdown("\n".join(
+            f"- {'✅' if c and not c['error'] else '❌' if c else '⏳'} **{r.name}**"
+            + (f" ({c['seconds']:.0f} s)" if c else "")
+            for r, c in zip(requests, clips)
+        ))
+
+    def run(i: int) -> None:
+        clip_started = time.perf_counter()
+        try:
+            result = {**analyze_swing(clip_jobs[i], client, registry, requests[i]), "error": None}
+        except Exception as e:
+            result = {"text": "", "notes": [], "frames": [], "cached": False, "tokens": 0, "error": str(e)}
+        clips[i] = {"name": requests[i].name, "seconds": time.perf_counter() - clip_started, **result}
+        show_status()
+
+    show_status()
+    with ThreadPoolExecutor(max_workers=parallelism, thread_name_prefix=f"batch-{job.id}") as pool:
+        list(pool.map(run, range(len(requests))))
+
+    # Resum de la sessió: una sola crida de text amb tots els informes
+    reports = [f"## {c['name']}\n{c['text']}" for c in clips if c["text"]]
+    summary = ""
+    if len(reports) > 1:
+        job.update("Resumint els errors recurrents", 1.0)
+        stream = client.models.generate_content_stream(
+            model=requests[0].model,
+            contents=[BATCH_SUMMARY_PROMPT.format(n=len(reports)), "\n\n".join(reports)],
+            config=get_video_config(),
+        )
+        summary = render_stream(stream, job, "batch-summary").text
+
+    seconds = time.perf_counter() - started
+    clip_seconds = sum(c["seconds"] for c in clips)
+    log.info("Sessió de %d clips (%d alhora) en %.1fs (suma dels clips: %.1fs, el més lent: %.1fs)",
+             len(clips), parallelism, seconds, clip_seconds,
+             max((c["seconds"] for c in clips), default=0.0))
+    return {"clips": clips, "summary": summary, "seconds": seconds, "clip_seconds": clip_seconds}
+
+
+# ── COMPARACIÓ ABANS / DESPRÉS ────────────────────────────────────────────────
+
+def analyze_comparison(job, client, registry, before: SwingRequest, after: SwingRequest) -> dict:
+    """
+    Compara dos swings del mateix jugador (p. ex. el del mes passat i el d'avui).
+
+    Els dos clips s'alineen localment a l'impacte (coach_video.align_on_impact)
+    i només se'n puja el tram alineat. Si el clip ja té un fitxer viu al
+    registre (el tram d'una comparació anterior, o el swing retallat o
+    l'original d'una anàlisi normal), no es retalla ni es torna a pujar: es
+    reutilitza i es diu al model en quin segon de cada vídeo cau l'impacte.
+    La comparació es fa en una sola crida amb els dos vídeos. El prompt, el
+    model i la resolució són els de `after`.
+
+    Returns:
+        dict: {"text", "notes", "frames" (buit), "cached", "tokens"}
+
+    Raises:
+        RuntimeError: amb el missatge per a l'usuari (friendly_error).
+    """
+    try:
+        return _compare(job, client, registry, before, after)
+    except Exception as e:
+        raise RuntimeError(friendly_error(e)) from e
+
+
+def _compare(job, client, registry, before: SwingRequest, after: SwingRequest) -> dict:
+    from coach_context_cache import usage_report
+    from coach_resources import get_video_config
+    from coach_streaming import render_stream
+    from coach_upload import upload_video, wait_until_active
+    from coach_video import align_on_impact, trim_segment
+    from coach_video_registry import video_key
+
+    result = {"text": "", "notes": [], "frames": [], "cached": False, "tokens": 0}
+    variant = f"impact-{after.max_height}p{after.fps}"
+    pair = f"{video_key(before.digest, variant)}>{video_key(after.digest, variant)}"
+
+    cached_report = registry.get_analysis(pair, after.prompt, after.model)
+    if cached_report:
+        result.update(text=cached_report, cached=True)
+        result["notes"].append("♻️ Comparació ja feta d'aquests mateixos vídeos (sense cap crida a Gemini).")
+        return result
+
+    # PAS 0: Situar l'impacte de cada clip i decidir els trams alineats
+    job.update("Alineant els dos swings a l'impacte")
+    alignment = align_on_impact([before.clip(), after.clip()])
+    if alignment:
+        result["notes"].append(alignment.summary())
+    else:
+        result["notes"].append("⚠️ No s'han pogut alinear els clips; s'envien sencers.")
+
+    def impact_second(i: int, variant: str):
+        """Segon de l'impacte dins del fitxer d'una variant del clip `i` (None si no se sap)."""
+        if variant == "original":
+            start = 0
+        elif variant.startswith("swing-"):
+            start = alignment.windows[i][0]                 # El tram de prepare_video()
+        elif variant.startswith("impact") and variant[6:7].isdigit():
+            start = int(variant[6:].split("-")[0])          # impact{inici}-{final}-...
+        else:
+            return None
+        return (alignment.impact_frames[i] - start) / alignment.originals[i].fps
+
+    def reuse(i: int, request: SwingRequest, preferred: str):
+        """Fitxer viu del registre del mateix clip: la variant preferida o qualsevol altra."""
+        for variant in [preferred] + [v for v in registry.variants(request.digest) if v != preferred]:
+            offset = impact_second(i, variant) if alignment else None
+            if alignment and offset is None:
+                continue
+            video_file = registry.get_file(client, video_key(request.digest, variant))
+            if video_file is not None:
+                return video_file, offset
+        return None, None
+
+    def remote_file(i: int, request: SwingRequest):
+        """
+        Fitxer remot d'un clip: un de ja pujat (registry.variants) o el tram
+        alineat retallat i pujat.
+
+        Returns:
+            tuple: (fitxer, reutilitzat, segon de l'impacte al fitxer o None)
+        """
+        segment, impact = None, alignment.impacts[i] if alignment else None
+        if alignment:
+            start, end = alignment.segments[i]
+            variant = f"impact{start}-{end}-{after.max_height}p{after.fps}"
+        else:
+            variant = "original"
+        video_file, offset = reuse(i, request, variant)
+        if video_file is not None:
+            return video_file, True, offset
+        if alignment:
+            segment = trim_segment(request.clip(), start, end, after.max_height, after.fps)
+            if segment is None:
+                variant, impact = "original", impact_second(i, "original")
+        if segment:
+            video_file = upload_video(client, io.BytesIO(segment.data), segment.mime_type)
+        else:
+            video_file = upload_video(client, request.clip())
+        video_file = wait_until_active(client, video_file)
+        registry.put_file(client, video_key(request.digest, variant), video_file)
+        return video_file, False, impact
+
+    # PAS 1-2: Els dos clips es preparen, es pugen i s'esperen alhora
+    job.update("Preparant i pujant els dos clips")
+    with ThreadPoolExecutor(max_workers=2, thread_name_prefix=f"compare-{job.id}") as pool:
+        files = list(pool.map(remote_file, (0, 1), (before, after)))
+    for request, (_, reused, _) in zip((before, after), files):
+        if reused:
+            result["notes"].append(f"♻️ {request.name}: ja era al servidor, no s'ha tornat a pujar.")
+
+    # PAS 3: Una sola crida amb els dos vídeos, en streaming. Si els dos
+    # fitxers són els trams alineats, l'impacte cau al mateix segon; si se
+    # n'ha reutilitzat un altre, es diu on cau a cadascun.
+    job.update("Comparant els dos swings", 1.0)
+    started = time.perf_counter()
+    impacts = [impact for _, _, impact in files]
+    if not alignment:
+        where = ""
+    elif abs(impacts[0] - impacts[1]) < 0.05 and alignment.aligned:
+        where = COMPARE_ALIGNED.format(impacts=f"{impacts[0]:.1f}")
+    else:
+        where = COMPARE_IMPACTS.format(before=impacts[0], after=impacts[1])
+    prompt = COMPARE_PROMPT.format(alignment=where, prompt=after.prompt)
+    stream = client.models.generate_content_stream(
+        model=after.model,
+        contents=[prompt, "SWING ANTERIOR:", files[0][0], "SWING ACTUAL:", files[1][0]],
+        config=get_video_config(),
+    )
+    streamed = render_stream(stream, job, "compare", started)
+    result.update(text=streamed.text, tokens=usage_report(streamed.last_chunk)["prompt_tokens"])
+    if streamed.text:
+        registry.put_analysis(pair, after.prompt, after.model, streamed.text)
+    return result
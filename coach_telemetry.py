@@ -0,0 +1,173 @@
+"""
+coach_telemetry.py
+==================
+Enviament de telemetria (GA4 i comptador de visites) en segon pla.
+
+Abans, `_ga4_send` feia un `requests.post` síncron (3 s de timeout) i el
+comptador de visites un `requests.get` síncron (4 s): un servidor lent aturava
+el render de la pàgina i cada consulta del chat. Ara:
+
+  - Els events GA4 es posen en una cua en memòria i un fil de treball els
+    envia agrupats (fins a 25 events per petició, el límit del Measurement
+    Protocol) amb una única requests.Session (connexions reutilitzades).
+  - Cada enviament té reintents limitats; si la cua és plena, l'event es
+    descarta (la telemetria mai no ha d'aturar l'app).
+  - El comptador de visites es demana en segon pla (un pool de
+    FETCH_WORKERS fils, no un fil nou per petició) i el resultat es llegeix
+    en una rerenderització posterior, quan ja ha arribat.
+
+Els endpoints són configurables, així que es pot provar contra un servidor
+HTTP local (vegeu bench/bench_telemetry.py).
+"""
+
+import logging
+import queue
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+
+log = logging.getLogger(__name__)
+
+GA4_MAX_EVENTS = 25          # Màxim d'events per petició del Measurement Protocol
+QUEUE_SIZE = 1000            # Events pendents màxims (la resta es descarten)
+MAX_RETRIES = 2              # Reintents per lot (a més del primer intent)
+RETRY_BACKOFF = 0.5          # Segons d'espera abans del primer reintent (es dobla)
+BATCH_WAIT = 0.5             # Segons màxims esperant més events per completar un lot
+FETCH_WORKERS = 2            # Fils per a fetch_json (el fil dels events pot estar en reintents)
+
+
+class TelemetryDispatcher:
+    """
+    Cua d'events GA4 buidada per un fil de treball en segon pla.
+
+    Args:
+        ga4_endpoint: URL de /mp/collect amb measurement_id i api_secret
+        timeout: timeout (s) de cada petició HTTP
+    """
+
+    def __init__(self, ga4_endpoint: str, timeout: float = 3):
+        self.ga4_endpoint = ga4_endpoint
+        self.timeout = timeout
+        self._session = None
+        self._session_lock = threading.Lock()
+        self._stats = {"queued": 0, "sent": 0, "dropped": 0, "failed": 0, "requests": 0}
+        self._stats_lock = threading.Lock()
+        self._queue = queue.Queue(maxsize=QUEUE_SIZE)
+        self._fetcher = ThreadPoolExecutor(max_workers=FETCH_WORKERS,
+                                           thread_name_prefix="telemetry-get")
+        self._worker = threading.Thread(target=self._run, name="telemetry", daemon=True)
+        self._worker.start()
+
+    @property
+    def stats(self) -> dict:
+        """Còpia dels comptadors (l'script i el fil de treball els actualitzen alhora)."""
+        with self._stats_lock:
+            return dict(self._stats)
+
+    def _count(self, key: str, n: int = 1) -> None:
+        with self._stats_lock:
+            self._stats[key] += n
+
+    @property
+    def session(self):
+        """requests.Session compartida; `requests` s'importa al primer enviament, fora del render."""
+        with self._session_lock:
+            if self._session is None:
+                import requests
+                self._session = requests.Session()
+            return self._session
+
+    # ── API pública (no bloquejant) ──────────────────────────────────────────
+
+    def send_event(self, client_id: str, name: str, params: dict = None) -> None:
+        """Afegeix un event GA4 a la cua; si és plena, el descarta."""
+        try:
+            self._queue.put_nowait((client_id, {"name": name, "params": params or {}}))
+            self._count("queued")
+        except queue.Full:
+            self._count("dropped")
+
+    def fetch_json(self, url: str, timeout: float = 4) -> Future:
+        """
+        Fa un GET en segon pla (p. ex. el comptador de visites).
+
+        Returns:
+            Future: es resol amb el JSON de la resposta, o amb None si falla.
+        """
+        def _get():
+            try:
+                r = self.session.get(url, timeout=timeout)
+                return r.json() if r.ok else None
+            except Exception:
+                return None
+
+        return self._fetcher.submit(_get)
+
+    def flush(self, timeout: float = 5) -> bool:
+        """Espera que la cua quedi buida (útil en proves). Retorna True si ho ha aconseguit."""
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if self._queue.unfinished_tasks == 0:
+                return True
+            time.sleep(0.01)
+        return False
+
+    # ── Fil de treball ───────────────────────────────────────────────────────
+
+    def _next_batch(self) -> list:
+        """Bloqueja fins al primer event i hi afegeix els que arribin en BATCH_WAIT."""
+        batch = [self._queue.get()]
+        deadline = time.monotonic() + BATCH_WAIT
+        while len(batch) < QUEUE_SIZE:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(self._queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        return batch
+
+    def _run(self):
+        while True:
+            batch = self._next_batch()
+            # El Measurement Protocol agrupa events d'un mateix client_id
+            by_client: dict = {}
+            for client_id, event in batch:
+                by_client.setdefault(client_id, []).append(event)
+            for client_id, events in by_client.items():
+                for i in range(0, len(events), GA4_MAX_EVENTS):
+                    self._post({"client_id": client_id, "events": events[i:i + GA4_MAX_EVENTS]})
+            for _ in batch:
+                self._queue.task_done()
+
+    def _post(self, payload: dict) -> None:
+        n = len(payload["events"])
+        for attempt in range(MAX_RETRIES + 1):
+            try:
+                self._count("requests")
+                r = self.session.post(self.ga4_endpoint, json=payload, timeout=self.timeout)
+                if r.status_code < 500:
+                    self._count("sent", n)
+                    return
+            except Exception:
+                pass
+            if attempt < MAX_RETRIES:
+                time.sleep(RETRY_BACKOFF * 2 ** attempt)
+        self._count("failed", n)
+        log.debug("Lot de %d events GA4 descartat després de %d intents", n, MAX_RETRIES + 1)
+
+
+# ── INSTÀNCIA PER PROCÉS ──────────────────────────────────────────────────────
+# Streamlit torna a executar l'script a cada interacció; el dispatcher (i el
+# seu fil) es crea una sola vegada per procés i endpoint.
+
+_dispatchers: dict = {}
+_dispatchers_lock = threading.Lock()
+
+
+def get_dispatcher(ga4_endpoint: str) -> TelemetryDispatcher:
+    with _dispatchers_lock:
+        if ga4_endpoint not in _dispatchers:
+            _dispatchers[ga4_endpoint] = TelemetryDispatcher(ga4_endpoint)
+        return _dispatchers[ga4_endpoint]
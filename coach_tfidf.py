@@ -0,0 +1,166 @@
+"""
+coach_tfidf.py
+==============
+Índex de similitud TF-IDF (NumPy) sobre els mateixos passatges que coach_index.json.
+
+Complementa la cerca BM25 per paraules exactes: els termes es redueixen a una
+arrel curta (els 6 primers caràcters), de manera que "límits"/"límites" o
+"chipear"/"chip" coincideixen encara que no siguin la mateixa paraula.
+
+build_gem.py desa la matriu TF-IDF en format dispers COO (files normalitzades L2) com a
+fitxers .npy dins de coach_tfidf/. L'app els obre amb memory-mapping una sola
+vegada per procés i puntua cada consulta amb un únic producte matriu-vector
+vectoritzat (np.bincount sobre els valors no nuls).
+
+Fitxers de coach_tfidf/:
+    data.npy     float32  valors TF-IDF no nuls
+    indices.npy  int32    columna (terme) de cada valor
+    rows.npy     int32    fila (passatge) de cada valor
+    idf.npy      float32  IDF de cada terme
+    vocab.json            {arrel: columna}
+"""
+
+import json
+import math
+import os
+import threading
+from collections import Counter
+
+import numpy as np
+
+from coach_retrieval import tokenize
+
+STEM_CHARS = 6
+
+
+def stems(text: str) -> list[str]:
+    """Termes de cerca reduïts a una arrel de STEM_CHARS caràcters."""
+    return [t[:STEM_CHARS] for t in tokenize(text)]
+
+
+def _concat(parts: list, dtype) -> np.ndarray:
+    return np.concatenate(parts) if parts else np.zeros(0, dtype)
+
+
+class TfidfIndex:
+    """
+    Matriu TF-IDF dispersa en format COO (cada valor guarda la seva fila i columna).
+
+    Attributes:
+        n_rows: nombre de passatges (files)
+        vocab:  {arrel: columna}
+    """
+
+    def __init__(self, data, indices, rows, idf, vocab: dict, n_rows: int):
+        self.data = data
+        self.indices = indices
+        self.rows = rows
+        self.idf = idf
+        self.vocab = vocab
+        self.n_rows = n_rows
+
+    @classmethod
+    def build(cls, passages: list[dict]) -> "TfidfIndex":
+        """Construeix la matriu a partir dels passatges (mateix ordre que BM25Index)."""
+        counts = [Counter(stems(p["text"] + " " + p["label"])) for p in passages]
+        df = Counter(term for c in counts for term in c)
+        vocab = {term: col for col, term in enumerate(sorted(df))}
+        n = len(passages)
+        idf = np.array(
+            [math.log((1 + n) / (1 + df[t])) + 1 for t in sorted(df)], dtype=np.float32,
+        )
+
+        data, indices, rows = [], [], []
+        for i, c in enumerate(counts):
+            cols = np.array([vocab[t] for t in c], dtype=np.int32)
+            # TF sublineal (1 + log tf) × IDF, normalitzat L2 per fila
+            vals = (1 + np.log(np.array(list(c.values()), dtype=np.float32))) * idf[cols]
+            norm = np.linalg.norm(vals)
+            if norm:
+                vals /= norm
+            data.append(vals.astype(np.float32))
+            indices.append(cols)
+            rows.append(np.full(len(cols), i, dtype=np.int32))
+
+        return cls(
+            _concat(data, np.float32), _concat(indices, np.int32), _concat(rows, np.int32),
+            idf, vocab, n,
+        )
+
+    def save(self, directory: str) -> None:
+        """Desa la matriu com a fitxers .npy (aptes per a memory-mapping)."""
+        os.makedirs(directory, exist_ok=True)
+        np.save(os.path.join(directory, "data.npy"), self.data)
+        np.save(os.path.join(directory, "indices.npy"), self.indices)
+        np.save(os.path.join(directory, "rows.npy"), self.rows)
+        np.save(os.path.join(directory, "idf.npy"), self.idf)
+        with open(os.path.join(directory, "vocab.json"), "w", encoding="utf-8") as f:
+            json.dump({"n_rows": self.n_rows, "vocab": self.vocab},
+                      f, ensure_ascii=False, separators=(",", ":"))
+
+    @classmethod
+    def load(cls, directory: str) -> "TfidfIndex":
+        """Obre la matriu amb memory-mapping (no es copia a memòria fins que es llegeix)."""
+        def mm(name):
+            return np.load(os.path.join(directory, name), mmap_mode="r")
+
+        with open(os.path.join(directory, "vocab.json"), "r", encoding="utf-8") as f:
+            meta = json.load(f)
+        return cls(
+            mm("data.npy"), mm("indices.npy"), mm("rows.npy"), mm("idf.npy"),
+            meta["vocab"], meta["n_rows"],
+        )
+
+    def query_vector(self, query: str) -> np.ndarray:
+        """Vector TF-IDF (dens, normalitzat) de la consulta."""
+        q = np.zeros(len(self.vocab), dtype=np.float32)
+        for term, tf in Counter(stems(query)).items():
+            col = self.vocab.get(term)
+            if col is not None:
+                q[col] = (1 + math.log(tf)) * self.idf[col]
+        norm = np.linalg.norm(q)
+        return q / norm if norm else q
+
+    def scores(self, query: str) -> np.ndarray:
+        """Similitud del cosinus de la consulta amb cada passatge (un sol matvec)."""
+        q = self.query_vector(query)
+        return np.bincount(self.rows, weights=self.data * q[self.indices], minlength=self.n_rows)
+
+    def ranked(self, query: str, k: int = 8) -> list[tuple[int, float]]:
+        """Retorna [(id_passatge, similitud), ...] dels k passatges més similars."""
+        s = self.scores(query)
+        if k < len(s):
+            top = np.argpartition(-s, k)[:k]
+        else:
+            top = np.arange(len(s))
+        top = top[np.argsort(-s[top])]
+        return [(int(i), float(s[i])) for i in top if s[i] > 0]
+
+
+# ── CÀRREGA UNA VEGADA PER PROCÉS ─────────────────────────────────────────────
+
+_loaded: dict = {}
+_loaded_lock = threading.Lock()
+
+
+def load_tfidf(directory: str):
+    """
+    Obre l'índex TF-IDF una sola vegada per procés i data de modificació.
+
+    Returns:
+        TfidfIndex | None: None si el directori no existeix o és il·legible.
+    """
+    try:
+        mtime = os.path.getmtime(os.path.join(directory, "vocab.json"))
+    except OSError:
+        return None
+    with _loaded_lock:
+        cached = _loaded.get(directory)
+        if cached and cached[0] == mtime:
+            return cached[1]
+        try:
+            index = TfidfIndex.load(directory)
+        except Exception:
+            index = None
+        _loaded[directory] = (mtime, index)
+        return index
@@ -0,0 +1,348 @@
+"""
+coach_transcripts.py
+====================
+Magatzem de transcripcions (transcripts.jsonl) amb índex ID → offset.
+
+Abans, transcripts.json era un sol objecte JSON: build_gem.py el carregava
+sencer i get_transcripts.py el reescrivia sencer a cada execució. Ara:
+
+  - Una línia JSON per transcripció ({"id", "status", "lang", "text",
+    "segments"}). Desar-ne una és afegir una línia al final: no es reescriu
+    res. Si un ID hi surt més d'una vegada, val l'última.
+  - transcripts.jsonl.idx guarda {id: [offset, mida]} de l'última línia de
+    cada ID: llegir-ne una és un seek + una lectura. L'índex es pot refer
+    sempre a partir del .jsonl (no es versiona); si el fitxer ha crescut des
+    de l'últim índex (p. ex. una execució interrompuda), només es llegeix
+    la part nova.
+  - records() recorre les transcripcions una a una (generador), sense
+    carregar-les totes.
+  - La primera vegada, open_store() hi migra el transcripts.json antic.
+
+Quins vídeos formen part del coneixement (i amb quina etiqueta) ho diu
+videos.txt, no el codi: read_video_list() / add_videos().
+
+Ús:
+    with open_store() as store:
+        store.put("Nb4KsqpWv24", {"status": "ok", "lang": "es", "text": ..., "segments": ...})
+        for vid_id, entry in store.records(["Nb4KsqpWv24", ...]):
+            ...
+
+Execució (manteniment):
+  python coach_transcripts.py            # estadístiques del magatzem
+  python coach_transcripts.py --compact  # reescriu-lo sense les línies substituïdes
+"""
+
+import argparse
+import json
+import os
+import re
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+TRANSCRIPTS_FILE = os.path.join(ROOT, "transcripts.jsonl")
+LEGACY_FILE = os.path.join(ROOT, "transcripts.json")       # Format antic (un sol objecte)
+VIDEOS_FILE = os.path.join(ROOT, "videos.txt")              # Vídeos del coneixement
+INDEX_FORMAT = 1
+
+_ID_RE = re.compile(r"(?:v=|youtu\.be/|shorts/|embed/)([\w-]{11})|^([\w-]{11})$")
+
+
+def video_id(text: str):
+    """ID d'un vídeo de YouTube a partir d'un ID o una URL (None si no ho és)."""
+    m = _ID_RE.search(text.strip())
+    return (m.group(1) or m.group(2)) if m else None
+
+
+def read_video_list(path: str = VIDEOS_FILE) -> dict:
+    """
+    Llegeix una llista de vídeos: una línia per vídeo amb l'ID o la URL i,
+    opcionalment, l'etiqueta; les línies buides i les que comencen per # s'ignoren.
+
+    Returns:
+        dict: {id: etiqueta}, en l'ordre del fitxer ("Video N" si no n'hi ha)
+    """
+    videos = {}
+    if not os.path.exists(path):
+        return videos
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            first, _, label = line.partition(" ")
+            vid_id = video_id(first)
+            if vid_id is None:
+                print(f"⚠️  {os.path.basename(path)}: no és un ID ni una URL de YouTube: {first!r}")
+            elif vid_id not in videos:
+                videos[vid_id] = label.strip() or f"Video {len(videos) + 1}"
+    return videos
+
+
+def add_videos(ids: list, path: str = VIDEOS_FILE) -> list:
+    """
+    Afegeix al final de la llista els vídeos que encara no hi són.
+
+    Returns:
+        list: IDs afegits
+    """
+    videos = read_video_list(path)
+    new = [v for v in dict.fromkeys(ids) if v not in videos]
+    if new:
+        with open(path, "a", encoding="utf-8") as f:
+            for n, vid_id in enumerate(new, len(videos) + 1):
+                f.write(f"{vid_id}  Video {n}\n")
+    return new
+
+
+def _line(vid_id: str, entry: dict) -> bytes:
+    record = {"id": vid_id, **{k: v for k, v in entry.items() if k != "id"}}
+    return (json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n").encode("utf-8")
+
+
+class TranscriptStore:
+    """
+    Fitxer JSONL de transcripcions amb l'índex ID → (offset, mida) en memòria.
+
+    Les escriptures s'afegeixen al final del fitxer (i es buiden al disc a
+    cada put); l'índex es desa en tancar el magatzem.
+    """
+
+    def __init__(self, path: str = TRANSCRIPTS_FILE):
+        self.path = path
+        self.index_path = path + ".idx"
+        self._index = {}            # id → (offset, mida) de la seva última línia
+        self._size = 0              # Bytes del fitxer cobertos per l'índex
+        self._out = None
+        self._dirty = False
+        self._load_index()
+
+    # ── ÍNDEX ─────────────────────────────────────────────────────────────────
+
+    def _load_index(self) -> None:
+        try:
+            size = os.path.getsize(self.path)
+        except OSError:
+            size = 0
+        try:
+            with open(self.index_path, encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("format") == INDEX_FORMAT:
+                self._index = {k: tuple(v) for k, v in data["ids"].items()}
+                self._size = data["size"]
+        except (OSError, ValueError, KeyError):
+            pass
+        if size == self._size and self._intact():
+            return
+        if size > self._size and self._intact():
+            self._scan(self._size)              # Només les línies afegides després de l'índex
+        else:
+            self._index, self._size = {}, 0
+            self._scan(0)
+        self._dirty = True
+
+    def _intact(self) -> bool:
+        """L'última línia indexada continua on diu l'índex (el fitxer no s'ha reescrit)."""
+        if not self._index:
+            return self._size == 0
+        offset, length = max(self._index.values())
+        try:
+            with open(self.path, "rb") as f:
+                f.seek(offset)
+                line = f.read(length)
+            return (offset + length == self._size and line.endswith(b"\n")
+                    and json.loads(line)["id"] in self._index)
+        except (OSError, ValueError, KeyError):
+            return False
+
+    def _scan(self, start: int) -> None:
+        """Indexa les línies completes a partir de `start` (una línia a mitges s'ignora)."""
+        if not os.path.exists(self.path):
+            return
+        with open(self.path, "rb") as f:
+            f.seek(start)
+            offset = start
+            for line in f:
+                if not line.endswith(b"\n"):
+                    break                       # Escriptura interrompuda: es descarta
+                try:
+                    self._index[json.loads(line)["id"]] = (offset, len(line))
+                except (ValueError, KeyError):
+                    pass
+                offset += len(line)
+        self._size = offset
+
+    def _save_index(self) -> None:
+        tmp = self.index_path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"format": INDEX_FORMAT, "size": self._size,
+                       "ids": {k: list(v) for k, v in self._index.items()}}, f, separators=(",", ":"))
+        os.replace(tmp, self.index_path)
+        self._dirty = False
+
+    # ── LECTURA ───────────────────────────────────────────────────────────────
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __contains__(self, vid_id: str) -> bool:
+        return vid_id in self._index
+
+    @property
+    def ids(self) -> list:
+        """IDs de les transcripcions, en l'ordre del fitxer."""
+        return [k for k, _ in sorted(self._index.items(), key=lambda kv: kv[1])]
+
+    def get(self, vid_id: str):
+        """
+        Returns:
+            dict | None: l'entrada ({"status", "lang", "text", "segments"} o
+                         {"status": "error", "error"}), o None si no hi és.
+        """
+        if vid_id not in self._index:
+            return None
+        offset, length = self._index[vid_id]
+        if self._out:
+            self._out.flush()
+        with open(self.path, "rb") as f:
+            f.seek(offset)
+            record = json.loads(f.read(length))
+        del record["id"]
+        return record
+
+    def records(self, ids=None):
+        """
+        Recorre les transcripcions una a una.
+
+        Args:
+            ids: IDs a llegir, en aquest ordre (els que no hi són se salten);
+                 None = totes, en l'ordre del fitxer (lectura seqüencial)
+
+        Yields:
+            tuple: (id, entrada)
+        """
+        if ids is not None:
+            for vid_id in ids:
+                entry = self.get(vid_id)
+                if entry is not None:
+                    yield vid_id, entry
+            return
+        if not self._index:
+            return
+        if self._out:
+            self._out.flush()
+        latest = {offset for offset, _ in self._index.values()}
+        with open(self.path, "rb") as f:
+            offset = 0
+            for line in f:
+                if offset in latest:
+                    record = json.loads(line)
+                    yield record.pop("id"), record
+                offset += len(line)
+                if offset >= self._size:
+                    break
+
+    def garbage(self) -> int:
+        """Bytes de línies substituïdes per una de posterior amb el mateix ID."""
+        return self._size - sum(length for _, length in self._index.values())
+
+    # ── ESCRIPTURA ────────────────────────────────────────────────────────────
+
+    def put(self, vid_id: str, entry: dict) -> None:
+        """Afegeix (o substitueix) una transcripció: una línia al final del fitxer."""
+        if self._out is None:
+            self._out = open(self.path, "ab")
+            if self._out.tell() != self._size:
+                self._out.truncate(self._size)      # Línia a mitges d'una execució interrompuda
+                self._out.seek(self._size)
+        line = _line(vid_id, entry)
+        self._out.write(line)
+        self._out.flush()
+        self._index[vid_id] = (self._size, len(line))
+        self._size += len(line)
+        self._dirty = True
+
+    def compact(self) -> int:
+        """
+        Reescriu el fitxer només amb l'última línia de cada ID (atòmicament).
+
+        Returns:
+            int: bytes alliberats
+        """
+        freed = self.garbage()
+        if self._out:
+            self._out.close()
+            self._out = None
+        tmp = self.path + ".tmp"
+        index, size = {}, 0
+        with open(tmp, "wb") as out:
+            for vid_id, entry in self.records():
+                line = _line(vid_id, entry)
+                out.write(line)
+                index[vid_id] = (size, len(line))
+                size += len(line)
+        os.replace(tmp, self.path)
+        self._index, self._size = index, size
+        self._save_index()
+        return freed
+
+    def close(self) -> None:
+        if self._out:
+            self._out.close()
+            self._out = None
+        if self._dirty:
+            self._save_index()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def migrate(legacy: str = LEGACY_FILE, path: str = TRANSCRIPTS_FILE) -> int:
+    """
+    Passa un transcripts.json antic ({id: entrada}) al format JSONL.
+
+    Returns:
+        int: transcripcions migrades (0 si no hi ha res a migrar o el
+             magatzem ja existeix)
+    """
+    if os.path.exists(path) or not os.path.exists(legacy):
+        return 0
+    with open(legacy, encoding="utf-8") as f:
+        data = json.load(f)
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as out:
+        for vid_id, entry in data.items():
+            out.write(_line(vid_id, entry))
+    os.replace(tmp, path)
+    return len(data)
+
+
+def open_store(path: str = TRANSCRIPTS_FILE, legacy: str = None) -> TranscriptStore:
+    """
+    Obre el magatzem, migrant-hi abans el fitxer antic si encara no existeix.
+
+    Args:
+        legacy: fitxer en el format antic (per defecte, el mateix nom amb
+                extensió .json: transcripts.jsonl ← transcripts.json)
+    """
+    legacy = legacy or os.path.splitext(path)[0] + ".json"
+    migrated = migrate(legacy, path)
+    if migrated:
+        print(f"{migrated} transcripcions migrades de {os.path.basename(legacy)} a "
+              f"{os.path.basename(path)} (ja es pot esborrar {os.path.basename(legacy)})")
+    return TranscriptStore(path)
+
+
+if __name__ == "__main__":
+    ap = argparse.ArgumentParser(description="Manteniment del magatzem de transcripcions.")
+    ap.add_argument("--compact", action="store_true", help="elimina les línies substituïdes")
+    args = ap.parse_args()
+
+    with open_store() as store:
+        ok = sum(1 for _, entry in store.records() if entry.get("status") == "ok")
+        print(f"{store.path}: {len(store)} transcripcions ({ok} ok), "
+              f"{os.path.getsize(store.path) if len(store) else 0:,} bytes, "
+              f"{store.garbage():,} bytes substituïts")
+        if args.compact:
+            print(f"Compactat: {store.compact():,} bytes alliberats")
@@ -0,0 +1,282 @@
+"""
+coach_upload.py
+===============
+Pujada dels vídeos de swing a la Files API sense còpies completes en memòria.
+
+Abans, la secció de vídeo feia `uploaded_file.read()`, l'escrivia sencer en
+un NamedTemporaryFile i pujava el fitxer temporal: amb clips de mòbil de
+200 MB, una segona còpia completa per petició (a disc, i a memòria si el
+buffer ja s'havia llegit o modificat). Ara:
+
+  - El buffer de l'UploadedFile de Streamlit s'exposa com un memoryview
+    (sense copiar-lo) i s'embolcalla en un lector de només lectura.
+  - La Files API el llegeix a trossos (8 MB per petició al SDK); cada
+    tros és l'única còpia temporal.
+  - No es toca el disc.
+  - httpx deixa cada tros enviat en un cicle de referències (Request ↔
+    Response) que el comptador de referències no allibera: sense ajuda, un
+    vídeo de 200 MB acumula ~100 MB de trossos fins que passa el recol·lector.
+    El lector el crida cada GC_EVERY_BYTES per mantenir el pic fitat.
+
+Un cop pujat, el fitxer passa per l'estat PROCESSING al servidor.
+wait_until_active() n'espera el final amb intervals creixents (des de
+0,25 s), un termini màxim i gestió de l'estat FAILED, i registra el temps
+d'espera de cada fitxer (wait_stats()).
+
+Vegeu bench/bench_upload.py per a la comparació de memòria màxima (RSS).
+"""
+
+import gc
+import io
+import logging
+import math
+import mimetypes
+import statistics
+import threading
+import time
+from collections import deque
+
+log = logging.getLogger(__name__)
+
+DEFAULT_MIME_TYPE = "video/mp4"
+GC_EVERY_BYTES = 32 * 1024 * 1024   # Recull els trossos ja enviats cada 32 MB llegits
+
+# Espera del processament (PROCESSING → ACTIVE)
+POLL_INITIAL = 0.25          # Primer interval entre consultes (segons)
+POLL_FACTOR = 1.5            # Cada interval és 1,5 vegades l'anterior...
+POLL_MAX = 2.0               # ...fins a aquest segon; després, consulta fixa cada
+                             # POLL_MAX (el sondeig d'abans), alineada des de l'inici
+WAIT_DEADLINE = 300.0        # Termini màxim d'espera per fitxer (segons)
+WAIT_HISTORY = 200           # Esperes recents guardades per a wait_stats()
+
+
+class ProcessingFailed(RuntimeError):
+    """El servidor ha marcat el fitxer com a FAILED."""
+
+
+class ProcessingTimeout(TimeoutError):
+    """El fitxer no ha sortit de PROCESSING abans del termini."""
+
+
+class BufferReader(io.RawIOBase):
+    """
+    Lector de només lectura i amb seek() sobre un buffer en memòria.
+
+    `read(n)` només copia els n bytes demanats; el buffer original (bytes,
+    bytearray, mmap...) es comparteix a través d'un memoryview.
+    """
+
+    def __init__(self, buffer, gc_every: int = GC_EVERY_BYTES):
+        super().__init__()
+        self._view = memoryview(buffer).cast("B")
+        self._pos = 0
+        self._gc_every = gc_every
+        self._next_gc = gc_every
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._pos
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        base = {io.SEEK_SET: 0, io.SEEK_CUR: self._pos, io.SEEK_END: len(self._view)}[whence]
+        self._pos = max(0, base + offset)
+        return self._pos
+
+    def readinto(self, b) -> int:
+        chunk = self._view[self._pos:self._pos + len(b)]
+        n = len(chunk)
+        memoryview(b).cast("B")[:n] = chunk
+        self._pos += n
+        return n
+
+    def read(self, size: int = -1) -> bytes:
+        if self._gc_every and self._pos >= self._next_gc:
+            gc.collect()
+            self._next_gc = self._pos + self._gc_every
+        end = len(self._view) if size is None or size < 0 else self._pos + size
+        chunk = self._view[self._pos:end].tobytes()
+        self._pos += len(chunk)
+        return chunk
+
+    def close(self):
+        self._view.release()
+        super().close()
+
+
+def as_reader(uploaded_file) -> BufferReader:
+    """
+    Lector sense còpia sobre un UploadedFile de Streamlit (o qualsevol BytesIO).
+
+    UploadedFile és un io.BytesIO creat a partir dels bytes rebuts:
+    `getvalue()` retorna aquests mateixos bytes (CPython comparteix el buffer
+    mentre no es modifica), així que no es fa cap còpia del vídeo.
+    """
+    return BufferReader(uploaded_file.getvalue())
+
+
+def guess_mime_type(uploaded_file) -> str:
+    """Tipus MIME del vídeo: el que envia el navegador, o el de l'extensió."""
+    mime_type = getattr(uploaded_file, "type", None)
+    if not mime_type or mime_type == "application/octet-stream":
+        mime_type, _ = mimetypes.guess_type(getattr(uploaded_file, "name", "") or "")
+    return mime_type or DEFAULT_MIME_TYPE
+
+
+def upload_video(client, uploaded_file, mime_type: str = None):
+    """
+    Puja un vídeo a la Files API directament des de la memòria, a trossos.
+
+    Args:
+        client: genai.Client (o un fals amb `files.upload`)
+        uploaded_file: UploadedFile de st.file_uploader (o un BytesIO)
+        mime_type: tipus MIME; per defecte, guess_mime_type(uploaded_file)
+
+    Returns:
+        google.genai.types.File: referència al fitxer pujat.
+    """
+    from google.genai import types
+
+    mime_type = mime_type or guess_mime_type(uploaded_file)
+    started = time.perf_counter()
+    with as_reader(uploaded_file) as reader:
+        video_file = client.files.upload(
+            file=reader,
+            config=types.UploadFileConfig(
+                mime_type=mime_type,
+                display_name=getattr(uploaded_file, "name", None),
+            ),
+        )
+        size = reader.seek(0, io.SEEK_END)
+    log.info("Vídeo pujat: %s (%.1f MB, %s) en %.2fs",
+             video_file.name, size / 1e6, mime_type, time.perf_counter() - started)
+    return video_file
+
+
+# ── ESPERA DEL PROCESSAMENT ───────────────────────────────────────────────────
+
+_waits = deque(maxlen=WAIT_HISTORY)
+_waits_lock = threading.Lock()
+
+
+def _state(file) -> str:
+    state = getattr(file, "state", None)
+    return getattr(state, "name", state) or "STATE_UNSPECIFIED"
+
+
+def _record_wait(name: str, seconds: float, polls: int, state: str) -> None:
+    with _waits_lock:
+        _waits.append({"name": name, "seconds": seconds, "polls": polls, "state": state})
+    log.info("Processament de %s: %s en %.2fs (%d consultes)", name, state, seconds, polls)
+
+
+def wait_stats() -> dict:
+    """
+    Resum de les esperes recents (totes les crides a wait_until_active del procés).
+
+    Returns:
+        dict: {"files", "active", "failed", "timeout", "mean", "p50", "p95", "max"}
+              amb els temps en segons dels fitxers que han arribat a ACTIVE.
+    """
+    with _waits_lock:
+        waits = list(_waits)
+    ok = sorted(w["seconds"] for w in waits if w["state"] == "ACTIVE")
+
+    def pick(q: float) -> float:
+        return ok[min(len(ok) - 1, int(q * len(ok)))] if ok else 0.0
+
+    return {
+        "files": len(waits),
+        "active": len(ok),
+        "failed": sum(w["state"] == "FAILED" for w in waits),
+        "timeout": sum(w["state"] == "TIMEOUT" for w in waits),
+        "mean": statistics.fmean(ok) if ok else 0.0,
+        "p50": pick(0.5),
+        "p95": pick(0.95),
+        "max": ok[-1] if ok else 0.0,
+    }
+
+
+def expected_progress(elapsed: float) -> float:
+    """
+    Fracció (0-1) per a una barra de progrés d'una espera de durada desconeguda.
+
+    Creix ràpid al principi i s'acosta a 1 sense arribar-hi; la mediana de les
+    esperes recents correspon al 63%.
+    """
+    typical = wait_stats()["p50"] or 10.0
+    return 1 - math.exp(-elapsed / typical)
+
+
+def wait_until_active(client, file, deadline: float = WAIT_DEADLINE, on_progress=None,
+                      cleanup: bool = True):
+    """
+    Espera que un fitxer de la Files API deixi l'estat PROCESSING.
+
+    Consulta `client.files.get` amb intervals creixents (POLL_INITIAL,
+    ×POLL_FACTOR) fins al primer POLL_MAX, i a partir d'aquí als múltiples
+    de POLL_MAX comptats des de l'inici (2, 4, 6 s...), mai més enllà del
+    termini. Així l'espera mai acaba més tard que amb la consulta fixa cada
+    POLL_MAX d'abans, i els fitxers curts s'aprofiten de les primeres consultes.
+
+    Args:
+        client: genai.Client (o un fals amb `files.get` / `files.delete`)
+        file: el File retornat per files.upload (o una consulta posterior)
+        deadline: segons màxims d'espera
+        on_progress: funció opcional cridada a cada consulta amb
+                     (segons transcorreguts, estat actual)
+        cleanup: si falla o s'esgota el termini, esborra el fitxer remot
+
+    Returns:
+        File: el fitxer en estat ACTIVE.
+
+    Raises:
+        ProcessingFailed: el servidor l'ha marcat com a FAILED.
+        ProcessingTimeout: segueix en PROCESSING en arribar al termini.
+    """
+    started = time.monotonic()
+    interval, polls, next_at = POLL_INITIAL, 0, POLL_INITIAL
+    while _state(file) == "PROCESSING":
+        elapsed = time.monotonic() - started
+        if on_progress:
+            on_progress(elapsed, "PROCESSING")
+        remaining = deadline - elapsed
+        if remaining <= 0:
+            _record_wait(file.name, elapsed, polls, "TIMEOUT")
+            if cleanup:
+                _delete_quietly(client, file.name)
+            raise ProcessingTimeout(
+                f"El vídeo {file.name} segueix en processament després de {deadline:.0f} s"
+            )
+        time.sleep(max(0.0, min(next_at - elapsed, remaining)))
+        file = client.files.get(name=file.name)
+        polls += 1
+        interval *= POLL_FACTOR
+        if next_at + interval < POLL_MAX:
+            next_at += interval
+        else:
+            next_at = (math.floor(next_at / POLL_MAX) + 1) * POLL_MAX
+
+    elapsed = time.monotonic() - started
+    state = _state(file)
+    if on_progress:
+        on_progress(elapsed, state)
+    _record_wait(file.name, elapsed, polls, state)
+    if state == "FAILED":
+        if cleanup:
+            _delete_quietly(client, file.name)
+        error = getattr(getattr(file, "error", None), "message", None)
+        raise ProcessingFailed(f"Google no ha pogut processar el vídeo {file.name}"
+                               + (f": {error}" if error else ""))
+    return file
+
+
+def _delete_quietly(client, name: str) -> None:
+    try:
+        client.files.delete(name=name)
+    except Exception as e:
+        log.debug("No s'ha pogut esborrar %s: %s", name, e)
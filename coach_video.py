@@ -0,0 +1,555 @@
+"""
+coach_video.py
+==============
+Preprocessament local (només CPU) dels vídeos de swing abans de pujar-los.
+
+Els clips dels usuaris solen ser 4K/60fps amb molta estona quieta abans i
+després del swing, i tot s'enviava a Gemini. Aquí:
+
+  1. Es calcula l'energia de moviment de cada fotograma (diferència absoluta
+     mitjana, amb NumPy) sobre fotogrames reduïts i en escala de grisos, i
+     només en un de cada N (~MOTION_FPS per segon): els altres s'avancen
+     amb grab() sense convertir-los ni reduir-los.
+  2. La finestra del swing és el tram continu de moviment alt al voltant del
+     pic d'energia, ampliat amb un marge a cada costat.
+  3. Només aquesta finestra es torna a codificar (MP4) a la resolució i
+     fps configurats.
+
+Menys bytes pujats, menys espera de processament i menys tokens de vídeo.
+
+Per a un diagnòstic ràpid, extract_keyframes() n'extreu només cinc
+fotogrames (address, takeaway, top, impact i finish) escollits amb la
+mateixa energia de moviment, per enviar-los com a imatges en línia.
+Per comparar dos swings (abans / després), align_on_impact() situa l'impacte
+de cada clip i en pren un tram fix al voltant (ALIGN_BEFORE / ALIGN_AFTER),
+de manera que l'impacte cau al mateix segon a tots dos; trim_segment()
+n'escriu només aquests trams.
+OpenCV (opencv-python-headless) és opcional: si no hi és, prepare_video()
+retorna None i es puja el vídeo original.
+"""
+
+import logging
+import math
+import os
+import tempfile
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+
+import numpy as np
+
+log = logging.getLogger(__name__)
+
+# ── CONFIGURACIÓ ──────────────────────────────────────────────────────────────
+MAX_HEIGHT = 720              # Alçada màxima del vídeo retallat (píxels)
+TARGET_FPS = 30               # Fotogrames per segon del vídeo retallat
+MARGIN_SECONDS = 0.75         # Marge abans i després de la finestra del swing
+MOTION_WIDTH = 160            # Amplada dels fotogrames per calcular el moviment
+MOTION_FPS = 30               # Fotogrames per segon mostrejats per calcular el moviment
+SMOOTH_SECONDS = 0.1          # Finestra del suavitzat de l'energia de moviment
+THRESHOLD_RATIO = 0.2         # Llindar: fons + 20% del rang (pic - fons)
+MAX_GAP_SECONDS = 0.4         # Pauses curtes dins del swing (p. ex. al top)
+TOKENS_PER_SECOND = 263       # Tokens de vídeo+àudio per segon (Gemini, 1 fps)
+KEYFRAME_MAX_SIDE = 768       # Costat màxim de cada fotograma clau (una sola "tile")
+KEYFRAME_QUALITY = 85         # Qualitat JPEG dels fotogrames clau
+TOKENS_PER_TILE = 258         # Tokens per tile d'imatge de 768x768 (Gemini)
+TAKEAWAY_FRACTION = 0.25      # Takeaway: 25% del moviment acumulat entre address i top
+ALIGN_BEFORE = 2.5            # Comparació: segons abans de l'impacte (address i backswing)
+ALIGN_AFTER = 1.5             # Comparació: segons després de l'impacte (fins al finish)
+
+# Fases del swing en l'ordre en què passen
+PHASES = ("address", "takeaway", "top", "impact", "finish")
+
+
+@dataclass
+class VideoInfo:
+    """Propietats bàsiques d'un vídeo."""
+    width: int
+    height: int
+    fps: float
+    frames: int
+    bytes: int
+
+    @property
+    def duration(self) -> float:
+        return self.frames / self.fps if self.fps else 0.0
+
+    @property
+    def tokens(self) -> int:
+        """Estimació dels tokens d'entrada del vídeo a Gemini."""
+        return round(self.duration * TOKENS_PER_SECOND)
+
+    def describe(self) -> str:
+        return (f"{self.bytes / 1e6:.1f} MB · {self.width}x{self.height} · "
+                f"{self.fps:.0f} fps · {self.duration:.1f} s")
+
+
+@dataclass
+class PreparedVideo:
+    """Resultat del preprocessament: vídeo retallat i la comparació amb l'original."""
+    data: bytes
+    mime_type: str
+    original: VideoInfo
+    prepared: VideoInfo
+    window: tuple             # (inici, final) del swing al clip original, en segons
+    seconds: float            # Temps de CPU del preprocessament
+
+    def summary(self) -> str:
+        saved = 1 - self.prepared.bytes / self.original.bytes if self.original.bytes else 0.0
+        return (f"Vídeo original: {self.original.describe()} → retallat al swing "
+                f"({self.window[0]:.1f}–{self.window[1]:.1f} s): {self.prepared.describe()} "
+                f"(−{saved:.0%} bytes, ~{self.original.tokens:,} → ~{self.prepared.tokens:,} tokens, "
+                f"{self.seconds:.1f} s de preprocessament)")
+
+
+@dataclass
+class ImpactAlignment:
+    """Trams de diversos clips alineats a l'impacte."""
+    segments: list            # (primer, últim) fotograma del tram de cada clip
+    originals: list           # VideoInfo de cada clip
+    impacts: list             # Segon de l'impacte dins del tram de cada clip
+    impact_frames: list       # Fotograma de l'impacte de cada clip original
+    windows: list             # swing_window() de cada clip (el tram de prepare_video)
+    seconds: float            # Temps de CPU de l'alineació
+
+    @property
+    def aligned(self) -> bool:
+        """Si l'impacte cau al mateix segon a tots els trams (cap clip és massa curt)."""
+        return max(self.impacts) - min(self.impacts) < 0.05
+
+    def summary(self) -> str:
+        spans = ", ".join(f"{start / info.fps:.1f}–{(end + 1) / info.fps:.1f} s"
+                          for (start, end), info in zip(self.segments, self.originals))
+        impact = (f"l'impacte al segon {self.impacts[0]:.1f}" if self.aligned else
+                  "l'impacte als segons " + " / ".join(f"{t:.1f}" for t in self.impacts))
+        return f"Clips alineats a l'impacte: trams amb {impact} (dels originals: {spans})"
+
+
+@dataclass
+class Keyframe:
+    """Un fotograma clau en JPEG."""
+    phase: str                # Una de PHASES
+    time: float               # Segons des de l'inici del clip
+    jpeg: bytes
+    width: int
+    height: int
+
+    @property
+    def tokens(self) -> int:
+        return image_tokens(self.width, self.height)
+
+
+@dataclass
+class KeyframeSet:
+    """Fotogrames clau d'un clip i el cost comparat amb enviar-lo sencer."""
+    frames: list              # Keyframe, en l'ordre de PHASES
+    original: VideoInfo
+    seconds: float            # Temps de CPU de l'extracció
+
+    @property
+    def bytes(self) -> int:
+        return sum(len(k.jpeg) for k in self.frames)
+
+    @property
+    def tokens(self) -> int:
+        return sum(k.tokens for k in self.frames)
+
+    def summary(self) -> str:
+        return (f"{len(self.frames)} fotogrames clau: {self.bytes / 1e3:.0f} KB, "
+                f"~{self.tokens:,} tokens (vídeo complet: {self.original.describe()}, "
+                f"~{self.original.tokens:,} tokens)")
+
+
+def image_tokens(width: int, height: int) -> int:
+    """Estimació dels tokens d'una imatge a Gemini (≤384 px: 258; si no, per tiles de 768)."""
+    if width <= 384 and height <= 384:
+        return TOKENS_PER_TILE
+    return math.ceil(width / 768) * math.ceil(height / 768) * TOKENS_PER_TILE
+
+
+# ── ENERGIA DE MOVIMENT ───────────────────────────────────────────────────────
+
+def _open(path: str):
+    import cv2
+    cap = cv2.VideoCapture(path)
+    if not cap.isOpened():
+        raise ValueError(f"No s'ha pogut obrir el vídeo: {path}")
+    return cap
+
+
+def video_info(path: str) -> VideoInfo:
+    import cv2
+    cap = _open(path)
+    try:
+        return VideoInfo(
+            width=int(cap.get(cv2.CAP_PROP_FRAME_WIDTH)),
+            height=int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT)),
+            fps=cap.get(cv2.CAP_PROP_FPS) or 30.0,
+            frames=int(cap.get(cv2.CAP_PROP_FRAME_COUNT)),
+            bytes=os.path.getsize(path),
+        )
+    finally:
+        cap.release()
+
+
+def motion_energy(path: str, width: int = MOTION_WIDTH, sample_fps: float = MOTION_FPS) -> np.ndarray:
+    """
+    Energia de moviment de cada fotograma del vídeo.
+
+    Només es recupera (retrieve) i es redueix un fotograma de cada
+    `stride` = fps / sample_fps; la resta només s'avancen (grab), sense la
+    conversió a BGR a resolució completa. La diferència entre dos fotogrames
+    mostrejats es reparteix entre els `stride` fotogrames que cobreix.
+
+    Args:
+        sample_fps: fotogrames per segon mostrejats (0 = tots)
+
+    Returns:
+        np.ndarray: float32, un valor per fotograma (el primer és 0): mitjana
+                    de |fotograma - anterior| en escala de grisos reduïda.
+    """
+    import cv2
+    cap = _open(path)
+    fps = cap.get(cv2.CAP_PROP_FPS) or 30.0
+    stride = max(1, round(fps / sample_fps)) if sample_fps else 1
+    energy, prev, i = [], None, 0
+    try:
+        while cap.grab():
+            i += 1
+            if (i - 1) % stride:
+                continue
+            ok, frame = cap.retrieve()
+            if not ok:
+                break
+            h = max(1, round(frame.shape[0] * width / frame.shape[1]))
+            gray = cv2.cvtColor(cv2.resize(frame, (width, h), interpolation=cv2.INTER_AREA),
+                                cv2.COLOR_BGR2GRAY).astype(np.int16)
+            if prev is None:
+                energy.append(0.0)
+            else:
+                energy += [float(np.abs(gray - prev).mean()) / stride] * stride
+            prev = gray
+    finally:
+        cap.release()
+    # Fotogrames finals després de l'últim mostrejat
+    energy += [energy[-1] if energy else 0.0] * (i - len(energy))
+    return np.asarray(energy[:i], dtype=np.float32)
+
+
+def smooth(energy: np.ndarray, fps: float, seconds: float = SMOOTH_SECONDS) -> np.ndarray:
+    """Mitjana mòbil de l'energia (elimina el soroll d'un sol fotograma)."""
+    n = max(1, round(fps * seconds))
+    if n == 1 or len(energy) < n:
+        return energy
+    return np.convolve(energy, np.ones(n, dtype=np.float32) / n, mode="same")
+
+
+def swing_bounds(energy: np.ndarray, fps: float) -> tuple:
+    """
+    Troba el tram de moviment del swing a partir de l'energia de moviment.
+
+    Es parteix del pic d'energia i s'estén a banda i banda mentre l'energia
+    suavitzada supera el llindar (tolerant pauses de fins a MAX_GAP_SECONDS).
+
+    Returns:
+        tuple: (primer_fotograma, últim_fotograma) del swing, inclosos.
+    """
+    if len(energy) == 0:
+        return 0, 0
+    e = smooth(energy, fps)
+    floor, peak = float(np.median(e)), float(e.max())
+    active = e > floor + THRESHOLD_RATIO * (peak - floor)
+    max_gap = round(MAX_GAP_SECONDS * fps)
+
+    def extend(i: int, step: int) -> int:
+        last, gap = i, 0
+        while 0 <= i + step < len(e) and gap <= max_gap:
+            i += step
+            if active[i]:
+                last, gap = i, 0
+            else:
+                gap += 1
+        return last
+
+    peak = int(e.argmax())
+    return extend(peak, -1), extend(peak, +1)
+
+
+def swing_window(energy: np.ndarray, fps: float, margin: float = MARGIN_SECONDS) -> tuple:
+    """swing_bounds() ampliat amb `margin` segons a cada costat."""
+    start, end = swing_bounds(energy, fps)
+    pad = round(margin * fps)
+    return max(0, start - pad), max(0, min(len(energy) - 1, end + pad))
+
+
+def swing_phases(energy: np.ndarray, fps: float) -> dict:
+    """
+    Situa les fases del swing amb heurístiques de moviment.
+
+      - address:  inici del tram de moviment (el jugador encara és quiet)
+      - impact:   pic d'energia (el pal va a la màxima velocitat)
+      - top:      mínim d'energia entre el pic del backswing i l'impacte (canvi
+                  de direcció); el pic del backswing es busca als 2/3 inicials
+                  del tram, perquè el backswing dura ~3 vegades el downswing
+      - takeaway: quan s'ha fet el TAKEAWAY_FRACTION del moviment fins al top
+      - finish:   final del tram de moviment (posició final aguantada)
+
+    Returns:
+        dict: {fase: índex de fotograma}, en l'ordre de PHASES.
+    """
+    start, end = swing_bounds(energy, fps)
+    e = smooth(energy, fps)
+    impact = int(e.argmax())
+    backswing_peak = start + int(e[start:start + max(1, (impact - start) * 2 // 3)].argmax())
+    top = backswing_peak + int(e[backswing_peak:impact].argmin()) if impact > backswing_peak else start
+    backswing = np.cumsum(e[start:top + 1])
+    takeaway = start + int(np.searchsorted(backswing, backswing[-1] * TAKEAWAY_FRACTION))
+    return {"address": start, "takeaway": min(takeaway, top), "top": top,
+            "impact": impact, "finish": end}
+
+
+# ── RETALL I RECODIFICACIÓ ────────────────────────────────────────────────────
+
+def trim_video(src: str, dst: str, start: int, end: int,
+               max_height: int = MAX_HEIGHT, fps: float = TARGET_FPS) -> None:
+    """Escriu a `dst` (MP4) els fotogrames [start, end] de `src`, reduïts i remostrejats."""
+    import cv2
+    cap = _open(src)
+    src_fps = cap.get(cv2.CAP_PROP_FPS) or fps
+    fps = min(fps, src_fps)
+    writer = None
+    try:
+        for _ in range(start):
+            cap.grab()                      # Sense descodificar la imatge
+        next_t = 0.0
+        for i in range(end - start + 1):
+            ok, frame = cap.read()
+            if not ok:
+                break
+            if i / src_fps + 1e-9 < next_t:
+                continue                    # Remostreig: descarta fotogrames sobrants
+            next_t += 1 / fps
+            h, w = frame.shape[:2]
+            if h > max_height:
+                w, h = round(w * max_height / h) // 2 * 2, max_height
+                frame = cv2.resize(frame, (w, h), interpolation=cv2.INTER_AREA)
+            if writer is None:
+                writer = cv2.VideoWriter(dst, cv2.VideoWriter_fourcc(*"mp4v"), fps, (w, h))
+            writer.write(frame)
+    finally:
+        cap.release()
+        if writer is not None:
+            writer.release()
+    if writer is None:
+        raise ValueError("La finestra del swing no conté cap fotograma")
+
+
+@contextmanager
+def _local_copy(uploaded_file):
+    """
+    Directori temporal amb el vídeo pujat escrit a `original`.
+
+    OpenCV només descodifica fitxers; el directori s'esborra en sortir.
+    """
+    with tempfile.TemporaryDirectory(prefix="coach-video-") as tmp:
+        src = os.path.join(tmp, "original")
+        with open(src, "wb") as f:
+            f.write(uploaded_file.getvalue())
+        yield tmp, src
+
+
+def _trim(src: str, tmp: str, original: VideoInfo, start: int, end: int,
+          max_height: int, fps: float, started: float) -> PreparedVideo:
+    """Retalla [start, end] de `src` dins de `tmp` i en retorna el PreparedVideo."""
+    dst = os.path.join(tmp, "swing.mp4")
+    trim_video(src, dst, start, end, max_height, fps)
+    prepared = video_info(dst)
+    with open(dst, "rb") as f:
+        data = f.read()
+    return PreparedVideo(
+        data=data,
+        mime_type="video/mp4",
+        original=original,
+        prepared=prepared,
+        window=(start / original.fps, (end + 1) / original.fps),
+        seconds=time.perf_counter() - started,
+    )
+
+
+def prepare_video(uploaded_file, max_height: int = MAX_HEIGHT, fps: float = TARGET_FPS,
+                  margin: float = MARGIN_SECONDS):
+    """
+    Retalla un vídeo pujat a la finestra del swing i el redueix.
+
+    L'original i el resultat passen per un directori temporal (_local_copy).
+
+    Args:
+        uploaded_file: UploadedFile de st.file_uploader (o un BytesIO)
+        max_height: alçada màxima del resultat (no s'amplia mai)
+        fps: fotogrames per segon del resultat (mai més que l'original)
+        margin: segons afegits abans i després del swing
+
+    Returns:
+        PreparedVideo | None: None si OpenCV no està instal·lat o el vídeo
+                              no es pot descodificar (es puja l'original).
+    """
+    started = time.perf_counter()
+    try:
+        with _local_copy(uploaded_file) as (tmp, src):
+            original = video_info(src)
+            energy = motion_energy(src)
+            original.frames = len(energy) or original.frames   # El recompte de la capçalera pot fallar
+            start, end = swing_window(energy, original.fps, margin)
+            result = _trim(src, tmp, original, start, end, max_height, fps, started)
+    except Exception as e:
+        log.warning("Preprocessament del vídeo no disponible, es puja l'original: %s", e)
+        return None
+    log.info("%s en %.2fs", result.summary(), result.seconds)
+    return result
+
+
+# ── ALINEACIÓ DE DOS SWINGS ───────────────────────────────────────────────────
+
+def align_on_impact(uploaded_files: list, before: float = ALIGN_BEFORE, after: float = ALIGN_AFTER):
+    """
+    Alinea diversos clips a l'impacte per comparar-los.
+
+    El tram de cada clip va de `before` segons abans del seu impacte a `after`
+    segons després (retallat al que hi ha gravat). Depèn només del clip: el
+    mateix clip dona sempre el mateix tram, i el fitxer pujat es pot
+    reutilitzar en comparacions successives.
+
+    Returns:
+        ImpactAlignment | None: None si OpenCV no està instal·lat o algun
+                                vídeo no es pot descodificar.
+    """
+    started = time.perf_counter()
+    segments, originals, impacts, impact_frames, windows = [], [], [], [], []
+    try:
+        for uploaded_file in uploaded_files:
+            with _local_copy(uploaded_file) as (_, src):
+                info = video_info(src)
+                energy = motion_energy(src)
+            info.frames = len(energy) or info.frames
+            impact = swing_phases(energy, info.fps)["impact"]
+            start = max(0, impact - round(before * info.fps))
+            end = min(info.frames, impact + round(after * info.fps)) - 1
+            segments.append((start, end))
+            originals.append(info)
+            impacts.append((impact - start) / info.fps)
+            impact_frames.append(impact)
+            windows.append(swing_window(energy, info.fps))
+    except Exception as e:
+        log.warning("No s'han pogut alinear els clips: %s", e)
+        return None
+    result = ImpactAlignment(segments=segments, originals=originals, impacts=impacts,
+                             impact_frames=impact_frames, windows=windows,
+                             seconds=time.perf_counter() - started)
+    log.info("%s en %.2fs", result.summary(), result.seconds)
+    return result
+
+
+def trim_segment(uploaded_file, start: int, end: int,
+                 max_height: int = MAX_HEIGHT, fps: float = TARGET_FPS):
+    """
+    Com prepare_video(), però amb un tram de fotogrames ja decidit (p. ex. per
+    align_on_impact()).
+
+    Returns:
+        PreparedVideo | None
+    """
+    started = time.perf_counter()
+    try:
+        with _local_copy(uploaded_file) as (tmp, src):
+            original = video_info(src)
+            return _trim(src, tmp, original, start, end, max_height, fps, started)
+    except Exception as e:
+        log.warning("No s'ha pogut retallar el tram %d-%d: %s", start, end, e)
+        return None
+
+
+# ── FOTOGRAMES CLAU ───────────────────────────────────────────────────────────
+
+def read_frames(path: str, indices) -> dict:
+    """Descodifica només els fotogrames `indices` (en una passada seqüencial)."""
+    import cv2
+    wanted = sorted(set(indices))
+    frames = {}
+    cap = _open(path)
+    try:
+        i = 0
+        for target in wanted:
+            while i < target and cap.grab():
+                i += 1
+            ok, frame = cap.read()
+            if not ok:
+                break
+            frames[target] = frame
+            i += 1
+    finally:
+        cap.release()
+    return frames
+
+
+def _encode_jpeg(frame, max_side: int):
+    import cv2
+    h, w = frame.shape[:2]
+    scale = max_side / max(h, w)
+    if scale < 1:
+        w, h = round(w * scale), round(h * scale)
+        frame = cv2.resize(frame, (w, h), interpolation=cv2.INTER_AREA)
+    ok, buf = cv2.imencode(".jpg", frame, [cv2.IMWRITE_JPEG_QUALITY, KEYFRAME_QUALITY])
+    if not ok:
+        raise ValueError("No s'ha pogut codificar el fotograma en JPEG")
+    return buf.tobytes(), w, h
+
+
+def extract_keyframes(uploaded_file, max_side: int = KEYFRAME_MAX_SIDE):
+    """
+    Extreu els fotogrames clau del swing (address, takeaway, top, impact, finish).
+
+    Args:
+        uploaded_file: UploadedFile de st.file_uploader (o un BytesIO)
+        max_side: costat màxim de cada JPEG (768 = una sola tile de Gemini)
+
+    Returns:
+        KeyframeSet | None: None si OpenCV no està instal·lat o el vídeo no
+                            es pot descodificar.
+    """
+    started = time.perf_counter()
+    try:
+        with _local_copy(uploaded_file) as (_, src):
+            original = video_info(src)
+            energy = motion_energy(src)
+            original.frames = len(energy) or original.frames
+            phases = swing_phases(energy, original.fps)
+            decoded = read_frames(src, phases.values())
+    except Exception as e:
+        log.warning("No s'han pogut extreure els fotogrames clau: %s", e)
+        return None
+    frames = []
+    for phase, index in phases.items():
+        if index in decoded:
+            jpeg, w, h = _encode_jpeg(decoded[index], max_side)
+            frames.append(Keyframe(phase, index / original.fps, jpeg, w, h))
+    if not frames:
+        return None
+    result = KeyframeSet(frames, original, time.perf_counter() - started)
+    log.info("%s en %.2fs", result.summary(), result.seconds)
+    return result
+
+
+def keyframe_contents(prompt: str, keyframes: KeyframeSet) -> list:
+    """
+    `contents` d'una sola crida a generate_content amb els fotogrames en línia.
+
+    Cada imatge va precedida de la fase i el temps, perquè el model sàpiga
+    què està mirant; no cal la Files API ni esperar el processament.
+    """
+    from google.genai import types
+
+    contents = [prompt + "\n\nAnalitza aquests fotogrames clau del swing, en ordre:"]
+    for k in keyframes.frames:
+        contents.append(f"{k.phase.upper()} ({k.time:.2f} s):")
+        contents.append(types.Part.from_bytes(data=k.jpeg, mime_type="image/jpeg"))
+    return contents
@@ -0,0 +1,243 @@
+"""
+coach_video_registry.py
+=======================
+Registre (SQLite) dels vídeos de swing pujats a la Files API i de les
+anàlisis ja fetes, indexat pel SHA-256 del contingut del clip.
+
+Abans, cada "🔍 Analitzar Swing" tornava a pujar el mateix clip, a esperar
+el processament i, en acabar, l'esborrava. Ara:
+
+  - Clau del vídeo: SHA-256 dels bytes del clip + la variant enviada
+    ("original", "swing-720p30" si s'ha retallat, "keyframes"...).
+  - El fitxer remot es conserva fins poc abans de la seva caducitat
+    (expiration_time, ~48 h) i es reutilitza: repetir l'anàlisi amb un altre
+    prompt no torna a pujar res.
+  - El text de cada anàlisi es guarda per (vídeo, prompt normalitzat, model).
+  - Límit LRU de fitxers vius: els que en surten s'esborren del servidor.
+
+Cada operació obre la seva pròpia connexió (com coach_answer_cache.py).
+"""
+
+import hashlib
+import logging
+import os
+import sqlite3
+import time
+from contextlib import contextmanager
+
+from coach_answer_cache import normalize_prompt
+
+log = logging.getLogger(__name__)
+
+VIDEO_REGISTRY_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "coach_videos.sqlite")
+MAX_FILES = 50                      # Fitxers remots vius màxims (LRU)
+MAX_ANALYSES = 1000                 # Anàlisis guardades màximes (LRU)
+EXPIRY_MARGIN = 15 * 60             # No es reutilitza un fitxer a menys de 15 min de caducar
+DEFAULT_LIFETIME = 48 * 3600        # Vida dels fitxers de la Files API si no se'n sap la caducitat
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    key         TEXT PRIMARY KEY,
+    name        TEXT NOT NULL,
+    expires     REAL NOT NULL,
+    created     REAL NOT NULL,
+    last_access REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS files_last_access ON files (last_access);
+CREATE TABLE IF NOT EXISTS analyses (
+    key         TEXT PRIMARY KEY,
+    video       TEXT NOT NULL,
+    prompt      TEXT NOT NULL,
+    model       TEXT NOT NULL,
+    text        TEXT NOT NULL,
+    created     REAL NOT NULL,
+    last_access REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS analyses_last_access ON analyses (last_access);
+CREATE TABLE IF NOT EXISTS stats (
+    name  TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+"""
+
+
+def video_digest(uploaded_file) -> str:
+    """SHA-256 (hex) del contingut d'un UploadedFile, sense copiar-lo."""
+    return hashlib.sha256(uploaded_file.getvalue()).hexdigest()
+
+
+def video_key(digest: str, variant: str = "original") -> str:
+    """Clau d'un vídeo: hash del clip + variant enviada al model."""
+    return f"{digest}:{variant}"
+
+
+def _analysis_key(video: str, prompt: str, model: str) -> str:
+    raw = "\0".join((video, normalize_prompt(prompt), model))
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def _expires_at(file) -> float:
+    expiration = getattr(file, "expiration_time", None)
+    return expiration.timestamp() if expiration else time.time() + DEFAULT_LIFETIME
+
+
+class VideoRegistry:
+    """
+    Registre de fitxers remots i d'anàlisis, guardat en un fitxer SQLite.
+
+    Args:
+        path: fitxer SQLite
+        max_files: fitxers remots vius màxims; els menys usats s'esborren
+        max_analyses: anàlisis guardades màximes
+    """
+
+    def __init__(self, path: str = VIDEO_REGISTRY_FILE,
+                 max_files: int = MAX_FILES, max_analyses: int = MAX_ANALYSES):
+        self.path = path
+        self.max_files = max_files
+        self.max_analyses = max_analyses
+        with self._connect() as db:
+            db.executescript(_SCHEMA)
+
+    @contextmanager
+    def _connect(self):
+        """Connexió amb commit automàtic en sortir del bloc, i tancada després."""
+        db = sqlite3.connect(self.path, timeout=5)
+        try:
+            with db:
+                yield db
+        finally:
+            db.close()
+
+    def _count(self, db, name: str) -> None:
+        db.execute(
+            "INSERT INTO stats (name, value) VALUES (?, 1) "
+            "ON CONFLICT(name) DO UPDATE SET value = value + 1",
+            (name,),
+        )
+
+    # ── Fitxers remots ───────────────────────────────────────────────────────
+
+    def get_file(self, client, key: str):
+        """
+        Retorna el fitxer remot d'un vídeo ja pujat, si encara és utilitzable.
+
+        Es comprova amb `client.files.get` que existeix i és ACTIVE; si no (o
+        caduca d'aquí a menys d'EXPIRY_MARGIN), s'oblida.
+
+        Returns:
+            File | None
+        """
+        now = time.time()
+        with self._connect() as db:
+            row = db.execute("SELECT name, expires FROM files WHERE key = ?", (key,)).fetchone()
+        if row is None or row[1] - now < EXPIRY_MARGIN:
+            self._forget(key, "file_misses")
+            return None
+        try:
+            file = client.files.get(name=row[0])
+        except Exception as e:
+            log.info("El fitxer %s ja no és al servidor: %s", row[0], e)
+            file = None
+        state = getattr(getattr(file, "state", None), "name", None)
+        if state != "ACTIVE":
+            self._forget(key, "file_misses")
+            return None
+        with self._connect() as db:
+            db.execute("UPDATE files SET last_access = ? WHERE key = ?", (now, key))
+            self._count(db, "file_hits")
+        return file
+
+    def variants(self, digest: str) -> list:
+        """
+        Variants d'un clip amb fitxer remot registrat (sense comprovar-ne
+        l'estat al servidor: get_file() ho fa), les usades més recentment primer.
+
+        Returns:
+            list: p. ex. ["swing-720p30", "original"]
+        """
+        prefix = video_key(digest, "")
+        with self._connect() as db:
+            rows = db.execute("SELECT key FROM files WHERE substr(key, 1, ?) = ? ORDER BY last_access DESC",
+                              (len(prefix), prefix)).fetchall()
+        return [key[len(prefix):] for key, in rows]
+
+    def put_file(self, client, key: str, file) -> None:
+        """Registra un fitxer pujat i esborra del servidor els que surten del límit LRU."""
+        now = time.time()
+        with self._connect() as db:
+            db.execute("INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?, ?)",
+                       (key, file.name, _expires_at(file), now, now))
+        self.collect(client)
+
+    def _forget(self, key: str, counter: str) -> None:
+        with self._connect() as db:
+            db.execute("DELETE FROM files WHERE key = ?", (key,))
+            self._count(db, counter)
+
+    def collect(self, client) -> int:
+        """
+        Neteja el registre: oblida els fitxers caducats i esborra del servidor
+        els menys usats per sobre de max_files.
+
+        Returns:
+            int: nombre de fitxers remots esborrats.
+        """
+        with self._connect() as db:
+            db.execute("DELETE FROM files WHERE expires < ?", (time.time(),))
+            evicted = db.execute(
+                "SELECT key, name FROM files ORDER BY last_access DESC LIMIT -1 OFFSET ?",
+                (self.max_files,),
+            ).fetchall()
+            db.executemany("DELETE FROM files WHERE key = ?", [(k,) for k, _ in evicted])
+        for _, name in evicted:
+            try:
+                client.files.delete(name=name)
+            except Exception as e:
+                log.debug("No s'ha pogut esborrar %s: %s", name, e)
+        return len(evicted)
+
+    # ── Anàlisis ─────────────────────────────────────────────────────────────
+
+    def get_analysis(self, video: str, prompt: str, model: str):
+        """
+        Busca l'anàlisi d'un vídeo amb un prompt i model concrets.
+
+        Returns:
+            str | None
+        """
+        key = _analysis_key(video, prompt, model)
+        with self._connect() as db:
+            row = db.execute("SELECT text FROM analyses WHERE key = ?", (key,)).fetchone()
+            if row:
+                db.execute("UPDATE analyses SET last_access = ? WHERE key = ?", (time.time(), key))
+            self._count(db, "analysis_hits" if row else "analysis_misses")
+        return row[0] if row else None
+
+    def put_analysis(self, video: str, prompt: str, model: str, text: str) -> None:
+        """Guarda el text d'una anàlisi i aplica el límit LRU."""
+        now = time.time()
+        with self._connect() as db:
+            db.execute(
+                "INSERT OR REPLACE INTO analyses VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (_analysis_key(video, prompt, model), video, normalize_prompt(prompt),
+                 model, text, now, now),
+            )
+            db.execute(
+                "DELETE FROM analyses WHERE key IN ("
+                "  SELECT key FROM analyses ORDER BY last_access DESC LIMIT -1 OFFSET ?)",
+                (self.max_analyses,),
+            )
+
+    def stats(self) -> dict:
+        """Retorna {"files", "analyses", "file_hits", "file_misses", "analysis_hits", "analysis_misses"}."""
+        with self._connect() as db:
+            counters = dict(db.execute("SELECT name, value FROM stats").fetchall())
+            files = db.execute("SELECT COUNT(*) FROM files").fetchone()[0]
+            analyses = db.execute("SELECT COUNT(*) FROM analyses").fetchone()[0]
+        return {
+            "files": files,
+            "analyses": analyses,
+            **{name: counters.get(name, 0) for name in
+               ("file_hits", "file_misses", "analysis_hits", "analysis_misses")},
+        }
@@ -2,13 +2,15 @@
 extract_rules.py
 ================
 Extreu el text del document PDF de normativa de Pitch&Putt
-i el guarda a rules.txt per ser inclòs a CoachGolfGem.py.
+i el guarda a rules.txt, d'on build_gem.py l'inclou al coneixement de
+l'entrenador (coach_knowledge.bin).
 
 Ús:
   1. Copia el PDF al mateix directori amb el nom: normativa_pp.pdf
   2. Executa:  python extract_rules.py
   3. Es crearà el fitxer rules.txt amb el text extret
-  4. Executa:  python build_gem.py   per regenerar CoachGolfGem.py
+  4. Executa:  python build_gem.py   per regenerar coach_knowledge.bin
+     (CoachGolfGem.py i CoachGolfPro.py el carreguen en arrencar)
 """
 
 import os
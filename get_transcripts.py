@@ -1,58 +1,283 @@
-from youtube_transcript_api import YouTubeTranscriptApi
-import json
-
-video_ids = [
-    "Nb4KsqpWv24",
-    "1pP_435kO1s",
-    "pNcnpTgGMmY",
-    "u4mvIC71Ny8",
-    "ED63gIMfbf8",
-    "Joc50kdFE2c",
-    "2PFCogJsaYE",
-    "KhThqqywr7Q",
-    "IWl3qndvGhM",
-    "XoUQnqQGayM",
-    "Ifd5MkFS4sU",
-    "Oe8CcAhtwvc",
-    "IbW8IQjPvac",
-    "LEYR2BEDHFg"
-]
-
-ytt = YouTubeTranscriptApi()
-results = {}
-
-for vid_id in video_ids:
-    try:
-        # List available transcripts and pick best language
-        transcript_list = ytt.list(vid_id)
-        transcript = None
-        for lang in ['es', 'ca', 'en']:
+"""
+get_transcripts.py
+==================
+Descarrega les transcripcions dels vídeos de YouTube a transcripts.jsonl
+(vegeu coach_transcripts.py).
+
+  - Entrada: IDs o URLs de vídeos, o fitxers de llista (un ID o URL per
+    línia; les línies buides i les que comencen per # s'ignoren). Sense
+    arguments, els vídeos de l'entrenador (videos.txt).
+  - Descàrrega concurrent amb un pool de fils limitat (--workers).
+  - Reintents amb espera exponencial i jitter per als errors transitoris
+    (xarxa, bloquejos temporals); els errors permanents (sense subtítols,
+    vídeo no disponible) no es reintenten.
+  - Cada transcripció es guarda amb el text sencer i els seus segments amb
+    temps ([[inici, durada, text], ...], en segons), que build_gem.py ajunta
+    en finestres de ~30 s amb l'enllaç al minut exacte del vídeo.
+  - Els vídeos que ja són a transcripts.jsonl amb `status: ok` i segments no
+    es tornen a descarregar (llevat de --refresh); els desats abans sense
+    temps es tornen a descarregar una vegada.
+  - Cada resultat s'afegeix de seguida al magatzem (una línia al final, sense
+    reescriure les altres): si l'execució s'interromp, la següent continua
+    on ho havia deixat. Un error mai substitueix una transcripció bona ja
+    desada (només s'informa).
+  - Els vídeos nous descarregats bé al magatzem real s'afegeixen a
+    videos.txt, perquè build_gem.py els inclogui al coneixement (només es
+    processen aquests; la resta no es refà).
+
+Execució:
+  python get_transcripts.py                         # els vídeos de l'entrenador
+  python get_transcripts.py IDS.txt dQw4w9WgXcQ     # llistes i IDs
+  python get_transcripts.py --fake --output /tmp/t.jsonl IDS.txt   # proveïdor fals (proves)
+"""
+
+import argparse
+import os
+import random
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from coach_transcripts import TRANSCRIPTS_FILE, VIDEOS_FILE, add_videos, open_store, read_video_list, video_id
+
+LANGUAGES = ["es", "ca", "en"]      # Preferència d'idioma de les transcripcions
+WORKERS = 8                         # Descàrregues simultànies
+RETRIES = 4                         # Reintents per vídeo (errors transitoris)
+BACKOFF_BASE = 1.0                  # Espera base dels reintents (segons)
+BACKOFF_MAX = 30.0                  # Espera màxima entre reintents (segons)
+
+
+class PermanentError(Exception):
+    """Error que no s'arregla tornant-ho a intentar (p. ex. vídeo sense subtítols)."""
+
+
+# ── PROVEÏDORS ────────────────────────────────────────────────────────────────
+
+class YouTubeProvider:
+    """
+    Transcripcions de YouTube (youtube_transcript_api).
+
+    Cada fil fa servir la seva pròpia instància de l'API (i de la sessió HTTP).
+    """
+
+    def __init__(self, languages: list = LANGUAGES):
+        self.languages = languages
+        self._local = threading.local()
+
+    def _api(self):
+        if not hasattr(self._local, "api"):
+            from youtube_transcript_api import YouTubeTranscriptApi
+            self._local.api = YouTubeTranscriptApi()
+        return self._local.api
+
+    def fetch(self, vid_id: str) -> dict:
+        """
+        Returns:
+            dict: {"lang", "text", "segments"}
+
+        Raises:
+            PermanentError: el vídeo no té transcripció o no està disponible.
+        """
+        import youtube_transcript_api as yta
+
+        ytt = self._api()
+        try:
+            # List available transcripts and pick best language
+            transcript_list = ytt.list(vid_id)
             try:
-                transcript = transcript_list.find_transcript([lang])
-                break
-            except:
-                continue
-        if transcript is None:
-            # Take whatever is available
-            transcript = next(iter(transcript_list))
-
-        entries = transcript.fetch()
-        full_text = " ".join([e.text for e in entries])
-        results[vid_id] = {"status": "ok", "lang": transcript.language_code, "text": full_text}
-        print(f"OK  [{transcript.language_code}] {vid_id}: {len(full_text)} chars")
-    except Exception as e:
-        # Fallback: try fetch directly
+                transcript = transcript_list.find_transcript(self.languages)
+            except yta.NoTranscriptFound:
+                # Take whatever is available
+                transcript = next(iter(transcript_list))
+            entries = transcript.fetch()
+        except (yta.TranscriptsDisabled, yta.NoTranscriptFound, yta.VideoUnavailable,
+                yta.VideoUnplayable, yta.InvalidVideoId, yta.AgeRestricted, StopIteration) as e:
+            raise PermanentError(str(e) or type(e).__name__) from e
+        return {
+            "lang": transcript.language_code,
+            "text": " ".join(e.text for e in entries),
+            "segments": [[round(e.start, 2), round(e.duration, 2), e.text] for e in entries],
+        }
+
+
+class FakeProvider:
+    """
+    Proveïdor local per a proves: text sintètic, latència i errors simulats.
+
+    Args:
+        latency: segons de cada descàrrega
+        fail_rate: probabilitat d'error transitori en cada intent
+        missing: IDs sense transcripció (PermanentError)
+        seed: llavor dels errors simulats
+    """
+
+    def __init__(self, latency: float = 0.05, fail_rate: float = 0.0, missing=(), seed: int = 0):
+        self.latency = latency
+        self.fail_rate = fail_rate
+        self.missing = set(missing)
+        self.calls = 0
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def fetch(self, vid_id: str) -> dict:
+        with self._lock:
+            self.calls += 1
+            fail = self._rng.random() < self.fail_rate
+        time.sleep(self.latency)
+        if vid_id in self.missing:
+            raise PermanentError(f"Subtitles are disabled for {vid_id}")
+        if fail:
+            raise ConnectionError(f"Simulated network error for {vid_id}")
+        segments = [[i * 3.0, 3.0, f"Frase {i} de la transcripció de prova del vídeo {vid_id}."]
+                    for i in range(40)]
+        return {"lang": "es", "text": " ".join(seg[2] for seg in segments), "segments": segments}
+
+
+# ── DESCÀRREGA ────────────────────────────────────────────────────────────────
+
+def parse_inputs(args: list) -> list:
+    """IDs de vídeo (sense duplicats, en ordre) a partir d'IDs, URLs i fitxers de llista."""
+    ids = []
+
+    def add(item: str) -> None:
+        vid_id = video_id(item)
+        if vid_id:
+            ids.append(vid_id)
+        else:
+            print(f"⚠️  No és un ID ni una URL de YouTube: {item!r}")
+
+    for arg in args:
+        if os.path.isfile(arg):
+            with open(arg, encoding="utf-8") as f:
+                for line in f:
+                    line = line.strip()
+                    if line and not line.startswith("#"):
+                        add(line.split()[0])        # Pot portar l'etiqueta darrere (videos.txt)
+        else:
+            add(arg)
+    return list(dict.fromkeys(ids))
+
+
+def fetch_with_retry(provider, vid_id: str, retries: int = RETRIES,
+                     base: float = BACKOFF_BASE, cap: float = BACKOFF_MAX) -> dict:
+    """
+    Descarrega una transcripció, reintentant els errors transitoris.
+
+    L'espera abans de cada reintent és aleatòria entre 0 i base·2^intent
+    (limitada a `cap`): així els fils que fallen alhora no tornen a
+    coincidir.
+
+    Returns:
+        dict: entrada del magatzem ({"status": "ok", "lang", "text", "segments"}
+              o {"status": "error", "error"}), amb el nombre d'intents.
+    """
+    for attempt in range(retries + 1):
         try:
-            entries = ytt.fetch(vid_id)
-            full_text = " ".join([e.text for e in entries])
-            results[vid_id] = {"status": "ok", "text": full_text}
-            print(f"OK  {vid_id}: {len(full_text)} chars")
-        except Exception as e2:
-            results[vid_id] = {"status": "error", "error": str(e2)}
-            print(f"ERR {vid_id}: {e2}")
-
-with open("transcripts.json", "w", encoding="utf-8") as f:
-    json.dump(results, f, ensure_ascii=False, indent=2)
-
-ok = sum(1 for v in results.values() if v["status"] == "ok")
-print(f"\nFet! {ok}/{len(video_ids)} transcripcions obtingudes. Guardat a transcripts.json")
+            result = provider.fetch(vid_id)
+            return {"status": "ok", **result, "attempts": attempt + 1}
+        except PermanentError as e:
+            return {"status": "error", "error": str(e), "attempts": attempt + 1}
+        except Exception as e:
+            if attempt == retries:
+                return {"status": "error", "error": str(e), "attempts": attempt + 1}
+            time.sleep(random.uniform(0, min(cap, base * 2 ** attempt)))
+
+
+def _complete(entry) -> bool:
+    """La transcripció ja és a punt (no cal tornar-la a descarregar)."""
+    return bool(entry) and entry.get("status") == "ok" and "segments" in entry
+
+
+def harvest(video_ids: list, provider, path: str = TRANSCRIPTS_FILE,
+            workers: int = WORKERS, refresh: bool = False, **retry) -> dict:
+    """
+    Descarrega les transcripcions que falten i les afegeix al magatzem `path`.
+
+    Cada resultat s'hi afegeix tan bon punt arriba (una línia al final del
+    .jsonl): si l'execució s'interromp, les acabades ja hi són. Si un vídeo
+    ja tenia una transcripció bona (p. ex. sense segments, o amb --refresh)
+    i ara falla, es conserva l'anterior.
+
+    Returns:
+        dict: {"ok", "error", "skipped", "seconds", "ok_ids"}
+    """
+    started = time.perf_counter()
+    ok = error = 0
+    ok_ids = []
+    with open_store(path) as store:
+        pending = [v for v in video_ids if refresh or not _complete(store.get(v))]
+        skipped = len(video_ids) - len(pending)
+        # Transcripcions bones que un error no ha de substituir
+        have_ok = {v for v in pending if (store.get(v) or {}).get("status") == "ok"}
+        if skipped:
+            print(f"{skipped} vídeos ja tenen transcripció (no es tornen a descarregar)")
+
+        pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="transcripts")
+        try:
+            futures = {pool.submit(fetch_with_retry, provider, v, **retry): v for v in pending}
+            for future in as_completed(futures):
+                vid_id = futures[future]
+                entry = future.result()
+                attempts = entry.pop("attempts")
+                retried = f" ({attempts} intents)" if attempts > 1 else ""
+                if entry["status"] == "ok":
+                    store.put(vid_id, entry)
+                    ok += 1
+                    ok_ids.append(vid_id)
+                    print(f"OK  [{entry['lang']}] {vid_id}: {len(entry['text'])} chars{retried}")
+                else:
+                    error += 1
+                    if vid_id in have_ok:
+                        print(f"ERR {vid_id}: {entry['error']}{retried} "
+                              "(es conserva la transcripció anterior)")
+                    else:
+                        store.put(vid_id, entry)
+                        print(f"ERR {vid_id}: {entry['error']}{retried}")
+        finally:
+            # Amb Ctrl+C no s'esperen les descàrregues pendents: les acabades ja
+            # són al magatzem i la propera execució continuarà.
+            pool.shutdown(wait=False, cancel_futures=True)
+
+        # Les transcripcions substituïdes (--refresh, reintents d'errors) ocupen
+        # espai fins que es compacta el fitxer
+        garbage = store.garbage()
+        if garbage and os.path.exists(store.path) and garbage >= os.path.getsize(store.path) // 2:
+            store.compact()
+    return {"ok": ok, "error": error, "skipped": skipped, "seconds": time.perf_counter() - started,
+            "ok_ids": ok_ids}
+
+
+if __name__ == "__main__":
+    ap = argparse.ArgumentParser(description="Descarrega transcripcions de YouTube a transcripts.jsonl.")
+    ap.add_argument("inputs", nargs="*", help="IDs, URLs o fitxers de llista (per defecte, videos.txt)")
+    ap.add_argument("--workers", type=int, default=WORKERS)
+    ap.add_argument("--retries", type=int, default=RETRIES)
+    ap.add_argument("--refresh", action="store_true", help="torna a descarregar també les que ja hi són")
+    ap.add_argument("--output", help=f"magatzem de sortida (per defecte, {os.path.basename(TRANSCRIPTS_FILE)})")
+    ap.add_argument("--fake", action="store_true",
+                    help="proveïdor fals local (sense xarxa); cal --output, per no barrejar text sintètic "
+                         "amb les transcripcions reals")
+    args = ap.parse_args()
+    if args.fake and not args.output:
+        ap.error("--fake necessita --output (un magatzem de proves, no el real)")
+    args.output = args.output or TRANSCRIPTS_FILE
+
+    video_ids = parse_inputs(args.inputs) if args.inputs else list(read_video_list())
+    provider = FakeProvider(fail_rate=0.2) if args.fake else YouTubeProvider()
+    try:
+        stats = harvest(video_ids, provider, args.output, args.workers, args.refresh, retries=args.retries)
+    except KeyboardInterrupt:
+        print(f"\nInterromput. Les transcripcions acabades ja són a {args.output}; "
+              "torna a executar l'ordre per continuar.")
+        sys.exit(130)
+
+    print(f"\nFet! {stats['ok']} transcripcions noves, {stats['error']} errors, "
+          f"{stats['skipped']} ja hi eren ({stats['seconds']:.1f} s). Guardat a {args.output}")
+    if os.path.abspath(args.output) == TRANSCRIPTS_FILE:
+        # Les transcripcions noves (p. ex. d'una playlist) entren al coneixement
+        added = add_videos(stats["ok_ids"])
+        if added:
+            print(f"{len(added)} vídeos nous afegits a {os.path.basename(VIDEOS_FILE)} "
+                  "(executa build_gem.py per incloure'ls)")
+    sys.exit(1 if stats["error"] else 0)